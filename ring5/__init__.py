@@ -300,18 +300,32 @@ def __dir__() -> list[str]:
 
 def shutdown() -> None:
     # [impl->req~ring5.api.process-lifecycle~1]
-    """Tear down the process-wide worker pools (Perl workers + thread pool).
+    """Tear down the process-wide worker pools.
+
+    Covers the Perl parser/scanner workers, the ``python_mmap`` scan
+    processes, the thread pool, the Kaleido render service's warm browsers
+    and the Matplotlib export farm.
 
     Safe to call at any time: the pools restart transparently on the next
-    parse/scan. Both also register ``atexit`` hooks, so calling this is
-    only needed for long-running processes that want to release resources
-    early.
+    parse/scan/export. All of them also register ``atexit`` hooks, so
+    calling this is only needed for long-running processes that want to
+    release resources early.
     """
     from src.parsing.framework.work_pool import WorkPool
-    from src.parsing.gem5.impl.strategies.perl_worker_pool import shutdown_worker_pool
+    from src.parsing.gem5.impl.strategies.mmap_parse_work import shutdown_mmap_scan_pool
+    from src.parsing.gem5.impl.strategies.perl_worker_pool import (
+        shutdown_scanner_pool,
+        shutdown_worker_pool,
+    )
+    from src.web.rendering.kaleido_render_service import shutdown_render_service
+    from src.web.rendering.matplotlib_export_farm import shutdown_export_farm
 
     shutdown_worker_pool()
+    shutdown_scanner_pool()
+    shutdown_mmap_scan_pool()
     WorkPool.get_instance().shutdown()
+    shutdown_render_service()
+    shutdown_export_farm()
 
 
 __all__ = [
@@ -8,8 +8,9 @@ dependency failures into typed ring5 errors.
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
-from typing import get_args
+from typing import Sequence, get_args
 
 import plotly.graph_objects as go
 from kaleido.errors import ChromeNotFoundError
@@ -20,8 +21,15 @@ from src.web.rendering.figure_export import (
     MatplotlibFormat,
     PlotlyFormat,
     matplotlib_download_bytes,
+    plotly_download_batch,
     plotly_download_bytes,
 )
+from src.web.rendering.export_cache import active_theme, export_cache_key, get_export_cache
+from src.web.rendering.matplotlib_export_farm import (
+    MatplotlibExportJob,
+    figure_source,
+    get_export_farm,
+)
 
 from ring5.errors import DependencyMissingError, ExportError
 
@@ -52,7 +60,11 @@ def export_bytes(
     The engine is inferred from the figure type: ``go.Figure`` → plotly
     (png/svg/pdf/html via Kaleido/to_html), matplotlib ``Figure`` →
     savefig (pdf/pgf/png/svg; PGF applies the LaTeX preamble from the
-    spec the renderer attached).
+    spec the renderer attached). When the Matplotlib export farm is enabled
+    (``RING5_MPL_EXPORT_WORKERS``), unedited rendered figures are rebuilt and
+    exported in a worker process instead. With the export cache enabled
+    (``RING5_EXPORT_CACHE_DIR``), repeat exports of unchanged figures return
+    the stored bytes.
 
     Args:
         fig: The figure ``Session.render`` returned.
@@ -70,6 +82,98 @@ def export_bytes(
         DependencyMissingError: Kaleido found no Chrome-family browser
             (plotly png/svg/pdf), with the install hint.
     """
+    cache = get_export_cache()
+    key = (
+        _cache_key(
+            fig,
+            fmt,
+            deterministic=deterministic,
+            width=width,
+            height=height,
+            scale=scale,
+            dpi=dpi,
+            spec=spec,
+        )
+        if cache is not None
+        else None
+    )
+    if cache is not None and key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    data = _export_uncached(
+        fig,
+        fmt,
+        deterministic=deterministic,
+        width=width,
+        height=height,
+        scale=scale,
+        dpi=dpi,
+        spec=spec,
+    )
+    if cache is not None and key is not None:
+        cache.put(key, data)
+    return data
+
+
+def _cache_key(
+    fig: go.Figure | MplFigure,
+    fmt: str,
+    *,
+    deterministic: bool,
+    width: int,
+    height: int,
+    scale: int,
+    dpi: int,
+    spec: FigureConfig | None,
+) -> str | None:
+    """Return the export-cache address of *fig*, or None when it cannot be cached.
+
+    Plotly figures are addressed by their own JSON, which reflects any edit.
+    Matplotlib figures are addressed by the data/config identity recorded at
+    render time, and only while the figure is unedited and uses that spec.
+    """
+    if isinstance(fig, go.Figure):
+        if fmt not in _PLOTLY_FORMATS:
+            return None
+        figure_digest = hashlib.sha256(fig.to_json().encode()).hexdigest()
+        return export_cache_key(
+            identity={"figure": figure_digest},
+            engine="plotly",
+            fmt=fmt,
+            options={"width": width, "height": height, "scale": scale},
+            deterministic=deterministic,
+            theme=active_theme("plotly"),
+        )
+    if isinstance(fig, MplFigure):
+        identity = getattr(fig, "_ring5_identity", None)
+        if fmt not in _MPL_FORMATS or not isinstance(identity, dict) or figure_source(fig) is None:
+            return None
+        if spec is not None and spec is not getattr(fig, "_ring5_spec", None):
+            return None
+        return export_cache_key(
+            identity=identity,
+            engine="matplotlib",
+            fmt=fmt,
+            options={"dpi": dpi},
+            deterministic=deterministic,
+            theme=active_theme("matplotlib"),
+        )
+    return None
+
+
+def _export_uncached(
+    fig: go.Figure | MplFigure,
+    fmt: str,
+    *,
+    deterministic: bool,
+    width: int,
+    height: int,
+    scale: int,
+    dpi: int,
+    spec: FigureConfig | None,
+) -> bytes:
+    """Produce export bytes with the engine of *fig* (see :func:`export_bytes`)."""
     if isinstance(fig, go.Figure):
         if fmt not in _PLOTLY_FORMATS:
             raise ExportError(
@@ -99,11 +203,27 @@ def export_bytes(
                 f"(choose from {', '.join(_MPL_FORMATS)}; "
                 "html needs the plotly engine)."
             )
+        # With the export farm running, an unedited rendered figure is rebuilt and
+        # exported in a worker process, off the in-process Matplotlib export lock.
+        farm = get_export_farm()
+        source = figure_source(fig) if farm is not None else None
+        if spec is not None and spec is not getattr(fig, "_ring5_spec", None):
+            source = None
         # Explicit spec wins; otherwise use the one Session.render attached.
         # Figures from other sources (e.g. the web app's cached figure) have
         # neither — pass spec= explicitly to apply a LaTeX preamble to PGF.
         spec = spec if spec is not None else getattr(fig, "_ring5_spec", None)
         try:
+            if farm is not None and source is not None:
+                return farm.export(
+                    MatplotlibExportJob(
+                        source,
+                        # mypy: fmt is validated against _MPL_FORMATS above
+                        fmt,  # type: ignore[arg-type]
+                        dpi=dpi,
+                        deterministic=deterministic,
+                    )
+                )
             return matplotlib_download_bytes(
                 fig,
                 # mypy: fmt is validated against _MPL_FORMATS above
@@ -172,6 +292,20 @@ def export_file(
         dpi=dpi,
         spec=spec,
     )
+    return write_export(path, data)
+
+
+def write_export(path: str, data: bytes) -> str:
+    """Write already encoded export bytes to ``path``, creating parent directories.
+
+    Args:
+        path: Output file path; parent directories are created.
+        data: Encoded image or document bytes, e.g. from ``export_bytes``.
+
+    Returns:
+        The written file path.
+    """
+    target = Path(path)
     try:
         target.parent.mkdir(parents=True, exist_ok=True)
         target.write_bytes(data)
@@ -180,10 +314,90 @@ def export_file(
     return str(target)
 
 
+def export_bytes_batch(
+    figs: Sequence[go.Figure],
+    fmt: str,
+    *,
+    deterministic: bool = False,
+    width: int = 700,
+    height: int = 400,
+    scale: int = 2,
+) -> list[bytes]:
+    # [impl->req~ring5.export.plotly-static~1]
+    """Export several Plotly figures in one format, preserving input order.
+
+    Figures missing from the export cache are rendered as one batch, which the
+    Kaleido render service (``RING5_KALEIDO_WORKERS``) spreads across its warm
+    browsers.
+
+    Args:
+        figs: Plotly figures ``Session.render`` returned.
+        fmt: Target format (png/svg/pdf/html).
+        deterministic: Byte-identical re-exports (CI regression mode).
+        width: Image width in pixels (before scale).
+        height: Image height in pixels (before scale).
+        scale: Raster resolution multiplier.
+
+    Returns:
+        Encoded bytes for each figure, in input order.
+
+    Raises:
+        ExportError: Unsupported format, or the export failed.
+        DependencyMissingError: Kaleido found no Chrome-family browser.
+    """
+    if fmt not in _PLOTLY_FORMATS:
+        raise ExportError(
+            f"Format {fmt!r} is not supported for plotly figures "
+            f"(choose from {', '.join(_PLOTLY_FORMATS)}; "
+            "pgf needs the matplotlib engine)."
+        )
+    cache = get_export_cache()
+    results: list[bytes | None] = [None] * len(figs)
+    keys: list[str | None] = [None] * len(figs)
+    if cache is not None:
+        for index, fig in enumerate(figs):
+            key = _cache_key(
+                fig,
+                fmt,
+                deterministic=deterministic,
+                width=width,
+                height=height,
+                scale=scale,
+                dpi=0,
+                spec=None,
+            )
+            keys[index] = key
+            results[index] = cache.get(key) if key is not None else None
+    missing = [index for index, data in enumerate(results) if data is None]
+    if missing:
+        try:
+            rendered = plotly_download_batch(
+                [figs[index] for index in missing],
+                # mypy: fmt is validated against _PLOTLY_FORMATS above
+                fmt,  # type: ignore[arg-type]
+                width=width,
+                height=height,
+                scale=scale,
+                deterministic=deterministic,
+            )
+        except ChromeNotFoundError as exc:
+            raise DependencyMissingError("chrome", _CHROME_HINT) from exc
+        except (OSError, RuntimeError, ValueError) as exc:
+            raise ExportError(f"Plotly {fmt} export failed: {exc}") from exc
+        for index, data in zip(missing, rendered):
+            results[index] = data
+            missing_key = keys[index]
+            if cache is not None and missing_key is not None:
+                cache.put(missing_key, data)
+    return [data for data in results if data is not None]
+
+
 # Re-exported for callers that want to type against the format unions.
 __all__ = [
     "export_bytes",
+    "export_bytes_batch",
     "export_file",
+    "write_export",
     "PlotlyFormat",
     "MatplotlibFormat",
 ]
@@ -10,7 +10,7 @@ handle-based (the job owns its futures).
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NoReturn
 
 import pandas as pd
 
@@ -69,6 +69,8 @@ class ParseJob:
     stats_path: str
     stats_pattern: str
     incremental_batch: "IncrementalParseBatchResult | None" = None
+    column_schema: tuple[tuple[str, tuple[str, ...] | None], ...] = ()
+    streaming: bool = False
 
     def cancel(self) -> None:
         """Cancel this job's pending work (only this job's — handle-based)."""
@@ -92,14 +94,12 @@ class ParseJob:
         # [impl->req~ring5.ingestion.parse-integrity~1]
         from concurrent.futures import wait
 
+        if self.streaming:
+            return self._finalize_streaming(strict=strict)
+
         _done, pending = wait(self.futures, timeout=PARSE_BATCH_TIMEOUT_SECONDS)
         if pending:
-            cancelled = sum(future.cancel() for future in pending)
-            raise ParseError(
-                f"Parse batch exceeded {PARSE_BATCH_TIMEOUT_SECONDS:g} seconds; "
-                f"{len(pending)} file(s) remained unfinished and cancellation "
-                f"succeeded for {cancelled} not-yet-running file(s)."
-            )
+            self._raise_timeout()
 
         csv_path: str | None
         try:
@@ -134,6 +134,47 @@ class ParseJob:
                 f"Parsing '{self.stats_pattern}' under {self.stats_path} produced no CSV."
             )
 
+        return self._result(csv_path, strict, parsed_files, reused_files, removed_files)
+
+    def _finalize_streaming(self, *, strict: bool) -> ParseResult:
+        """Write rows as workers finish instead of collecting every result first."""
+        try:
+            csv_path = self.api.finalize_parsing_streaming(
+                self.output_dir,
+                self.futures,
+                self.column_schema,
+                strategy_type=self.strategy,
+                timeout=PARSE_BATCH_TIMEOUT_SECONDS,
+            )
+        except TimeoutError:
+            self._raise_timeout()
+        except (OSError, RuntimeError, TypeError, ValueError) as exc:
+            raise ParseError(f"Could not assemble parser output: {exc}") from exc
+        if csv_path is None:
+            raise ParseError(
+                f"Parsing '{self.stats_pattern}' under {self.stats_path} produced no CSV."
+            )
+        return self._result(csv_path, strict, len(self.futures), 0, 0)
+
+    def _raise_timeout(self) -> NoReturn:
+        """Cancel unfinished work and report the exceeded batch deadline."""
+        pending = [future for future in self.futures if not future.done()]
+        cancelled = sum(future.cancel() for future in pending)
+        raise ParseError(
+            f"Parse batch exceeded {PARSE_BATCH_TIMEOUT_SECONDS:g} seconds; "
+            f"{len(pending)} file(s) remained unfinished and cancellation "
+            f"succeeded for {cancelled} not-yet-running file(s)."
+        )
+
+    def _result(
+        self,
+        csv_path: str,
+        strict: bool,
+        parsed_files: int,
+        reused_files: int,
+        removed_files: int,
+    ) -> ParseResult:
+        """Check the written CSV for missing statistics and build the public result."""
         try:
             missing = _find_missing_stats(csv_path, self.var_names)
         except (OSError, ValueError, UnicodeError) as exc:
@@ -123,6 +123,17 @@ def _validate_line_style(config: Mapping[str, Any]) -> None:
             raise DataValidationError(f"Plot config field {field!r} must be a boolean.")
 
 
+def _validate_large_data(config: Mapping[str, Any]) -> None:
+    """Reject a large-data threshold that is not a non-negative point count."""
+    if "large_data_threshold" not in config:
+        return
+    threshold = config["large_data_threshold"]
+    if isinstance(threshold, bool) or not isinstance(threshold, int) or threshold < 0:
+        raise DataValidationError(
+            "Plot config field 'large_data_threshold' must be a non-negative integer."
+        )
+
+
 def validate_plot_config(plot_type: str, data: pd.DataFrame, config: Mapping[str, Any]) -> None:
     # [impl->req~ring5.api.plot-validation~1]
     """Validate required fields, their types, and every referenced column.
@@ -165,3 +176,5 @@ def validate_plot_config(plot_type: str, data: pd.DataFrame, config: Mapping[str
         _columns(data, config, field, required=False)
     if plot_type == "line":
         _validate_line_style(config)
+    if plot_type in ("line", "scatter", "area"):
+        _validate_large_data(config)
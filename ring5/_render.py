@@ -10,6 +10,7 @@ difference — and the audit proved it does not affect the produced bytes.
 
 from __future__ import annotations
 
+import copy
 from typing import Union
 
 import plotly.graph_objects as go
@@ -42,7 +43,8 @@ def render_figure(plot: BasePlot, *, engine: EngineMode = "plotly") -> Figure:
         Matplotlib figures are deregistered from pyplot's global manager
         (no accumulation in long-running scripts; ``savefig`` still works)
         and carry the resolved ``FigureConfig`` as ``fig._ring5_spec`` so
-        PGF export can apply the LaTeX preamble.
+        PGF export can apply the LaTeX preamble, plus the picklable render
+        inputs as ``fig._ring5_source`` for the Matplotlib export farm.
 
     Raises:
         RenderError: The engine is invalid or the plot has no processed data.
@@ -74,6 +76,11 @@ def render_figure(plot: BasePlot, *, engine: EngineMode = "plotly") -> Figure:
         import matplotlib.pyplot as plt
 
         from src.web.pages.ui.plotting.base_plot import _relabel_traces
+        from src.web.rendering.export_cache import get_export_cache, plot_identity
+        from src.web.rendering.matplotlib_export_farm import (
+            MatplotlibFigureSource,
+            figure_fingerprint,
+        )
         from src.web.rendering.matplotlib_figure_builder import (
             build_matplotlib_figure_from_traces,
         )
@@ -93,6 +100,18 @@ def render_figure(plot: BasePlot, *, engine: EngineMode = "plotly") -> Figure:
         plt.close(mpl_fig)
 
         mpl_fig._ring5_spec = spec  # type: ignore[attr-defined]
+        # The picklable render inputs let the export farm rebuild this figure in a
+        # worker process; the fingerprint rejects it there once the figure is edited.
+        mpl_fig._ring5_source = MatplotlibFigureSource(  # type: ignore[attr-defined]
+            copy.deepcopy(plot.config),
+            plot.plot_type,
+            traces_result,
+            figure_fingerprint(mpl_fig),
+        )
+        if get_export_cache() is not None:
+            mpl_fig._ring5_identity = plot_identity(  # type: ignore[attr-defined]
+                plot.processed_data, plot.plot_type, plot.config
+            )
         return mpl_fig
     except (AttributeError, IndexError, KeyError, RuntimeError, TypeError, ValueError) as exc:
         raise RenderError(
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import copy
+import functools
 import shutil
 import tempfile
 import threading
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
 from dataclasses import replace
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, cast
@@ -19,6 +21,7 @@ from src.core.models import (
     AnalysisReport,
     AnalysisRecipe,
     AnalysisRecipeInfo,
+    AnalysisRecipeMatrixCase,
     AnalysisRecipeMatrixResult,
     AnalysisRecipeRunResult,
     BackgroundJobInfo,
@@ -124,6 +127,10 @@ PlotType = Literal[
 ]
 
 if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+    from src.core.services.analysis_recipe_matrix_service import RecipeStageContext
+
     from ring5.data import Table
 
 
@@ -480,6 +487,9 @@ class Session:
         scan_limit: int = 10,
         incremental: bool = False,
         cache_path: str | None = None,
+        change_detection: str = "content",
+        verify_fraction: float = 0.0,
+        streaming: bool = False,
     ) -> _parse.ParseJob:
         """Scan the tree, resolve *variables*, and submit an async parse.
 
@@ -502,8 +512,16 @@ class Session:
             scan_limit: Maximum files to scan; zero scans every matching file
                 up to the global discovery ceiling.
             incremental: Parse only new or changed inputs and reuse unchanged finalized rows.
-            cache_path: Optional JSON cache location for incremental mode. By default the cache
-                lives beside ``results.csv`` in ``output_dir``.
+            cache_path: Optional SQLite cache location for incremental mode. By default the
+                cache lives beside ``results.csv`` in ``output_dir``.
+            change_detection: ``"content"`` hashes every input on each incremental run;
+                ``"metadata"`` hashes only inputs whose size, modification time, or inode
+                changed since the cached run.
+            verify_fraction: Share of metadata-unchanged inputs to content-hash anyway in
+                ``"metadata"`` mode; any mismatch makes the run hash every input.
+            streaming: Write ``results.csv`` row by row as workers finish, in file order,
+                and release each worker result once written. The header comes from the
+                variable configuration. Not available with ``incremental``.
 
         Returns:
             A submitted parse job that can be finalized or cancelled.
@@ -516,6 +534,8 @@ class Session:
         # [impl->req~ring5.ingestion.incremental-parsing~1]
         # [impl->req~ring5.ingestion.async-parse~1]
         # [impl->req~ring5.ingestion.parse-output-provenance~1]
+        if streaming and incremental:
+            raise ParseError("Streaming CSV assembly is not available for incremental parses.")
         configs, scanned = _parse.build_stat_configs(
             self.api, stats_path, variables, pattern=pattern, scan_limit=scan_limit
         )
@@ -552,6 +572,8 @@ class Session:
                     strategy_type=strategy,
                     scanned_vars=scanned,
                     cache_path=cache_path,
+                    change_detection=change_detection,
+                    verify_fraction=verify_fraction,
                 )
             else:
                 batch = self.api.submit_parse_async(
@@ -595,6 +617,8 @@ class Session:
             stats_path=stats_path,
             stats_pattern=pattern,
             incremental_batch=(batch if isinstance(batch, IncrementalParseBatchResult) else None),
+            column_schema=(batch.column_schema if isinstance(batch, ParseBatchResult) else ()),
+            streaming=streaming,
         )
         self._parse_jobs.append(job)
         return job
@@ -611,6 +635,9 @@ class Session:
         strict: bool = True,
         incremental: bool = False,
         cache_path: str | None = None,
+        change_detection: str = "content",
+        verify_fraction: float = 0.0,
+        streaming: bool = False,
     ) -> _parse.ParseResult:
         """Parse simulator statistics and wait for completion.
 
@@ -625,7 +652,11 @@ class Session:
                 up to the global discovery ceiling.
             strict: Raise when a requested statistic produces no values.
             incremental: Parse only new or changed files and reuse unchanged finalized rows.
-            cache_path: Optional JSON cache location for incremental mode.
+            cache_path: Optional SQLite cache location for incremental mode.
+            change_detection: ``"content"`` or ``"metadata"`` change detection for
+                incremental mode; see :meth:`parse_submit`.
+            verify_fraction: Share of metadata-unchanged inputs to content-hash anyway.
+            streaming: Assemble the CSV while workers run; see :meth:`parse_submit`.
 
         Returns:
             The assembled CSV path and any missing statistic names.
@@ -645,6 +676,9 @@ class Session:
             scan_limit=scan_limit,
             incremental=incremental,
             cache_path=cache_path,
+            change_detection=change_detection,
+            verify_fraction=verify_fraction,
+            streaming=streaming,
         )
         return job.finalize(strict=strict)
 
@@ -2085,13 +2119,16 @@ class Session:
         bootstrap_samples: int = 2_000,
         random_seed: int = 0,
         minimum_sample_size: int = 5,
+        workers: int = 1,
     ) -> "pd.DataFrame | Table":
         """Calculate statistics for repeated baseline and candidate samples.
 
         Results include per-side sample counts and means, a Welch confidence
         interval and p-value, Hedges' g, a deterministic bootstrap estimate and
         interval, and explicit sample-quality warnings. A :class:`ring5.Table`
-        is returned when both inputs are tables.
+        is returned when both inputs are tables. With ``workers`` above one,
+        groups are compared in parallel processes; every (group, metric)
+        bootstrap keeps its own seeded stream, so results are identical.
 
         Args:
             baseline: Reference observations.
@@ -2104,6 +2141,7 @@ class Session:
             bootstrap_samples: Deterministic resample count from 100 to 50,000.
             random_seed: Non-negative resampling seed.
             minimum_sample_size: Per-side count below which a warning is emitted.
+            workers: Processes comparing groups in parallel (``1`` runs in-process).
 
         Returns:
             Long-form statistical results. The output is a :class:`ring5.Table`
@@ -2131,6 +2169,7 @@ class Session:
                 bootstrap_samples=bootstrap_samples,
                 random_seed=random_seed,
                 minimum_sample_size=minimum_sample_size,
+                workers=workers,
             )
         except (TypeError, ValueError) as exc:
             raise DataValidationError(str(exc)) from exc
@@ -3707,6 +3746,19 @@ class Session:
         """
         # [impl->req~ring5.portfolio.analysis-recipes~1]
         definition = self.load_analysis_recipe(recipe) if isinstance(recipe, str) else recipe
+        return self._run_analysis_recipe(definition, values, None)
+
+    def _run_analysis_recipe(
+        self,
+        definition: AnalysisRecipe,
+        values: Mapping[str, RecipeScalar] | None,
+        stages: RecipeStageContext | None,
+    ) -> AnalysisRecipeRunResult:
+        """Execute a recipe, sharing matrix stages through ``stages`` when given.
+
+        Shared stage results (DataFrames and encoded export bytes) are read-only;
+        copy-on-write keeps later edits in one case from reaching another.
+        """
         materialized = self.materialize_analysis_recipe(definition, values)
         resolved_values = tuple(
             (
@@ -3720,11 +3772,11 @@ class Session:
         )
 
         source = materialized.source
-        try:
-            if source.kind == "csv":
-                data = self.api.data_services.load_csv_file(source.path)
-                source_path = source.path
-            else:
+
+        def load_source() -> tuple[pd.DataFrame, str]:
+            try:
+                if source.kind == "csv":
+                    return self.api.data_services.load_csv_file(source.path), source.path
                 parser_variables = _recipe_stat_configs(source.variables)
                 parsed = self.parse(
                     source.path,
@@ -3734,23 +3786,29 @@ class Session:
                     scan_limit=source.scan_limit,
                     strict=source.strict,
                 )
-                source_path = parsed.csv_path
-                data = self.api.data_services.load_csv_file(parsed.csv_path)
-        except (OSError, TypeError, UnicodeError, ValueError) as exc:
-            raise RecipeError(f"Could not load recipe source {source.path!r}: {exc}") from exc
+                return self.api.data_services.load_csv_file(parsed.csv_path), parsed.csv_path
+            except (OSError, TypeError, UnicodeError, ValueError) as exc:
+                raise RecipeError(f"Could not load recipe source {source.path!r}: {exc}") from exc
 
-        transformed = cast(
-            pd.DataFrame,
-            self.shape(data, list(materialized.transformations)),
-        )
+        data, source_path = load_source() if stages is None else stages.source(load_source)
+
+        def shape_dataset() -> pd.DataFrame:
+            return cast(pd.DataFrame, self.shape(data, list(materialized.transformations)))
+
+        transformed = shape_dataset() if stages is None else stages.dataset(shape_dataset)
         prepared: list[tuple[RecipePlot, pd.DataFrame]] = []
-        for plot_spec in materialized.plots:
-            plot_data = cast(
-                pd.DataFrame,
-                self.shape(transformed, list(plot_spec.pipeline)),
-            )
-            resolved_type = _resolve_plot_type(plot_spec.plot_type)
-            validate_plot_config(resolved_type, plot_data, dict(plot_spec.config))
+        for index, plot_spec in enumerate(materialized.plots):
+
+            def shape_plot(plot_spec: RecipePlot = plot_spec) -> pd.DataFrame:
+                plot_data = cast(
+                    pd.DataFrame,
+                    self.shape(transformed, list(plot_spec.pipeline)),
+                )
+                resolved_type = _resolve_plot_type(plot_spec.plot_type)
+                validate_plot_config(resolved_type, plot_data, dict(plot_spec.config))
+                return plot_data
+
+            plot_data = shape_plot() if stages is None else stages.plot(index, shape_plot)
             prepared.append((plot_spec, plot_data))
 
         state = self.api.state_manager
@@ -3782,21 +3840,63 @@ class Session:
 
         exported: list[str] = []
         figures: dict[tuple[str, str], _render.Figure] = {}
-        for export in materialized.exports:
+
+        def figure_for(export: RecipeExport) -> _render.Figure:
             key = (export.plot, export.engine)
             figure = figures.get(key)
             if figure is None:
                 figure = self.render(created[export.plot], engine=export.engine)
                 figures[key] = figure
-            exported.append(
-                self.export(
-                    figure,
-                    export.path,
-                    fmt=export.format,
+            return figure
+
+        exports = materialized.exports
+        batched: dict[int, bytes] = {}
+
+        def batch_group(export: RecipeExport) -> tuple[str, bool] | None:
+            if export.engine != "plotly" or export.format not in ("png", "svg", "pdf"):
+                return None
+            return (export.format, export.deterministic)
+
+        def encode(index: int) -> bytes:
+            # Static Plotly exports sharing a format are rendered as one batch
+            # on first use, so the Kaleido render service spreads them across
+            # its warm browsers instead of rendering one figure per call.
+            export = exports[index]
+            group = batch_group(export)
+            if group is not None and index not in batched:
+                members = [
+                    member
+                    for member in range(index, len(exports))
+                    if member == index
+                    or (
+                        member not in batched
+                        and batch_group(exports[member]) == group
+                        and (stages is None or not stages.has_artifact(member))
+                    )
+                ]
+                payloads = _export.export_bytes_batch(
+                    [cast("go.Figure", figure_for(exports[member])) for member in members],
+                    export.format,
                     deterministic=export.deterministic,
                 )
+                batched.update(zip(members, payloads))
+                self._guided_exported = True
+            if index in batched:
+                return batched.pop(index)
+            return self.export_bytes(
+                figure_for(export), export.format, deterministic=export.deterministic
             )
 
+        for index, export in enumerate(exports):
+            if stages is None:
+                exported.append(_export.write_export(export.path, encode(index)))
+                continue
+
+            def encode_stage(index: int = index) -> bytes:
+                return encode(index)
+
+            exported.append(_export.write_export(export.path, stages.artifact(index, encode_stage)))
+
         return AnalysisRecipeRunResult(
             recipe_name=materialized.name,
             parameter_values=resolved_values,
@@ -3911,6 +4011,10 @@ class Session:
         *,
         output_directory: str = "ring5-batch-output",
         max_workers: int = 2,
+        processes: bool = False,
+        max_cases_per_worker: int | None = None,
+        worker_memory_limit_mb: int | None = None,
+        on_case: Callable[[AnalysisRecipeMatrixCase], None] | None = None,
     ) -> AnalysisRecipeMatrixResult:
         """Execute the Cartesian product of typed recipe parameter values.
 
@@ -3918,18 +4022,31 @@ class Session:
         order regardless of completion order, and exports are redirected to a
         stable ``case-NNN-<digest>`` directory beneath ``output_directory``.
 
+        With ``processes=True`` the cases run in worker processes instead of
+        threads, so shaping and rendering use several cores. Each worker keeps
+        one warm session for all of its cases and pulls the next case as soon
+        as it is idle.
+
         Args:
             recipe: Recipe object or exact locally saved recipe name.
             matrix: Parameter names mapped to ordered value sequences. Omitted
                 parameters use recipe defaults.
             output_directory: Root for collision-free per-case exports.
-            max_workers: Concurrency bound from one through eight.
+            max_workers: Concurrency bound from one through eight threads, or
+                one through 32 worker processes.
+            processes: Run cases in worker processes.
+            max_cases_per_worker: Replace a worker process after this many cases.
+            worker_memory_limit_mb: Replace a worker process whose resident
+                memory exceeds this many MiB after a case.
+            on_case: Called with each settled case in recipe order while later
+                cases are still running.
 
         Returns:
             Ordered case outcomes, including bounded per-case failures.
 
         Raises:
-            RecipeError: The recipe, matrix, output path, or worker bound is invalid.
+            RecipeError: The recipe, matrix, output path, worker bound, or
+                worker recycling limit is invalid.
         """
         # [impl->req~ring5.automation.batch-matrices~1]
         from src.core.services.analysis_recipe_matrix_service import (
@@ -3937,13 +4054,30 @@ class Session:
         )
 
         definition = self.load_analysis_recipe(recipe) if isinstance(recipe, str) else recipe
+        if not processes and (max_cases_per_worker, worker_memory_limit_mb) != (None, None):
+            raise RecipeError("Worker recycling limits require processes=True.")
+        if processes:
+            try:
+                return AnalysisRecipeMatrixService.execute_in_processes(
+                    definition,
+                    matrix,
+                    output_directory,
+                    functools.partial(_recipe_matrix_worker, self._parser_override),
+                    max_workers=max_workers,
+                    max_cases_per_worker=max_cases_per_worker,
+                    memory_limit_mb=worker_memory_limit_mb,
+                    on_case=on_case,
+                )
+            except (KeyError, TypeError, ValueError) as exc:
+                raise RecipeError(str(exc)) from exc
 
         def run_case(
             case_recipe: AnalysisRecipe,
             values: Mapping[str, RecipeScalar],
+            stages: RecipeStageContext,
         ) -> AnalysisRecipeRunResult:
             with Session(parser=self._parser_override) as child:
-                return child.run_analysis_recipe(case_recipe, values)
+                return child._run_analysis_recipe(case_recipe, values, stages)
 
         try:
             return AnalysisRecipeMatrixService.execute(
@@ -3952,6 +4086,8 @@ class Session:
                 output_directory,
                 run_case,
                 max_workers=max_workers,
+                share_stages=True,
+                on_case=on_case,
             )
         except (KeyError, TypeError, ValueError) as exc:
             raise RecipeError(str(exc)) from exc
@@ -3963,6 +4099,9 @@ class Session:
         *,
         output_directory: str = "ring5-batch-output",
         max_workers: int = 2,
+        processes: bool = False,
+        max_cases_per_worker: int | None = None,
+        worker_memory_limit_mb: int | None = None,
         label: str | None = None,
     ) -> BackgroundJobInfo:
         """Submit a bounded recipe matrix to this session's background jobs.
@@ -3975,7 +4114,11 @@ class Session:
             recipe: Recipe object or exact locally saved recipe name.
             matrix: Parameter names mapped to ordered value sequences.
             output_directory: Root for collision-free per-case exports.
-            max_workers: Concurrency bound from one through eight.
+            max_workers: Thread or worker-process bound, as for
+                :meth:`run_analysis_recipe_matrix`.
+            processes: Run cases in worker processes.
+            max_cases_per_worker: Replace a worker process after this many cases.
+            worker_memory_limit_mb: Replace a worker process above this resident size.
             label: Optional human-readable job-center label.
 
         Returns:
@@ -3999,12 +4142,24 @@ class Session:
                     captured_matrix,
                     output_directory=output_directory,
                     max_workers=max_workers,
+                    processes=processes,
+                    max_cases_per_worker=max_cases_per_worker,
+                    worker_memory_limit_mb=worker_memory_limit_mb,
                 ),
             )
         except (RuntimeError, TypeError, ValueError) as exc:
             raise JobError(str(exc)) from exc
 
 
+@contextmanager
+def _recipe_matrix_worker(
+    parser: SimulationParser | None,
+) -> Iterator[Callable[[AnalysisRecipe, Mapping[str, RecipeScalar]], AnalysisRecipeRunResult]]:
+    """Hold one warm session for a recipe-matrix worker process."""
+    with Session(parser=parser) as session:
+        yield session.run_analysis_recipe
+
+
 def _require_columns(data: pd.DataFrame, columns: list[str]) -> None:
     """Raise the typed missing-column error before delegating to core."""
     for col in columns:
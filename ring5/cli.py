@@ -136,6 +136,9 @@ def _cmd_recipe_matrix(args: argparse.Namespace) -> int:
             matrix,
             output_directory=args.output_dir,
             max_workers=args.workers,
+            processes=args.processes,
+            max_cases_per_worker=args.max_cases_per_worker,
+            worker_memory_limit_mb=args.worker_memory_mb,
         )
     print(json.dumps(_matrix_result_payload(result), indent=2, sort_keys=True))
     return 0 if result.complete else 1
@@ -442,7 +445,24 @@ def build_parser() -> argparse.ArgumentParser:
         "--workers",
         type=int,
         default=2,
-        help="concurrent cases, from 1 through 8 (default: 2)",
+        help="concurrent cases, from 1 through 8 threads or 32 processes (default: 2)",
+    )
+    matrix_p.add_argument(
+        "--processes",
+        action="store_true",
+        help="run cases in worker processes that each keep a warm session",
+    )
+    matrix_p.add_argument(
+        "--max-cases-per-worker",
+        type=int,
+        default=None,
+        help="with --processes, replace a worker after this many cases",
+    )
+    matrix_p.add_argument(
+        "--worker-memory-mb",
+        type=int,
+        default=None,
+        help="with --processes, replace a worker whose resident memory exceeds this size",
     )
     matrix_p.set_defaults(func=_cmd_recipe_matrix)
 
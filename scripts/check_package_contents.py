@@ -15,8 +15,10 @@ RUNTIME_FILES = frozenset(
         "src/parsing/gem5/perl/fileParser.pl",
         "src/parsing/gem5/perl/fileParserServer.pl",
         "src/parsing/gem5/perl/statsScanner.pl",
+        "src/parsing/gem5/perl/statsScannerServer.pl",
         "src/parsing/gem5/perl/libs/TypesFormatRegex.pm",
         "src/parsing/gem5/perl/libs/Scanning/RegexUtils.pm",
+        "src/parsing/gem5/perl/libs/Scanning/StatsScan.pm",
         "src/parsing/gem5/perl/libs/Scanning/Type/Configuration.pm",
         "src/parsing/gem5/perl/libs/Scanning/Type/Distribution.pm",
         "src/parsing/gem5/perl/libs/Scanning/Type/Histogram.pm",
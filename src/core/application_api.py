@@ -82,7 +82,11 @@ from src.core.services.background_job_service import BackgroundJobService
 from src.core.services.browser_upload_service import BrowserUploadService
 from src.core.services.managers.managers_api import ManagersAPI
 from src.core.services.import_preview_service import ImportPreviewService
-from src.core.services.parse_job_service import PARSER_CONTRACT_VERSION, ParseJobService
+from src.core.services.parse_job_service import (
+    PARSER_CONTRACT_VERSION,
+    ParseCheckpointHooks,
+    ParseJobService,
+)
 from src.core.services.parse_job_workspace import ParseJobRuntimeWorkspace
 from src.core.services.remote_source_service import RemoteSourceService
 from src.core.services.services_impl import DefaultServicesAPI
@@ -928,6 +932,10 @@ class ApplicationAPI:
         """Retry a terminal parse attempt after recomputing input signatures."""
         return self._get_parse_job_service().retry(job_id)
 
+    def resume_parse_job(self, job_id: str) -> ParseJobSnapshot:
+        """Resume a terminal parse attempt, reparsing only files without a checkpoint."""
+        return self._get_parse_job_service().resume(job_id)
+
     def consume_parse_job(self, job_id: str, allow_partial: bool = False) -> ParseJobReceipt:
         """Consume a completed job and load its Recent CSV into application state."""
         return self._get_parse_job_service().consume(
@@ -964,9 +972,49 @@ class ApplicationAPI:
                 self._finalize_background_parse,
                 self._publish_background_csv,
                 runtime_workspace=ParseJobRuntimeWorkspace.get_instance(),
+                checkpoint_hooks=self._background_checkpoint_hooks(),
             )
         return self._parse_jobs
 
+    def _background_checkpoint_hooks(self) -> ParseCheckpointHooks | None:
+        """Enable per-file job checkpoints when the parser can flatten result rows.
+
+        Like partial incremental finalization, row flattening stays a private parser
+        capability so SimulationParser's public contract is unchanged.
+        """
+        flatten = getattr(self._parser, "_flatten_result_row", None)
+        write_rows = getattr(self._parser, "_finalize_checkpoint_rows", None)
+        if not callable(flatten) or not callable(write_rows):
+            return None
+        return ParseCheckpointHooks(
+            submit_files=self._submit_background_parse_files,
+            checkpoint_result=flatten,
+            finalize_rows=write_rows,
+        )
+
+    def _submit_background_parse_files(
+        self,
+        stats_path: str,
+        stats_pattern: str,
+        variables: Sequence[JsonValue],
+        output_dir: str,
+        strategy_type: str,
+        scanned_vars: list[JsonValue] | None,
+        file_paths: list[str],
+    ) -> ParseBatchResult:
+        """Submit a resumed background parse restricted to ``file_paths``."""
+        batch = self._submit_background_parse(
+            stats_path,
+            stats_pattern,
+            variables,
+            output_dir,
+            strategy_type,
+            scanned_vars,
+            False,
+            file_paths=file_paths,
+        )
+        return cast(ParseBatchResult, batch)
+
     def _submit_background_parse(
         self,
         stats_path: str,
@@ -976,6 +1024,8 @@ class ApplicationAPI:
         strategy_type: str,
         scanned_vars: list[JsonValue] | None,
         incremental: bool,
+        *,
+        file_paths: list[str] | None = None,
     ) -> ParseBatchResult | IncrementalParseBatchResult:
         """Adapt persisted JSON values to the existing parser primitive."""
         typed_variables: list[ParseVariableConfig | StatConfig] = []
@@ -1007,7 +1057,7 @@ class ApplicationAPI:
             typed_variables, typed_scanned
         )
         if incremental:
-            cache_path = str(Path(output_dir).parent.parent / "incremental-cache.json")
+            cache_path = str(Path(output_dir).parent.parent / "incremental-cache.sqlite")
             return self._parser.submit_incremental_parse_async(
                 stats_path,
                 stats_pattern,
@@ -1018,7 +1068,13 @@ class ApplicationAPI:
                 cache_path,
             )
         return self._parser.submit_parse_async(
-            stats_path, stats_pattern, stat_configs, output_dir, strategy_type, resolved_scanned
+            stats_path,
+            stats_pattern,
+            stat_configs,
+            output_dir,
+            strategy_type,
+            resolved_scanned,
+            file_paths=file_paths,
         )
 
     def _finalize_background_parse(
@@ -1149,6 +1205,8 @@ class ApplicationAPI:
         strategy_type: str = "simple",
         scanned_vars: list[ScannedVariable] | list[ScannedVariableDict] | None = None,
         cache_path: str | None = None,
+        change_detection: str = "content",
+        verify_fraction: float = 0.0,
     ) -> IncrementalParseBatchResult:
         # [impl->req~ring5.ingestion.incremental-parsing~1]
         """Submit only new or changed simulator inputs and retain unchanged rows."""
@@ -1161,6 +1219,8 @@ class ApplicationAPI:
             strategy_type,
             resolved_scanned,
             cache_path,
+            change_detection=change_detection,
+            verify_fraction=verify_fraction,
         )
         self._background_jobs.track_futures(
             "parse",
@@ -1181,6 +1241,20 @@ class ApplicationAPI:
             output_dir, results, strategy_type, var_names=var_names
         )
 
+    def finalize_parsing_streaming(
+        self,
+        output_dir: str,
+        futures: Sequence[Future[dict[str, Any]]],
+        column_schema: Sequence[tuple[str, tuple[str, ...] | None]],
+        strategy_type: str = "simple",
+        *,
+        timeout: float | None = None,
+    ) -> str | None:
+        """Write the CSV in submission order while parse futures complete."""
+        return self._parser.finalize_parsing_streaming(
+            output_dir, futures, column_schema, strategy_type, timeout=timeout
+        )
+
     def finalize_incremental_parsing(
         self,
         batch: IncrementalParseBatchResult,
@@ -61,6 +61,7 @@ MAX_ANALYSIS_RECIPE_STRING_LENGTH = 10_000
 MAX_ANALYSIS_RECIPE_MATRIX_BYTES = 512 * 1024
 MAX_ANALYSIS_RECIPE_MATRIX_CASES = 256
 MAX_ANALYSIS_RECIPE_MATRIX_WORKERS = 8
+MAX_ANALYSIS_RECIPE_MATRIX_PROCESSES = 32
 MAX_SCHEDULED_REPORT_STATE_BYTES = 64 * 1024
 MAX_SCHEDULED_REPORT_SOURCE_FILES = 4_096
 MAX_SCHEDULED_REPORT_SOURCE_BYTES = 4 * 1024 * 1024 * 1024
@@ -87,6 +88,7 @@ MAX_RECOVERY_TOTAL_BYTES = 1024 * 1024 * 1024
 MAX_RECOVERY_OWNER_KEY_LENGTH = 256
 MAX_PORTFOLIO_DIFF_ENTRIES = 5_000
 MAX_PORTFOLIO_BUNDLE_BYTES = 64 * 1024 * 1024
+MAX_DATASET_SNAPSHOT_BYTES = 16 * 1024 * 1024 * 1024
 MAX_PORTFOLIO_BUNDLE_MEMBERS = 64
 MAX_PORTFOLIO_BUNDLE_RESULT_BYTES = 32 * 1024 * 1024
 MAX_BACKGROUND_JOBS = 100
@@ -161,6 +161,8 @@ class ParseVariableConfig(TypedDict, total=False):
 
     # Optional: configuration type
     onEmpty: str
+    # Read ``name`` as a ``section.key`` path of config.ini (config_columns strategy)
+    configIni: bool
 
     # Optional: Perl parser repeat count
     repeat: str
@@ -49,6 +49,7 @@ class DatasetRevision:
     source_datasets: tuple[str, ...]
     parent_revision_ids: tuple[str, ...]
     current: bool = False
+    retained: bool = True
 
 
 @dataclass(frozen=True, slots=True)
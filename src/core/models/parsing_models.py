@@ -23,6 +23,9 @@ from src.core.models.data_models import ScannedVariableDict
 # Type alias for StatConfig parameter values
 StatParamValue = str | int | float | bool | list[str] | None
 
+# Parser strategies that also read the ``config.ini`` beside every statistics file.
+CONFIG_INI_STRATEGIES = frozenset({"config_aware", "config_columns"})
+
 
 @dataclass(frozen=True)
 class ParseBatchResult:
@@ -32,11 +35,14 @@ class ParseBatchResult:
     Bundles the futures returned by the worker pool together with the
     variable names that were submitted, so that ``construct_final_csv``
     can guarantee column ordering without relying on shared class-level
-    mutable state.
+    mutable state. ``column_schema`` lists each variable's entry columns
+    (``None`` for single-column variables) so a streaming writer can emit
+    the header before any result arrives.
     """
 
     futures: list[Future[dict[str, Any]]]
     var_names: list[str]
+    column_schema: tuple[tuple[str, tuple[str, ...] | None], ...] = ()
 
 
 @dataclass(frozen=True)
@@ -44,7 +50,9 @@ class IncrementalParseBatchResult:
     """Submitted changed-file work plus the immutable reuse plan needed to finalize it.
 
     ``cached_rows`` stores finalized scalar CSV cells, never parser objects or executable
-    serialization.  This keeps the on-disk cache inspectable and safe to load as JSON.
+    serialization.  This keeps the on-disk SQLite cache inspectable and safe to load.
+    ``stamps`` holds each input's ``(size, mtime_ns, inode)`` stamp; ``change_detection`` is
+    ``"metadata"`` when unchanged stamps were trusted instead of re-hashing contents.
     """
 
     # [impl->req~ring5.ingestion.incremental-parsing~1]
@@ -59,6 +67,8 @@ class IncrementalParseBatchResult:
     cached_rows: tuple[tuple[str, tuple[tuple[str, str], ...]], ...]
     changed_files: tuple[str, ...]
     removed_files: tuple[str, ...]
+    stamps: tuple[tuple[str, str], ...] = ()
+    change_detection: str = "content"
 
     @property
     def parsed_file_count(self) -> int:
@@ -228,6 +238,8 @@ class StatConfig:
               ``configuration``.
         repeat: Number of dump repetitions expected.
         params: Type-specific parameters (entries, min/max, etc.).
+            ``configIni: True`` makes the ``config_columns`` strategy read the
+            source name as a ``section.key`` path of the run's config.ini.
         statistics_only: If True, parse only statistical summaries.
         is_regex: Whether ``source_name`` is a pattern that must be expanded
             against scanned variables.
@@ -32,8 +32,8 @@ class PlotProtocol(Protocol):
     source_data: pd.DataFrame | None
     processed_data: pd.DataFrame | None
 
-    def to_dict(self) -> dict[str, Any]:
-        """Serialize the plot to a dictionary."""
+    def to_dict(self, *, include_data: bool = True) -> dict[str, Any]:
+        """Serialize the plot to a dictionary, optionally without its processed data."""
         raise NotImplementedError
 
     def invalidate_figure(self) -> None:
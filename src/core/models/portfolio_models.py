@@ -6,6 +6,7 @@ and restoration across all layers, plus the RestoreReport returned by
 ``restore_session`` so callers can see what was (and wasn't) restored.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any, TypedDict
 
@@ -61,7 +62,9 @@ class PortfolioData(TypedDict, total=False):
         csv_path: Path to processed CSV data
         use_parser: Whether parser mode is enabled
         scanned_variables: List of variables discovered by scanner
-        data_csv: CSV string representation of data
+        data_csv: Legacy (schema 4 and older) CSV string of the data
+        data_ref: Fingerprint of the data table in ``frames``
+        frames: Stored tables keyed by fingerprint (see portfolio_container)
         data_semantics: Semantic labels and units retained with data
         environment_metadata: Save-time runtime and dependency versions
         integrity_manifest: Checksums and optional HMAC signature for saved content
@@ -82,6 +85,8 @@ class PortfolioData(TypedDict, total=False):
     use_parser: bool
     scanned_variables: list[ScannedVariableDict]
     data_csv: str
+    data_ref: str | None
+    frames: Mapping[str, Mapping[str, Any]]
     data_semantics: dict[str, dict[str, str]]
     environment_metadata: dict[str, Any] | None
     integrity_manifest: dict[str, Any] | None
@@ -42,12 +42,15 @@ class AnalysisRecipeMatrixResult:
         output_directory: Root containing collision-free case directories.
         max_workers: Actual concurrency bound used for this matrix.
         cases: Outcomes in Cartesian-product order.
+        stages: ``(stage kind, executions, reuses)`` per shared stage kind;
+            empty when cases ran without stage sharing.
     """
 
     recipe_name: str
     output_directory: str
     max_workers: int
     cases: tuple[AnalysisRecipeMatrixCase, ...]
+    stages: tuple[tuple[str, int, int], ...] = ()
 
     @property
     def complete(self) -> bool:
@@ -8,13 +8,21 @@ translate these into ``go.Bar``, ``go.Scatter``, or ``ax.bar()`` calls.
 ``TraceConfig`` carries positioning data so that the matplotlib connector
 does **not** need to reimplement bar grouping math — it gets the exact
 x-positions, widths, and offsets pre-computed.
+
+Point data (``x``, ``y``, error bars, bubble sizes) may be any sequence or a
+NumPy array.  Plot types with potentially large series hand over
+``Series.to_numpy()`` directly; the connectors consume arrays as-is and
+Plotly's JSON encoder converts them only when the figure is serialized.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
+from numpy.typing import NDArray
+
 LineDash = Literal["solid", "dash", "dot", "dashdot", "longdash", "longdashdot"]
 LineShape = Literal["linear", "spline", "hv", "vh", "hvh", "vhv"]
 
@@ -38,6 +46,9 @@ LINE_MARKER_SYMBOLS: tuple[str, ...] = (
     "star",
 )
 
+PointValues = Sequence[str | int | float] | NDArray[Any]
+NumericValues = Sequence[float] | NDArray[Any]
+
 TraceType = Literal[
     "bar",
     "line",
@@ -60,8 +71,8 @@ class TraceConfig:
     Attributes:
         name: Legend label for this trace.
         trace_type: Discriminator for sub-type dispatch.
-        x: X-axis data values (categories or numeric).
-        y: Y-axis data values (always numeric).
+        x: X-axis data values (categories or numeric), as a sequence or array.
+        y: Y-axis data values (always numeric), as a sequence or array.
         yaxis: Which Y-axis this trace belongs to ("y" or "y2").
         color: Trace color (hex, rgb, or named).
         opacity: Fill/marker opacity (0–1).
@@ -73,8 +84,8 @@ class TraceConfig:
 
     name: str = ""
     trace_type: TraceType = "bar"
-    x: list[str | int | float] = field(default_factory=list)
-    y: list[int | float] = field(default_factory=list)
+    x: PointValues = field(default_factory=list)
+    y: PointValues = field(default_factory=list)
     yaxis: Literal["y", "y2"] = "y"
     color: str = ""
     opacity: float = 1.0
@@ -127,10 +138,11 @@ class LineTraceConfig(TraceConfig):
     show_markers: bool = True
     connect_gaps: bool = False
     fill: Literal["none", "tozeroy", "tonexty"] = "none"
-    fill_base: list[float] | None = None
+    fill_base: NumericValues | None = None
+    webgl: bool = False  # large-data mode: draw with a WebGL trace
 
     # Error bars
-    error_y: list[float] | None = None
+    error_y: NumericValues | None = None
 
 
 @dataclass
@@ -144,10 +156,11 @@ class ScatterTraceConfig(TraceConfig):
     marker_line_width: float = 0.0
     marker_line_color: str = ""
     colorscale: str | None = None  # for continuous color mapping
-    size_values: list[float] | None = None  # bubble chart sizes
+    size_values: NumericValues | None = None  # bubble chart sizes
+    webgl: bool = False  # large-data mode: draw with a WebGL trace
 
     # Error bars
-    error_y: list[float] | None = None
+    error_y: NumericValues | None = None
 
 
 @dataclass
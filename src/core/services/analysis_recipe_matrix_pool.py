@@ -0,0 +1,267 @@
+"""Process pool of warm recipe workers for large analysis-recipe matrices.
+
+Threads cannot spread a matrix across cores: shaping and Matplotlib rendering
+hold the GIL and exports are serialized by a process-wide lock. This pool runs
+cases in ``spawn`` worker processes instead. Each worker enters its factory's
+context once (for the public API, one warm ``ring5.Session``) and then runs
+case after case in it.
+
+Cases sit in one shared queue and idle workers pull the next one, so a slow
+case never strands work behind it on a busy worker. Finished cases stream
+back to the caller in recipe order as soon as every earlier case has settled.
+A worker retires after ``max_cases_per_worker`` cases or once its resident
+memory exceeds ``memory_limit_mb`` (checked between cases), and a fresh
+worker takes its place while cases remain. A worker that dies mid-case fails
+only that case.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import pickle
+import resource
+import sys
+from collections.abc import Callable, Generator, Mapping, Sequence
+from concurrent.futures import Future
+from contextlib import AbstractContextManager
+from itertools import count
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from typing import Any, cast
+
+from src.core.models import AnalysisRecipe, AnalysisRecipeRunResult, RecipeScalar
+
+logger = logging.getLogger(__name__)
+
+RecipeCaseRunner = Callable[[AnalysisRecipe, Mapping[str, RecipeScalar]], AnalysisRecipeRunResult]
+#: Picklable zero-argument callable entered once per worker process.
+RecipeWorkerFactory = Callable[[], AbstractContextManager[RecipeCaseRunner]]
+
+_POLL_SECONDS = 0.1
+_SHUTDOWN_SECONDS = 10.0
+
+
+def _resident_bytes() -> int:
+    """Return this process's resident set size (peak RSS where current is unavailable)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _encode_outcome(run: Callable[[], AnalysisRecipeRunResult]) -> bytes:
+    """Run one case and pickle ``(succeeded, result or exception)`` for the parent."""
+    try:
+        outcome: tuple[bool, Any] = (True, run())
+    except Exception as exc:
+        outcome = (False, exc)
+    try:
+        return pickle.dumps(outcome)
+    except (pickle.PicklingError, AttributeError, TypeError) as exc:
+        detail = outcome[1] if not outcome[0] else exc
+        return pickle.dumps((False, RuntimeError(str(detail) or type(detail).__name__)))
+
+
+def _worker_main(
+    factory: RecipeWorkerFactory,
+    tasks: Any,
+    results: Connection,
+    max_cases: int | None,
+    memory_limit_bytes: int | None,
+) -> None:
+    """Run queued cases in one warm runner until a sentinel or a recycle limit.
+
+    Messages go straight down the worker's own pipe, so everything sent before
+    a hard crash still reaches the parent.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    with factory() as runner:
+        completed = 0
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            index, recipe, values = task
+            results.send(("start", index, None))
+            results.send(("done", index, _encode_outcome(lambda: runner(recipe, values))))
+            completed += 1
+            if (max_cases is not None and completed >= max_cases) or (
+                memory_limit_bytes is not None and _resident_bytes() > memory_limit_bytes
+            ):
+                results.send(("retire", None, None))
+                return
+
+
+class RecipeMatrixProcessPool:
+    # [impl->req~ring5.automation.batch-matrices~1]
+    """Run recipe cases in recycled worker processes and yield them in order."""
+
+    def __init__(
+        self,
+        factory: RecipeWorkerFactory,
+        workers: int,
+        *,
+        max_cases_per_worker: int | None = None,
+        memory_limit_mb: int | None = None,
+    ) -> None:
+        for name, value in (
+            ("max_cases_per_worker", max_cases_per_worker),
+            ("memory_limit_mb", memory_limit_mb),
+        ):
+            if value is None:
+                continue
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise TypeError(f"Analysis recipe matrix {name} must be an integer.")
+            if value < 1:
+                raise ValueError(f"Analysis recipe matrix {name} must be positive.")
+        try:
+            pickle.dumps(factory)
+        except (pickle.PicklingError, AttributeError, TypeError) as exc:
+            raise TypeError(
+                "Analysis recipe matrix worker factory must be picklable for process execution."
+            ) from exc
+        self.factory = factory
+        self.workers = workers
+        self.max_cases_per_worker = max_cases_per_worker
+        self.memory_limit_mb = memory_limit_mb
+
+    def run(
+        self,
+        cases: Sequence[tuple[AnalysisRecipe, Mapping[str, RecipeScalar]]],
+    ) -> Generator[Future[AnalysisRecipeRunResult], None, None]:
+        """Yield one settled future per case, in ``cases`` order.
+
+        Workers are stopped when the iterator is exhausted or closed early.
+        """
+        if not cases:
+            return
+        context = multiprocessing.get_context("spawn")
+        tasks = context.Queue()
+        for index, (recipe, values) in enumerate(cases):
+            tasks.put((index, recipe, dict(values)))
+        memory_limit_bytes = (
+            None if self.memory_limit_mb is None else self.memory_limit_mb * 1024 * 1024
+        )
+        worker_ids = count()
+        workers: dict[int, tuple[BaseProcess, Connection]] = {}
+        in_flight: dict[int, int] = {}
+        retiring: set[int] = set()
+        productive: set[int] = set()
+        started: set[int] = set()
+        settled: dict[int, Future[AnalysisRecipeRunResult]] = {}
+        startup_failures = 0
+
+        def spawn() -> None:
+            worker_id = next(worker_ids)
+            reader, writer = context.Pipe(duplex=False)
+            process = context.Process(
+                target=_worker_main,
+                args=(
+                    self.factory,
+                    tasks,
+                    writer,
+                    self.max_cases_per_worker,
+                    memory_limit_bytes,
+                ),
+                name=f"ring5-recipe-matrix-{worker_id}",
+                daemon=True,
+            )
+            process.start()
+            writer.close()  # The worker now holds the only write end; EOF means it exited.
+            workers[worker_id] = (process, reader)
+
+        def settle(index: int, succeeded: bool, value: Any) -> None:
+            future: Future[AnalysisRecipeRunResult] = Future()
+            if succeeded:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+            settled[index] = future
+
+        def handle(worker_id: int, message: tuple[str, int | None, bytes | None]) -> None:
+            kind, index, payload = message
+            if kind == "start" and index is not None:
+                started.add(index)
+                productive.add(worker_id)
+                in_flight[worker_id] = index
+            elif kind == "done" and index is not None and payload is not None:
+                in_flight.pop(worker_id, None)
+                settle(index, *pickle.loads(payload))
+            elif kind == "retire":
+                retiring.add(worker_id)
+
+        def finish(worker_id: int) -> None:
+            nonlocal startup_failures
+            process, reader = workers.pop(worker_id)
+            reader.close()
+            process.join()
+            index = in_flight.pop(worker_id, None)
+            if index is not None:
+                logger.warning("Recipe matrix worker %d died running case %d", worker_id, index)
+                settle(
+                    index,
+                    False,
+                    RuntimeError(
+                        f"Recipe matrix worker exited unexpectedly (exit code {process.exitcode})."
+                    ),
+                )
+            elif worker_id not in productive and process.exitcode != 0:
+                startup_failures += 1
+                logger.warning(
+                    "Recipe matrix worker %d exited before running a case (exit code %s)",
+                    worker_id,
+                    process.exitcode,
+                )
+            # A retired or crashed worker never consumed its sentinel, so its
+            # replacement inherits it and the sentinel count stays balanced.
+            # Workers that keep dying before their first case are not replaced.
+            crashed = process.exitcode != 0
+            if (
+                (worker_id in retiring or crashed)
+                and len(started) < len(cases)
+                and startup_failures < self.workers
+            ):
+                spawn()
+            retiring.discard(worker_id)
+            if not workers:
+                for lost in range(len(cases)):
+                    if lost not in settled:
+                        settle(lost, False, RuntimeError("Recipe matrix worker pool stopped."))
+
+        def pump() -> None:
+            readers = {reader: worker_id for worker_id, (_process, reader) in workers.items()}
+            for reader in wait(list(readers), timeout=_POLL_SECONDS):
+                worker_id = readers[cast(Connection, reader)]
+                try:
+                    handle(worker_id, cast(Connection, reader).recv())
+                except EOFError:
+                    finish(worker_id)
+
+        finished = False
+        try:
+            for _ in range(min(self.workers, len(cases))):
+                spawn()
+            for _ in range(len(workers)):
+                tasks.put(None)
+            for index in range(len(cases)):
+                while index not in settled:
+                    pump()
+                yield settled.pop(index)
+            finished = True
+        finally:
+            # After a full run the remaining workers drain their sentinels and
+            # close their sessions; an abandoned run stops them immediately.
+            for process, reader in workers.values():
+                if finished:
+                    process.join(timeout=_SHUTDOWN_SECONDS)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+                reader.close()
+            tasks.cancel_join_thread()
@@ -4,15 +4,19 @@ from __future__ import annotations
 
 import hashlib
 import json
-from collections.abc import Callable, Mapping, Sequence
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, replace
 from itertools import product
 from pathlib import Path
+from typing import Any, TypeVar, cast
 
 from src.core.common.security_limits import (
     MAX_ANALYSIS_RECIPE_PARAMETERS,
     MAX_ANALYSIS_RECIPE_MATRIX_CASES,
+    MAX_ANALYSIS_RECIPE_MATRIX_PROCESSES,
     MAX_ANALYSIS_RECIPE_MATRIX_WORKERS,
     MAX_ANALYSIS_RECIPE_STRING_LENGTH,
     MAX_BACKGROUND_JOB_ERROR_LENGTH,
@@ -26,10 +30,182 @@ from src.core.models import (
     RecipeExport,
     RecipeScalar,
 )
+from src.core.services.analysis_recipe_matrix_pool import (
+    RecipeMatrixProcessPool,
+    RecipeWorkerFactory,
+)
 from src.core.services.data_services.analysis_recipe_service import AnalysisRecipeService
 
 RecipeMatrix = Mapping[str, Sequence[RecipeScalar]]
 RecipeRunner = Callable[[AnalysisRecipe, Mapping[str, RecipeScalar]], AnalysisRecipeRunResult]
+RecipeCaseCallback = Callable[[AnalysisRecipeMatrixCase], None]
+StagedRecipeRunner = Callable[
+    [AnalysisRecipe, Mapping[str, RecipeScalar], "RecipeStageContext"],
+    AnalysisRecipeRunResult,
+]
+
+_T = TypeVar("_T")
+_STAGE_KINDS = ("source", "dataset", "plot", "artifact")
+
+
+def _stage_key(kind: str, *parts: object) -> str:
+    """Return a content key for one stage from its kind and canonical inputs."""
+    encoded = json.dumps(
+        [kind, *parts], ensure_ascii=True, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class RecipeCaseStages:
+    # [impl->req~ring5.automation.batch-matrices~1]
+    """Content keys of one materialized case's stage DAG.
+
+    ``source`` (load or parse) feeds ``dataset`` (dataset-wide shapers), which
+    feeds one ``plots`` entry per recipe plot (per-plot shapers and mapping
+    validation), which feeds one ``artifacts`` entry per export (render and
+    encode). Writing the encoded bytes to the case's own path is the only step
+    that is never shared. Keys hash every materialized input of a stage plus
+    its upstream key, so equal keys mean equal results.
+    """
+
+    source: str
+    dataset: str
+    plots: tuple[str, ...]
+    artifacts: tuple[str, ...]
+
+    @classmethod
+    def for_recipe(cls, recipe: AnalysisRecipe) -> RecipeCaseStages:
+        """Derive the stage keys of a materialized recipe."""
+        source = recipe.source
+        source_key = _stage_key(
+            "source",
+            source.kind,
+            source.path,
+            source.pattern,
+            source.strategy,
+            list(source.variables),
+            list(source.scanned_variables),
+            source.scan_limit,
+            source.strict,
+        )
+        dataset_key = _stage_key("dataset", source_key, list(recipe.transformations))
+        plot_keys: dict[str, str] = {}
+        for plot in recipe.plots:
+            plot_keys[plot.name] = _stage_key(
+                "plot", dataset_key, plot.plot_type, dict(plot.config), list(plot.pipeline)
+            )
+        artifacts = tuple(
+            _stage_key(
+                "artifact",
+                plot_keys.get(export.plot),
+                export.plot,
+                export.engine,
+                export.format,
+                export.deterministic,
+            )
+            for export in recipe.exports
+        )
+        return cls(
+            source=source_key,
+            dataset=dataset_key,
+            plots=tuple(plot_keys[plot.name] for plot in recipe.plots),
+            artifacts=artifacts,
+        )
+
+    def keys(self) -> tuple[str, ...]:
+        """Return every stage key of the case, upstream first."""
+        return (self.source, self.dataset, *self.plots, *self.artifacts)
+
+
+class RecipeStageCache:
+    # [impl->req~ring5.automation.batch-matrices~1]
+    """Run-once stage results shared read-only between matrix cases.
+
+    The first case to request a key computes it; concurrent requests for the
+    same key wait for that result (or its exception) instead of recomputing.
+    When ``consumers`` gives the number of cases that use a key, the entry is
+    released after its last consumer has read it.
+    """
+
+    def __init__(self, consumers: Mapping[str, int] | None = None) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, Future[Any]] = {}
+        self._remaining = dict(consumers or {})
+        self._computed: Counter[str] = Counter()
+        self._reused: Counter[str] = Counter()
+
+    def run(self, kind: str, key: str, compute: Callable[[], _T]) -> _T:
+        """Return the stage result for ``key``, computing it at most once."""
+        with self._lock:
+            entry = self._entries.get(key)
+            owner = entry is None
+            if entry is None:
+                entry = Future()
+                self._entries[key] = entry
+                self._computed[kind] += 1
+            else:
+                self._reused[kind] += 1
+        if owner:
+            try:
+                entry.set_result(compute())
+            except BaseException as exc:
+                entry.set_exception(exc)
+        try:
+            return cast(_T, entry.result())
+        finally:
+            self._release(key)
+
+    def contains(self, key: str) -> bool:
+        """Return whether ``key`` has been computed or is being computed."""
+        with self._lock:
+            return key in self._entries
+
+    def _release(self, key: str) -> None:
+        with self._lock:
+            if key not in self._remaining:
+                return
+            self._remaining[key] -= 1
+            if self._remaining[key] <= 0:
+                del self._remaining[key]
+                self._entries.pop(key, None)
+
+    def usage(self) -> tuple[tuple[str, int, int], ...]:
+        """Return ``(stage kind, executions, reuses)`` in DAG order."""
+        with self._lock:
+            return tuple(
+                (kind, self._computed[kind], self._reused[kind])
+                for kind in _STAGE_KINDS
+                if self._computed[kind] or self._reused[kind]
+            )
+
+
+@dataclass(frozen=True)
+class RecipeStageContext:
+    """One case's handle on the shared stage DAG, passed to staged runners."""
+
+    stages: RecipeCaseStages
+    cache: RecipeStageCache
+
+    def source(self, compute: Callable[[], _T]) -> _T:
+        """Load or parse the recipe source once per distinct source."""
+        return self.cache.run("source", self.stages.source, compute)
+
+    def dataset(self, compute: Callable[[], _T]) -> _T:
+        """Apply dataset-wide shapers once per distinct source and pipeline."""
+        return self.cache.run("dataset", self.stages.dataset, compute)
+
+    def plot(self, index: int, compute: Callable[[], _T]) -> _T:
+        """Shape and validate recipe plot ``index`` once per distinct input."""
+        return self.cache.run("plot", self.stages.plots[index], compute)
+
+    def artifact(self, index: int, compute: Callable[[], _T]) -> _T:
+        """Render and encode recipe export ``index`` once per distinct input."""
+        return self.cache.run("artifact", self.stages.artifacts[index], compute)
+
+    def has_artifact(self, index: int) -> bool:
+        """Return whether export ``index`` is already encoded (or in flight) for another case."""
+        return self.cache.contains(self.stages.artifacts[index])
 
 
 @dataclass(frozen=True)
@@ -48,11 +224,19 @@ class AnalysisRecipeMatrixService:
         recipe: AnalysisRecipe,
         matrix: RecipeMatrix,
         output_directory: str,
-        runner: RecipeRunner,
+        runner: RecipeRunner | StagedRecipeRunner,
         *,
         max_workers: int = 2,
+        share_stages: bool = False,
+        on_case: RecipeCaseCallback | None = None,
     ) -> AnalysisRecipeMatrixResult:
-        """Execute prepared cases concurrently and return them in stable order."""
+        """Execute prepared cases concurrently and return them in stable order.
+
+        With ``share_stages``, ``runner`` is a :data:`StagedRecipeRunner` and
+        receives each case's :class:`RecipeStageContext`; stages whose
+        materialized inputs are identical across cases run once. ``on_case``
+        receives each settled case in recipe order while later cases run.
+        """
         # [impl->req~ring5.automation.batch-matrices~1]
         prepared = AnalysisRecipeMatrixService.prepare(
             recipe,
@@ -63,18 +247,78 @@ class AnalysisRecipeMatrixService:
         if not callable(runner):
             raise TypeError("Analysis recipe matrix runner must be callable.")
         worker_count = min(max_workers, len(prepared))
+        cache: RecipeStageCache | None = None
+        contexts: list[RecipeStageContext] = []
+        if share_stages:
+            stages = [RecipeCaseStages.for_recipe(case.recipe) for case in prepared]
+            cache = RecipeStageCache(Counter(key for case in stages for key in case.keys()))
+            contexts = [RecipeStageContext(case, cache) for case in stages]
         with ThreadPoolExecutor(
             max_workers=worker_count,
             thread_name_prefix="ring5-recipe-matrix",
         ) as executor:
             futures: list[Future[AnalysisRecipeRunResult]] = [
-                executor.submit(runner, case.recipe, dict(case.parameter_values))
-                for case in prepared
+                (
+                    executor.submit(
+                        cast(StagedRecipeRunner, runner),
+                        case.recipe,
+                        dict(case.parameter_values),
+                        contexts[index],
+                    )
+                    if cache is not None
+                    else executor.submit(
+                        cast(RecipeRunner, runner), case.recipe, dict(case.parameter_values)
+                    )
+                )
+                for index, case in enumerate(prepared)
             ]
-            cases = tuple(
-                AnalysisRecipeMatrixService._settle(case, future)
-                for case, future in zip(prepared, futures, strict=True)
-            )
+            cases = AnalysisRecipeMatrixService._collect(prepared, futures, on_case)
+        return AnalysisRecipeMatrixResult(
+            recipe_name=recipe.name,
+            output_directory=output_directory,
+            max_workers=worker_count,
+            cases=cases,
+            stages=cache.usage() if cache is not None else (),
+        )
+
+    @staticmethod
+    def execute_in_processes(
+        recipe: AnalysisRecipe,
+        matrix: RecipeMatrix,
+        output_directory: str,
+        worker_factory: RecipeWorkerFactory,
+        *,
+        max_workers: int = 2,
+        max_cases_per_worker: int | None = None,
+        memory_limit_mb: int | None = None,
+        on_case: RecipeCaseCallback | None = None,
+    ) -> AnalysisRecipeMatrixResult:
+        """Execute prepared cases in recycled worker processes, in stable order.
+
+        ``worker_factory`` must be picklable; each worker enters it once and
+        runs its cases through the yielded runner. Stages are not shared
+        across processes.
+        """
+        # [impl->req~ring5.automation.batch-matrices~1]
+        prepared = AnalysisRecipeMatrixService.prepare(
+            recipe,
+            matrix,
+            output_directory,
+            max_workers=max_workers,
+            worker_limit=MAX_ANALYSIS_RECIPE_MATRIX_PROCESSES,
+        )
+        worker_count = min(max_workers, len(prepared))
+        pool = RecipeMatrixProcessPool(
+            worker_factory,
+            worker_count,
+            max_cases_per_worker=max_cases_per_worker,
+            memory_limit_mb=memory_limit_mb,
+        )
+        futures = pool.run([(case.recipe, dict(case.parameter_values)) for case in prepared])
+        try:
+            cases = AnalysisRecipeMatrixService._collect(prepared, futures, on_case)
+        finally:
+            futures.close()
         return AnalysisRecipeMatrixResult(
             recipe_name=recipe.name,
             output_directory=output_directory,
@@ -89,10 +333,11 @@ class AnalysisRecipeMatrixService:
         output_directory: str,
         *,
         max_workers: int = 2,
+        worker_limit: int = MAX_ANALYSIS_RECIPE_MATRIX_WORKERS,
     ) -> tuple[_PreparedCase, ...]:
         """Validate and materialize collision-free cases without executing them."""
         AnalysisRecipeService.validate(recipe)
-        AnalysisRecipeMatrixService._validate_workers(max_workers)
+        AnalysisRecipeMatrixService._validate_workers(max_workers, worker_limit)
         root = AnalysisRecipeMatrixService._validate_output_directory(output_directory)
         dimensions = AnalysisRecipeMatrixService._validate_matrix(recipe, matrix)
         combinations = product(*(values for _name, values in dimensions))
@@ -186,14 +431,11 @@ class AnalysisRecipeMatrixService:
         return count
 
     @staticmethod
-    def _validate_workers(max_workers: int) -> None:
+    def _validate_workers(max_workers: int, limit: int) -> None:
         if isinstance(max_workers, bool) or not isinstance(max_workers, int):
             raise TypeError("Analysis recipe matrix max_workers must be an integer.")
-        if not 1 <= max_workers <= MAX_ANALYSIS_RECIPE_MATRIX_WORKERS:
-            raise ValueError(
-                "Analysis recipe matrix max_workers must be between 1 and "
-                f"{MAX_ANALYSIS_RECIPE_MATRIX_WORKERS}."
-            )
+        if not 1 <= max_workers <= limit:
+            raise ValueError(f"Analysis recipe matrix max_workers must be between 1 and {limit}.")
 
     @staticmethod
     def _validate_output_directory(output_directory: str) -> Path:
@@ -231,6 +473,20 @@ class AnalysisRecipeMatrixService:
             rewritten.append(replace(export, path=str(case_directory / filename)))
         return tuple(rewritten)
 
+    @staticmethod
+    def _collect(
+        prepared: Sequence[_PreparedCase],
+        futures: Iterable[Future[AnalysisRecipeRunResult]],
+        on_case: RecipeCaseCallback | None,
+    ) -> tuple[AnalysisRecipeMatrixCase, ...]:
+        cases: list[AnalysisRecipeMatrixCase] = []
+        for case, future in zip(prepared, futures, strict=True):
+            settled = AnalysisRecipeMatrixService._settle(case, future)
+            if on_case is not None:
+                on_case(settled)
+            cases.append(settled)
+        return tuple(cases)
+
     @staticmethod
     def _settle(
         case: _PreparedCase,
@@ -1,4 +1,11 @@
-"""Owner-isolated bounded local drafts using the verified portfolio format."""
+"""Owner-isolated bounded local drafts using the verified portfolio format.
+
+Draft documents are small and self-contained, so any one draft restores even
+after its neighbours are pruned.  Snapshot tables are kept beside the drafts in
+one content-addressed frame store that every draft and owner shares; a table
+is written only the first time its fingerprint appears and is removed once no
+remaining draft refers to it.
+"""
 
 from __future__ import annotations
 
@@ -9,9 +16,10 @@ import re
 import tempfile
 import threading
 import time
-from collections.abc import Callable
+import weakref
+from collections.abc import Callable, Mapping
 from datetime import datetime, timezone
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Any, cast
 
 import pandas as pd
@@ -28,11 +36,15 @@ from src.core.common.utils import validate_path_within
 from src.core.models import PlotProtocol, PortfolioData, RecoveryDraftCapture, RecoveryDraftInfo
 from src.core.services.data_services.path_service import PathService
 from src.core.services.data_services.portfolio_service import PortfolioService
+from src.core.services.portfolio_container import PortfolioContainer, PortfolioFrameWriter
 from src.core.services.portfolio_integrity_service import PortfolioIntegrityService
 from src.core.services.portfolio_migrator import PortfolioMigrator
 from src.core.state.state_manager import StateManager
 
 _DRAFT_ID = re.compile(r"^[0-9]{20}-[0-9a-f]{64}$")
+_FRAME_STORE = "frames"
+_FRAME_BLOB = re.compile(r"^[0-9a-f]{64}\.ring5-snapshot$")
+_FRAME_SUFFIX = ".ring5-snapshot"
 _DEFAULT_PARSE_VARIABLES = (
     ("simTicks", "scalar"),
     ("benchmark_name", "configuration"),
@@ -44,6 +56,10 @@ class AutosaveRecoveryService:
     """Capture and restore private, deduplicated, bounded workspace drafts."""
 
     _lock = threading.RLock()
+    # Last captured change marker and draft per state manager and owner.
+    _captured: weakref.WeakKeyDictionary[object, dict[str, tuple[tuple[int, str], str]]] = (
+        weakref.WeakKeyDictionary()
+    )
 
     @classmethod
     def capture(
@@ -55,40 +71,75 @@ class AutosaveRecoveryService:
             Callable[[dict[str, Any], str], dict[str, Any] | None]
         ) = None,
     ) -> RecoveryDraftCapture | None:
-        """Capture meaningful state unless its content matches the newest draft."""
+        """Capture meaningful state unless its content matches the newest draft.
+
+        A state manager whose ``state_version`` and plot change tokens have not
+        moved since its last capture for *owner_key* is not serialized again.
+        """
         # [impl->req~ring5.workspace.autosave-recovery~1]
         owner = cls._owner(owner_key)
+        marker = cls._change_marker(state_manager)
+        with cls._lock:
+            unchanged = cls._unchanged_draft(state_manager, owner, marker)
+            if unchanged is not None:
+                return RecoveryDraftCapture(cls._info(unchanged), created=False)
+            shared = cls._stored_frames()
         data = state_manager.get_data()
         plots = state_manager.get_plots()
         config = state_manager.get_config()
         parse_variables = state_manager.get_parse_variables()
         if not cls._meaningful(state_manager, data, plots, config, parse_variables):
             return None
-        payload = PortfolioService(state_manager).serialize_workspace(
-            data,
-            plots,
-            config,
-            state_manager.get_plot_counter(),
-            csv_path=state_manager.get_csv_path(),
-            parse_variables=parse_variables,
-            figure_spec_enricher=figure_spec_enricher,
-        )
-        if len(payload) > MAX_RECOVERY_DRAFT_BYTES:
-            raise ValueError(f"Recovery drafts are limited to {MAX_RECOVERY_DRAFT_BYTES:,} bytes.")
-        fingerprint = cls._workspace_fingerprint(payload)
+
+        def serialize(stored: set[str]) -> tuple[bytes, Mapping[str, bytes]]:
+            writer = PortfolioFrameWriter(shared=stored)
+            payload = PortfolioService(state_manager).serialize_workspace(
+                data,
+                plots,
+                config,
+                state_manager.get_plot_counter(),
+                csv_path=state_manager.get_csv_path(),
+                parse_variables=parse_variables,
+                figure_spec_enricher=figure_spec_enricher,
+                frame_writer=writer,
+            )
+            detached = writer.detached()
+            size = len(payload) + sum(len(blob) for blob in detached.values())
+            if size > MAX_RECOVERY_DRAFT_BYTES:
+                raise ValueError(
+                    f"Recovery drafts are limited to {MAX_RECOVERY_DRAFT_BYTES:,} bytes."
+                )
+            return payload, detached
+
+        payload, detached = serialize(shared)
         with cls._lock:
+            current = cls._stored_frames()
+            if not shared <= current:
+                # A concurrent prune collected a table this draft was going to share.
+                payload, detached = serialize(current)
+            fingerprint = cls._workspace_fingerprint(payload)
             directory = cls._owner_directory(owner, create=True)
             existing = cls._files(directory)
             if existing and existing[-1].stem.endswith(fingerprint):
-                cls._prune(directory)
+                if cls._prune(directory):
+                    cls._collect_frames()
+                cls._remember(state_manager, owner, marker, existing[-1].stem)
                 return RecoveryDraftCapture(cls._info(existing[-1]), created=False)
+            store = cls._frame_store(create=True)
+            for member, blob in detached.items():
+                blob_path = cls._blob_path(store, PurePosixPath(member).name)
+                if not blob_path.exists():
+                    cls._atomic_write(blob_path, blob)
             draft_id = f"{time.time_ns():020d}-{fingerprint}"
             path = cls._draft_path(directory, draft_id)
             cls._atomic_write(path, payload)
-            cls._prune(directory)
-            cls._prune_global()
+            pruned = cls._prune(directory)
+            pruned = cls._prune_global() or pruned
+            if pruned:
+                cls._collect_frames()
             if not path.exists():
                 raise OSError("The new recovery draft could not be retained within global limits.")
+            cls._remember(state_manager, owner, marker, draft_id)
             return RecoveryDraftCapture(cls._info(path), created=True)
 
     @classmethod
@@ -116,15 +167,19 @@ class AutosaveRecoveryService:
             if path.stat().st_size > MAX_RECOVERY_DRAFT_BYTES:
                 raise ValueError("Recovery draft exceeds its safe local size limit.")
             raw = path.read_bytes()
-        try:
-            value = json.loads(raw.decode("utf-8"))
-        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
-            raise ValueError("Recovery draft is not valid UTF-8 portfolio JSON.") from exc
-        if not isinstance(value, dict):
-            raise ValueError("Recovery draft must contain one portfolio object.")
+            try:
+                value = PortfolioContainer.read_document(raw)
+            except ValueError as exc:
+                raise ValueError("Recovery draft is not a readable portfolio.") from exc
+            # Read shared tables now; a later prune may collect them from the store.
+            detached = cls._read_frames(value)
         report = PortfolioIntegrityService.verify(value)
         PortfolioIntegrityService.require_restorable(report)
-        return cast(PortfolioData, PortfolioMigrator.migrate(value))
+        migrated = PortfolioMigrator.migrate(value)
+        return cast(
+            PortfolioData,
+            PortfolioContainer.attach_frames(migrated, raw, detached=detached),
+        )
 
     @classmethod
     def delete(cls, owner_key: str, draft_id: str) -> None:
@@ -140,6 +195,59 @@ class AutosaveRecoveryService:
             path.unlink()
             if directory.exists() and not any(directory.iterdir()):
                 directory.rmdir()
+            cls._collect_frames()
+
+    @classmethod
+    def _change_marker(cls, state_manager: StateManager) -> tuple[int, str] | None:
+        """Return a cheap signature of the workspace, or ``None`` when untracked."""
+        version = state_manager.state_version()
+        if not isinstance(version, int):
+            return None
+        # Plots are edited in place, so their settings and data tokens join the marker.
+        signature: list[Any] = []
+        for plot in state_manager.get_plots():
+            data_version = getattr(plot, "data_version", None)
+            if not isinstance(data_version, int):
+                return None
+            signature.append([plot.to_dict(include_data=False), data_version])
+        try:
+            canonical = json.dumps(signature, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        return version, hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _unchanged_draft(
+        cls,
+        state_manager: StateManager,
+        owner: str,
+        marker: tuple[int, str] | None,
+    ) -> Path | None:
+        if marker is None:
+            return None
+        try:
+            remembered = cls._captured.get(state_manager, {}).get(owner)
+        except TypeError:
+            return None
+        if remembered is None or remembered[0] != marker:
+            return None
+        path = cls._draft_path(cls._owner_directory(owner, create=False), remembered[1])
+        return path if path.is_file() and not path.is_symlink() else None
+
+    @classmethod
+    def _remember(
+        cls,
+        state_manager: StateManager,
+        owner: str,
+        marker: tuple[int, str] | None,
+        draft_id: str,
+    ) -> None:
+        if marker is None:
+            return
+        try:
+            cls._captured.setdefault(state_manager, {})[owner] = (marker, draft_id)
+        except TypeError:
+            pass
 
     @staticmethod
     def _meaningful(
@@ -188,10 +296,8 @@ class AutosaveRecoveryService:
 
     @staticmethod
     def _workspace_fingerprint(payload: bytes) -> str:
-        value = json.loads(payload.decode("utf-8"))
-        if not isinstance(value, dict):
-            raise ValueError("Serialized recovery workspace must be a portfolio object.")
-        content = dict(value)
+        # Frames are content-addressed, so the document alone identifies the workspace.
+        content = dict(PortfolioContainer.read_document(payload))
         content.pop("timestamp", None)
         content.pop("environment_metadata", None)
         content.pop("integrity_manifest", None)
@@ -263,33 +369,133 @@ class AutosaveRecoveryService:
             temporary.unlink(missing_ok=True)
 
     @classmethod
-    def _prune(cls, directory: Path) -> None:
+    def _prune(cls, directory: Path) -> bool:
+        # Shared frames belong to no single owner, so only draft documents count here.
         files = cls._files(directory)
         total = sum(path.stat().st_size for path in files)
+        pruned = False
         while files and (
             len(files) > MAX_RECOVERY_DRAFTS_PER_OWNER or total > MAX_RECOVERY_OWNER_BYTES
         ):
             oldest = files.pop(0)
             total -= oldest.stat().st_size
             oldest.unlink()
+            pruned = True
+        return pruned
 
     @classmethod
-    def _prune_global(cls) -> None:
-        root = PathService.get_recovery_drafts_dir()
-        files: list[Path] = []
-        for directory in root.iterdir():
-            if directory.is_symlink():
-                raise ValueError("Recovery owner storage must not be a symbolic link.")
-            if directory.is_dir():
-                files.extend(cls._files(directory))
+    def _prune_global(cls) -> bool:
+        files = cls._all_files()
         files.sort(key=lambda path: (path.stat().st_mtime_ns, path.name))
-        total = sum(path.stat().st_size for path in files)
+        drafts = sum(path.stat().st_size for path in files)
+        frames = cls._frame_bytes()
+        pruned = False
         while files and (
-            len(files) > MAX_RECOVERY_DRAFTS_GLOBAL or total > MAX_RECOVERY_TOTAL_BYTES
+            len(files) > MAX_RECOVERY_DRAFTS_GLOBAL or drafts + frames > MAX_RECOVERY_TOTAL_BYTES
         ):
             oldest = files.pop(0)
-            total -= oldest.stat().st_size
+            drafts -= oldest.stat().st_size
             parent = oldest.parent
             oldest.unlink()
+            pruned = True
             if not any(parent.iterdir()):
                 parent.rmdir()
+            if drafts + frames > MAX_RECOVERY_TOTAL_BYTES:
+                # Tables are freed only once no remaining draft refers to them.
+                cls._collect_frames()
+                frames = cls._frame_bytes()
+        return pruned
+
+    @classmethod
+    def _all_files(cls) -> list[Path]:
+        root = PathService.get_recovery_drafts_dir()
+        files: list[Path] = []
+        if not root.exists():
+            return files
+        for directory in root.iterdir():
+            if directory.name == _FRAME_STORE:
+                continue
+            if directory.is_symlink():
+                raise ValueError("Recovery owner storage must not be a symbolic link.")
+            if directory.is_dir():
+                files.extend(cls._files(directory))
+        return files
+
+    @classmethod
+    def _frame_store(cls, *, create: bool) -> Path:
+        root = PathService.get_recovery_drafts_dir()
+        if root.is_symlink():
+            raise ValueError("Recovery draft storage must not be a symbolic link.")
+        store = validate_path_within(root / _FRAME_STORE, root)
+        if store.is_symlink():
+            raise ValueError("Recovery frame storage must not be a symbolic link.")
+        if create:
+            store.mkdir(mode=0o700, parents=True, exist_ok=True)
+            os.chmod(store, 0o700)
+        return store
+
+    @staticmethod
+    def _blob_path(store: Path, name: str) -> Path:
+        if not _FRAME_BLOB.fullmatch(name):
+            raise ValueError("Recovery frame names have an invalid format.")
+        return validate_path_within(store / name, store)
+
+    @classmethod
+    def _blobs(cls) -> dict[str, Path]:
+        store = cls._frame_store(create=False)
+        blobs: dict[str, Path] = {}
+        if not store.is_dir():
+            return blobs
+        for path in store.glob(f"*{_FRAME_SUFFIX}"):
+            if not _FRAME_BLOB.fullmatch(path.name):
+                continue
+            if path.is_symlink():
+                raise ValueError("Recovery frames must not be symbolic links.")
+            if path.is_file():
+                blobs[path.name] = path
+        return blobs
+
+    @classmethod
+    def _stored_frames(cls) -> set[str]:
+        return {f"sha256:{name.removesuffix(_FRAME_SUFFIX)}" for name in cls._blobs()}
+
+    @classmethod
+    def _frame_bytes(cls) -> int:
+        return sum(path.stat().st_size for path in cls._blobs().values())
+
+    @staticmethod
+    def _frame_members(document: Mapping[str, Any]) -> set[str]:
+        frames = document.get("frames")
+        if not isinstance(frames, Mapping):
+            return set()
+        members = (entry.get("member") for entry in frames.values() if isinstance(entry, Mapping))
+        return {member for member in members if isinstance(member, str)}
+
+    @classmethod
+    def _read_frames(cls, document: Mapping[str, Any]) -> dict[str, bytes]:
+        blobs = cls._blobs()
+        payloads: dict[str, bytes] = {}
+        for member in cls._frame_members(document):
+            path = blobs.get(PurePosixPath(member).name)
+            if path is None:
+                continue
+            if path.stat().st_size > MAX_RECOVERY_DRAFT_BYTES:
+                raise ValueError("Recovery draft frame exceeds its safe local size limit.")
+            payloads[member] = path.read_bytes()
+        return payloads
+
+    @classmethod
+    def _collect_frames(cls) -> None:
+        blobs = cls._blobs()
+        if not blobs:
+            return
+        referenced: set[str] = set()
+        for path in cls._all_files():
+            try:
+                document = PortfolioContainer.read_document(path.read_bytes())
+            except (OSError, ValueError):
+                continue
+            referenced.update(PurePosixPath(member).name for member in cls._frame_members(document))
+        for name, path in blobs.items():
+            if name not in referenced:
+                path.unlink(missing_ok=True)
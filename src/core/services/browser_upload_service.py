@@ -31,6 +31,7 @@ from src.core.models.portfolio_models import PortfolioData
 from src.core.models.portfolio_bundle_models import PortfolioBundleContents
 from src.core.services.import_preview_service import ImportPreviewService
 from src.core.services.portfolio_migrator import PortfolioMigrator
+from src.core.services.portfolio_container import PortfolioContainer
 from src.core.services.portfolio_integrity_service import PortfolioIntegrityService
 from src.core.services.portfolio_bundle_service import PortfolioBundleService
 
@@ -248,6 +249,13 @@ def _validate_csv_table(content: bytes, encoding: str, delimiter: str, header_ro
         raise ValueError(f"CSV upload parsing failed near line {reader.line_num}: {exc}.") from exc
 
 
+def _parse_json_upload(content: bytes) -> Any:
+    """Decode a ``.json`` upload, reading saved portfolio containers by content."""
+    if PortfolioContainer.is_container(content):
+        return PortfolioContainer.read_document(content)
+    return _parse_json(content)
+
+
 def _portfolio(
     value: Any,
     *,
@@ -341,7 +349,9 @@ class BrowserUploadService:
                 f"Browser upload exceeds the {MAX_BROWSER_UPLOAD_BYTES // (1024 * 1024)} MiB limit."
             )
 
-        json_value = _parse_json(content) if Path(clean_name).suffix.lower() == ".json" else None
+        json_value = (
+            _parse_json_upload(content) if Path(clean_name).suffix.lower() == ".json" else None
+        )
         kind = _kind(clean_name, json_value, request)
         normalized_media = content_type.partition(";")[0].strip().lower()
         if normalized_media not in _MEDIA_TYPES[kind]:
@@ -378,7 +388,7 @@ class BrowserUploadService:
                 source_path=str(source.resolve()),
                 portfolio_schema_version=int(portfolio["schema_version"]),
                 portfolio_plot_count=len(portfolio.get("plots", [])),
-                portfolio_has_data=bool(portfolio.get("data_csv")),
+                portfolio_has_data=bool(portfolio.get("data_csv") or portfolio.get("data_ref")),
                 portfolio_integrity_status=integrity.status,
                 portfolio_signing_key_id=integrity.key_id,
             )
@@ -432,14 +442,12 @@ class BrowserUploadService:
         content = Path(upload.source_path).read_bytes()
         if hashlib.sha256(content).hexdigest() != upload.source_sha256:
             raise ValueError("Uploaded portfolio changed after validation; upload it again.")
-        return cast(
-            PortfolioData,
-            _portfolio(
-                _parse_json(content),
-                signing_key=signing_key,
-                require_signature=require_signature,
-            ),
+        portfolio = _portfolio(
+            _parse_json_upload(content),
+            signing_key=signing_key,
+            require_signature=require_signature,
         )
+        return cast(PortfolioData, PortfolioContainer.attach_frames(portfolio, content))
 
     @staticmethod
     def load_portfolio_bundle(
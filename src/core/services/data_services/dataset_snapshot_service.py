@@ -8,19 +8,23 @@ import json
 import logging
 import math
 import os
+import struct
 import tempfile
 from datetime import date, datetime, time, timezone
 from decimal import Decimal
 from io import BytesIO
 from pathlib import Path
 from typing import Any, cast
-from zipfile import ZIP_DEFLATED, BadZipFile, ZipFile
+from zipfile import ZIP64_LIMIT, ZIP_DEFLATED, ZIP_STORED, BadZipFile, ZipFile, ZipInfo
 
 import numpy as np
 import pandas as pd
 
 from src.core.common.utils import sanitize_filename, validate_path_within
-from src.core.common.security_limits import MAX_PORTFOLIO_BUNDLE_BYTES
+from src.core.common.security_limits import (
+    MAX_DATASET_SNAPSHOT_BYTES,
+    MAX_PORTFOLIO_BUNDLE_BYTES,
+)
 from src.core.models import DatasetSnapshotInfo
 from src.core.services.data_services.dataset_fingerprint import fingerprint_dataset
 from src.core.services.data_services.path_service import PathService
@@ -29,10 +33,19 @@ from src.core.services.managers.semantic_metadata_service import SemanticMetadat
 logger = logging.getLogger(__name__)
 
 _FORMAT = "ring5.dataset-snapshot"
-_FORMAT_VERSION = 1
+_FORMAT_VERSION = 2
+# Version 1 stored every cell in ``data.json``; it stays readable for older portfolios.
+_ROW_FORMAT_VERSION = 1
 _EXTENSION = ".ring5-snapshot"
 _MANIFEST_MEMBER = "manifest.json"
 _DATA_MEMBER = "data.json"
+_BUFFER_MEMBER = "columns.bin"
+_BUFFER_ALIGNMENT = 64
+# NumPy kinds stored as raw little-endian-or-native buffers: bool, ints, floats,
+# complex, timedelta64, and datetime64.
+_BUFFER_KINDS = frozenset("biufcmM")
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_PADDING_EXTRA_ID = 0xD935
 
 
 class DatasetSnapshotService:
@@ -59,46 +72,17 @@ class DatasetSnapshotService:
         source_dataset: str,
         overwrite: bool = False,
     ) -> DatasetSnapshotInfo:
-        """Atomically save an exact, non-executable dataframe snapshot."""
+        """Atomically save an exact, non-executable dataframe snapshot.
+
+        Columns are written whole into an uncompressed, memory-mappable buffer
+        member; the written archive is decoded again before it is published.
+        """
         # [impl->req~ring5.data.dataset-snapshots~1]
         resolved_name = cls._validate_name(name, "Snapshot")
         resolved_source = cls._validate_name(source_dataset, "Source dataset")
         if not isinstance(data, pd.DataFrame):
             raise TypeError("Dataset snapshots require a pandas DataFrame.")
 
-        frame_payload = cls._encode_frame(data)
-        payload_bytes = json.dumps(
-            frame_payload,
-            ensure_ascii=False,
-            allow_nan=False,
-            separators=(",", ":"),
-        ).encode("utf-8")
-        expected_fingerprint = fingerprint_dataset(data)
-        reconstructed = cls._decode_frame(frame_payload)
-        if fingerprint_dataset(reconstructed) != expected_fingerprint:
-            raise ValueError(
-                "This dataset contains labels, values, or dtypes that cannot be saved exactly "
-                "in the reusable snapshot format."
-            )
-
-        created_at = datetime.now(timezone.utc).isoformat()
-        manifest: dict[str, Any] = {
-            "format": _FORMAT,
-            "format_version": _FORMAT_VERSION,
-            "name": resolved_name,
-            "source_dataset": resolved_source,
-            "created_at": created_at,
-            "row_count": len(data),
-            "column_count": len(data.columns),
-            "fingerprint": expected_fingerprint,
-            "payload_sha256": hashlib.sha256(payload_bytes).hexdigest(),
-        }
-        manifest_bytes = json.dumps(
-            manifest,
-            ensure_ascii=False,
-            allow_nan=False,
-            indent=2,
-        ).encode("utf-8")
         destination = cls._snapshot_path(resolved_name)
         if destination.exists() and not overwrite:
             raise FileExistsError(f"Dataset snapshot {resolved_name!r} already exists.")
@@ -113,9 +97,7 @@ class DatasetSnapshotService:
                 delete=False,
             ) as temporary:
                 temporary_path = Path(temporary.name)
-            with ZipFile(temporary_path, "w", compression=ZIP_DEFLATED, compresslevel=6) as archive:
-                archive.writestr(_MANIFEST_MEMBER, manifest_bytes)
-                archive.writestr(_DATA_MEMBER, payload_bytes)
+            manifest = cls._write_archive(temporary_path, data, resolved_name, resolved_source)
             if overwrite:
                 os.replace(temporary_path, destination)
             else:
@@ -133,13 +115,119 @@ class DatasetSnapshotService:
         return cls._info_from_manifest(manifest, destination.stat().st_size)
 
     @classmethod
-    def load_snapshot(cls, name: str) -> tuple[DatasetSnapshotInfo, pd.DataFrame]:
-        """Load a snapshot only after payload and dataframe fingerprints verify."""
+    def load_snapshot(
+        cls, name: str, *, memory_map: bool = False
+    ) -> tuple[DatasetSnapshotInfo, pd.DataFrame]:
+        """Load a snapshot only after payload and dataframe fingerprints verify.
+
+        Args:
+            name: Saved snapshot name.
+            memory_map: Back buffer-encoded columns with a read-only mapping of
+                the snapshot file instead of reading them into memory. Without
+                it the frame owns writable columns.
+
+        Returns:
+            Verified snapshot metadata and the reconstructed dataframe.
+        """
         # [impl->req~ring5.data.dataset-snapshots~1]
         path = cls._snapshot_path(cls._validate_name(name, "Snapshot"))
         if not path.exists():
             raise FileNotFoundError(f"Dataset snapshot {name!r} does not exist.")
-        return cls._load_payload(path.read_bytes(), expected_name=name.strip())
+        return cls._read_file(path, expected_name=name.strip(), memory_map=memory_map)
+
+    @classmethod
+    def write_snapshot_file(
+        cls,
+        path: Path,
+        data: pd.DataFrame,
+        *,
+        name: str,
+        source_dataset: str,
+    ) -> DatasetSnapshotInfo:
+        """Write one verified snapshot archive to a caller-owned path.
+
+        Unlike :meth:`save_snapshot`, the archive is not published in the
+        snapshot catalog; callers such as the dataset revision store own its
+        location and lifetime.
+
+        Args:
+            path: Destination file; an existing file is replaced.
+            data: Dataframe to store.
+            name: Snapshot name recorded in the manifest.
+            source_dataset: Source dataset name recorded in the manifest.
+
+        Returns:
+            Metadata for the written archive.
+
+        Raises:
+            ValueError: The dataframe cannot be stored exactly.
+        """
+        resolved_name = cls._validate_name(name, "Snapshot")
+        resolved_source = cls._validate_name(source_dataset, "Source dataset")
+        if not isinstance(data, pd.DataFrame):
+            raise TypeError("Dataset snapshots require a pandas DataFrame.")
+        written = False
+        try:
+            manifest = cls._write_archive(path, data, resolved_name, resolved_source)
+            written = True
+        finally:
+            if not written:
+                path.unlink(missing_ok=True)
+        return cls._info_from_manifest(manifest, path.stat().st_size)
+
+    @classmethod
+    def read_snapshot_file(
+        cls, path: Path, *, memory_map: bool = False
+    ) -> tuple[DatasetSnapshotInfo, pd.DataFrame]:
+        """Load a caller-owned snapshot archive after full verification.
+
+        Args:
+            path: Archive written by :meth:`write_snapshot_file`.
+            memory_map: Back buffer-encoded columns with a read-only mapping.
+
+        Returns:
+            Verified snapshot metadata and the reconstructed dataframe.
+        """
+        return cls._read_file(path, expected_name=None, memory_map=memory_map)
+
+    @classmethod
+    def snapshot_bytes(cls, data: pd.DataFrame, *, name: str, source_dataset: str) -> bytes:
+        """Return one verified snapshot archive for embedding in another container.
+
+        Args:
+            data: Dataframe to store.
+            name: Snapshot name recorded in the manifest.
+            source_dataset: Source dataset name recorded in the manifest.
+
+        Returns:
+            Complete ``.ring5-snapshot`` archive bytes.
+
+        Raises:
+            ValueError: The dataframe cannot be stored exactly.
+        """
+        with tempfile.TemporaryDirectory(prefix="ring5-snapshot-") as directory:
+            path = Path(directory) / f"snapshot{_EXTENSION}"
+            cls.write_snapshot_file(path, data, name=name, source_dataset=source_dataset)
+            return path.read_bytes()
+
+    @classmethod
+    def read_snapshot_bytes(cls, payload: bytes) -> tuple[DatasetSnapshotInfo, pd.DataFrame]:
+        """Decode snapshot bytes embedded in another container after full verification.
+
+        Buffer-encoded columns are copied out of *payload*, so the frame is writable.
+
+        Args:
+            payload: Complete ``.ring5-snapshot`` archive bytes.
+
+        Returns:
+            Verified snapshot metadata and the reconstructed dataframe.
+        """
+        if not isinstance(payload, bytes) or not payload:
+            raise ValueError("Dataset snapshot payload must be non-empty bytes.")
+        manifest, data = cls._read_archive(payload, size_limit=MAX_DATASET_SNAPSHOT_BYTES)
+        if fingerprint_dataset(data) != manifest["fingerprint"]:
+            raise ValueError("Dataset snapshot failed fingerprint verification.")
+        return cls._info_from_manifest(manifest, len(payload)), data
 
     @classmethod
     def export_snapshot(cls, name: str) -> bytes:
@@ -171,6 +259,72 @@ class DatasetSnapshotService:
         info, _data = cls._load_payload(payload)
         return info
 
+    @classmethod
+    def _write_archive(
+        cls, path: Path, data: pd.DataFrame, name: str, source_dataset: str
+    ) -> dict[str, Any]:
+        """Write a snapshot archive to ``path`` and decode it again before returning."""
+        buffers = _ColumnBuffers()
+        frame_payload = cls._encode_columnar_frame(data, buffers)
+        frame_payload["buffer"] = {"size": buffers.size, "sha256": buffers.sha256()}
+        payload_bytes = json.dumps(
+            frame_payload,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        expected_fingerprint = fingerprint_dataset(data)
+        manifest: dict[str, Any] = {
+            "format": _FORMAT,
+            "format_version": _FORMAT_VERSION,
+            "name": name,
+            "source_dataset": source_dataset,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "row_count": len(data),
+            "column_count": len(data.columns),
+            "fingerprint": expected_fingerprint,
+            "payload_sha256": hashlib.sha256(payload_bytes).hexdigest(),
+        }
+        manifest_bytes = json.dumps(
+            manifest,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=2,
+        ).encode("utf-8")
+        with ZipFile(path, "w", compression=ZIP_DEFLATED, compresslevel=6) as archive:
+            # The buffer goes first so its data offset, and thus alignment, is known.
+            buffers.write_to(archive)
+            archive.writestr(_MANIFEST_MEMBER, manifest_bytes)
+            archive.writestr(_DATA_MEMBER, payload_bytes)
+        _manifest, reconstructed = cls._read_archive(
+            path,
+            size_limit=MAX_DATASET_SNAPSHOT_BYTES,
+            memory_map=True,
+        )
+        exact = fingerprint_dataset(reconstructed) == expected_fingerprint
+        # Release the mapping before the file is linked or replaced.
+        del reconstructed
+        if not exact:
+            raise ValueError(
+                "This dataset contains labels, values, or dtypes that cannot be saved exactly "
+                "in the reusable snapshot format."
+            )
+        return manifest
+
+    @classmethod
+    def _read_file(
+        cls, path: Path, *, expected_name: str | None, memory_map: bool
+    ) -> tuple[DatasetSnapshotInfo, pd.DataFrame]:
+        manifest, data = cls._read_archive(
+            path,
+            size_limit=MAX_DATASET_SNAPSHOT_BYTES,
+            expected_name=expected_name,
+            memory_map=memory_map,
+        )
+        if fingerprint_dataset(data) != manifest["fingerprint"]:
+            raise ValueError("Dataset snapshot failed fingerprint verification.")
+        return cls._info_from_manifest(manifest, path.stat().st_size), data
+
     @classmethod
     def _load_payload(
         cls,
@@ -183,22 +337,55 @@ class DatasetSnapshotService:
             raise ValueError("Dataset snapshot payload must be non-empty bytes.")
         if len(payload) > MAX_PORTFOLIO_BUNDLE_BYTES:
             raise ValueError("Dataset snapshot exceeds the portable bundle size limit.")
+        manifest, data = cls._read_archive(
+            payload,
+            size_limit=MAX_PORTFOLIO_BUNDLE_BYTES,
+            expected_name=expected_name,
+        )
+        if fingerprint_dataset(data) != manifest["fingerprint"]:
+            raise ValueError("Dataset snapshot failed fingerprint verification.")
+        return cls._info_from_manifest(manifest, len(payload)), data
+
+    @classmethod
+    def _read_archive(
+        cls,
+        source: bytes | Path,
+        *,
+        size_limit: int,
+        expected_name: str | None = None,
+        memory_map: bool = False,
+    ) -> tuple[dict[str, Any], pd.DataFrame]:
+        """Decode a bounded archive whose payload checksums verify.
+
+        The dataframe fingerprint is left to the caller, which decides how a
+        mismatch is reported.
+        """
         try:
-            with ZipFile(BytesIO(payload)) as archive:
+            with ZipFile(BytesIO(source) if isinstance(source, bytes) else source) as archive:
                 infos = archive.infolist()
-                if {info.filename for info in infos} != {_MANIFEST_MEMBER, _DATA_MEMBER}:
+                names = {info.filename for info in infos}
+                if names not in (
+                    {_MANIFEST_MEMBER, _DATA_MEMBER},
+                    {_MANIFEST_MEMBER, _DATA_MEMBER, _BUFFER_MEMBER},
+                ):
                     raise ValueError("Dataset snapshot has unexpected archive members.")
                 if any(
-                    info.file_size > MAX_PORTFOLIO_BUNDLE_BYTES
-                    or info.flag_bits & 0x1
-                    or info.is_dir()
+                    info.file_size > size_limit or info.flag_bits & 0x1 or info.is_dir()
                     for info in infos
                 ):
                     raise ValueError("Dataset snapshot contains an unsafe archive member.")
-                if sum(info.file_size for info in infos) > MAX_PORTFOLIO_BUNDLE_BYTES:
-                    raise ValueError("Dataset snapshot expands beyond the portable size limit.")
+                if sum(info.file_size for info in infos) > size_limit:
+                    raise ValueError("Dataset snapshot expands beyond its size limit.")
                 manifest = cls._parse_manifest(archive.read(_MANIFEST_MEMBER))
                 payload_bytes = archive.read(_DATA_MEMBER)
+                buffer_info = archive.getinfo(_BUFFER_MEMBER) if _BUFFER_MEMBER in names else None
+                if (buffer_info is None) != (manifest["format_version"] == _ROW_FORMAT_VERSION):
+                    raise ValueError("Dataset snapshot members do not match its format version.")
+                buffer = (
+                    cls._open_buffer(archive, buffer_info, source, memory_map=memory_map)
+                    if buffer_info is not None
+                    else None
+                )
         except (BadZipFile, KeyError, json.JSONDecodeError, UnicodeDecodeError) as exc:
             raise ValueError("Dataset snapshot is unreadable or incomplete.") from exc
 
@@ -212,14 +399,61 @@ class DatasetSnapshotService:
             raise ValueError("Dataset snapshot failed its payload checksum.")
         try:
             frame_payload = cast(dict[str, Any], json.loads(payload_bytes))
-            data = cls._decode_frame(frame_payload)
+            if buffer is None:
+                data = cls._decode_frame(frame_payload)
+            else:
+                cls._verify_buffer(frame_payload, buffer)
+                data = cls._decode_columnar_frame(frame_payload, buffer)
         except (KeyError, TypeError, ValueError, json.JSONDecodeError, UnicodeDecodeError) as exc:
             raise ValueError("Dataset snapshot contains invalid table data.") from exc
         if len(data) != manifest["row_count"] or len(data.columns) != manifest["column_count"]:
             raise ValueError("Dataset snapshot does not match its recorded dimensions.")
-        if fingerprint_dataset(data) != manifest["fingerprint"]:
-            raise ValueError("Dataset snapshot failed fingerprint verification.")
-        return cls._info_from_manifest(manifest, len(payload)), data
+        return manifest, data
+
+    @staticmethod
+    def _open_buffer(
+        archive: ZipFile,
+        info: ZipInfo,
+        source: bytes | Path,
+        *,
+        memory_map: bool,
+    ) -> np.ndarray[Any, np.dtype[np.uint8]]:
+        """Return the stored column buffer without going through zip decompression."""
+        if info.compress_type != ZIP_STORED or info.compress_size != info.file_size:
+            raise ValueError("Dataset snapshot column buffer must be stored uncompressed.")
+        fp = archive.fp
+        if fp is None:
+            raise ValueError("Dataset snapshot archive is closed.")
+        fp.seek(info.header_offset)
+        header = _LOCAL_HEADER.unpack(fp.read(_LOCAL_HEADER.size))
+        if header[0] != b"PK\x03\x04":
+            raise ValueError("Dataset snapshot column buffer header is corrupt.")
+        offset = info.header_offset + _LOCAL_HEADER.size + header[-2] + header[-1]
+        if info.file_size == 0:
+            return np.empty(0, dtype=np.uint8)
+        if isinstance(source, bytes):
+            if offset + info.file_size > len(source):
+                raise ValueError("Dataset snapshot column buffer is truncated.")
+            # Copy out of the immutable payload so the decoded frame is writable.
+            return np.frombuffer(source, dtype=np.uint8, count=info.file_size, offset=offset).copy()
+        if offset + info.file_size > source.stat().st_size:
+            raise ValueError("Dataset snapshot column buffer is truncated.")
+        if memory_map:
+            # A plain ndarray view keeps the mapping alive without leaking np.memmap into pandas.
+            return np.asarray(
+                np.memmap(source, dtype=np.uint8, mode="r", offset=offset, shape=info.file_size)
+            )
+        return np.fromfile(source, dtype=np.uint8, count=info.file_size, offset=offset)
+
+    @staticmethod
+    def _verify_buffer(
+        payload: dict[str, Any], buffer: np.ndarray[Any, np.dtype[np.uint8]]
+    ) -> None:
+        spec = payload["buffer"]
+        if not isinstance(spec, dict) or spec.get("size") != len(buffer):
+            raise ValueError("Snapshot column buffer size does not match its metadata.")
+        if hashlib.sha256(memoryview(buffer)).hexdigest() != spec.get("sha256"):
+            raise ValueError("Snapshot column buffer failed its checksum.")
 
     @classmethod
     def delete_snapshot(cls, name: str) -> None:
@@ -255,7 +489,7 @@ class DatasetSnapshotService:
                 raise ValueError(f"Snapshot manifest field {key!r} is invalid.")
         if parsed["format"] != _FORMAT:
             raise ValueError("File is not a RING-5 dataset snapshot.")
-        if parsed["format_version"] != _FORMAT_VERSION:
+        if parsed["format_version"] not in (_ROW_FORMAT_VERSION, _FORMAT_VERSION):
             raise ValueError(f"Unsupported dataset snapshot version {parsed['format_version']!r}.")
         if parsed["row_count"] < 0 or parsed["column_count"] < 0:
             raise ValueError("Snapshot dimensions cannot be negative.")
@@ -297,49 +531,225 @@ class DatasetSnapshotService:
         return resolved
 
     @classmethod
-    def _encode_frame(cls, data: pd.DataFrame) -> dict[str, Any]:
+    def _encode_columnar_frame(cls, data: pd.DataFrame, buffers: _ColumnBuffers) -> dict[str, Any]:
         # [impl->req~ring5.data.semantic-units~1]
-        columns = [cls._encode_scalar(column) for column in data.columns]
         column_kind = "multi" if isinstance(data.columns, pd.MultiIndex) else "single"
-        column_names = [cls._encode_scalar(name) for name in data.columns.names]
-        dtypes = [
-            cls._encode_dtype(data.iloc[:, index].dtype) for index in range(len(data.columns))
-        ]
-        rows = [
-            [cls._encode_scalar(value) for value in row]
-            for row in data.itertuples(index=False, name=None)
-        ]
-        if isinstance(data.index, pd.MultiIndex):
+        if isinstance(data.index, pd.RangeIndex):
             index: dict[str, Any] = {
-                "kind": "multi",
-                "names": [cls._encode_scalar(name) for name in data.index.names],
-                "dtypes": [
-                    cls._encode_dtype(data.index.get_level_values(level).dtype)
-                    for level in range(data.index.nlevels)
-                ],
-                "values": [cls._encode_scalar(tuple(value)) for value in data.index.tolist()],
+                "kind": "range",
+                "names": [cls._encode_scalar(data.index.name)],
+                "start": data.index.start,
+                "stop": data.index.stop,
+                "step": data.index.step,
             }
         else:
+            levels = (
+                [data.index.get_level_values(level) for level in range(data.index.nlevels)]
+                if isinstance(data.index, pd.MultiIndex)
+                else [data.index]
+            )
             index = {
-                "kind": "single",
-                "names": [cls._encode_scalar(data.index.name)],
-                "dtypes": [cls._encode_dtype(data.index.dtype)],
-                "values": [cls._encode_scalar(value) for value in data.index.tolist()],
+                "kind": "multi" if isinstance(data.index, pd.MultiIndex) else "single",
+                "names": [cls._encode_scalar(name) for name in data.index.names],
+                "dtypes": [cls._encode_dtype(level.dtype) for level in levels],
+                "values": [cls._encode_column(level, buffers) for level in levels],
             }
         return {
-            "columns": columns,
+            "columns": [cls._encode_scalar(column) for column in data.columns],
             "column_kind": column_kind,
-            "column_names": column_names,
-            "dtypes": dtypes,
+            "column_names": [cls._encode_scalar(name) for name in data.columns.names],
+            "dtypes": [
+                cls._encode_dtype(data.iloc[:, position].dtype)
+                for position in range(len(data.columns))
+            ],
+            "row_count": len(data),
             "index": index,
-            "rows": rows,
+            "values": [
+                cls._encode_column(data.iloc[:, position], buffers)
+                for position in range(len(data.columns))
+            ],
             "semantic_columns": SemanticMetadataService.to_payload(
                 SemanticMetadataService.inspect(data)
             ),
         }
 
+    @classmethod
+    def _encode_column(
+        cls, values: pd.Series[Any] | pd.Index[Any], buffers: _ColumnBuffers
+    ) -> dict[str, Any]:
+        """Encode one whole column, preferring raw buffers over per-cell JSON."""
+        dtype = values.dtype
+        array = values.array
+        if isinstance(dtype, np.dtype) and dtype.kind in _BUFFER_KINDS:
+            return {"encoding": "buffer", "data": buffers.add(values.to_numpy(copy=False))}
+        if isinstance(
+            array, (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)
+        ):
+            numpy_dtype = np.dtype(cast(Any, dtype).numpy_dtype)
+            mask = np.asarray(values.isna())
+            data = array.to_numpy(dtype=numpy_dtype, na_value=numpy_dtype.type(0))
+            return {"encoding": "masked", "data": buffers.add(data), "mask": buffers.add(mask)}
+        if isinstance(array, pd.Categorical):
+            return {"encoding": "categorical", "codes": buffers.add(array.codes)}
+        if isinstance(dtype, pd.DatetimeTZDtype):
+            utc = pd.DatetimeIndex(values).tz_convert(None).to_numpy()
+            return {"encoding": "datetimetz", "data": buffers.add(utc)}
+        if isinstance(dtype, pd.StringDtype):
+            items = np.asarray(values, dtype=object)
+            items[np.asarray(values.isna())] = None
+            return {"encoding": "strings", "items": items.tolist()}
+        return {"encoding": "values", "items": [cls._encode_scalar(item) for item in values]}
+
+    @classmethod
+    def _decode_columnar_frame(
+        cls, payload: dict[str, Any], buffer: np.ndarray[Any, np.dtype[np.uint8]]
+    ) -> pd.DataFrame:
+        # [impl->req~ring5.data.semantic-units~1]
+        raw_columns = payload["columns"]
+        raw_column_names = payload["column_names"]
+        raw_dtypes = payload["dtypes"]
+        raw_values = payload["values"]
+        row_count = payload["row_count"]
+        if not isinstance(raw_columns, list) or not isinstance(raw_dtypes, list):
+            raise ValueError("Snapshot columns and dtypes must be lists.")
+        if not isinstance(raw_column_names, list) or not isinstance(raw_values, list):
+            raise ValueError("Snapshot column names and values must be lists.")
+        if not len(raw_columns) == len(raw_dtypes) == len(raw_values):
+            raise ValueError("Snapshot column, dtype, and value counts do not match.")
+        if isinstance(row_count, bool) or not isinstance(row_count, int) or row_count < 0:
+            raise ValueError("Snapshot row count is invalid.")
+
+        columns = {
+            position: pd.Series(cls._decode_column(spec, dtype_spec, buffer, row_count), copy=False)
+            for position, (spec, dtype_spec) in enumerate(zip(raw_values, raw_dtypes, strict=True))
+        }
+        frame = pd.DataFrame(columns, index=pd.RangeIndex(row_count), copy=False)
+        cls._set_columns(frame, raw_columns, raw_column_names, payload["column_kind"])
+        frame.index = cls._decode_columnar_index(payload["index"], buffer, row_count)
+        semantics = SemanticMetadataService.from_payload(
+            payload.get("semantic_columns", {}),
+            available_columns=tuple(str(column) for column in frame.columns),
+        )
+        return SemanticMetadataService.attach(frame, semantics) if semantics.columns else frame
+
+    @classmethod
+    def _decode_columnar_index(
+        cls, spec: Any, buffer: np.ndarray[Any, np.dtype[np.uint8]], row_count: int
+    ) -> pd.Index[Any]:
+        if not isinstance(spec, dict) or not isinstance(spec.get("names"), list):
+            raise ValueError("Snapshot index must be an object.")
+        names = [cls._decode_scalar(name) for name in spec["names"]]
+        if spec.get("kind") == "range" and len(names) == 1:
+            start, stop, step = (spec.get(key) for key in ("start", "stop", "step"))
+            if any(
+                isinstance(value, bool) or not isinstance(value, int)
+                for value in (start, stop, step)
+            ):
+                raise ValueError("Snapshot range index bounds are invalid.")
+            index = pd.RangeIndex(start=start, stop=stop, step=step, name=names[0])
+            if len(index) != row_count:
+                raise ValueError("Snapshot index length does not match its rows.")
+            return index
+        dtypes = spec.get("dtypes")
+        values = spec.get("values")
+        if (
+            not isinstance(dtypes, list)
+            or not isinstance(values, list)
+            or not len(names) == len(dtypes) == len(values)
+        ):
+            raise ValueError("Snapshot index metadata is invalid.")
+        levels = [
+            cls._decode_column(level, dtype_spec, buffer, row_count)
+            for level, dtype_spec in zip(values, dtypes, strict=True)
+        ]
+        if spec.get("kind") == "single" and len(levels) == 1:
+            return cast("pd.Index[Any]", pd.Index(levels[0], name=names[0], copy=False))
+        if spec.get("kind") == "multi":
+            return pd.MultiIndex.from_arrays(levels, names=names)
+        raise ValueError("Snapshot index kind is invalid.")
+
+    @classmethod
+    def _decode_column(
+        cls,
+        spec: Any,
+        dtype_spec: Any,
+        buffer: np.ndarray[Any, np.dtype[np.uint8]],
+        row_count: int,
+    ) -> Any:
+        """Rebuild one column as an array of ``row_count`` values."""
+        if not isinstance(spec, dict):
+            raise ValueError("Snapshot column encoding must be an object.")
+        dtype = cls._decode_dtype(dtype_spec)
+        encoding = spec.get("encoding")
+        if encoding == "buffer":
+            values = _ColumnBuffers.view(buffer, spec["data"], row_count)
+            if values.dtype != pd.api.types.pandas_dtype(dtype):
+                raise ValueError("Snapshot column buffer dtype does not match its metadata.")
+            return values
+        if encoding == "masked":
+            resolved = pd.api.types.pandas_dtype(dtype)
+            if not isinstance(resolved, pd.api.extensions.ExtensionDtype) or not hasattr(
+                resolved, "numpy_dtype"
+            ):
+                raise ValueError("Snapshot masked column has an invalid dtype.")
+            data = _ColumnBuffers.view(buffer, spec["data"], row_count)
+            mask = _ColumnBuffers.view(buffer, spec["mask"], row_count)
+            if data.dtype != resolved.numpy_dtype or mask.dtype != np.bool_:
+                raise ValueError("Snapshot masked column buffers are invalid.")
+            return cast(Any, resolved.construct_array_type())(data, mask)
+        if encoding == "categorical":
+            if not isinstance(dtype, pd.CategoricalDtype):
+                raise ValueError("Snapshot categorical column has an invalid dtype.")
+            codes = _ColumnBuffers.view(buffer, spec["codes"], row_count)
+            if codes.dtype.kind != "i":
+                raise ValueError("Snapshot categorical codes are invalid.")
+            return pd.Categorical.from_codes(codes, dtype=dtype)
+        if encoding == "datetimetz":
+            resolved = pd.api.types.pandas_dtype(dtype)
+            if not isinstance(resolved, pd.DatetimeTZDtype):
+                raise ValueError("Snapshot timezone column has an invalid dtype.")
+            utc = _ColumnBuffers.view(buffer, spec["data"], row_count)
+            if utc.dtype != np.dtype(f"M8[{resolved.unit}]"):
+                raise ValueError("Snapshot timezone column buffer is invalid.")
+            naive = pd.DatetimeIndex(utc)
+            return naive.tz_localize("UTC").tz_convert(resolved.tz).array
+        if encoding in {"strings", "values"}:
+            items = spec.get("items")
+            if not isinstance(items, list) or len(items) != row_count:
+                raise ValueError("Snapshot column length does not match its rows.")
+            if encoding == "strings":
+                if any(item is not None and not isinstance(item, str) for item in items):
+                    raise ValueError("Snapshot string column contains non-text values.")
+                return pd.array(items, dtype=dtype)
+            decoded = [cls._decode_scalar(item) for item in items]
+            return pd.Series(decoded, dtype=dtype).array
+        raise ValueError(f"Unknown snapshot column encoding {encoding!r}.")
+
+    @classmethod
+    def _set_columns(
+        cls, frame: pd.DataFrame, raw_columns: list[Any], raw_names: list[Any], kind: Any
+    ) -> None:
+        labels = [cls._decode_scalar(column) for column in raw_columns]
+        decoded_column_names = [cls._decode_scalar(name) for name in raw_names]
+        if kind == "single" and len(decoded_column_names) == 1:
+            frame.columns = pd.Index(
+                labels,
+                name=decoded_column_names[0],
+                tupleize_cols=False,
+            )
+        elif kind == "multi" and decoded_column_names:
+            if any(not isinstance(label, tuple) for label in labels):
+                raise ValueError("Snapshot multi-level column labels are invalid.")
+            frame.columns = pd.MultiIndex.from_tuples(
+                labels,
+                names=decoded_column_names,
+            )
+        else:
+            raise ValueError("Snapshot column index kind is invalid.")
+
     @classmethod
     def _decode_frame(cls, payload: dict[str, Any]) -> pd.DataFrame:
+        """Decode a format-version-1 payload that stores every cell as JSON."""
         # [impl->req~ring5.data.semantic-units~1]
         raw_columns = payload["columns"]
         column_kind = payload["column_kind"]
@@ -357,28 +767,12 @@ class DatasetSnapshotService:
         if any(not isinstance(row, list) or len(row) != len(raw_columns) for row in raw_rows):
             raise ValueError("Snapshot row width does not match its columns.")
 
-        labels = [cls._decode_scalar(column) for column in raw_columns]
         series: list[pd.Series[Any]] = []
         for position, dtype_spec in enumerate(raw_dtypes):
             values = [cls._decode_scalar(row[position]) for row in raw_rows]
             series.append(pd.Series(values, dtype=cls._decode_dtype(dtype_spec)))
         frame = pd.concat(series, axis=1) if series else pd.DataFrame(index=range(len(raw_rows)))
-        decoded_column_names = [cls._decode_scalar(name) for name in raw_column_names]
-        if column_kind == "single" and len(decoded_column_names) == 1:
-            frame.columns = pd.Index(
-                labels,
-                name=decoded_column_names[0],
-                tupleize_cols=False,
-            )
-        elif column_kind == "multi" and decoded_column_names:
-            if any(not isinstance(label, tuple) for label in labels):
-                raise ValueError("Snapshot multi-level column labels are invalid.")
-            frame.columns = pd.MultiIndex.from_tuples(
-                labels,
-                names=decoded_column_names,
-            )
-        else:
-            raise ValueError("Snapshot column index kind is invalid.")
+        cls._set_columns(frame, raw_columns, raw_column_names, column_kind)
         frame.index = cls._decode_index(payload["index"])
         semantics = SemanticMetadataService.from_payload(
             payload.get("semantic_columns", {}),
@@ -543,3 +937,78 @@ class DatasetSnapshotService:
                 cls._decode_scalar(key): cls._decode_scalar(item) for key, item in value["items"]
             }
         raise ValueError(f"Unknown snapshot scalar tag {kind!r}.")
+
+
+class _ColumnBuffers:
+    """Accumulate aligned raw column buffers for one snapshot's ``columns.bin``."""
+
+    def __init__(self) -> None:
+        self._arrays: list[tuple[int, np.ndarray[Any, np.dtype[np.uint8]]]] = []
+        self.size = 0
+
+    def add(self, values: np.ndarray[Any, Any]) -> dict[str, Any]:
+        """Register one 1-D array and return its JSON buffer reference."""
+        array = np.ascontiguousarray(values)
+        offset = -(-self.size // _BUFFER_ALIGNMENT) * _BUFFER_ALIGNMENT
+        raw = array.reshape(-1).view(np.uint8)
+        self._arrays.append((offset, raw))
+        self.size = offset + raw.nbytes
+        return {"dtype": array.dtype.str, "offset": offset}
+
+    def _chunks(self) -> Any:
+        position = 0
+        for offset, raw in self._arrays:
+            if offset > position:
+                yield bytes(offset - position)
+            yield memoryview(raw)
+            position = offset + raw.nbytes
+
+    def sha256(self) -> str:
+        """Return the SHA-256 of the complete buffer member."""
+        digest = hashlib.sha256()
+        for chunk in self._chunks():
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    def write_to(self, archive: ZipFile) -> None:
+        """Stream the buffer as the archive's first, uncompressed member.
+
+        A zipalign-style padding extra field puts the member data on an
+        alignment boundary so memory-mapped columns are naturally aligned.
+        """
+        info = ZipInfo(_BUFFER_MEMBER, date_time=(1980, 1, 1, 0, 0, 0))
+        info.compress_type = ZIP_STORED
+        info.file_size = self.size
+        zip64 = self.size * 1.05 > ZIP64_LIMIT
+        header = _LOCAL_HEADER.size + len(_BUFFER_MEMBER) + (20 if zip64 else 0) + 4
+        padding = -header % _BUFFER_ALIGNMENT
+        info.extra = struct.pack("<HH", _PADDING_EXTRA_ID, padding) + bytes(padding)
+        with archive.open(info, "w", force_zip64=zip64) as member:
+            for chunk in self._chunks():
+                member.write(chunk)
+
+    @staticmethod
+    def view(
+        buffer: np.ndarray[Any, np.dtype[np.uint8]], reference: Any, count: int
+    ) -> np.ndarray[Any, Any]:
+        """Return ``count`` items of one referenced column as a zero-copy view.
+
+        The view is writable exactly when *buffer* is, i.e. unless memory-mapped.
+        """
+        if not isinstance(reference, dict):
+            raise ValueError("Snapshot buffer reference must be an object.")
+        dtype = np.dtype(reference.get("dtype"))
+        offset = reference.get("offset")
+        if dtype.kind not in _BUFFER_KINDS:
+            raise ValueError("Snapshot buffer dtype is not a plain numeric type.")
+        if isinstance(offset, bool) or not isinstance(offset, int) or offset < 0:
+            raise ValueError("Snapshot buffer offset is invalid.")
+        end = offset + dtype.itemsize * count
+        if end > len(buffer):
+            raise ValueError("Snapshot buffer reference exceeds the column buffer.")
+        values = buffer[offset:end].view(dtype)
+        if values.ctypes.data % dtype.alignment:
+            # Only hand-built archives are misaligned; pandas expects aligned data.
+            values = values.copy()
+            values.flags.writeable = buffer.flags.writeable
+        return values
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import copy
 import hashlib
-import json
 import logging
 import math
 import os
@@ -26,6 +25,7 @@ from src.core.models.portfolio_revision_models import (
     PortfolioRevisionInfo,
 )
 from src.core.services.data_services.path_service import PathService
+from src.core.services.portfolio_container import PortfolioContainer
 from src.core.services.portfolio_migrator import PortfolioMigrator
 from src.core.services.portfolio_integrity_service import PortfolioIntegrityService
 
@@ -368,12 +368,11 @@ class PortfolioRevisionService:
 
     @staticmethod
     def _load_document(raw: bytes) -> PortfolioData:
-        value = json.loads(raw.decode("utf-8"))
-        if not isinstance(value, dict):
-            raise ValueError("Portfolio revision must contain a JSON object.")
+        value = PortfolioContainer.read_document(raw)
         integrity = PortfolioIntegrityService.verify(value)
         PortfolioIntegrityService.require_restorable(integrity)
-        return cast(PortfolioData, PortfolioMigrator.migrate(value))
+        migrated = PortfolioMigrator.migrate(value)
+        return cast(PortfolioData, PortfolioContainer.attach_frames(migrated, raw))
 
     @staticmethod
     def _created_at(data: PortfolioData, modified: float) -> str:
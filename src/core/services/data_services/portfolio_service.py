@@ -1,6 +1,5 @@
 """Save, migrate, and restore application portfolios."""
 
-import json
 import logging
 from collections.abc import Callable
 from pathlib import Path
@@ -22,6 +21,11 @@ from src.core.services.data_services.portfolio_revision_service import (
     PortfolioRevisionService,
 )
 from src.core.services.environment_metadata_service import EnvironmentMetadataService
+from src.core.services.portfolio_container import (
+    PortfolioContainer,
+    PortfolioFrameRef,
+    PortfolioFrameWriter,
+)
 from src.core.services.portfolio_migrator import PortfolioMigrator
 from src.core.services.portfolio_integrity_service import PortfolioIntegrityService
 from src.core.state.state_manager import StateManager
@@ -153,13 +157,20 @@ class PortfolioService:
         ) = None,
         signing_key: str | bytes | None = None,
         signing_key_id: str = "default",
+        frame_writer: PortfolioFrameWriter | None = None,
     ) -> bytes:
-        """Serialize current state into the integrity-checked portfolio format."""
+        """Serialize current state into an integrity-checked portfolio container.
+
+        Tables are stored once per distinct content; a plot restored from a
+        portfolio whose data was never loaded keeps its stored bytes as-is.
+        Pass *frame_writer* to control where snapshot tables are kept.
+        """
         # [impl->req~ring5.workspace.autosave-recovery~1]
         logger = logging.getLogger(__name__)
+        frames = frame_writer if frame_writer is not None else PortfolioFrameWriter()
         serialized_plots: list[dict[str, Any]] = []
         for plot in plots:
-            plot_dict: dict[str, Any] = plot.to_dict()
+            plot_dict: dict[str, Any] = plot.to_dict(include_data=False)
             plot_config: dict[str, Any] = plot_dict.get("config", {})
             if figure_spec_enricher is not None:
                 try:
@@ -174,9 +185,21 @@ class PortfolioService:
                         "Could not build FigureConfig for plot %s; saving without it",
                         plot_dict.get("name", "?"),
                     )
+            pending = getattr(plot, "pending_processed_data", None)
+            if isinstance(pending, PortfolioFrameRef):
+                plot_dict["processed_data_ref"] = frames.reuse(pending)
+                plot_dict["processed_semantics"] = dict(pending.semantics)
+            elif isinstance(plot.processed_data, pd.DataFrame):
+                plot_dict["processed_data_ref"] = frames.add(plot.processed_data)
+                plot_dict["processed_semantics"] = SemanticMetadataService.to_payload(
+                    SemanticMetadataService.inspect(plot.processed_data)
+                )
+            else:
+                plot_dict["processed_data_ref"] = None
+                plot_dict["processed_semantics"] = {}
             serialized_plots.append(plot_dict)
 
-        data_csv = data.to_csv(index=False) if data is not None and not data.empty else ""
+        data_ref = frames.add(data) if data is not None and not data.empty else None
         data_semantics = (
             SemanticMetadataService.to_payload(SemanticMetadataService.inspect(data))
             if data is not None
@@ -184,10 +207,10 @@ class PortfolioService:
         )
         portfolio_data: dict[str, Any] = {
             "schema_version": PortfolioMigrator.CURRENT_VERSION,
-            "version": "4.0",
+            "version": "5.0",
             "timestamp": pd.Timestamp.now().isoformat(),
             "environment_metadata": EnvironmentMetadataService.capture().to_dict(),
-            "data_csv": data_csv,
+            "data_ref": data_ref,
             "data_semantics": data_semantics,
             "csv_path": str(csv_path) if csv_path else None,
             "plots": serialized_plots,
@@ -200,13 +223,14 @@ class PortfolioService:
             "scanned_variables": self.state_manager.get_scanned_variables(),
             "manager_history": self.state_manager.get_manager_history(),
             "portfolio_history": self.state_manager.get_portfolio_history(),
+            "frames": frames.table(),
         }
         portfolio_data["integrity_manifest"] = PortfolioIntegrityService.create_manifest(
             portfolio_data,
             signing_key=signing_key,
             key_id=signing_key_id,
         )
-        return json.dumps(portfolio_data, indent=2).encode("utf-8")
+        return frames.container(portfolio_data)
 
     def load_portfolio(
         self,
@@ -216,27 +240,25 @@ class PortfolioService:
         require_signature: bool = False,
     ) -> PortfolioData:
         # [impl->req~ring5.portfolio.signed-manifests~1]
-        """Load a portfolio JSON by name.
+        """Load a portfolio by name.
 
         Runs schema migration via :class:`PortfolioMigrator` to ensure
-        backward compatibility with older portfolio formats.
+        backward compatibility with older portfolio formats. Only the
+        document is decoded here; its tables are decoded on first use.
         """
         load_path = self._portfolio_path(name)
         if not load_path.exists():
             raise FileNotFoundError(f"Portfolio '{name}' not found")
 
-        with open(load_path, encoding="utf-8") as f:
-            value = json.load(f)
-        if not isinstance(value, dict):
-            raise ValueError("Portfolio JSON must contain one top-level object.")
-        raw: dict[str, Any] = value
-
+        payload = load_path.read_bytes()
+        raw = PortfolioContainer.read_document(payload)
         report = PortfolioIntegrityService.verify(raw, signing_key=signing_key)
         PortfolioIntegrityService.require_restorable(
             report,
             require_signature=require_signature,
         )
-        return cast(PortfolioData, PortfolioMigrator.migrate(raw))
+        migrated = PortfolioMigrator.migrate(raw)
+        return cast(PortfolioData, PortfolioContainer.attach_frames(migrated, payload))
 
     def verify_portfolio(
         self,
@@ -257,10 +279,7 @@ class PortfolioService:
         load_path = self._portfolio_path(name)
         if not load_path.exists():
             raise FileNotFoundError(f"Portfolio '{name}' not found")
-        with open(load_path, encoding="utf-8") as handle:
-            raw = json.load(handle)
-        if not isinstance(raw, dict):
-            raise ValueError("Portfolio JSON must contain one top-level object.")
+        raw = PortfolioContainer.read_document(load_path.read_bytes())
         return PortfolioIntegrityService.verify(raw, signing_key=signing_key)
 
     def export_portfolio_bytes(self, name: str) -> bytes:
@@ -270,18 +289,16 @@ class PortfolioService:
             name: Saved portfolio name.
 
         Returns:
-            Exact JSON file bytes after content-integrity verification.
+            Exact portfolio file bytes after content-integrity verification.
         """
         load_path = self._portfolio_path(name)
         if not load_path.exists():
             raise FileNotFoundError(f"Portfolio '{name}' not found")
         payload = load_path.read_bytes()
         try:
-            value = json.loads(payload.decode("utf-8"))
-        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
-            raise ValueError(f"Portfolio '{name}' is not valid UTF-8 JSON.") from exc
-        if not isinstance(value, dict):
-            raise ValueError("Portfolio JSON must contain one top-level object.")
+            value = PortfolioContainer.read_document(payload)
+        except ValueError as exc:
+            raise ValueError(f"Portfolio '{name}' is not a readable portfolio: {exc}") from exc
         report = PortfolioIntegrityService.verify(value)
         PortfolioIntegrityService.require_restorable(report)
         PortfolioMigrator.migrate(value)
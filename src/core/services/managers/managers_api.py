@@ -154,6 +154,7 @@ class ManagersAPI(Protocol):
         bootstrap_samples: int = 2_000,
         random_seed: int = 0,
         minimum_sample_size: int = 5,
+        workers: int = 1,
     ) -> pd.DataFrame:
         """Calculate repeated-sample comparison statistics.
 
@@ -167,6 +168,7 @@ class ManagersAPI(Protocol):
             bootstrap_samples: Number of deterministic resamples.
             random_seed: Seed used for resampling.
             minimum_sample_size: Per-side count below which warnings are emitted.
+            workers: Processes comparing groups in parallel; results do not change.
 
         Returns:
             Long-form statistical comparison rows.
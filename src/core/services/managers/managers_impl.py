@@ -160,6 +160,7 @@ class DefaultManagersAPI:
         bootstrap_samples: int = 2_000,
         random_seed: int = 0,
         minimum_sample_size: int = 5,
+        workers: int = 1,
     ) -> pd.DataFrame:
         """Calculate repeated-sample comparison statistics."""
         return StatisticalComparisonService.compare(
@@ -172,6 +173,7 @@ class DefaultManagersAPI:
             bootstrap_samples=bootstrap_samples,
             random_seed=random_seed,
             minimum_sample_size=minimum_sample_size,
+            workers=workers,
         )
 
     def annotate_comparison(
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import math
+import multiprocessing
 from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
 import numpy as np
@@ -22,6 +24,40 @@ class _SampleStatistics:
     size: int
 
 
+@dataclass(frozen=True, slots=True)
+class _ComparisonOptions:
+    metrics: tuple[str, ...]
+    confidence_level: float
+    alpha: float
+    bootstrap_samples: int
+    random_seed: int
+    minimum_sample_size: int
+
+
+@dataclass(frozen=True, slots=True)
+class _GroupBlock:
+    """One group's metric values, one column per metric in ``options.metrics`` order."""
+
+    group_index: int
+    baseline: np.ndarray
+    candidate: np.ndarray
+
+
+def _compare_group(block: _GroupBlock, options: _ComparisonOptions) -> list[dict[str, object]]:
+    """Compare every metric of one group (also the process-pool entry point)."""
+    return [
+        StatisticalComparisonService._compare_metric(
+            block.baseline[:, metric_index],
+            block.candidate[:, metric_index],
+            metric,
+            options,
+            block.group_index,
+            metric_index,
+        )
+        for metric_index, metric in enumerate(options.metrics)
+    ]
+
+
 class StatisticalComparisonService:
     """Calculate repeated-sample evidence for baseline and candidate groups."""
 
@@ -38,9 +74,14 @@ class StatisticalComparisonService:
         bootstrap_samples: int = 2_000,
         random_seed: int = 0,
         minimum_sample_size: int = 5,
+        workers: int = 1,
     ) -> pd.DataFrame:
         """Compare repeated measurements with Welch and bootstrap estimates.
 
+        Each group's metric values are extracted once, and every (group,
+        metric) bootstrap draws from its own ``SeedSequence`` stream, so
+        results do not depend on ``workers``.
+
         Args:
             baseline: Reference observations.
             candidate: Candidate observations.
@@ -52,6 +93,7 @@ class StatisticalComparisonService:
             bootstrap_samples: Resample count from 100 through 50,000.
             random_seed: Seed for deterministic resampling.
             minimum_sample_size: Per-side count below which a warning is emitted.
+            workers: Processes comparing groups in parallel; ``1`` stays in-process.
 
         Returns:
             One row per group and metric with means, confidence intervals,
@@ -69,31 +111,46 @@ class StatisticalComparisonService:
         resamples = cls._bootstrap_count(bootstrap_samples)
         seed = cls._integer(random_seed, "random_seed", minimum=0)
         minimum = cls._integer(minimum_sample_size, "minimum_sample_size", minimum=2)
+        worker_count = cls._integer(workers, "workers", minimum=1)
+        options = _ComparisonOptions(
+            tuple(metrics), confidence, significance_alpha, resamples, seed, minimum
+        )
 
         baseline_groups = cls._group_indices(baseline, groups)
         candidate_groups = cls._group_indices(candidate, groups)
         ordered_groups = list(baseline_groups)
         ordered_groups.extend(key for key in candidate_groups if key not in baseline_groups)
 
-        rows: list[dict[str, object]] = []
-        for group_index, group_key in enumerate(ordered_groups):
-            baseline_indices = baseline_groups.get(group_key, np.array([], dtype=int))
-            candidate_indices = candidate_groups.get(group_key, np.array([], dtype=int))
-            for metric_index, metric in enumerate(metrics):
-                row = cls._compare_metric(
-                    baseline,
-                    candidate,
-                    baseline_indices,
-                    candidate_indices,
-                    metric,
-                    confidence,
-                    significance_alpha,
-                    resamples,
-                    seed,
-                    minimum,
-                    group_index,
-                    metric_index,
+        baseline_values = cls._metric_matrix(baseline, metrics)
+        candidate_values = cls._metric_matrix(candidate, metrics)
+        empty = np.array([], dtype=int)
+        blocks = [
+            _GroupBlock(
+                group_index,
+                baseline_values[baseline_groups.get(group_key, empty)],
+                candidate_values[candidate_groups.get(group_key, empty)],
+            )
+            for group_index, group_key in enumerate(ordered_groups)
+        ]
+        if worker_count > 1 and len(blocks) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(worker_count, len(blocks)),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                group_rows = list(
+                    executor.map(
+                        _compare_group,
+                        blocks,
+                        [options] * len(blocks),
+                        chunksize=max(1, len(blocks) // (worker_count * 4)),
+                    )
                 )
+        else:
+            group_rows = [_compare_group(block, options) for block in blocks]
+
+        rows: list[dict[str, object]] = []
+        for group_key, metric_rows in zip(ordered_groups, group_rows, strict=True):
+            for row in metric_rows:
                 row.update(dict(zip(groups, group_key, strict=True)))
                 rows.append(row)
 
@@ -187,24 +244,27 @@ class StatisticalComparisonService:
             result[key] = np.asarray(indices, dtype=int)
         return result
 
+    @staticmethod
+    def _metric_matrix(frame: pd.DataFrame, metrics: list[str]) -> np.ndarray:
+        """Return the metric columns as one float matrix (rows follow ``frame``)."""
+        matrix = np.empty((len(frame), len(metrics)), dtype=float)
+        for position, metric in enumerate(metrics):
+            matrix[:, position] = frame[metric].to_numpy(dtype=float)
+        return matrix
+
     @classmethod
     def _compare_metric(
         cls,
-        baseline: pd.DataFrame,
-        candidate: pd.DataFrame,
-        baseline_indices: np.ndarray,
-        candidate_indices: np.ndarray,
+        raw_baseline: np.ndarray,
+        raw_candidate: np.ndarray,
         metric: str,
-        confidence_level: float,
-        alpha: float,
-        bootstrap_samples: int,
-        random_seed: int,
-        minimum_sample_size: int,
+        options: _ComparisonOptions,
         group_index: int,
         metric_index: int,
     ) -> dict[str, object]:
-        raw_baseline = baseline.iloc[baseline_indices][metric].to_numpy(dtype=float, copy=True)
-        raw_candidate = candidate.iloc[candidate_indices][metric].to_numpy(dtype=float, copy=True)
+        confidence_level = options.confidence_level
+        alpha = options.alpha
+        bootstrap_samples = options.bootstrap_samples
         baseline_values = raw_baseline[np.isfinite(raw_baseline)]
         candidate_values = raw_candidate[np.isfinite(raw_candidate)]
         baseline_stats = cls._sample_statistics(baseline_values)
@@ -216,7 +276,7 @@ class StatisticalComparisonService:
             raw_candidate,
             baseline_stats,
             candidate_stats,
-            minimum_sample_size,
+            options.minimum_sample_size,
         )
         ci_low, ci_high, p_value = cls._welch_results(
             baseline_stats,
@@ -232,7 +292,7 @@ class StatisticalComparisonService:
             candidate_values,
             bootstrap_samples,
             confidence_level,
-            random_seed,
+            options.random_seed,
             group_index,
             metric_index,
         )
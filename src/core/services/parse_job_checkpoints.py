@@ -0,0 +1,124 @@
+"""Append-only per-file checkpoints for background parse attempts."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import IO, Any
+
+from src.core.models import ParseFileSignature
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILE_NAME = "checkpoints.jsonl"
+
+
+class ParseCheckpointLog:
+    """Persist one flattened CSV row per completed file inside an attempt directory.
+
+    The log is JSON Lines: a header line carrying the batch's variable names,
+    then one ``{"path", "size", "mtime_ns", "cells"}`` line per file. Each line
+    is flushed as it is written, so a crash loses at most the file being
+    recorded; a torn final line is ignored when the log is read back.
+    """
+
+    # [impl->req~ring5.ingestion.session-background-parse~1]
+
+    def __init__(self, path: Path) -> None:
+        """Bind the log to a file path without touching the disk."""
+        self.path = path
+        self._handle: IO[str] | None = None
+
+    def exists(self) -> bool:
+        """Return whether any checkpoint has been written for the attempt."""
+        return self.path.is_file()
+
+    def start(self, var_names: Sequence[str]) -> None:
+        """Create the log with its header unless a carried-over log already exists."""
+        if self.exists():
+            return
+        self._write_line({"var_names": list(var_names)})
+
+    def append(self, signature: ParseFileSignature, cells: Mapping[str, str]) -> None:
+        """Record the flattened row of one completed file."""
+        self._write_line(
+            {
+                "path": signature.path,
+                "size": signature.size,
+                "mtime_ns": signature.mtime_ns,
+                "cells": dict(cells),
+            }
+        )
+
+    def close(self) -> None:
+        """Close the append handle; later appends reopen it."""
+        handle, self._handle = self._handle, None
+        if handle is not None:
+            handle.close()
+
+    def read(self) -> tuple[list[str], dict[str, dict[str, str]]]:
+        """Return the header variable names and checkpointed rows keyed by source path."""
+        var_names: list[str] = []
+        rows: dict[str, dict[str, str]] = {}
+        if not self.exists():
+            return var_names, rows
+        for entry in self._entries():
+            if "var_names" in entry:
+                var_names = [str(name) for name in entry["var_names"]]
+                continue
+            rows[str(entry["path"])] = {
+                str(column): str(value) for column, value in entry["cells"].items()
+            }
+        return var_names, rows
+
+    def carry_over(
+        self,
+        destination: ParseCheckpointLog,
+        signatures: Sequence[ParseFileSignature],
+    ) -> int:
+        """Copy checkpoints whose source file is unchanged into ``destination``.
+
+        Returns:
+            The number of file checkpoints carried over.
+        """
+        if not self.exists():
+            return 0
+        current = {signature.path: signature for signature in signatures}
+        carried = 0
+        for entry in self._entries():
+            if "var_names" not in entry:
+                signature = current.get(str(entry["path"]))
+                if signature is None or (signature.size, signature.mtime_ns) != (
+                    entry["size"],
+                    entry["mtime_ns"],
+                ):
+                    continue
+                carried += 1
+            destination._write_line(entry)
+        destination.close()
+        return carried
+
+    def _entries(self) -> Iterator[dict[str, Any]]:
+        """Decode complete lines, skipping a final line torn by a crash."""
+        with open(self.path, encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle, start=1):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(
+                        "Ignoring unreadable parse checkpoint line %d in %s", line_number, self.path
+                    )
+                    continue
+                if isinstance(entry, dict):
+                    yield entry
+
+    def _write_line(self, entry: Mapping[str, Any]) -> None:
+        """Append one JSON line and push it to the operating system."""
+        if self._handle is None:
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+            self._handle = os.fdopen(fd, "a", encoding="utf-8")
+        self._handle.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self._handle.flush()
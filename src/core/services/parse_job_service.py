@@ -17,6 +17,7 @@ from concurrent.futures import (
     ThreadPoolExecutor,
     wait,
 )
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -35,6 +36,8 @@ from src.core.models import (
     ParseJobStatus,
 )
 from src.core.models.parse_job_models import JsonValue
+from src.core.models.parsing_models import CONFIG_INI_STRATEGIES
+from src.core.services.parse_job_checkpoints import CHECKPOINT_FILE_NAME, ParseCheckpointLog
 from src.core.services.parse_job_store import ParseJobStore
 from src.core.services.parse_job_workspace import ParseJobRuntimeWorkspace
 from src.parsing.framework.file_discovery import find_stats_files
@@ -59,6 +62,31 @@ FinalizeParse = Callable[
 ]
 PublishCsv = Callable[[str, str], str]
 BeforeCleanup = Callable[[ParseJobReceipt], None]
+SubmitParseFiles = Callable[
+    [str, str, Sequence[JsonValue], str, str, list[JsonValue] | None, list[str]],
+    ParseBatchResult,
+]
+CheckpointResult = Callable[[dict[str, Any], str, list[str]], tuple[str, dict[str, str]]]
+FinalizeCheckpoints = Callable[
+    [str, list[str], list[tuple[str, dict[str, str]]], str], str | None
+]
+
+
+@dataclass(frozen=True)
+class ParseCheckpointHooks:
+    """Parser callbacks that let non-incremental jobs checkpoint and resume.
+
+    Attributes:
+        submit_files: ``SubmitParse`` restricted to an explicit list of stats files.
+        checkpoint_result: Flatten one worker result into ``(source_path, cells)``
+            for the given strategy and variable names.
+        finalize_rows: Write the attempt CSV from ordered ``(source_path, cells)`` rows
+            for the given strategy.
+    """
+
+    submit_files: SubmitParseFiles
+    checkpoint_result: CheckpointResult
+    finalize_rows: FinalizeCheckpoints
 
 
 def build_parse_job_request(
@@ -105,7 +133,7 @@ def build_parse_job_request(
     signatures.sort(key=lambda item: item.path)
 
     companion_inputs: list[dict[str, JsonValue]] = []
-    if strategy_type == "config_aware":
+    if strategy_type in CONFIG_INI_STRATEGIES:
         companion_paths = {Path(signature.path).parent / "config.ini" for signature in signatures}
         for companion in sorted(companion_paths):
             try:
@@ -180,11 +208,18 @@ class ParseJobService:
         publish_csv: PublishCsv,
         *,
         runtime_workspace: ParseJobRuntimeWorkspace | None = None,
+        checkpoint_hooks: ParseCheckpointHooks | None = None,
     ) -> None:
-        """Create an isolated session workspace and metadata store."""
+        """Create an isolated session workspace and metadata store.
+
+        With ``checkpoint_hooks``, non-incremental attempts persist each completed
+        file as a flattened row in the attempt directory instead of holding worker
+        results until finalization, and :meth:`resume` can reuse those rows.
+        """
         self._submit_parse = submit_parse
         self._finalize_parse = finalize_parse
         self._publish_csv = publish_csv
+        self._checkpoint_hooks = checkpoint_hooks
         self._runtime_workspace = (
             runtime_workspace
             if runtime_workspace is not None
@@ -262,44 +297,17 @@ class ParseJobService:
 
     def retry(self, job_id: str) -> ParseJobSnapshot:
         """Recompute file signatures and enqueue a fresh explicit attempt."""
-        with self._operation_lock:
-            snapshot = self._require_job(job_id)
-            if snapshot.status not in {
-                ParseJobStatus.PARTIAL,
-                ParseJobStatus.FAILED,
-                ParseJobStatus.CANCELLED,
-            }:
-                raise ParseJobNotConsumableError(
-                    f"Parse job in {snapshot.status.value} state cannot be retried"
-                )
-            active = self._store.get_active_job()
-            if active is not None and active.job_id != job_id:
-                raise ParseJobConflictError(
-                    f"Parse job {active.job_id} is already active in this session"
-                )
-            old_request = self._store.get_request(job_id)
-            variables = old_request.variables()
-            scanned_variables = old_request.scanned_variables()
-            request = build_parse_job_request(
-                stats_path=old_request.stats_path,
-                stats_pattern=old_request.stats_pattern,
-                variables=variables,
-                strategy_type=old_request.strategy_type,
-                scanned_variables=scanned_variables,
-                simulator=old_request.simulator,
-                parser_contract_version=old_request.parser_contract_version,
-                incremental=old_request.incremental,
-            )
-            attempt_dir = self._store.delete_job(job_id)
-            shutil.rmtree(attempt_dir, ignore_errors=True)
-            self._remove_cancel_event(job_id)
-            self._file_futures.pop(job_id, None)
-            self._orchestration_futures.pop(job_id, None)
-            return self._submit_request(
-                request,
-                attempt=snapshot.attempt + 1,
-                ignore_cached_result=True,
-            )
+        return self._resubmit(job_id, resume=False)
+
+    def resume(self, job_id: str) -> ParseJobSnapshot:
+        """Enqueue a new attempt that reparses only files without a valid checkpoint.
+
+        Checkpoints of files whose size or modification time changed since they
+        were parsed are dropped. Config-aware attempts also depend on companion
+        ``config.ini`` files, so their checkpoints are reused only while the
+        request fingerprint is unchanged. Without checkpoints this is a retry.
+        """
+        return self._resubmit(job_id, resume=True)
 
     def consume(
         self,
@@ -411,14 +419,71 @@ class ParseJobService:
             self._discard_when_terminal.clear()
             self._runtime_workspace.release_session_workspace(self.session_dir)
 
+    def _resubmit(self, job_id: str, *, resume: bool) -> ParseJobSnapshot:
+        """Replace a terminal attempt with a new one, optionally keeping its checkpoints."""
+        with self._operation_lock:
+            snapshot = self._require_job(job_id)
+            if snapshot.status not in {
+                ParseJobStatus.PARTIAL,
+                ParseJobStatus.FAILED,
+                ParseJobStatus.CANCELLED,
+            }:
+                action = "resumed" if resume else "retried"
+                raise ParseJobNotConsumableError(
+                    f"Parse job in {snapshot.status.value} state cannot be {action}"
+                )
+            active = self._store.get_active_job()
+            if active is not None and active.job_id != job_id:
+                raise ParseJobConflictError(
+                    f"Parse job {active.job_id} is already active in this session"
+                )
+            old_request = self._store.get_request(job_id)
+            variables = old_request.variables()
+            scanned_variables = old_request.scanned_variables()
+            request = build_parse_job_request(
+                stats_path=old_request.stats_path,
+                stats_pattern=old_request.stats_pattern,
+                variables=variables,
+                strategy_type=old_request.strategy_type,
+                scanned_variables=scanned_variables,
+                simulator=old_request.simulator,
+                parser_contract_version=old_request.parser_contract_version,
+                incremental=old_request.incremental,
+            )
+            carried: Path | None = None
+            if resume and (
+                old_request.strategy_type not in CONFIG_INI_STRATEGIES
+                or old_request.fingerprint == request.fingerprint
+            ):
+                checkpoints = _checkpoint_log(self._store.get_attempt_dir(job_id))
+                if checkpoints.exists():
+                    carried = self._attempts_dir / f"{job_id}.{CHECKPOINT_FILE_NAME}"
+                    checkpoints.path.replace(carried)
+            self._delete_transient_job(job_id)
+            try:
+                return self._submit_request(
+                    request,
+                    attempt=snapshot.attempt + 1,
+                    ignore_cached_result=True,
+                    resume_from=carried,
+                )
+            finally:
+                if carried is not None:
+                    carried.unlink(missing_ok=True)
+
     def _submit_request(
         self,
         request: ParseJobRequest,
         *,
         attempt: int,
         ignore_cached_result: bool,
+        resume_from: Path | None = None,
     ) -> ParseJobSnapshot:
-        """Coalesce, reuse, or enqueue an already-canonical request."""
+        """Coalesce, reuse, or enqueue an already-canonical request.
+
+        ``resume_from`` is a previous attempt's checkpoint log; rows for unchanged
+        files are copied into the new attempt before its work is enqueued.
+        """
         if self._closed:
             raise RuntimeError("Parse job service is closed")
 
@@ -470,6 +535,15 @@ class ParseJobService:
         except Exception:
             shutil.rmtree(attempt_dir, ignore_errors=True)
             raise
+        if resume_from is not None:
+            try:
+                carried = ParseCheckpointLog(resume_from).carry_over(
+                    _checkpoint_log(attempt_dir), request.file_signatures
+                )
+            except Exception:
+                self._delete_transient_job(job_id)
+                raise
+            logger.info("Resuming parse job %s with %d checkpointed files", job_id, carried)
         event = threading.Event()
         with self._cancel_event_lock:
             self._cancel_events[job_id] = event
@@ -485,6 +559,7 @@ class ParseJobService:
     def _run_job(self, job_id: str) -> None:
         """Drive one persisted attempt to a terminal state on the session executor."""
         results: list[dict[str, Any]] = []
+        checkpoints: ParseCheckpointLog | None = None
         try:
             event = self._get_cancel_event(job_id)
             if event is None:
@@ -500,23 +575,54 @@ class ParseJobService:
             variables = request.variables()
             scanned_values = request.scanned_variables()
             scanned_variables = scanned_values if scanned_values else None
-            batch = self._submit_parse(
-                request.stats_path,
-                request.stats_pattern,
-                variables,
-                str(attempt_dir),
-                request.strategy_type,
-                scanned_variables,
-                request.incremental,
-            )
+            hooks = None if request.incremental else self._checkpoint_hooks
+            checkpoint_rows: dict[str, dict[str, str]] = {}
+            signatures = {signature.path: signature for signature in request.file_signatures}
+            if hooks is not None:
+                checkpoints = _checkpoint_log(attempt_dir)
+                checkpointed_var_names, checkpoint_rows = checkpoints.read()
+            batch: ParseBatchResult | IncrementalParseBatchResult
+            if hooks is not None and checkpoint_rows:
+                # Only the header and the set of finished paths are needed here; the
+                # rows themselves are re-read from disk at finalization.
+                remaining = [path for path in signatures if path not in checkpoint_rows]
+                checkpointed_files = len(signatures) - len(remaining)
+                checkpoint_rows.clear()
+                if remaining:
+                    batch = hooks.submit_files(
+                        request.stats_path,
+                        request.stats_pattern,
+                        variables,
+                        str(attempt_dir),
+                        request.strategy_type,
+                        scanned_variables,
+                        remaining,
+                    )
+                else:
+                    batch = ParseBatchResult(futures=[], var_names=checkpointed_var_names)
+            else:
+                checkpointed_files = 0
+                batch = self._submit_parse(
+                    request.stats_path,
+                    request.stats_pattern,
+                    variables,
+                    str(attempt_dir),
+                    request.strategy_type,
+                    scanned_variables,
+                    request.incremental,
+                )
+            if checkpoints is not None:
+                checkpoints.start(batch.var_names)
             futures = batch.futures
             reused_files = (
-                batch.reused_file_count if isinstance(batch, IncrementalParseBatchResult) else 0
+                batch.reused_file_count
+                if isinstance(batch, IncrementalParseBatchResult)
+                else checkpointed_files
             )
             total_files = (
                 batch.total_file_count
                 if isinstance(batch, IncrementalParseBatchResult)
-                else len(futures)
+                else len(futures) + checkpointed_files
             )
             with self._operation_lock:
                 self._file_futures[job_id] = futures
@@ -534,6 +640,7 @@ class ParseJobService:
                 ),
             )
             completed = reused_files
+            checkpointed = checkpointed_files
             pending = set(futures)
             while pending:
                 if event.is_set():
@@ -545,10 +652,17 @@ class ParseJobService:
                         continue
                     try:
                         result = future.result()
-                        completed += 1
-                        if result:
+                        if result and checkpoints is not None and hooks is not None:
+                            _checkpoint_result(
+                                hooks, checkpoints, signatures, result, request, batch
+                            )
+                            checkpointed += 1
+                            completed += 1
+                        elif result:
+                            completed += 1
                             results.append(result)
                         else:
+                            completed += 1
                             self._store.append_error(
                                 job_id,
                                 "Parser returned no usable result for one file",
@@ -575,7 +689,7 @@ class ParseJobService:
             snapshot = self._store.get_job(job_id)
             if snapshot is None:
                 return
-            has_reusable_rows = (
+            has_reusable_rows = checkpointed > 0 or (
                 isinstance(batch, IncrementalParseBatchResult) and batch.reused_file_count > 0
             )
             if not results and not has_reusable_rows:
@@ -590,13 +704,24 @@ class ParseJobService:
                 total_files,
                 "Finalizing CSV",
             )
-            output_path = self._finalize_parse(
-                str(attempt_dir),
-                batch,
-                results,
-                snapshot.error_count == 0,
-                request.strategy_type,
-            )
+            if checkpoints is not None and hooks is not None:
+                checkpoints.close()
+                var_names, rows = checkpoints.read()
+                output_path = hooks.finalize_rows(
+                    str(attempt_dir),
+                    var_names,
+                    [(path, rows[path]) for path in signatures if path in rows],
+                    request.strategy_type,
+                )
+                rows.clear()
+            else:
+                output_path = self._finalize_parse(
+                    str(attempt_dir),
+                    batch,
+                    results,
+                    snapshot.error_count == 0,
+                    request.strategy_type,
+                )
             results.clear()
             if event.is_set():
                 self._mark_cancelled(job_id)
@@ -663,6 +788,9 @@ class ParseJobService:
             except (ParseJobNotFoundError, OSError):
                 logger.debug("Parse job %s disappeared during shutdown", job_id)
             logger.error("Background parse job %s failed: %s", job_id, exc, exc_info=True)
+        finally:
+            if checkpoints is not None:
+                checkpoints.close()
 
     def _mark_cancelled(self, job_id: str) -> None:
         """Finish cancellation and discard reset jobs after workers return."""
@@ -762,6 +890,29 @@ class ParseJobService:
         self._orchestration_futures.pop(job_id, None)
 
 
+def _checkpoint_result(
+    hooks: ParseCheckpointHooks,
+    checkpoints: ParseCheckpointLog,
+    signatures: Mapping[str, ParseFileSignature],
+    result: dict[str, Any],
+    request: ParseJobRequest,
+    batch: ParseBatchResult | IncrementalParseBatchResult,
+) -> None:
+    """Flatten one worker result into the attempt's checkpoint log and release it."""
+    source_path, cells = hooks.checkpoint_result(result, request.strategy_type, batch.var_names)
+    # The future keeps its result alive; clearing it releases the stat objects.
+    result.clear()
+    signature = signatures.get(source_path)
+    if signature is None:
+        raise RuntimeError(f"PARSER: worker returned an unplanned file: {source_path}")
+    checkpoints.append(signature, cells)
+
+
+def _checkpoint_log(attempt_dir: Path) -> ParseCheckpointLog:
+    """Return the checkpoint log that belongs to one attempt directory."""
+    return ParseCheckpointLog(attempt_dir / CHECKPOINT_FILE_NAME)
+
+
 def _format_error(exc: BaseException) -> str:
     """Flatten an exception into one bounded-store-friendly line."""
     message = str(exc).replace("\n", " ").replace("\r", " ")
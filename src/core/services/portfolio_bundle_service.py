@@ -25,6 +25,7 @@ from src.core.models import (
 )
 from src.core.models.portfolio_bundle_models import PortfolioBundleArtifactRole
 from src.core.services.data_services.dataset_snapshot_service import DatasetSnapshotService
+from src.core.services.portfolio_container import CONTAINER_MEDIA_TYPE, PortfolioContainer
 from src.core.services.portfolio_integrity_service import PortfolioIntegrityService
 from src.core.services.portfolio_migrator import PortfolioMigrator
 from src.core.services.environment_metadata_service import EnvironmentMetadataService
@@ -84,7 +85,7 @@ class PortfolioBundleService:
             ValueError: Any input is invalid, unsafe, modified, or over its limit.
         """
         resolved_name = cls._bounded_name(name, "Bundle")
-        portfolio_raw = cls._json_object(portfolio_bytes, "Portfolio")
+        portfolio_raw = PortfolioContainer.read_document(portfolio_bytes)
         integrity = PortfolioIntegrityService.verify(portfolio_raw)
         PortfolioIntegrityService.require_restorable(integrity)
         PortfolioMigrator.migrate(portfolio_raw)
@@ -95,7 +96,11 @@ class PortfolioBundleService:
                 signing_key=signing_key,
                 key_id=signing_key_id,
             )
-            portfolio_bytes = cls._json_bytes(portfolio_raw, indent=2)
+            portfolio_bytes = (
+                PortfolioContainer.replace_document(portfolio_bytes, portfolio_raw)
+                if PortfolioContainer.is_container(portfolio_bytes)
+                else cls._json_bytes(portfolio_raw, indent=2)
+            )
         if len(portfolio_bytes) > MAX_PORTFOLIO_BUNDLE_BYTES:
             raise ValueError("Portfolio exceeds the portable bundle size limit.")
 
@@ -103,7 +108,15 @@ class PortfolioBundleService:
         environment = cls._environment(portfolio_raw.get("environment_metadata"))
         requirements = cls._requirements(environment)
         members: dict[str, tuple[PortfolioBundleArtifactRole, str, bytes]] = {
-            _PORTFOLIO_MEMBER: ("portfolio", "application/json", portfolio_bytes),
+            _PORTFOLIO_MEMBER: (
+                "portfolio",
+                (
+                    CONTAINER_MEDIA_TYPE
+                    if PortfolioContainer.is_container(portfolio_bytes)
+                    else "application/json"
+                ),
+                portfolio_bytes,
+            ),
             _SOURCE_MEMBER: (
                 "source-manifest",
                 "application/json",
@@ -228,13 +241,19 @@ class PortfolioBundleService:
             raise ValueError("Portable bundle can contain at most one dataset snapshot.")
 
         portfolio_artifact = by_role["portfolio"][0]
-        portfolio_raw = cls._json_object(archive[portfolio_artifact.path], "Portfolio")
+        portfolio_bytes = archive[portfolio_artifact.path]
+        portfolio_raw = PortfolioContainer.read_document(portfolio_bytes)
         integrity = PortfolioIntegrityService.verify(portfolio_raw, signing_key=signing_key)
         PortfolioIntegrityService.require_restorable(
             integrity,
             require_signature=require_signature,
         )
-        portfolio = cast(PortfolioData, PortfolioMigrator.migrate(portfolio_raw))
+        portfolio = cast(
+            PortfolioData,
+            PortfolioContainer.attach_frames(
+                PortfolioMigrator.migrate(portfolio_raw), portfolio_bytes
+            ),
+        )
 
         source_artifact = by_role["source-manifest"][0]
         source_manifest = cls._json_object(archive[source_artifact.path], "Source manifest")
@@ -444,11 +463,13 @@ class PortfolioBundleService:
         elif portfolio.get("csv_path"):
             sources.append({"kind": "csv", "location": portfolio.get("csv_path")})
         data_csv = portfolio.get("data_csv")
-        embedded_digest = (
-            hashlib.sha256(data_csv.encode("utf-8")).hexdigest()
-            if isinstance(data_csv, str)
-            else None
-        )
+        data_ref = portfolio.get("data_ref")
+        if isinstance(data_csv, str):
+            embedded_digest: str | None = hashlib.sha256(data_csv.encode("utf-8")).hexdigest()
+        elif isinstance(data_ref, str) and data_ref.startswith("sha256:"):
+            embedded_digest = data_ref.removeprefix("sha256:")
+        else:
+            embedded_digest = None
         return {
             "format": "ring5.source-manifest",
             "format_version": 1,
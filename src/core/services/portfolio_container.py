@@ -0,0 +1,388 @@
+"""Binary portfolio containers with content-addressed, lazily decoded frames.
+
+Schema-5 portfolios are ZIP containers.  ``portfolio.json`` holds the usual
+document, and every distinct dataframe is stored once as a ``frames/`` member
+named by its content fingerprint.  The document refers to frames by that
+fingerprint (``data_ref`` for the workspace data, ``processed_data_ref`` per
+plot) and describes each member in its ``frames`` table, so plots whose
+processed data is identical share one member.
+
+Opening a portfolio reads only the document.  :class:`PortfolioFrames`
+decodes a frame the first time a caller asks for it, which for plots is the
+first render after a restore.  Older portfolios are plain JSON; the migrator
+moves their embedded CSV text into the same ``frames`` table.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections.abc import Collection, Iterator, Mapping
+from dataclasses import dataclass, field
+from io import BytesIO, StringIO
+from typing import Any, cast
+from zipfile import ZIP_DEFLATED, ZIP_STORED, BadZipFile, ZipFile, ZipInfo
+
+import pandas as pd
+
+from src.core.common.security_limits import MAX_DATASET_SNAPSHOT_BYTES
+from src.core.services.data_services.dataset_fingerprint import fingerprint_dataset
+from src.core.services.data_services.dataset_snapshot_service import DatasetSnapshotService
+from src.core.services.managers.semantic_metadata_service import SemanticMetadataService
+
+CONTAINER_MEDIA_TYPE = "application/vnd.ring5.portfolio+zip"
+_ZIP_MAGIC = b"PK\x03\x04"
+_DOCUMENT_MEMBER = "portfolio.json"
+_FRAME_DIRECTORY = "frames/"
+_SNAPSHOT_SUFFIX = ".ring5-snapshot"
+_CSV_SUFFIX = ".csv"
+_DIGEST_LENGTH = 64
+
+
+def _digest(ref: str) -> str:
+    """Return the hexadecimal part of a ``sha256:`` frame reference."""
+    if not isinstance(ref, str) or not ref.startswith("sha256:"):
+        raise ValueError(f"Portfolio frame reference {ref!r} is invalid.")
+    digest = ref.removeprefix("sha256:")
+    if len(digest) != _DIGEST_LENGTH or any(char not in "0123456789abcdef" for char in digest):
+        raise ValueError(f"Portfolio frame reference {ref!r} is invalid.")
+    return digest
+
+
+def _member_info(name: str) -> ZipInfo:
+    """Return a timestamp-free member header so equal content gives equal bytes."""
+    return ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+
+
+class PortfolioFrames(Mapping[str, Mapping[str, Any]]):
+    """A portfolio's ``frames`` table together with the bytes that hold its members.
+
+    The mapping view exposes the JSON table entries unchanged; :meth:`load`
+    decodes a frame on first use and keeps it for later callers.  The object
+    is immutable from the outside, so copies of a plot share one instance.
+    """
+
+    def __init__(
+        self,
+        table: Mapping[str, Any] | None,
+        container: bytes | None = None,
+        *,
+        detached: Mapping[str, bytes] | None = None,
+    ) -> None:
+        """Wrap a ``frames`` table.
+
+        Args:
+            table: The document's ``frames`` table (``None`` for no frames).
+            container: Container bytes holding the table's members, or
+                ``None`` for migrated JSON portfolios whose entries are inline.
+            detached: Member payloads stored outside the container, keyed by
+                member name (recovery drafts share snapshots this way).
+        """
+        if table is not None and not isinstance(table, Mapping):
+            raise ValueError("Portfolio frames must be an object.")
+        self._table: dict[str, Mapping[str, Any]] = {
+            str(ref): entry for ref, entry in (table or {}).items()
+        }
+        self._container = container
+        self._detached = dict(detached or {})
+        self._decoded: dict[str, pd.DataFrame] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, ref: str) -> Mapping[str, Any]:
+        return self._table[ref]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __copy__(self) -> PortfolioFrames:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> PortfolioFrames:
+        return self
+
+    def load(self, ref: str) -> pd.DataFrame:
+        # [impl->req~ring5.portfolio.restore~1]
+        """Return the frame stored under *ref*, decoding it on first use.
+
+        Every caller receives its own shallow copy; copy-on-write keeps those
+        copies independent without duplicating the decoded columns.
+
+        Raises:
+            ValueError: The reference is unknown or its stored content fails
+                verification.
+        """
+        with self._lock:
+            frame = self._decoded.get(ref)
+            if frame is None:
+                frame = self._decode(ref)
+                self._decoded[ref] = frame
+        return frame.copy(deep=False)
+
+    def stored(self, ref: str) -> tuple[str, bytes]:
+        """Return the encoding and undecoded payload of *ref* for re-saving."""
+        entry = self._entry(ref)
+        encoding = entry.get("encoding")
+        if encoding == "csv" and isinstance(entry.get("text"), str):
+            return "csv", cast(str, entry["text"]).encode("utf-8")
+        if encoding not in {"csv", "snapshot"}:
+            raise ValueError(f"Portfolio frame {ref!r} has unknown encoding {encoding!r}.")
+        return cast(str, encoding), self._member(ref, entry)
+
+    def _entry(self, ref: str) -> Mapping[str, Any]:
+        entry = self._table.get(ref)
+        if not isinstance(entry, Mapping):
+            raise ValueError(f"Portfolio frame {ref!r} is missing from the frames table.")
+        return entry
+
+    def _decode(self, ref: str) -> pd.DataFrame:
+        encoding, payload = self.stored(ref)
+        if encoding == "snapshot":
+            info, frame = DatasetSnapshotService.read_snapshot_bytes(payload)
+            if info.fingerprint != ref:
+                raise ValueError(f"Portfolio frame {ref!r} does not match its reference.")
+            return frame
+        expected = self._entry(ref).get("sha256")
+        if hashlib.sha256(payload).hexdigest() != expected:
+            raise ValueError(f"Portfolio frame {ref!r} failed its checksum.")
+        return pd.read_csv(StringIO(payload.decode("utf-8")))
+
+    def _member(self, ref: str, entry: Mapping[str, Any]) -> bytes:
+        member = entry.get("member")
+        if not isinstance(member, str) or not member.startswith(_FRAME_DIRECTORY):
+            raise ValueError(f"Portfolio frame {ref!r} has an invalid member name.")
+        payload = self._detached.get(member)
+        if payload is not None:
+            return payload
+        if self._container is None:
+            raise ValueError(
+                f"Portfolio frame {ref!r} is stored in a container that is not available."
+            )
+        try:
+            with ZipFile(BytesIO(self._container)) as archive:
+                info = archive.getinfo(member)
+                if info.file_size > MAX_DATASET_SNAPSHOT_BYTES:
+                    raise ValueError(f"Portfolio frame {ref!r} exceeds its size limit.")
+                return archive.read(info)
+        except (BadZipFile, KeyError) as exc:
+            raise ValueError(f"Portfolio frame {ref!r} is unreadable or missing.") from exc
+
+
+@dataclass(frozen=True)
+class PortfolioFrameRef:
+    """A restored frame that has not been decoded yet.
+
+    Attributes:
+        frames: Frames of the portfolio the reference was read from.
+        ref: Content fingerprint of the frame.
+        semantics: Semantic payload saved with the frame's owner.
+    """
+
+    frames: PortfolioFrames
+    ref: str
+    semantics: Mapping[str, Any] = field(default_factory=dict)
+
+    def load(self) -> pd.DataFrame:
+        """Decode the frame and attach its saved semantic labels and units."""
+        # [impl->req~ring5.data.semantic-units~1]
+        frame = self.frames.load(self.ref)
+        semantics = SemanticMetadataService.from_payload(
+            dict(self.semantics),
+            available_columns=tuple(str(column) for column in frame.columns),
+        )
+        # Snapshot members already carry labels; re-attaching would copy every column.
+        if SemanticMetadataService.inspect(frame) == semantics:
+            return frame
+        return SemanticMetadataService.attach(frame, semantics)
+
+
+class PortfolioFrameWriter:
+    """Collect the distinct frames of one container, keyed by content fingerprint."""
+
+    def __init__(self, *, shared: Collection[str] | None = None) -> None:
+        """Start an empty frame set.
+
+        Args:
+            shared: When given, snapshot frames are kept out of the container
+                for a store shared between containers.  The listed references
+                are already in that store and are not encoded again; newly
+                encoded ones are returned by :meth:`detached`.
+        """
+        self._frames: dict[str, pd.DataFrame] = {}
+        self._reused: dict[str, PortfolioFrames] = {}
+        self._shared = None if shared is None else frozenset(shared)
+        self._members: dict[str, bytes] | None = None
+        self._detached: dict[str, bytes] = {}
+
+    def add(self, frame: pd.DataFrame) -> str:
+        """Register *frame* and return its reference; equal frames share one entry."""
+        ref = fingerprint_dataset(frame)
+        if ref not in self._reused:
+            self._frames.setdefault(ref, frame)
+        return ref
+
+    def reuse(self, pending: PortfolioFrameRef) -> str:
+        """Register a frame that was never decoded, copying its stored bytes as-is."""
+        if pending.ref not in self._frames:
+            self._reused.setdefault(pending.ref, pending.frames)
+        return pending.ref
+
+    def table(self) -> dict[str, dict[str, Any]]:
+        # [impl->req~ring5.portfolio.save~1]
+        """Encode every registered frame and return the document's ``frames`` table.
+
+        Frames whose values or dtypes a dataset snapshot cannot reproduce
+        exactly fall back to CSV text, the pre-container representation.
+        """
+        table: dict[str, dict[str, Any]] = {}
+        members: dict[str, bytes] = {}
+        detached: dict[str, bytes] = {}
+        stored: list[tuple[str, str, bytes | None]] = []
+        for ref, frame in self._frames.items():
+            if self._shared is not None and ref in self._shared:
+                stored.append((ref, "snapshot", None))
+            else:
+                stored.append((ref, *self._snapshot_or_csv(ref, frame)))
+        for ref, frames in self._reused.items():
+            if self._shared is not None and ref in self._shared:
+                stored.append((ref, "snapshot", None))
+            else:
+                stored.append((ref, *frames.stored(ref)))
+        for ref, encoding, payload in sorted(stored, key=lambda item: item[0]):
+            suffix = _SNAPSHOT_SUFFIX if encoding == "snapshot" else _CSV_SUFFIX
+            member = f"{_FRAME_DIRECTORY}{_digest(ref)}{suffix}"
+            entry: dict[str, Any] = {"encoding": encoding, "member": member}
+            table[ref] = entry
+            if payload is None:
+                continue
+            if encoding == "csv":
+                entry["sha256"] = hashlib.sha256(payload).hexdigest()
+            if encoding == "snapshot" and self._shared is not None:
+                detached[member] = payload
+            else:
+                members[member] = payload
+        self._members = members
+        self._detached = detached
+        return table
+
+    def detached(self) -> Mapping[str, bytes]:
+        """Return snapshot members :meth:`table` kept out of a shared-store container."""
+        return dict(self._detached)
+
+    def container(self, document: Mapping[str, Any]) -> bytes:
+        """Return container bytes for *document* and the frames :meth:`table` encoded."""
+        if self._members is None:
+            raise RuntimeError("PortfolioFrameWriter.table() must run before container().")
+        buffer = BytesIO()
+        with ZipFile(buffer, "w") as archive:
+            archive.writestr(
+                _member_info(_DOCUMENT_MEMBER),
+                json.dumps(document, indent=2).encode("utf-8"),
+                compress_type=ZIP_DEFLATED,
+            )
+            for member, payload in self._members.items():
+                # Snapshots compress their own JSON members; their column buffer stays raw.
+                compression = ZIP_STORED if member.endswith(_SNAPSHOT_SUFFIX) else ZIP_DEFLATED
+                archive.writestr(_member_info(member), payload, compress_type=compression)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _snapshot_or_csv(ref: str, frame: pd.DataFrame) -> tuple[str, bytes]:
+        try:
+            return "snapshot", DatasetSnapshotService.snapshot_bytes(
+                frame, name=_digest(ref)[:16], source_dataset="portfolio"
+            )
+        except (TypeError, ValueError):
+            return "csv", frame.to_csv(index=False).encode("utf-8")
+
+
+class PortfolioContainer:
+    """Read portfolio documents from container or legacy JSON bytes."""
+
+    @staticmethod
+    def is_container(raw: bytes) -> bool:
+        """Return whether *raw* is a container rather than a JSON document."""
+        return raw[: len(_ZIP_MAGIC)] == _ZIP_MAGIC
+
+    @classmethod
+    def read_document(cls, raw: bytes) -> dict[str, Any]:
+        """Return the top-level portfolio object without decoding any frame.
+
+        Raises:
+            ValueError: The bytes are neither a valid container nor a JSON object.
+        """
+        try:
+            if cls.is_container(raw):
+                value = json.loads(cls._document_member(raw).decode("utf-8"))
+            else:
+                value = json.loads(raw.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise ValueError("Portfolio is not a valid container or UTF-8 JSON.") from exc
+        if not isinstance(value, dict):
+            raise ValueError("Portfolio JSON must contain one top-level object.")
+        return cast(dict[str, Any], value)
+
+    @classmethod
+    def attach_frames(
+        cls,
+        portfolio: dict[str, Any],
+        raw: bytes,
+        *,
+        detached: Mapping[str, bytes] | None = None,
+    ) -> dict[str, Any]:
+        """Return migrated *portfolio* with its ``frames`` table backed by *raw*.
+
+        Args:
+            portfolio: Document already migrated to the current schema.
+            raw: Exact bytes the document was read from.
+            detached: Member payloads stored outside *raw*, keyed by member name.
+        """
+        frames = portfolio.get("frames")
+        portfolio["frames"] = PortfolioFrames(
+            frames if isinstance(frames, Mapping) else None,
+            raw if cls.is_container(raw) else None,
+            detached=detached,
+        )
+        return portfolio
+
+    @classmethod
+    def replace_document(cls, raw: bytes, document: Mapping[str, Any]) -> bytes:
+        """Return *raw* with its document replaced and every frame member kept."""
+        if not cls.is_container(raw):
+            return json.dumps(document, indent=2).encode("utf-8")
+        buffer = BytesIO()
+        try:
+            with ZipFile(BytesIO(raw)) as source, ZipFile(buffer, "w") as target:
+                for info in source.infolist():
+                    if info.filename == _DOCUMENT_MEMBER:
+                        target.writestr(
+                            _member_info(_DOCUMENT_MEMBER),
+                            json.dumps(document, indent=2).encode("utf-8"),
+                            compress_type=ZIP_DEFLATED,
+                        )
+                    else:
+                        target.writestr(info, source.read(info))
+        except BadZipFile as exc:
+            raise ValueError("Portfolio container is not a valid ZIP archive.") from exc
+        return buffer.getvalue()
+
+    @staticmethod
+    def _document_member(raw: bytes) -> bytes:
+        try:
+            with ZipFile(BytesIO(raw)) as archive:
+                for info in archive.infolist():
+                    name = info.filename
+                    if info.is_dir() or info.flag_bits & 0x1:
+                        raise ValueError("Portfolio container contains an unsafe member.")
+                    if name != _DOCUMENT_MEMBER and not (
+                        name.startswith(_FRAME_DIRECTORY)
+                        and name.endswith((_SNAPSHOT_SUFFIX, _CSV_SUFFIX))
+                        and "/" not in name.removeprefix(_FRAME_DIRECTORY)
+                    ):
+                        raise ValueError(f"Portfolio container has unexpected member {name!r}.")
+                return archive.read(_DOCUMENT_MEMBER)
+        except (BadZipFile, KeyError) as exc:
+            raise ValueError("Portfolio container is unreadable or incomplete.") from exc
@@ -31,6 +31,10 @@ _CONFIGURATION_KEYS = (
     "shapers",
 )
 _OUTPUT_PLOT_KEYS = ("id", "processed_data", "processed_semantics")
+# Schema-5 frame references join their sections only when present, so manifests
+# written before they existed keep verifying.
+_FRAME_INPUT_KEYS = ("data_ref", "frames")
+_FRAME_OUTPUT_PLOT_KEY = "processed_data_ref"
 _MAX_SIGNING_KEY_BYTES = 4096
 _MAX_KEY_ID_LENGTH = 128
 
@@ -301,10 +305,15 @@ class PortfolioIntegrityService:
         plots = body.get("plots", [])
         plot_values = plots if isinstance(plots, list) else []
         inputs = {key: body.get(key) for key in _INPUT_KEYS}
+        inputs.update({key: body[key] for key in _FRAME_INPUT_KEYS if key in body})
         configuration = {key: body.get(key) for key in _CONFIGURATION_KEYS}
         configuration["plots"] = [
             (
-                {str(key): value for key, value in plot.items() if key not in _OUTPUT_PLOT_KEYS}
+                {
+                    str(key): value
+                    for key, value in plot.items()
+                    if key not in _OUTPUT_PLOT_KEYS and key != _FRAME_OUTPUT_PLOT_KEY
+                }
                 if isinstance(plot, Mapping)
                 else plot
             )
@@ -313,7 +322,14 @@ class PortfolioIntegrityService:
         outputs = {
             "plots": [
                 (
-                    {key: plot.get(key) for key in _OUTPUT_PLOT_KEYS}
+                    {
+                        **{key: plot.get(key) for key in _OUTPUT_PLOT_KEYS},
+                        **(
+                            {_FRAME_OUTPUT_PLOT_KEY: plot[_FRAME_OUTPUT_PLOT_KEY]}
+                            if _FRAME_OUTPUT_PLOT_KEY in plot
+                            else {}
+                        ),
+                    }
                     if isinstance(plot, Mapping)
                     else plot
                 )
@@ -7,11 +7,14 @@ Schema versions:
     - **V1** (original): flat config dicts, ``export_*`` keys for LaTeX.
     - **V2**: ``engine`` field per plot, no ``export_*`` keys.
     - **V3**: optional save-time execution-environment metadata.
-    - **V4** (current): optional portfolio integrity manifest.
+    - **V4**: optional portfolio integrity manifest.
+    - **V5** (current): tables live in a content-addressed ``frames`` table
+      referenced by ``data_ref`` and per-plot ``processed_data_ref``.
 """
 
 from __future__ import annotations
 
+import hashlib
 from typing import Any
 
 from src.core.models.visualization.engine import DEFAULT_ENGINE
@@ -38,7 +41,7 @@ class PortfolioMigrator:
         migrated = PortfolioMigrator.migrate(raw)
     """
 
-    CURRENT_VERSION: int = 4
+    CURRENT_VERSION: int = 5
 
     @staticmethod
     def migrate(portfolio_data: dict[str, Any]) -> dict[str, Any]:
@@ -76,6 +79,8 @@ class PortfolioMigrator:
             portfolio_data = PortfolioMigrator._migrate_v2_to_v3(portfolio_data)
         if version < 4:
             portfolio_data = PortfolioMigrator._migrate_v3_to_v4(portfolio_data)
+        if version < 5:
+            portfolio_data = PortfolioMigrator._migrate_v4_to_v5(portfolio_data)
 
         portfolio_data["schema_version"] = PortfolioMigrator.CURRENT_VERSION
         return portfolio_data
@@ -141,3 +146,46 @@ class PortfolioMigrator:
         data.setdefault("integrity_manifest", None)
         data["version"] = "4.0"
         return data
+
+    @staticmethod
+    def _migrate_v4_to_v5(data: dict[str, Any]) -> dict[str, Any]:
+        # [impl->req~ring5.portfolio.migration~1]
+        """V4 → V5: move embedded CSV tables into the ``frames`` table.
+
+        Changes:
+            - ``data_csv`` becomes ``data_ref`` and each plot's
+              ``processed_data`` becomes ``processed_data_ref``.
+            - Identical CSV text (plots sharing one pipeline result) collapses
+              into a single entry keyed by its SHA-256.
+
+        Note:
+            The CSV text is only hashed here; it is parsed when the restored
+            workspace first needs the table.
+        """
+        data = dict(data)
+        raw_frames = data.get("frames")
+        frames: dict[str, Any] = dict(raw_frames) if isinstance(raw_frames, dict) else {}
+
+        def hoist(text: object) -> str | None:
+            if not isinstance(text, str) or not text:
+                return None
+            digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            ref = f"sha256:{digest}"
+            frames.setdefault(ref, {"encoding": "csv", "sha256": digest, "text": text})
+            return ref
+
+        if "data_csv" in data:
+            data["data_ref"] = hoist(data.pop("data_csv"))
+        data.setdefault("data_ref", None)
+        plots_raw = data.get("plots")
+        if isinstance(plots_raw, list):
+            plots: list[Any] = []
+            for plot in plots_raw:
+                if isinstance(plot, dict) and "processed_data" in plot:
+                    plot = dict(plot)
+                    plot["processed_data_ref"] = hoist(plot.pop("processed_data"))
+                plots.append(plot)
+            data["plots"] = plots
+        data["frames"] = frames
+        data["version"] = "5.0"
+        return data
@@ -19,6 +19,7 @@ from src.core.common.security_limits import (
     MAX_SCHEDULED_REPORT_STABLE_SECONDS,
     MAX_SCHEDULED_REPORT_STATE_BYTES,
 )
+from src.core.models.parsing_models import CONFIG_INI_STRATEGIES
 from src.core.models.recipe_models import RecipeSource
 from src.core.models.scheduled_report_models import ScheduledReportOutcome, ScheduledReportResult
 
@@ -69,7 +70,7 @@ class ScheduledReportService:
             raise ScheduledReportError(
                 f"No files matching {source.pattern!r} found under {source.path!r}."
             )
-        if source.strategy == "config_aware":
+        if source.strategy in CONFIG_INI_STRATEGIES:
             companions = tuple(str(Path(path).parent / "config.ini") for path in files)
             return tuple(dict.fromkeys(files + companions))
         return files
@@ -1,7 +1,8 @@
 """Shapers submodule: pipeline CRUD and shaper transformation chains."""
 
 from .factory import ShaperFactory
-from .pipeline_service import PipelineService
+from .pipeline_cache import PipelineCache
+from .pipeline_service import PipelineRun, PipelineService, PipelineStepTiming
 from .shaper import Shaper
 from .shapers_api import ShapersAPI
 from .shapers_impl import DefaultShapersAPI
@@ -10,6 +11,9 @@ __all__ = [
     "ShapersAPI",
     "DefaultShapersAPI",
     "PipelineService",
+    "PipelineRun",
+    "PipelineStepTiming",
+    "PipelineCache",
     "ShaperFactory",
     "Shaper",
 ]
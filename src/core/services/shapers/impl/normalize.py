@@ -1,9 +1,9 @@
 """Shaper for baseline-relative normalization within groups."""
 
 import logging
-import warnings
 from typing import Any, cast, override
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
@@ -110,63 +110,99 @@ class Normalize(UniDfShaper):
                 f"in column '{self._normalizer_column}'."
             )
 
-        # Group validation
-        groups = data_frame.groupby(self._group_by)
-        if len(groups) == 0:
+        # Group validation: one grouped count of all rows and one value_counts of
+        # the baseline rows replace a Python loop over every group.
+        group_sizes = data_frame.groupby(self._group_by).size()
+        if len(group_sizes) == 0:
             raise ValueError("No groups found for the specified groupBy columns.")
 
-        for name, group in groups:
-            baseline_rows = group[group[self._normalizer_column] == self._normalizer_value]
-            if len(baseline_rows) != 1:
-                raise ValueError(
-                    f"Ambiguous baseline: Group {name} has {len(baseline_rows)} baseline rows. "
-                    "Each group must have exactly one row matching the normalizer value."
-                )
+        groups = self._as_multi_index(group_sizes.index)
+        baseline_counts = (
+            data_frame.loc[self._baseline_mask(data_frame), self._group_by]
+            .value_counts()
+            .reindex(groups, fill_value=0)
+        )
+        ambiguous = baseline_counts[baseline_counts != 1]
+        if not ambiguous.empty:
+            # Plain scalars, as ``groupby`` iteration names each group.
+            name = tuple(
+                key.item() if isinstance(key, np.generic) else key for key in ambiguous.index[0]
+            )
+            raise ValueError(
+                f"Ambiguous baseline: Group {name} has {ambiguous.iloc[0]} baseline rows. "
+                "Each group must have exactly one row matching the normalizer value."
+            )
 
         return True
 
-    def _normalize_group(self, group: pd.DataFrame) -> pd.DataFrame:
+    def _baseline_mask(self, data_frame: pd.DataFrame) -> pd.Series:
+        """Return whether each row is its group's baseline row."""
+        return cast(pd.Series, data_frame[self._normalizer_column] == self._normalizer_value)
+
+    @staticmethod
+    def _as_multi_index(index: pd.Index) -> pd.MultiIndex:
+        """Express group keys as tuples, as ``groupby`` with a list of keys names them."""
+        if isinstance(index, pd.MultiIndex):
+            return index
+        return pd.MultiIndex.from_arrays([index])
+
+    def _normalize(self, data_frame: pd.DataFrame) -> pd.DataFrame:
         """
-        Normalize a single group of data.
+        Normalize every group in one vectorized pass.
+
+        Baseline denominators are summed once per baseline row and broadcast to
+        the rows of their group by group number. Rows keep their input order and
+        rows whose group keys are missing are dropped, as a per-group
+        ``groupby().apply`` returned them.
 
         Args:
-            group: A subdivision of the original dataframe.
+            data_frame: Validated input data.
 
         Returns:
             A new dataframe with normalized values.
         """
         # [impl->req~ring5.shaping.normalize~1]
-        result = group.copy()
-
-        # Identify the baseline row for this group
-        baseline = result[result[self._normalizer_column] == self._normalizer_value]
-
-        if baseline.empty:
-            return result
-
-        # Calculate denominator (sum of specified normalizer variables)
-        baseline_vars = baseline[self._normalizer_vars]
-        denominator = baseline_vars.iloc[0].sum()
-
-        if pd.isna(denominator) or denominator == 0:
-            # Prevent division by zero: zero out normalized columns
-            for var in self._normalize_vars:
-                result[var] = 0.0
-                if self._normalize_sd:
-                    sd_col = f"{var}.sd"
-                    if sd_col in result.columns:
-                        result[sd_col] = 0.0
-            return result
-
-        # Perform the actual scaling
-        for var in self._normalize_vars:
-            result[var] = result[var] / denominator
-            if self._normalize_sd:
-                sd_col = f"{var}.sd"
-                if sd_col in result.columns:
-                    result[sd_col] = result[sd_col] / denominator
-
-        return result
+        group_ids = data_frame.groupby(self._group_by).ngroup().to_numpy()
+        baseline = self._baseline_mask(data_frame).to_numpy(dtype=bool) & (group_ids >= 0)
+
+        # Sum of the normalizer variables in each group's (unique) baseline row,
+        # broadcast to every row through the position of that baseline row.
+        baseline_rows = data_frame.loc[baseline, self._normalizer_vars]
+        sums = baseline_rows.sum(axis=1)
+        slots = np.empty(int(group_ids.max()) + 1, dtype=np.intp)
+        slots[group_ids[baseline]] = np.arange(len(sums))
+        denominators = sums.take(slots[np.maximum(group_ids, 0)]).set_axis(data_frame.index)
+        # Prevent division by zero: groups with a zero or NaN denominator are zeroed out.
+        valid = (denominators.notna() & (denominators != 0)).to_numpy(dtype=bool)
+        # Per-group division used a scalar denominator, which adopts the column's
+        # precision (float32 stays float32); derive each result dtype the same way.
+        sample = baseline_rows.iloc[0].sum()
+
+        result = data_frame.copy()
+        targets = list(self._normalize_vars)
+        if self._normalize_sd:
+            targets = [
+                column
+                for var in self._normalize_vars
+                for column in (var, f"{var}.sd")
+                if column == var or column in result.columns
+            ]
+        for column in targets:
+            target = (result[column].iloc[:0] / sample).dtype
+            divisor = denominators
+            if isinstance(target, np.dtype) and isinstance(divisor.dtype, np.dtype):
+                divisor = divisor.astype(target)
+            scaled = result[column] / divisor
+            result[column] = scaled if valid.all() else scaled.where(valid, 0.0)
+
+        if not valid.all():
+            for column in dict.fromkeys(targets):
+                dtype = result[column].dtype
+                if isinstance(dtype, np.dtype):
+                    # Zeroed groups held float64 0.0 when the groups were concatenated.
+                    result[column] = result[column].astype(np.promote_types(dtype, np.float64))
+
+        return result[group_ids >= 0]
 
     @cached(ttl=300, maxsize=32, key_func=lambda self, df, fp: fp)
     def _normalize_with_cache(self, data_frame: pd.DataFrame, fingerprint: str) -> pd.DataFrame:
@@ -191,35 +227,7 @@ class Normalize(UniDfShaper):
         # fingerprint-matched frame does not repeat that work on every hit.
         self._verify_preconditions(data_frame)
 
-        with warnings.catch_warnings():
-            # Suppress pandas warning about group keys
-            warnings.filterwarnings(
-                "ignore",
-                category=FutureWarning,
-                message=".*DataFrameGroupBy.apply operated on the grouping columns.*",
-            )
-            # pandas >=2.x compat: groupby().apply() may drop grouping columns
-            # (FutureWarning in 2.x, default in 3.0). Preserve them manually.
-            grouped = data_frame.groupby(self._group_by, group_keys=False)
-            result: pd.DataFrame = grouped.apply(self._normalize_group)
-
-            # pandas >=2.x compat: grouping columns may be dropped, re-add them
-            if not all(col in result.columns for col in self._group_by):
-                # Merge with original group columns
-                for col in self._group_by:
-                    if col not in result.columns:
-                        result[col] = data_frame[col].copy()
-
-            # Preserve the original column order. Re-adding grouping columns
-            # above appends them at the end; pandas 3.0's groupby().apply() drops
-            # them by default, so without this the input order is lost (e.g. the
-            # groupBy column jumps to the end). New columns (e.g. .sd) keep their
-            # trailing position.
-            ordered = [c for c in data_frame.columns if c in result.columns]
-            extra = [c for c in result.columns if c not in ordered]
-            result = result[ordered + extra]
-
-        return result
+        return self._normalize(data_frame)
 
     @override
     def __call__(self, data_frame: pd.DataFrame) -> pd.DataFrame:
@@ -234,7 +242,7 @@ class Normalize(UniDfShaper):
         """
         # Compute fingerprint for caching (only hash metadata, not entire DataFrame).
         # Include ``normalizer_vars`` because it supplies the denominator (see
-        # ``_normalize_group``) and can differ from ``normalize_vars``; omitting it lets a
+        # ``_normalize``) and can differ from ``normalize_vars``; omitting it lets a
         # different baseline value return a stale (wrong) normalized frame within the TTL.
         relevant_cols = (
             self._normalize_vars
@@ -0,0 +1,155 @@
+"""Byte-budgeted memoization of shaper-pipeline prefixes.
+
+Every intermediate result is stored under a key chained from the input
+dataset fingerprint and the canonical configuration of each step up to it,
+so re-running a pipeline whose later steps were edited resumes from the
+longest unchanged prefix instead of the raw input.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from src.core.models.shaper_models import ShaperStepConfig
+from src.core.services.data_services.dataset_fingerprint import fingerprint_dataset
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MB = 256
+
+
+def _default_max_bytes() -> int:
+    """Return the cache budget, honoring an explicit megabyte deployment override."""
+    value = os.environ.get("RING5_PIPELINE_CACHE_MB")
+    if value is None:
+        return DEFAULT_MAX_MB * 1024 * 1024
+
+    try:
+        megabytes = int(value)
+    except ValueError:
+        logger.warning("Ignoring non-integer RING5_PIPELINE_CACHE_MB=%r", value)
+        return DEFAULT_MAX_MB * 1024 * 1024
+
+    if megabytes < 0:
+        logger.warning("Ignoring negative RING5_PIPELINE_CACHE_MB=%r", value)
+        return DEFAULT_MAX_MB * 1024 * 1024
+    return megabytes * 1024 * 1024
+
+
+class PipelineCache:
+    """Thread-safe LRU cache of pipeline prefix results bounded by total bytes."""
+
+    # [impl->req~ring5.quality.bounded-caching~1]
+
+    def __init__(self, max_bytes: int | None = None) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            max_bytes: Budget for the summed deep memory usage of cached frames.
+                Defaults to ``RING5_PIPELINE_CACHE_MB`` or 256 MiB; 0 disables caching.
+        """
+        resolved = _default_max_bytes() if max_bytes is None else max_bytes
+        if resolved < 0:
+            raise ValueError("Pipeline cache budget cannot be negative.")
+        self._cache: OrderedDict[str, tuple[pd.DataFrame, int]] = OrderedDict()
+        self._max_bytes = resolved
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any result can be cached under the current budget."""
+        return self._max_bytes > 0
+
+    @staticmethod
+    def prefix_keys(data: pd.DataFrame, pipeline_config: list[ShaperStepConfig]) -> list[str]:
+        """Return one key per step, each identifying the input plus steps ``0..i``.
+
+        Args:
+            data: Pipeline input.
+            pipeline_config: Ordered shaper step configurations.
+
+        Returns:
+            Keys aligned with ``pipeline_config``.
+        """
+        digest = hashlib.sha256(fingerprint_dataset(data).encode("utf-8"))
+        # Shapers read semantic metadata from attrs, which the fingerprint ignores.
+        digest.update(json.dumps(data.attrs, sort_keys=True, default=str).encode("utf-8"))
+        keys: list[str] = []
+        for step in pipeline_config:
+            digest.update(b"\x00")
+            digest.update(json.dumps(step, sort_keys=True, default=str).encode("utf-8"))
+            keys.append(digest.copy().hexdigest())
+        return keys
+
+    def longest_prefix(self, keys: list[str]) -> tuple[int, pd.DataFrame | None]:
+        """Find the longest cached prefix (marks it as recently used).
+
+        Args:
+            keys: Keys from :meth:`prefix_keys`.
+
+        Returns:
+            The number of steps covered and a shallow copy of their result,
+            or ``(0, None)`` when no prefix is cached.
+        """
+        with self._lock:
+            for position in range(len(keys) - 1, -1, -1):
+                entry = self._cache.get(keys[position])
+                if entry is not None:
+                    self._cache.move_to_end(keys[position])
+                    self._hits += 1
+                    return position + 1, entry[0].copy(deep=False)
+            self._misses += 1
+            return 0, None
+
+    def set(self, key: str, data: pd.DataFrame) -> None:
+        """Cache one prefix result, evicting least-recently-used entries over budget."""
+        size = int(data.memory_usage(index=True, deep=True).sum())
+        if size > self._max_bytes:
+            return
+        # A shallow copy so in-place edits by the caller never reach the cache.
+        value = data.copy(deep=False)
+        with self._lock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            while self._cache and self._bytes + size > self._max_bytes:
+                _key, (_value, evicted) = self._cache.popitem(last=False)
+                self._bytes -= evicted
+                self._evictions += 1
+            self._cache[key] = (value, size)
+            self._bytes += size
+
+    def clear(self) -> None:
+        """Clear all cached entries."""
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> dict[str, int | float]:
+        """Get cache statistics; hits and misses count pipeline runs."""
+        with self._lock:
+            total = self._hits + self._misses
+            hit_rate = (self._hits / total * 100) if total > 0 else 0
+            stats: dict[str, int | float] = {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._cache),
+                "hit_rate": round(hit_rate, 2),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "evictions": self._evictions,
+            }
+            return stats
@@ -7,11 +7,13 @@ canonical pipeline-execution engine, exposed to the UI through
 
 import logging
 import time
+from dataclasses import dataclass
 
 import pandas as pd
 
 from src.core.models.shaper_models import ShaperStepConfig
 from src.core.services.shapers.factory import ShaperFactory
+from src.core.services.shapers.pipeline_cache import PipelineCache
 
 logger = logging.getLogger(__name__)
 
@@ -30,9 +32,35 @@ class PipelineStepError(ValueError):
         super().__init__(message)
 
 
+@dataclass(frozen=True, slots=True)
+class PipelineStepTiming:
+    """Wall-clock cost of one pipeline step."""
+
+    step_index: int
+    shaper_type: str
+    seconds: float
+    cached: bool
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineRun:
+    """A pipeline result together with how each step was produced."""
+
+    data: pd.DataFrame
+    steps: tuple[PipelineStepTiming, ...]
+    total_seconds: float
+
+    @property
+    def cached_steps(self) -> int:
+        """Number of leading steps reused from the pipeline cache."""
+        return sum(1 for step in self.steps if step.cached)
+
+
 class PipelineService:
     """Executes shaper transformation chains."""
 
+    _cache = PipelineCache()
+
     @staticmethod
     def process_pipeline(
         data: pd.DataFrame, pipeline_config: list[ShaperStepConfig]
@@ -43,12 +71,45 @@ class PipelineService:
         Raises ``PipelineStepError`` (a ``ValueError`` carrying
         ``step_index``/``shaper_type``) if any step is malformed or fails.
         """
+        return PipelineService.run_pipeline(data, pipeline_config).data
+
+    @staticmethod
+    def run_pipeline(
+        data: pd.DataFrame, pipeline_config: list[ShaperStepConfig], *, use_cache: bool = True
+    ) -> PipelineRun:
+        """Apply a sequence of shapers, resuming from the longest cached prefix.
+
+        Args:
+            data: Pipeline input.
+            pipeline_config: Ordered shaper step configurations.
+            use_cache: Reuse and record intermediate results in the pipeline cache.
+
+        Returns:
+            The final dataframe with per-step timings.
+
+        Raises:
+            PipelineStepError: A step is malformed or fails.
+        """
         # [impl->req~ring5.shaping.independent-pipelines~1]
         # [impl->req~ring5.quality.immutable-data~1]
         t_start = time.perf_counter()
         current_data = data
+        timings: list[PipelineStepTiming] = []
+        cache = PipelineService._cache
+        keys: list[str] = []
+        resume_at = 0
+        if use_cache and cache.enabled and pipeline_config:
+            keys = PipelineCache.prefix_keys(data, pipeline_config)
+            resume_at, cached_data = cache.longest_prefix(keys)
+            if cached_data is not None:
+                current_data = cached_data
+                timings.extend(
+                    PipelineStepTiming(i, str(pipeline_config[i].get("type")), 0.0, True)
+                    for i in range(resume_at)
+                )
+                logger.info(f"PERF: Resumed pipeline from cache after {resume_at} step(s)")
 
-        for i, shaper_config in enumerate(pipeline_config):
+        for i, shaper_config in enumerate(pipeline_config[resume_at:], start=resume_at):
             shaper_type = shaper_config.get("type")
             if not shaper_type:
                 raise PipelineStepError(
@@ -72,7 +133,22 @@ class PipelineService:
                     step_index=i,
                     shaper_type=str(shaper_type),
                 ) from e
+            timings.append(
+                PipelineStepTiming(i, str(shaper_type), t_shaper_end - t_shaper_start, False)
+            )
+            if keys:
+                cache.set(keys[i], current_data)
 
         t_total = time.perf_counter() - t_start
         logger.info(f"PERF: process_pipeline total took {t_total:.4f}s for {len(data)} rows")
-        return current_data
+        return PipelineRun(data=current_data, steps=tuple(timings), total_seconds=t_total)
+
+    @staticmethod
+    def cache_stats() -> dict[str, int | float]:
+        """Return pipeline-prefix cache statistics."""
+        return PipelineService._cache.stats()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop every cached pipeline prefix."""
+        PipelineService._cache.clear()
@@ -9,6 +9,7 @@ from typing import Protocol, runtime_checkable
 import pandas as pd
 
 from src.core.models.shaper_models import ShaperStepConfig
+from src.core.services.shapers.pipeline_service import PipelineRun
 from src.core.services.shapers.shaper import Shaper
 
 
@@ -24,6 +25,18 @@ class ShapersAPI(Protocol):
         """Apply a sequence of shapers to a DataFrame."""
         raise NotImplementedError
 
+    def run_pipeline(
+        self,
+        data: pd.DataFrame,
+        pipeline_config: list[ShaperStepConfig],
+    ) -> PipelineRun:
+        """Apply a sequence of shapers and report per-step timings and cache reuse."""
+        raise NotImplementedError
+
+    def pipeline_cache_stats(self) -> dict[str, int | float]:
+        """Return pipeline-prefix cache statistics."""
+        raise NotImplementedError
+
     def create_shaper(
         self,
         shaper_type: str,
@@ -8,7 +8,7 @@ import pandas as pd
 
 from src.core.models.shaper_models import ShaperStepConfig
 from src.core.services.shapers.factory import ShaperFactory
-from src.core.services.shapers.pipeline_service import PipelineService
+from src.core.services.shapers.pipeline_service import PipelineRun, PipelineService
 from src.core.services.shapers.shaper import Shaper
 
 
@@ -26,6 +26,18 @@ class DefaultShapersAPI:
         """Apply a sequence of shapers to a DataFrame."""
         return PipelineService.process_pipeline(data, pipeline_config)
 
+    def run_pipeline(
+        self,
+        data: pd.DataFrame,
+        pipeline_config: list[ShaperStepConfig],
+    ) -> PipelineRun:
+        """Apply a sequence of shapers and report per-step timings and cache reuse."""
+        return PipelineService.run_pipeline(data, pipeline_config)
+
+    def pipeline_cache_stats(self) -> dict[str, int | float]:
+        """Return pipeline-prefix cache statistics."""
+        return PipelineService.cache_stats()
+
     def create_shaper(
         self,
         shaper_type: str,
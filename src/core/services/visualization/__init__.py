@@ -15,6 +15,11 @@ from src.core.services.visualization.config_resolver import (  # noqa: F401
 from src.core.services.visualization.accessibility_service import AccessibilityService  # noqa: F401
 from src.core.services.visualization.figure_theme_service import FigureThemeService  # noqa: F401
 from src.core.services.visualization.drill_down_service import drill_down_rows  # noqa: F401
+from src.core.services.visualization.downsampling_service import (  # noqa: F401
+    interactive_display,
+    reduce_for_display,
+)
+from src.core.services.visualization.row_partition import RowPartition  # noqa: F401
 from src.core.services.visualization.small_multiples_service import (  # noqa: F401
     create_small_multiples_spec,
 )
@@ -0,0 +1,237 @@
+"""Shape-preserving point reduction for very large line, scatter, and area traces.
+
+Browsers stall on traces with millions of points, so plot types reduce
+oversized groups server-side before building their traces:
+
+- Lines keep the first, last, lowest, and highest point of every x bucket
+  (min-max per pixel column), plus one missing value for every bucket that
+  contains a gap so broken lines stay broken.
+- Scatters keep one point per occupied cell of a fixed screen grid.
+
+When the user has zoomed (``range_x``), only the visible window is reduced,
+so each zoom re-samples at a finer resolution until the raw points fit.
+
+Reduction is a display concern: it only applies inside
+:func:`interactive_display`, which the web app enters while building the
+interactive Plotly chart. Every other render (the Matplotlib engine, static
+and file exports, the ``ring5`` API) keeps all points.
+
+All functions are pure and engine-agnostic; choosing a WebGL trace type for
+large groups is left to the plot types and connectors.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Literal
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype
+
+ReductionKind = Literal["line", "scatter"]
+
+DEFAULT_LARGE_DATA_THRESHOLD = 50_000
+LINE_BUCKETS = 2_000
+SCATTER_GRID = 256
+
+_interactive_display: ContextVar[bool] = ContextVar("ring5_interactive_display", default=False)
+
+
+@contextmanager
+def interactive_display() -> Iterator[None]:
+    """Enable the large-data mode for traces built inside this block."""
+    token = _interactive_display.set(True)
+    try:
+        yield
+    finally:
+        _interactive_display.reset(token)
+
+
+def large_data_threshold(config: Mapping[str, Any]) -> int:
+    """Return the per-trace point count above which traces are reduced.
+
+    Reads ``large_data_threshold`` from a plot config; ``0`` disables reduction.
+    Outside :func:`interactive_display` the value is validated but ``0`` is
+    returned, so the render keeps every point.
+
+    Raises:
+        ValueError: If the configured value is not a non-negative integer.
+    """
+    value = config.get("large_data_threshold")
+    if value is None:
+        value = DEFAULT_LARGE_DATA_THRESHOLD
+    if isinstance(value, bool) or not isinstance(value, (int, np.integer)) or value < 0:
+        raise ValueError("large_data_threshold must be a non-negative integer.")
+    return int(value) if _interactive_display.get() else 0
+
+
+def is_large(point_count: int, threshold: int) -> bool:
+    """Return whether a trace with *point_count* points needs the large-data mode."""
+    return threshold > 0 and point_count > threshold
+
+
+def _positions(values: pd.Series) -> NDArray[np.float64]:
+    """Map numeric, datetime, or categorical values onto a float axis (missing -> NaN)."""
+    if is_datetime64_any_dtype(values):
+        seconds: pd.Series[Any] = (values - values.min()) / pd.Timedelta(seconds=1)
+        return seconds.to_numpy(dtype=float, na_value=np.nan)
+    if is_numeric_dtype(values) and not is_bool_dtype(values):
+        return pd.to_numeric(values, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    codes = pd.factorize(values)[0].astype(float)
+    codes[codes < 0] = np.nan
+    return codes
+
+
+def _numeric(values: Any) -> NDArray[np.float64]:
+    """Coerce y values to floats, mapping missing and non-numeric entries to NaN."""
+    numeric = pd.to_numeric(pd.Series(values), errors="coerce")
+    return numeric.to_numpy(dtype=float, na_value=np.nan)
+
+
+def _visible_rows(x: pd.Series, x_range: object) -> NDArray[np.bool_] | None:
+    """Mask the rows inside a zoomed x range plus one neighbour on either side.
+
+    Returns ``None`` when there is no usable numeric or datetime range.
+    """
+    if not isinstance(x_range, Sequence) or isinstance(x_range, str) or len(x_range) != 2:
+        return None
+    try:
+        if is_datetime64_any_dtype(x):
+            bounds = pd.to_datetime(list(x_range))
+            start, end = min(bounds), max(bounds)
+            within = (x >= start) & (x <= end)
+        elif is_numeric_dtype(x) and not is_bool_dtype(x):
+            low, high = sorted(float(bound) for bound in x_range)
+            within = (x >= low) & (x <= high)
+        else:
+            return None
+        inside = within.to_numpy(dtype=bool, na_value=False)
+    except (TypeError, ValueError):
+        return None
+    # Neighbours keep lines running off the visible edges instead of stopping short.
+    rows = inside.copy()
+    rows[1:] |= inside[:-1]
+    rows[:-1] |= inside[1:]
+    return rows
+
+
+def _first_per_bucket(order: NDArray[np.intp], buckets: NDArray[np.int64]) -> NDArray[np.intp]:
+    """Return the first row of every bucket in a bucket-grouped *order*."""
+    ranked = buckets[order]
+    starts = np.flatnonzero(np.r_[True, ranked[1:] != ranked[:-1]])
+    return order[starts]
+
+
+def _grid_axis(values: NDArray[np.float64], cells: int) -> NDArray[np.int64]:
+    """Split *values* evenly into *cells* slots by their span."""
+    low, high = values.min(), values.max()
+    if high <= low:
+        return np.zeros(len(values), dtype=np.int64)
+    return np.minimum(((values - low) / (high - low) * cells).astype(np.int64), cells - 1)
+
+
+def line_indices(
+    x_positions: NDArray[np.float64],
+    y: NDArray[np.float64],
+    buckets: int = LINE_BUCKETS,
+) -> NDArray[np.intp]:
+    """Return sorted row indices keeping each x bucket's first, last, min, and max point.
+
+    Buckets split the x span evenly (one per pixel column); when some x
+    positions are missing, rows are split into equal-count buckets instead.
+    """
+    count = len(y)
+    if count <= 4 * buckets:
+        return np.arange(count)
+    rows = np.arange(count)
+    if np.isfinite(x_positions).all() and x_positions.max() > x_positions.min():
+        bucket = _grid_axis(x_positions, buckets)
+    else:
+        bucket = (rows * buckets) // count
+    missing = np.isnan(y)
+    lowest = np.where(missing, np.inf, y)
+    highest = np.where(missing, -np.inf, y)
+    keep = [
+        _first_per_bucket(np.lexsort((rows, bucket)), bucket),
+        _first_per_bucket(np.lexsort((-rows, bucket)), bucket),
+        _first_per_bucket(np.lexsort((lowest, bucket)), bucket),
+        _first_per_bucket(np.lexsort((-highest, bucket)), bucket),
+    ]
+    gaps = np.flatnonzero(missing)
+    if len(gaps):
+        keep.append(_first_per_bucket(gaps[np.argsort(bucket[gaps], kind="stable")], bucket))
+    return np.unique(np.concatenate(keep))
+
+
+def scatter_indices(
+    x_positions: NDArray[np.float64],
+    y: NDArray[np.float64],
+    grid: int = SCATTER_GRID,
+) -> NDArray[np.intp]:
+    """Return sorted row indices keeping the first point in every occupied grid cell.
+
+    Points with a missing coordinate are dropped; they are never drawn anyway.
+    """
+    rows = np.flatnonzero(np.isfinite(x_positions) & np.isfinite(y))
+    if len(rows) <= grid * grid:
+        return rows
+    cells = _grid_axis(x_positions[rows], grid) * grid + _grid_axis(y[rows], grid)
+    _, first = np.unique(cells, return_index=True)
+    return np.sort(rows[first])
+
+
+def display_rows(
+    x: pd.Series,
+    values: Sequence[Any],
+    *,
+    kind: ReductionKind,
+    threshold: int,
+    x_range: object = None,
+) -> NDArray[np.intp] | None:
+    # [impl->req~ring5.render.plotly~1]
+    """Return the row positions worth drawing, or ``None`` to draw every row.
+
+    Args:
+        x: Shared x coordinates, one per row.
+        values: One or more y series aligned with *x*; the kept rows are the
+            union of what each series needs, so stacked series stay aligned.
+        kind: ``"line"`` for min-max x buckets, ``"scatter"`` for grid thinning.
+        threshold: Point count at or below which nothing is reduced.
+        x_range: Optional zoomed ``[low, high]`` x range from the plot config.
+
+    Returns:
+        Sorted row positions, or ``None`` when the rows fit under *threshold*.
+    """
+    count = len(x)
+    if not is_large(count, threshold):
+        return None
+    rows = np.arange(count)
+    visible = _visible_rows(x.reset_index(drop=True), x_range)
+    if visible is not None:
+        rows = rows[visible]
+        if len(rows) <= threshold:
+            return rows
+    positions = _positions(x.reset_index(drop=True))[rows]
+    reduce = line_indices if kind == "line" else scatter_indices
+    keep = [reduce(positions, _numeric(series)[rows]) for series in values]
+    return rows[np.unique(np.concatenate(keep))]
+
+
+def reduce_for_display(
+    data: pd.DataFrame,
+    x_col: str,
+    y_col: str,
+    *,
+    kind: ReductionKind,
+    threshold: int,
+    x_range: object = None,
+) -> pd.DataFrame:
+    """Return the rows of *data* worth drawing; small frames come back unchanged."""
+    rows = display_rows(
+        data[x_col], [data[y_col]], kind=kind, threshold=threshold, x_range=x_range
+    )
+    return data if rows is None else data.iloc[rows]
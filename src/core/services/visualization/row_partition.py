@@ -0,0 +1,89 @@
+"""Single-pass row partitioning for faceted and grouped plots.
+
+Plot types that draw one trace (or one panel) per category used to build a
+full-frame boolean mask for every key, which is O(keys x rows).  A
+``RowPartition`` runs one ``groupby(...).indices`` pass instead and hands out
+row subsets by key.
+
+Missing values (``None``, ``NaN``, ``NaT``) collapse into one key, matching
+``Series.isna()`` masks, so callers may look them up with any missing marker.
+Subsets are plain positional selections: contiguous runs come back as
+slices, which pandas' copy-on-write shares with the source frame until either
+side is modified, so no defensive deep copy is needed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+_EMPTY = np.empty(0, dtype=np.intp)
+
+
+def _normalize(value: Any) -> Any:
+    """Fold every missing marker into ``None`` so it hashes to one key."""
+    try:
+        missing = pd.isna(value)
+    except (TypeError, ValueError):
+        return value
+    return None if isinstance(missing, (bool, np.bool_)) and missing else value
+
+
+class RowPartition:
+    """Row positions of every distinct key across one or more columns."""
+
+    def __init__(self, data: pd.DataFrame, columns: Sequence[str]) -> None:
+        """Group *data* once by *columns*.
+
+        Args:
+            data: Frame to partition; it is referenced, not copied.
+            columns: Key columns; an empty sequence yields one key, ``()``,
+                holding every row.
+        """
+        self._data = data
+        self._columns = tuple(columns)
+        if not self._columns:
+            self._positions: dict[tuple[Any, ...], NDArray[np.intp]] = {
+                (): np.arange(len(data), dtype=np.intp)
+            }
+            return
+        # A single column name yields scalar keys; a list yields tuples.
+        by: str | list[str] = self._columns[0] if len(self._columns) == 1 else list(self._columns)
+        grouped = data.groupby(by, dropna=False, observed=True, sort=False).indices
+        positions: dict[tuple[Any, ...], NDArray[np.intp]] = {}
+        for raw_key, rows in grouped.items():
+            key = self._key(raw_key)
+            subset: NDArray[np.intp] = np.asarray(rows, dtype=np.intp)
+            previous = positions.get(key)
+            if previous is not None:
+                subset = np.sort(np.concatenate((previous, subset)))
+            positions[key] = subset
+        self._positions = positions
+
+    def _key(self, value: Any) -> tuple[Any, ...]:
+        values = value if isinstance(value, tuple) else (value,)
+        return tuple(_normalize(item) for item in values)
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """Key columns in partition order."""
+        return self._columns
+
+    def keys(self) -> Iterator[tuple[Any, ...]]:
+        """Iterate over every observed key, one value per key column."""
+        return iter(self._positions)
+
+    def positions(self, *key: Any) -> NDArray[np.intp]:
+        """Return the ascending row positions for *key* (empty when absent)."""
+        return self._positions.get(self._key(key), _EMPTY)
+
+    def rows(self, *key: Any) -> pd.DataFrame:
+        """Return the rows for *key* in source order (an empty frame when absent)."""
+        positions = self.positions(*key)
+        if len(positions) and positions[-1] - positions[0] + 1 == len(positions):
+            return self._data.iloc[positions[0] : positions[-1] + 1]
+        return self._data.iloc[positions]
@@ -2,35 +2,33 @@
 
 import logging
 from collections.abc import Callable
-from dataclasses import dataclass, replace
+from dataclasses import replace
 from datetime import datetime, timezone
 
 import pandas as pd
 
 from src.core.models.dataset_workspace_models import DatasetInfo, DatasetLineage, DatasetRevision
 from src.core.services.data_services.dataset_fingerprint import fingerprint_dataset
+from src.core.state.repositories.dataset_revision_store import DatasetRevisionStore
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True, slots=True)
-class _StoredDatasetRevision:
-    """Internal immutable metadata plus its defensive dataframe snapshot."""
-
-    info: DatasetRevision
-    data: pd.DataFrame
-
-
 class DataRepository:
     """Store primary and processed dataframes."""
 
-    def __init__(self) -> None:
-        """Initialize in-memory storage."""
+    def __init__(self, revision_store: DatasetRevisionStore | None = None) -> None:
+        """Initialize in-memory storage.
+
+        Args:
+            revision_store: Budgeted storage for named-dataset revisions.
+        """
         self._data: pd.DataFrame | None = None
         self._processed_data: pd.DataFrame | None = None
         self._datasets: dict[str, pd.DataFrame] = {}
         self._selected_dataset: str | None = None
-        self._revisions: dict[str, _StoredDatasetRevision] = {}
+        self._revision_store = revision_store or DatasetRevisionStore()
+        self._revisions: dict[str, DatasetRevision] = {}
         self._dataset_revision_ids: dict[str, list[str]] = {}
         self._current_revision_ids: dict[str, str] = {}
         self._redo_revision_ids: dict[str, list[str]] = {}
@@ -121,6 +119,7 @@ class DataRepository:
         self._datasets.clear()
         self._selected_dataset = None
         self._revisions.clear()
+        self._revision_store.clear()
         self._dataset_revision_ids.clear()
         self._current_revision_ids.clear()
         self._redo_revision_ids.clear()
@@ -212,8 +211,10 @@ class DataRepository:
         removed_revisions = self._dataset_revision_ids.pop(resolved, [])
         for revision_id in removed_revisions:
             self._revisions.pop(revision_id, None)
+            self._revision_store.discard(revision_id)
         self._current_revision_ids.pop(resolved, None)
         self._redo_revision_ids.pop(resolved, None)
+        self._revision_store.trim(self._current_revision_ids.values())
         if self._selected_dataset != resolved:
             return
         self._selected_dataset = next(iter(self._datasets), None)
@@ -233,27 +234,30 @@ class DataRepository:
         current_id = self._current_revision_ids[resolved]
         revisions = tuple(
             replace(
-                self._revisions[revision_id].info,
+                self._revisions[revision_id],
                 current=revision_id == current_id,
+                retained=self._revision_store.contains(revision_id),
             )
             for revision_id in self._dataset_revision_ids[resolved]
         )
+        parent_id = self._same_dataset_parent(current_id)
         return DatasetLineage(
             dataset_name=resolved,
             revisions=revisions,
             current_revision_id=current_id,
-            can_undo=self._same_dataset_parent(current_id) is not None,
+            can_undo=parent_id is not None and self._revision_store.contains(parent_id),
             can_redo=bool(self._redo_revision_ids[resolved]),
         )
 
     def get_dataset_revision(self, revision_id: str) -> pd.DataFrame:
-        """Return a defensive copy of one immutable revision snapshot."""
+        """Return an independent copy-on-write view of one immutable revision snapshot."""
         resolved = self._validate_revision_id(revision_id)
-        try:
-            revision = self._revisions[resolved]
-        except KeyError as exc:
-            raise KeyError(f"Dataset revision {resolved!r} does not exist.") from exc
-        return revision.data.copy(deep=True)
+        if resolved not in self._revisions:
+            raise KeyError(f"Dataset revision {resolved!r} does not exist.")
+        self._require_retained(resolved)
+        snapshot = self._revision_store.get(resolved)
+        self._revision_store.trim(self._current_revision_ids.values())
+        return snapshot
 
     def undo_dataset(self, name: str | None = None) -> DatasetRevision:
         """Move a dataset to its preceding same-dataset revision."""
@@ -262,6 +266,7 @@ class DataRepository:
         parent_id = self._same_dataset_parent(current_id)
         if parent_id is None:
             raise ValueError(f"Dataset {resolved!r} has no earlier revision to restore.")
+        self._require_retained(parent_id)
         self._redo_revision_ids[resolved].append(current_id)
         return self._activate_revision(resolved, parent_id)
 
@@ -270,6 +275,7 @@ class DataRepository:
         resolved = self._resolve_dataset_name(name)
         if not self._redo_revision_ids[resolved]:
             raise ValueError(f"Dataset {resolved!r} has no revision to redo.")
+        self._require_retained(self._redo_revision_ids[resolved][-1])
         return self._activate_revision(resolved, self._redo_revision_ids[resolved].pop())
 
     def restore_dataset_revision(self, revision_id: str) -> DatasetRevision:
@@ -279,9 +285,10 @@ class DataRepository:
             stored = self._revisions[resolved_id]
         except KeyError as exc:
             raise KeyError(f"Dataset revision {resolved_id!r} does not exist.") from exc
-        name = stored.info.dataset_name
+        name = stored.dataset_name
         if name not in self._datasets or resolved_id not in self._dataset_revision_ids[name]:
             raise KeyError(f"Dataset {name!r} is no longer retained.")
+        self._require_retained(resolved_id)
         self._redo_revision_ids[name].clear()
         return self._activate_revision(name, resolved_id)
 
@@ -320,9 +327,12 @@ class DataRepository:
             if source_revision not in parents:
                 parents.append(source_revision)
 
-        snapshot = data.copy(deep=True)
+        fingerprint = fingerprint_dataset(data)
         self._revision_counter += 1
         revision_id = f"rev-{self._revision_counter:06d}"
+        # Unchanged columns are shared with the parent revisions; pandas copy-on-write
+        # keeps the stored snapshot immutable without a deep copy.
+        snapshot = self._revision_store.put(revision_id, data, base_revision_ids=tuple(parents))
         revision_ids = self._dataset_revision_ids.setdefault(name, [])
         info = DatasetRevision(
             revision_id=revision_id,
@@ -332,11 +342,11 @@ class DataRepository:
             created_at=datetime.now(timezone.utc).isoformat(),
             row_count=len(snapshot),
             column_count=len(snapshot.columns),
-            fingerprint=fingerprint_dataset(snapshot),
+            fingerprint=fingerprint,
             source_datasets=resolved_sources,
             parent_revision_ids=tuple(parents),
         )
-        self._revisions[revision_id] = _StoredDatasetRevision(info=info, data=snapshot)
+        self._revisions[revision_id] = info
         revision_ids.append(revision_id)
         self._current_revision_ids[name] = revision_id
         self._redo_revision_ids.setdefault(name, []).clear()
@@ -344,23 +354,31 @@ class DataRepository:
         if self._selected_dataset == name:
             self._data = snapshot
             self._processed_data = None
+        self._revision_store.trim(self._current_revision_ids.values())
         return replace(info, current=True)
 
     def _activate_revision(self, name: str, revision_id: str) -> DatasetRevision:
-        stored = self._revisions[revision_id]
-        restored = stored.data.copy(deep=True)
+        restored = self._revision_store.get(revision_id)
         self._current_revision_ids[name] = revision_id
         self._datasets[name] = restored
         if self._selected_dataset == name:
             self._data = restored
             self._processed_data = None
-        return replace(stored.info, current=True)
+        self._revision_store.trim(self._current_revision_ids.values())
+        return replace(self._revisions[revision_id], current=True)
+
+    def _require_retained(self, revision_id: str) -> None:
+        if not self._revision_store.contains(revision_id):
+            raise ValueError(
+                f"Dataset revision {revision_id!r} was evicted from the revision store; "
+                "only its lineage metadata is retained."
+            )
 
     def _same_dataset_parent(self, revision_id: str) -> str | None:
-        revision = self._revisions[revision_id].info
+        revision = self._revisions[revision_id]
         for parent_id in revision.parent_revision_ids:
             parent = self._revisions.get(parent_id)
-            if parent is not None and parent.info.dataset_name == revision.dataset_name:
+            if parent is not None and parent.dataset_name == revision.dataset_name:
                 return parent_id
         return None
 
@@ -0,0 +1,428 @@
+"""Memory-budgeted storage for immutable named-dataset revisions.
+
+Revisions are stored column by column. A new revision reuses the column and
+index entries of its parent revisions whenever the values are unchanged, and
+pandas copy-on-write keeps every shared reference immutable. When resident
+entries exceed the memory budget, the least recently used revisions are spilled
+to private snapshot files; past the disk budget they are evicted while the
+repository keeps their lineage metadata.
+"""
+
+from __future__ import annotations
+
+import copy
+import itertools
+import logging
+import os
+import tempfile
+from collections import Counter, OrderedDict
+from collections.abc import Collection, Hashable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeAlias, cast
+
+import numpy as np
+import pandas as pd
+
+from src.core.services.data_services.dataset_snapshot_service import DatasetSnapshotService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_BUDGET_MB = 1024
+DEFAULT_DISK_BUDGET_MB = 8192
+_MEBIBYTE = 1024 * 1024
+# NumPy kinds whose values are equal exactly when their raw bytes are.
+_BITWISE_KINDS = frozenset("biufcmM")
+
+_Values: TypeAlias = "pd.Series[Any] | pd.Index[Any]"
+
+
+def _budget_from_env(variable: str, default_mb: int) -> int:
+    """Return a byte budget, honoring an explicit megabyte deployment override."""
+    value = os.environ.get(variable)
+    if value is None:
+        return default_mb * _MEBIBYTE
+
+    try:
+        megabytes = int(value)
+    except ValueError:
+        logger.warning("Ignoring non-integer %s=%r", variable, value)
+        return default_mb * _MEBIBYTE
+
+    if megabytes < 0:
+        logger.warning("Ignoring negative %s=%r", variable, value)
+        return default_mb * _MEBIBYTE
+    return megabytes * _MEBIBYTE
+
+
+@dataclass(slots=True, eq=False)
+class _Entry:
+    """One shared column or index, resident in memory, spilled to disk, or both."""
+
+    values: _Values | None
+    nbytes: int
+    is_index: bool
+    references: int = 1
+    path: Path | None = None
+    disk_bytes: int = 0
+    spillable: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class _RevisionLayout:
+    """Column labels and entry references needed to rebuild one revision."""
+
+    columns: pd.Index[Any]
+    column_keys: tuple[int, ...]
+    index_key: int
+    row_count: int
+    attrs: dict[Hashable, Any]
+
+
+class DatasetRevisionStore:
+    """Hold dataset revisions within a memory budget, spilling and evicting by LRU."""
+
+    def __init__(
+        self,
+        memory_budget_bytes: int | None = None,
+        disk_budget_bytes: int | None = None,
+    ) -> None:
+        """Initialize an empty store.
+
+        Args:
+            memory_budget_bytes: Resident bytes kept for revisions beyond the
+                pinned current states. Defaults to ``RING5_REVISION_MEMORY_MB`` or 1 GiB.
+            disk_budget_bytes: Spilled bytes kept before revisions are evicted.
+                Defaults to ``RING5_REVISION_DISK_MB`` or 8 GiB.
+
+        Raises:
+            ValueError: A budget is negative.
+        """
+        if memory_budget_bytes is None:
+            memory_budget_bytes = _budget_from_env(
+                "RING5_REVISION_MEMORY_MB", DEFAULT_MEMORY_BUDGET_MB
+            )
+        if disk_budget_bytes is None:
+            disk_budget_bytes = _budget_from_env("RING5_REVISION_DISK_MB", DEFAULT_DISK_BUDGET_MB)
+        if memory_budget_bytes < 0 or disk_budget_bytes < 0:
+            raise ValueError("Revision store budgets cannot be negative.")
+        self._memory_budget = memory_budget_bytes
+        self._disk_budget = disk_budget_bytes
+        self._entries: dict[int, _Entry] = {}
+        # Least recently used first.
+        self._layouts: OrderedDict[str, _RevisionLayout] = OrderedDict()
+        self._entry_ids = itertools.count(1)
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._spill_dir: tempfile.TemporaryDirectory[str] | None = None
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes held by resident entries, counting each shared entry once."""
+        return self._memory_bytes
+
+    @property
+    def disk_bytes(self) -> int:
+        """Bytes held by spill files."""
+        return self._disk_bytes
+
+    def contains(self, revision_id: str) -> bool:
+        """Return whether a revision's data is still retained in memory or on disk."""
+        return revision_id in self._layouts
+
+    def put(
+        self,
+        revision_id: str,
+        data: pd.DataFrame,
+        *,
+        base_revision_ids: tuple[str, ...] = (),
+    ) -> pd.DataFrame:
+        """Store a revision and return a dataframe view of the stored state.
+
+        Args:
+            revision_id: New, unique revision identifier.
+            data: Dataset state to retain.
+            base_revision_ids: Parent revisions whose unchanged columns are shared.
+
+        Returns:
+            A dataframe over the stored entries.
+        """
+        # [impl->req~ring5.data.lineage-undo-redo~1]
+        if revision_id in self._layouts:
+            raise ValueError(f"Dataset revision {revision_id!r} is already stored.")
+        index_candidates: list[int] = []
+        column_candidates: dict[tuple[Hashable, int], int] = {}
+        for base_id in base_revision_ids:
+            base = self._layouts.get(base_id)
+            if base is None:
+                continue
+            index_candidates.append(base.index_key)
+            for occurrence, key in zip(
+                self._label_occurrences(base.columns), base.column_keys, strict=True
+            ):
+                column_candidates.setdefault(occurrence, key)
+
+        index_key = self._intern(data.index, index_candidates, is_index=True)
+        column_keys = tuple(
+            self._intern(
+                data.iloc[:, position].reset_index(drop=True),
+                [column_candidates[occurrence]] if occurrence in column_candidates else [],
+                is_index=False,
+            )
+            for position, occurrence in enumerate(self._label_occurrences(data.columns))
+        )
+        self._layouts[revision_id] = _RevisionLayout(
+            columns=data.columns,
+            column_keys=column_keys,
+            index_key=index_key,
+            row_count=len(data),
+            attrs=copy.deepcopy(data.attrs),
+        )
+        return self._materialize(self._layouts[revision_id])
+
+    def get(self, revision_id: str) -> pd.DataFrame:
+        """Rebuild a stored revision, reloading spilled entries when needed.
+
+        Raises:
+            KeyError: The revision is unknown or was evicted.
+        """
+        try:
+            layout = self._layouts[revision_id]
+        except KeyError as exc:
+            raise KeyError(f"Dataset revision {revision_id!r} is not retained.") from exc
+        self._layouts.move_to_end(revision_id)
+        return self._materialize(layout)
+
+    def discard(self, revision_id: str) -> None:
+        """Release a revision and any entries no other revision shares."""
+        layout = self._layouts.pop(revision_id, None)
+        if layout is not None:
+            self._release(layout)
+
+    def trim(self, pinned: Collection[str]) -> None:
+        """Spill, then evict, least recently used revisions until both budgets fit.
+
+        Args:
+            pinned: Revisions that must stay resident, such as current dataset states.
+        """
+        pinned_keys = {
+            key
+            for revision_id in pinned
+            if revision_id in self._layouts
+            for key in self._keys(self._layouts[revision_id])
+        }
+        # Current states are needed in memory anyway and do not count against the budget.
+        pinned_bytes = sum(
+            self._entries[key].nbytes
+            for key in pinned_keys
+            if self._entries[key].values is not None
+        )
+        for revision_id in list(self._layouts):
+            if self._memory_bytes - pinned_bytes <= self._memory_budget:
+                break
+            if revision_id not in pinned:
+                self._spill(self._layouts[revision_id], revision_id, pinned_keys)
+        for revision_id in list(self._layouts):
+            if (
+                self._memory_bytes - pinned_bytes <= self._memory_budget
+                and self._disk_bytes <= self._disk_budget
+            ):
+                break
+            if revision_id not in pinned:
+                logger.info("DATA_REPO: Evicting dataset revision %s", revision_id)
+                self.discard(revision_id)
+
+    def clear(self) -> None:
+        """Drop every revision and remove all spill files."""
+        self._entries.clear()
+        self._layouts.clear()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        if self._spill_dir is not None:
+            self._spill_dir.cleanup()
+            self._spill_dir = None
+
+    def _intern(self, values: _Values, candidates: list[int], *, is_index: bool) -> int:
+        for key in candidates:
+            entry = self._entries[key]
+            if entry.values is not None and self._same_values(entry.values, values):
+                entry.references += 1
+                return key
+        key = next(self._entry_ids)
+        nbytes = int(
+            values.memory_usage(deep=True)
+            if isinstance(values, pd.Index)
+            else values.memory_usage(index=False, deep=True)
+        )
+        self._entries[key] = _Entry(values=values, nbytes=nbytes, is_index=is_index)
+        self._memory_bytes += nbytes
+        return key
+
+    def _materialize(self, layout: _RevisionLayout) -> pd.DataFrame:
+        columns = {
+            position: cast("pd.Series[Any]", self._resident(key))
+            for position, key in enumerate(layout.column_keys)
+        }
+        frame = pd.DataFrame(columns, index=pd.RangeIndex(layout.row_count), copy=False)
+        frame.columns = layout.columns
+        frame.index = cast("pd.Index[Any]", self._resident(layout.index_key))
+        frame.attrs = copy.deepcopy(layout.attrs)
+        return frame
+
+    def _resident(self, key: int) -> _Values:
+        entry = self._entries[key]
+        if entry.values is None:
+            assert entry.path is not None
+            _info, frame = DatasetSnapshotService.read_snapshot_file(entry.path)
+            entry.values = frame.index if entry.is_index else frame.iloc[:, 0]
+            self._memory_bytes += entry.nbytes
+        return entry.values
+
+    def _spill(self, layout: _RevisionLayout, revision_id: str, pinned_keys: set[int]) -> None:
+        for key in self._keys(layout):
+            entry = self._entries[key]
+            if entry.values is None or key in pinned_keys:
+                continue
+            if entry.path is None:
+                if not entry.spillable:
+                    continue
+                try:
+                    self._write(key, entry, revision_id)
+                except (OSError, TypeError, ValueError) as exc:
+                    logger.debug("DATA_REPO: Keeping revision entry %d in memory: %s", key, exc)
+                    entry.spillable = False
+                    continue
+            entry.values = None
+            self._memory_bytes -= entry.nbytes
+
+    def _write(self, key: int, entry: _Entry, revision_id: str) -> None:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.TemporaryDirectory(prefix="ring5-revisions-")
+        path = Path(self._spill_dir.name) / f"entry-{key:08d}.ring5-snapshot"
+        values = entry.values
+        frame = (
+            pd.DataFrame(index=values)
+            if isinstance(values, pd.Index)
+            else pd.DataFrame({0: values}, copy=False)
+        )
+        info = DatasetSnapshotService.write_snapshot_file(
+            path, frame, name=path.stem, source_dataset=revision_id
+        )
+        entry.path = path
+        entry.disk_bytes = info.size_bytes
+        self._disk_bytes += info.size_bytes
+
+    def _release(self, layout: _RevisionLayout) -> None:
+        for key in self._keys(layout):
+            entry = self._entries[key]
+            entry.references -= 1
+            if entry.references:
+                continue
+            del self._entries[key]
+            if entry.values is not None:
+                self._memory_bytes -= entry.nbytes
+            if entry.path is not None:
+                entry.path.unlink(missing_ok=True)
+                self._disk_bytes -= entry.disk_bytes
+
+    @staticmethod
+    def _keys(layout: _RevisionLayout) -> tuple[int, ...]:
+        return (layout.index_key, *layout.column_keys)
+
+    @staticmethod
+    def _label_occurrences(columns: pd.Index[Any]) -> list[tuple[Hashable, int]]:
+        """Pair each column label with its occurrence number so duplicates match by order."""
+        seen: Counter[Hashable] = Counter()
+        occurrences: list[tuple[Hashable, int]] = []
+        for label in columns:
+            occurrences.append((label, seen[label]))
+            seen[label] += 1
+        return occurrences
+
+    @classmethod
+    def _same_values(cls, left: _Values, right: _Values) -> bool:
+        """Return whether two entries hold exactly the same values, labels, and dtype."""
+        if left is right:
+            return True
+        if type(left) is not type(right) or len(left) != len(right) or left.dtype != right.dtype:
+            return False
+        if isinstance(left.dtype, pd.CategoricalDtype):
+            # Unordered dtypes compare equal across category orders, but codes do not.
+            other_dtype = cast(pd.CategoricalDtype, right.dtype)
+            if left.dtype.ordered != other_dtype.ordered or not left.dtype.categories.equals(
+                other_dtype.categories
+            ):
+                return False
+        if isinstance(left, pd.Index):
+            if list(left.names) != list(right.names):
+                return False
+            if isinstance(left, pd.RangeIndex):
+                other = cast(pd.RangeIndex, right)
+                return (left.start, left.stop, left.step) == (other.start, other.stop, other.step)
+        left_buffers = cls._buffers(left)
+        right_buffers = cls._buffers(right)
+        if left_buffers is None or right_buffers is None:
+            return cls._same_objects(left, right)
+        if all(map(cls._same_memory, left_buffers, right_buffers)):
+            return True
+        return all(
+            np.array_equal(cls._raw_bytes(first), cls._raw_bytes(second))
+            for first, second in zip(left_buffers, right_buffers, strict=True)
+        )
+
+    @staticmethod
+    def _buffers(values: _Values) -> list[np.ndarray[Any, Any]] | None:
+        """Return the NumPy buffers that fully determine values of a given dtype."""
+        dtype = values.dtype
+        if isinstance(values, pd.MultiIndex):
+            return None
+        if isinstance(dtype, np.dtype) and dtype.kind in _BITWISE_KINDS:
+            return [values.to_numpy(copy=False)]
+        array = values.array
+        if isinstance(
+            array, (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)
+        ):
+            masked = cast(Any, array)
+            return [masked._data, masked._mask]
+        if isinstance(array, pd.Categorical):
+            return [array.codes]
+        return None
+
+    @classmethod
+    def _same_objects(cls, left: _Values, right: _Values) -> bool:
+        """Return whether two string or object entries hold identical elements."""
+        dtype = left.dtype
+        if isinstance(left, pd.MultiIndex):
+            return False
+        if isinstance(dtype, pd.StringDtype):
+            left_array = left.array
+            right_array = right.array
+            return left_array is right_array or bool(cast(Any, left_array).equals(right_array))
+        if not isinstance(dtype, np.dtype) or dtype.kind != "O":
+            return False
+        left_objects = left.to_numpy(copy=False)
+        right_objects = right.to_numpy(copy=False)
+        if cls._same_memory(left_objects, right_objects):
+            return True
+        try:
+            if not np.array_equal(left_objects, right_objects):
+                return False
+        except (TypeError, ValueError):
+            # Elements such as pd.NA or nested arrays have no single truth value.
+            return False
+        # Equality alone would share 1 with 1.0 or True, so element types must match too.
+        return all(
+            type(first) is type(second) for first, second in zip(left_objects, right_objects)
+        )
+
+    @staticmethod
+    def _same_memory(left: np.ndarray[Any, Any], right: np.ndarray[Any, Any]) -> bool:
+        return bool(
+            left.shape == right.shape
+            and left.strides == right.strides
+            and left.__array_interface__["data"][0] == right.__array_interface__["data"][0]
+        )
+
+    @staticmethod
+    def _raw_bytes(values: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+        return np.ascontiguousarray(values).reshape(-1).view(np.uint8)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import io
 import logging
+from typing import Any
 
 import pandas as pd
 
@@ -17,6 +18,7 @@ from src.core.state.repositories.plot_repository import PlotRepository
 from src.core.state.repositories.preview_repository import PreviewRepository
 from src.core.state.repositories.visualization_repository import VisualizationRepository
 from src.core.services.managers.semantic_metadata_service import SemanticMetadataService
+from src.core.services.portfolio_container import PortfolioFrameRef, PortfolioFrames
 
 logger = logging.getLogger(__name__)
 
@@ -121,15 +123,25 @@ class SessionRepository:
         # Restore data
         data_restored = False
         data_error: str | None = None
+        frames = self._frames(portfolio_data)
         data_csv = portfolio_data.get("data_csv", "")
-        if data_csv:
+        data_ref = portfolio_data.get("data_ref")
+        if data_csv or data_ref:
             try:
-                df = self.enforce_config_dtypes(pd.read_csv(io.StringIO(data_csv)))
-                semantics = SemanticMetadataService.from_payload(
-                    portfolio_data.get("data_semantics", {}),
-                    available_columns=tuple(str(column) for column in df.columns),
-                )
-                df = SemanticMetadataService.attach(df, semantics)
+                if data_csv:
+                    df = self.enforce_config_dtypes(pd.read_csv(io.StringIO(data_csv)))
+                    semantics = SemanticMetadataService.from_payload(
+                        portfolio_data.get("data_semantics", {}),
+                        available_columns=tuple(str(column) for column in df.columns),
+                    )
+                    df = SemanticMetadataService.attach(df, semantics)
+                else:
+                    # The workspace table is needed immediately; plot tables wait.
+                    df = self.enforce_config_dtypes(
+                        PortfolioFrameRef(
+                            frames, str(data_ref), portfolio_data.get("data_semantics", {})
+                        ).load()
+                    )
                 self.data_repo.set_data(df)
                 data_restored = True
                 logger.info("SESSION_REPO: Restored data - %d rows", len(df))
@@ -153,7 +165,7 @@ class SessionRepository:
             for plot_data in plot_specs:
                 plot_name = str(plot_data.get("name", "?"))
                 try:
-                    plot = self._plot_deserializer(plot_data)
+                    plot = self._plot_deserializer(self._with_frame_ref(plot_data, frames))
                     if plot is not None:
                         loaded_plots.append(plot)
                     else:
@@ -201,6 +213,30 @@ class SessionRepository:
             parse_variables_skipped=vars_skipped,
         )
 
+    @staticmethod
+    def _frames(portfolio_data: PortfolioData) -> PortfolioFrames:
+        """Return the portfolio's frames, wrapping a plain migrated table."""
+        frames = portfolio_data.get("frames")
+        if isinstance(frames, PortfolioFrames):
+            return frames
+        return PortfolioFrames(frames if isinstance(frames, dict) else None)
+
+    @staticmethod
+    def _with_frame_ref(plot_data: dict[str, Any], frames: PortfolioFrames) -> dict[str, Any]:
+        """Replace a plot's frame reference with a deferred load of that frame."""
+        ref = plot_data.get("processed_data_ref")
+        if not isinstance(ref, str):
+            return plot_data
+        if ref not in frames:
+            raise ValueError(f"processed data {ref!r} is missing from the portfolio frames")
+        semantics = plot_data.get("processed_semantics")
+        return {
+            **plot_data,
+            "processed_data_ref": PortfolioFrameRef(
+                frames, ref, semantics if isinstance(semantics, dict) else {}
+            ),
+        }
+
     def clear_all(self) -> None:
         """
         Clear all session state completely.
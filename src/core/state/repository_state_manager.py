@@ -43,6 +43,7 @@ class RepositoryStateManager:
         """
         # [impl->req~ring5.workspace.session-isolation~1]
         self._session_repo = SessionRepository(plot_deserializer=plot_deserializer)
+        self._state_version = 0
 
     def initialize(self) -> None:
         """Re-initialize the session to clean defaults.
@@ -50,6 +51,21 @@ class RepositoryStateManager:
         Useful for resetting state without constructing a new instance.
         """
         self._session_repo.initialize_session()
+        self._changed()
+
+    def state_version(self) -> int:
+        # [impl->req~ring5.workspace.autosave-recovery~1]
+        """Return a counter that advances whenever portfolio-recorded state changes.
+
+        Every mutator that affects what a portfolio stores advances it, so
+        callers such as autosave can skip serializing an unchanged workspace.
+        Previews, temporary paths, and the selected plot do not count.  Plot
+        objects are edited in place and carry their own change tokens.
+        """
+        return self._state_version
+
+    def _changed(self) -> None:
+        self._state_version += 1
 
     # ==================== Data Management ====================
 
@@ -77,6 +93,7 @@ class RepositoryStateManager:
             operation=operation,
             source_datasets=source_datasets,
         )
+        self._changed()
 
     def get_processed_data(self) -> pd.DataFrame | None:
         """Return the current processed data."""
@@ -106,6 +123,7 @@ class RepositoryStateManager:
         self._session_repo.plot_repo.clear_plots()
         self._session_repo.plot_repo.set_plot_counter(0)
         self._session_repo.plot_repo.set_current_plot_id(None)
+        self._changed()
 
     def add_dataset(
         self,
@@ -119,7 +137,7 @@ class RepositoryStateManager:
     ) -> DatasetInfo:
         """Retain a named dataset after applying shared dtype rules."""
         normalized = self._session_repo.enforce_config_dtypes(data)
-        return self._session_repo.data_repo.add_dataset(
+        result = self._session_repo.data_repo.add_dataset(
             name,
             normalized,
             select=select,
@@ -127,6 +145,8 @@ class RepositoryStateManager:
             operation=operation,
             source_datasets=source_datasets,
         )
+        self._changed()
+        return result
 
     def list_datasets(self) -> tuple[DatasetInfo, ...]:
         """Return retained dataset metadata in insertion order."""
@@ -138,11 +158,14 @@ class RepositoryStateManager:
 
     def select_dataset(self, name: str) -> pd.DataFrame:
         """Select a retained dataset as the active source data."""
-        return self._session_repo.data_repo.select_dataset(name)
+        result = self._session_repo.data_repo.select_dataset(name)
+        self._changed()
+        return result
 
     def remove_dataset(self, name: str) -> None:
         """Remove one retained dataset without changing unrelated data."""
         self._session_repo.data_repo.remove_dataset(name)
+        self._changed()
 
     def selected_dataset_name(self) -> str | None:
         """Return the selected retained dataset name."""
@@ -158,15 +181,21 @@ class RepositoryStateManager:
 
     def undo_dataset(self, name: str | None = None) -> DatasetRevision:
         """Restore the preceding revision of a named dataset."""
-        return self._session_repo.data_repo.undo_dataset(name)
+        result = self._session_repo.data_repo.undo_dataset(name)
+        self._changed()
+        return result
 
     def redo_dataset(self, name: str | None = None) -> DatasetRevision:
         """Reapply the most recently undone dataset revision."""
-        return self._session_repo.data_repo.redo_dataset(name)
+        result = self._session_repo.data_repo.redo_dataset(name)
+        self._changed()
+        return result
 
     def restore_dataset_revision(self, revision_id: str) -> DatasetRevision:
         """Restore an arbitrary retained dataset revision."""
-        return self._session_repo.data_repo.restore_dataset_revision(revision_id)
+        result = self._session_repo.data_repo.restore_dataset_revision(revision_id)
+        self._changed()
+        return result
 
     # ==================== Config & Parser ====================
 
@@ -177,10 +206,12 @@ class RepositoryStateManager:
     def set_config(self, config: dict[str, Any]) -> None:
         """Replace the application configuration."""
         self._session_repo.config_repo.set_config(config)
+        self._changed()
 
     def update_config(self, key: str, value: object) -> None:
         """Set one application configuration value."""
         self._session_repo.config_repo.update_config(key, value)
+        self._changed()
 
     def get_temp_dir(self) -> str | None:
         """Return the active temporary directory."""
@@ -197,6 +228,7 @@ class RepositoryStateManager:
     def set_csv_path(self, path: str) -> None:
         """Set the active CSV path."""
         self._session_repo.config_repo.set_csv_path(path)
+        self._changed()
 
     def get_csv_pool(self) -> list[CsvPoolEntry]:
         """Return saved CSV-pool entries."""
@@ -221,6 +253,7 @@ class RepositoryStateManager:
     def set_use_parser(self, use: bool) -> None:
         """Select whether the parser is the active data source."""
         self._session_repo.parser_repo.set_using_parser(use)
+        self._changed()
 
     def get_parse_variables(self) -> list[ParseVariableConfig]:
         """Return variables selected for parsing."""
@@ -229,6 +262,7 @@ class RepositoryStateManager:
     def set_parse_variables(self, variables: list[ParseVariableConfig]) -> None:
         """Replace variables selected for parsing."""
         self._session_repo.parser_repo.set_parse_variables(variables)
+        self._changed()
 
     def get_stats_path(self) -> str:
         """Return the simulator-statistics search path."""
@@ -237,6 +271,7 @@ class RepositoryStateManager:
     def set_stats_path(self, path: str) -> None:
         """Set the simulator-statistics search path."""
         self._session_repo.parser_repo.set_stats_path(path)
+        self._changed()
 
     def get_stats_pattern(self) -> str:
         """Return the statistics filename pattern."""
@@ -245,6 +280,7 @@ class RepositoryStateManager:
     def set_stats_pattern(self, pattern: str) -> None:
         """Set the statistics filename pattern."""
         self._session_repo.parser_repo.set_stats_pattern(pattern)
+        self._changed()
 
     def get_scanned_variables(self) -> list[ScannedVariableDict]:
         """Return variables found by the latest scan."""
@@ -253,6 +289,7 @@ class RepositoryStateManager:
     def set_scanned_variables(self, variables: list[ScannedVariableDict]) -> None:
         """Replace variables found by the latest scan."""
         self._session_repo.parser_repo.set_scanned_variables(variables)
+        self._changed()
 
     def get_parser_strategy(self) -> str:
         """Return the selected parser strategy."""
@@ -279,10 +316,12 @@ class RepositoryStateManager:
     def set_plots(self, plots: list[PlotProtocol]) -> None:
         """Replace registered plots."""
         self._session_repo.plot_repo.set_plots(plots)
+        self._changed()
 
     def add_plot(self, plot_obj: PlotProtocol) -> None:
         """Register a plot."""
         self._session_repo.plot_repo.add_plot(plot_obj)
+        self._changed()
 
     def get_plot_counter(self) -> int:
         """Return the latest allocated plot identifier."""
@@ -291,10 +330,13 @@ class RepositoryStateManager:
     def set_plot_counter(self, counter: int) -> None:
         """Set the latest allocated plot identifier."""
         self._session_repo.plot_repo.set_plot_counter(counter)
+        self._changed()
 
     def start_next_plot_id(self) -> int:
         """Allocate and return the next plot identifier."""
-        return self._session_repo.plot_repo.increment_plot_counter()
+        result = self._session_repo.plot_repo.increment_plot_counter()
+        self._changed()
+        return result
 
     def get_current_plot_id(self) -> int | None:
         """Return the selected plot identifier."""
@@ -341,6 +383,7 @@ class RepositoryStateManager:
     def add_manager_history_record(self, record: OperationRecord) -> None:
         """Append a data-manager history record."""
         self._session_repo.history_repo.add_manager_record(record)
+        self._changed()
 
     def get_manager_history(self) -> list[OperationRecord]:
         """Return data-manager history records."""
@@ -349,6 +392,7 @@ class RepositoryStateManager:
     def add_portfolio_history_record(self, record: OperationRecord) -> None:
         """Append a portfolio history record."""
         self._session_repo.history_repo.add_portfolio_record(record)
+        self._changed()
 
     def get_portfolio_history(self) -> list[OperationRecord]:
         """Return portfolio history records."""
@@ -357,18 +401,23 @@ class RepositoryStateManager:
     def remove_manager_history_record(self, record: OperationRecord) -> None:
         """Remove a data-manager history record."""
         self._session_repo.history_repo.remove_manager_record(record)
+        self._changed()
 
     def remove_portfolio_history_record(self, record: OperationRecord) -> None:
         """Remove a portfolio history record."""
         self._session_repo.history_repo.remove_portfolio_record(record)
+        self._changed()
 
     # ==================== Session ======================================
 
     def clear_all(self) -> None:
         """Reset all session repositories."""
         self._session_repo.clear_all()
+        self._changed()
 
     def restore_session(self, portfolio_data: PortfolioData) -> RestoreReport:
         # [impl->req~ring5.portfolio.restore~1]
         """Restore session state from a portfolio snapshot."""
-        return self._session_repo.restore_from_portfolio(portfolio_data)
+        result = self._session_repo.restore_from_portfolio(portfolio_data)
+        self._changed()
+        return result
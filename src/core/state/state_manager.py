@@ -45,6 +45,10 @@ class StateManager(Protocol):
         """Initialize the state manager."""
         raise NotImplementedError
 
+    def state_version(self) -> int:
+        """Return a counter that advances whenever portfolio-recorded state changes."""
+        raise NotImplementedError
+
     # Data
 
     def get_data(self) -> pd.DataFrame | None:
@@ -4,13 +4,22 @@ One implementation of "find the simulator output files under a directory", used
 the application facade (browse), the scanner (discover variables), and the parse
 strategies (enumerate work). Path/pattern sanitisation is reused from
 ``src.core.common.utils``; this module knows nothing simulator-specific.
+
+Directory listings are read by a small thread pool ahead of the lexical walk and cached
+per ``(root, pattern)``. A cached listing is reused while its directory's mtime is
+unchanged, so repeated discovery of an unchanged tree costs one ``stat`` per directory
+instead of one ``scandir``.
 """
 
 from __future__ import annotations
 
 import fnmatch
 import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 from src.core.common.security_limits import (
@@ -20,11 +29,108 @@ from src.core.common.security_limits import (
 )
 from src.core.common.utils import normalize_user_path, sanitize_glob_pattern
 
+# Threads listing directories ahead of the walk; they mostly wait on filesystem latency.
+DISCOVERY_THREADS = 8
+# Directory listings read ahead of the walk at any time.
+DISCOVERY_PREFETCH = 4 * DISCOVERY_THREADS
+# (root, pattern) trees whose directory listings stay cached, least recently used first out.
+MAX_CACHED_DISCOVERY_TREES = 8
+# A directory modified this recently may change again within the same mtime tick, so its
+# listing is re-read next time rather than trusted.
+_RACY_MTIME_NS = 2_000_000_000
+
 
 class FileDiscoveryLimitError(RuntimeError):
     """Filesystem discovery exceeded a configured resource bound."""
 
 
+@dataclass(frozen=True)
+class _Listing:
+    """One directory's subdirectories and matching files, sorted by name."""
+
+    mtime_ns: int
+    entry_count: int
+    # (name, is_directory) for subdirectories and pattern-matching regular files.
+    children: tuple[tuple[str, bool], ...]
+    reusable: bool
+
+
+_Tree = dict[str, _Listing]
+
+_cache_lock = threading.Lock()
+_listing_cache: OrderedDict[tuple[str, str], _Tree] = OrderedDict()
+
+
+def clear_discovery_cache() -> None:
+    """Forget every cached directory listing."""
+    with _cache_lock:
+        _listing_cache.clear()
+
+
+def _cached_tree(root: str, pattern: str) -> _Tree:
+    """Return the listing cache of one ``(root, pattern)`` tree, creating it if needed."""
+    key = (root, pattern)
+    with _cache_lock:
+        tree = _listing_cache.get(key)
+        if tree is None:
+            tree = _listing_cache[key] = {}
+            while len(_listing_cache) > MAX_CACHED_DISCOVERY_TREES:
+                _listing_cache.popitem(last=False)
+        else:
+            _listing_cache.move_to_end(key)
+        return tree
+
+
+def _limit_error(search_path: str, *, entries: bool) -> FileDiscoveryLimitError:
+    if entries:
+        return FileDiscoveryLimitError(
+            f"File discovery exceeded {MAX_DISCOVERY_ENTRIES} entries under: {search_path}"
+        )
+    return FileDiscoveryLimitError(
+        f"File discovery exceeded {MAX_DISCOVERY_SECONDS:g} seconds under: {search_path}"
+    )
+
+
+def _list_directory(
+    path: str, pattern: str, tree: _Tree | None, deadline: float, search_path: str
+) -> _Listing:
+    """List one directory, reusing its cached listing while the mtime is unchanged.
+
+    Reading stops one entry past the global entry bound; the walk then reports the
+    overflow in traversal order.
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = tree.get(path) if tree is not None else None
+    if cached is not None and cached.reusable and cached.mtime_ns == mtime_ns:
+        return cached
+
+    children: list[tuple[str, bool]] = []
+    entry_count = 0
+    with os.scandir(path) as iterator:
+        for entry in iterator:
+            entry_count += 1
+            if entry_count > MAX_DISCOVERY_ENTRIES:
+                break
+            if time.monotonic() > deadline:
+                raise _limit_error(search_path, entries=False)
+            if entry.is_dir(follow_symlinks=False):
+                children.append((entry.name, True))
+            elif entry.is_file(follow_symlinks=False) and fnmatch.fnmatchcase(entry.name, pattern):
+                children.append((entry.name, False))
+    children.sort()
+
+    listing = _Listing(
+        mtime_ns=mtime_ns,
+        entry_count=entry_count,
+        children=tuple(children),
+        reusable=entry_count <= MAX_DISCOVERY_ENTRIES
+        and time.time_ns() - mtime_ns > _RACY_MTIME_NS,
+    )
+    if tree is not None and listing.reusable:
+        tree[path] = listing
+    return listing
+
+
 def find_stats_files(
     search_path: str,
     pattern: str = "stats.txt",
@@ -32,6 +138,7 @@ def find_stats_files(
     limit: int = 0,
     sort: bool = False,
     raise_if_empty: bool = False,
+    use_cache: bool = True,
 ) -> list[str]:
     """Find files matching ``pattern`` recursively under ``search_path``.
 
@@ -44,6 +151,8 @@ def find_stats_files(
             stops as soon as the requested number of matches is collected.
         raise_if_empty: Raise ``FileNotFoundError`` when the path is missing or no
             file matches; otherwise return an empty list.
+        use_cache: Reuse directory listings whose mtime is unchanged since an earlier
+            discovery of the same root and pattern.
 
     Returns:
         Matching file paths as strings.
@@ -67,25 +176,37 @@ def find_stats_files(
         return []
 
     safe_pattern: str = sanitize_glob_pattern(pattern)
+    root = str(base)
+    tree = _cached_tree(root, safe_pattern) if use_cache else None
 
     requested_limit = limit if limit > 0 else MAX_DISCOVERED_FILES + 1
-    files: list[Path] = []
+    files: list[str] = []
     visited_entries = 0
     deadline = time.monotonic() + MAX_DISCOVERY_SECONDS
 
-    # Store directory-entry metadata in the stack so symlinks are never followed.
-    # Each directory is materialized only after the global entry budget is checked,
-    # giving deterministic lexical traversal without an unbounded full-tree list.
-    pending: list[tuple[Path, bool, bool]] = [(base, True, False)]
-    while pending:
-        if time.monotonic() > deadline:
-            raise FileDiscoveryLimitError(
-                f"File discovery exceeded {MAX_DISCOVERY_SECONDS:g} seconds under: {search_path}"
-            )
-
-        current, is_dir, is_file = pending.pop()
-        if is_file:
-            if fnmatch.fnmatchcase(current.name, safe_pattern):
+    # The walk itself is a serial lexical depth-first traversal, so results and limit
+    # errors are deterministic. Only directory reads run ahead on the pool; a stack item
+    # carries its prefetched listing, if any.
+    executor = ThreadPoolExecutor(
+        max_workers=DISCOVERY_THREADS, thread_name_prefix="ring5-discovery"
+    )
+    in_flight = 0
+
+    def prefetch(path: str) -> Future[_Listing] | None:
+        nonlocal in_flight
+        if in_flight >= DISCOVERY_PREFETCH:
+            return None
+        in_flight += 1
+        return executor.submit(_list_directory, path, safe_pattern, tree, deadline, search_path)
+
+    try:
+        pending: list[tuple[str, bool, Future[_Listing] | None]] = [(root, True, None)]
+        while pending:
+            if time.monotonic() > deadline:
+                raise _limit_error(search_path, entries=False)
+
+            current, is_dir, future = pending.pop()
+            if not is_dir:
                 files.append(current)
                 if limit == 0 and len(files) > MAX_DISCOVERED_FILES:
                     raise FileDiscoveryLimitError(
@@ -94,37 +215,36 @@ def find_stats_files(
                     )
                 if len(files) >= requested_limit:
                     break
-            continue
-        if not is_dir:
-            continue
-
-        entries: list[os.DirEntry[str]] = []
-        with os.scandir(current) as iterator:
-            for entry in iterator:
-                visited_entries += 1
-                if visited_entries > MAX_DISCOVERY_ENTRIES:
-                    raise FileDiscoveryLimitError(
-                        f"File discovery exceeded {MAX_DISCOVERY_ENTRIES} entries under: "
-                        f"{search_path}"
-                    )
-                if time.monotonic() > deadline:
-                    raise FileDiscoveryLimitError(
-                        f"File discovery exceeded {MAX_DISCOVERY_SECONDS:g} seconds under: "
-                        f"{search_path}"
-                    )
-                entries.append(entry)
-
-        entries.sort(key=lambda entry: entry.name, reverse=True)
-        for entry in entries:
-            entry_is_dir = entry.is_dir(follow_symlinks=False)
-            entry_is_file = entry.is_file(follow_symlinks=False)
-            if entry_is_dir or entry_is_file:
-                pending.append((Path(entry.path), entry_is_dir, entry_is_file))
+                continue
+
+            if future is None:
+                listing = _list_directory(current, safe_pattern, tree, deadline, search_path)
+            else:
+                in_flight -= 1
+                listing = future.result()
+            visited_entries += listing.entry_count
+            if visited_entries > MAX_DISCOVERY_ENTRIES:
+                raise _limit_error(search_path, entries=True)
+
+            # Prefetch subdirectories in visiting order, then push them in reverse so
+            # the lexically first child is popped next.
+            children = [
+                (
+                    os.path.join(current, name),
+                    child_is_dir,
+                    prefetch(os.path.join(current, name)) if child_is_dir else None,
+                )
+                for name, child_is_dir in listing.children
+            ]
+            pending.extend(reversed(children))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
     if sort:
-        files.sort()
+        # Component-wise path order, so "run/x" sorts before "run.old".
+        files.sort(key=Path)
 
     if not files and raise_if_empty:
         raise FileNotFoundError(f"No files matching '{pattern}' found under: {search_path}")
 
-    return [str(f) for f in files]
+    return files
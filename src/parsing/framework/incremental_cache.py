@@ -1,15 +1,20 @@
-"""Bounded, human-inspectable cache support for incremental simulator parsing."""
+"""Bounded SQLite cache and change detection for incremental simulator parsing."""
 
 from __future__ import annotations
 
 import hashlib
 import json
 import logging
-import os
-import tempfile
-from collections.abc import Sequence
-from dataclasses import asdict
+import math
+import random
+import re
+import sqlite3
+import zlib
+from collections.abc import Mapping, Sequence
+from contextlib import closing
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Literal
 
 from src.core.common.security_limits import (
     MAX_INCREMENTAL_CACHE_BYTES,
@@ -20,11 +25,46 @@ from src.core.common.security_limits import (
     MAX_PARSE_VARIABLES,
 )
 from src.core.models import ScannedVariable, StatConfig
+from src.core.models.parsing_models import CONFIG_INI_STRATEGIES
 
 logger = logging.getLogger(__name__)
 
-CACHE_SCHEMA_VERSION = 1
-DEFAULT_CACHE_NAME = ".ring5-incremental-parse.json"
+CACHE_SCHEMA_VERSION = 2
+DEFAULT_CACHE_NAME = ".ring5-incremental-parse.sqlite"
+
+ChangeDetection = Literal["content", "metadata"]
+CHANGE_DETECTION_MODES: tuple[ChangeDetection, ...] = ("content", "metadata")
+
+_SQLITE_HEADER = b"SQLite format 3\0"
+_STAMP_PATTERN = re.compile(r"\d+:\d+:\d+(?:;\d+:\d+:\d+)*")
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS files ("
+    "source_path TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, stamp TEXT NOT NULL, "
+    "raw_size INTEGER NOT NULL, cells BLOB NOT NULL)",
+)
+
+
+@dataclass(frozen=True)
+class CachedFile:
+    """One cached source: its content fingerprint, metadata stamp, and finalized CSV cells."""
+
+    fingerprint: str
+    stamp: str
+    cells: dict[str, str]
+
+
+@dataclass(frozen=True)
+class InputScan:
+    """Fingerprints and metadata stamps for a sorted set of parse inputs.
+
+    ``hashed_files`` counts the inputs whose contents were read; the rest reused a known
+    fingerprint because their ``(size, mtime_ns, inode)`` stamp was unchanged.
+    """
+
+    fingerprints: tuple[tuple[str, str], ...]
+    stamps: tuple[tuple[str, str], ...]
+    hashed_files: int
 
 
 def configuration_hash(
@@ -61,123 +101,237 @@ def fingerprint_inputs(
     The parser's existing per-file, aggregate-byte, and file-count bounds are enforced before any
     worker submission.
     """
+    return scan_inputs(file_paths, strategy_type).fingerprints
+
+
+def scan_inputs(
+    file_paths: Sequence[str],
+    strategy_type: str,
+    *,
+    change_detection: ChangeDetection = "content",
+    known: Mapping[str, tuple[str, str]] | None = None,
+    verify_fraction: float = 0.0,
+) -> InputScan:
+    # [impl->req~ring5.ingestion.incremental-parsing~1]
+    """Stamp every input and content-hash the ones whose change cannot be ruled out.
+
+    ``content`` mode hashes every input. ``metadata`` mode reuses the fingerprint in ``known``
+    (``path -> (stamp, fingerprint)``) when an input's ``(size, mtime_ns, inode)`` stamp is
+    unchanged, so an unchanged tree is only ``stat``-ed. ``verify_fraction`` content-hashes that
+    random share of the reused inputs; one mismatch distrusts metadata and hashes the rest.
+    """
+    if change_detection not in CHANGE_DETECTION_MODES:
+        raise ValueError(
+            f"PARSER: unknown change detection '{change_detection}'; expected one of "
+            + ", ".join(CHANGE_DETECTION_MODES)
+            + "."
+        )
+    if not 0.0 <= verify_fraction <= 1.0:
+        raise ValueError("PARSER: verify_fraction must be between 0 and 1.")
     if len(file_paths) > MAX_PARSE_FILES:
         raise RuntimeError(
             f"PARSER: {len(file_paths)} files exceed the {MAX_PARSE_FILES}-file parse limit."
         )
 
     total_bytes = 0
-    hashed_bytes = 0
-    fingerprints: list[tuple[str, str]] = []
+    inputs: list[tuple[str, list[Path], str]] = []
     for raw_path in sorted(file_paths):
         path = Path(raw_path).resolve(strict=True)
         sources = [path]
-        if strategy_type == "config_aware":
+        if strategy_type in CONFIG_INI_STRATEGIES:
             sources.append(path.parent / "config.ini")
 
-        digest = hashlib.sha256()
+        stamps: list[str] = []
         for source in sources:
             if not source.is_file():
                 raise FileNotFoundError(f"PARSER: incremental input not found: {source}")
-            size = source.stat().st_size
-            if size > MAX_PARSE_FILE_BYTES:
+            status = source.stat()
+            if status.st_size > MAX_PARSE_FILE_BYTES:
                 raise RuntimeError(
                     "PARSER: incremental input exceeds the "
                     f"{MAX_PARSE_FILE_BYTES // (1024 * 1024)} MiB per-file limit: {source}"
                 )
-            total_bytes += size
+            total_bytes += status.st_size
             if total_bytes > MAX_PARSE_TOTAL_BYTES:
                 raise RuntimeError(
                     "PARSER: selected incremental inputs exceed the "
                     f"{MAX_PARSE_TOTAL_BYTES // (1024 * 1024 * 1024)} GiB aggregate limit."
                 )
-            digest.update(source.name.encode("utf-8"))
-            digest.update(b"\0")
-            source_hashed_bytes = 0
-            with source.open("rb") as handle:
-                for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-                    source_hashed_bytes += len(chunk)
-                    hashed_bytes += len(chunk)
-                    if source_hashed_bytes > MAX_PARSE_FILE_BYTES:
-                        raise RuntimeError(
-                            "PARSER: incremental input grew beyond the "
-                            f"{MAX_PARSE_FILE_BYTES // (1024 * 1024)} MiB per-file limit "
-                            f"while fingerprinting: {source}"
-                        )
-                    if hashed_bytes > MAX_PARSE_TOTAL_BYTES:
-                        raise RuntimeError(
-                            "PARSER: incremental inputs grew beyond the "
-                            f"{MAX_PARSE_TOTAL_BYTES // (1024 * 1024 * 1024)} GiB "
-                            "aggregate limit while fingerprinting."
-                        )
-                    digest.update(chunk)
-            digest.update(b"\0")
-        fingerprints.append((str(path), digest.hexdigest()))
-    return tuple(fingerprints)
+            stamps.append(f"{status.st_size}:{status.st_mtime_ns}:{status.st_ino}")
+        inputs.append((str(path), sources, ";".join(stamps)))
+
+    # Stamps are taken before any hashing, so a write racing the hash changes the stamp and the
+    # next metadata-mode run hashes that input again.
+    fingerprints: dict[str, str] = {}
+    reused: list[str] = []
+    for source_path, _sources, stamp in inputs:
+        previous = (known or {}).get(source_path)
+        if change_detection == "metadata" and previous is not None and previous[0] == stamp:
+            fingerprints[source_path] = previous[1]
+            reused.append(source_path)
+
+    hashed_bytes = 0
+    hashed_files = 0
+
+    def hash_input(sources: list[Path]) -> str:
+        nonlocal hashed_bytes, hashed_files
+        digest, hashed_bytes = _content_digest(sources, hashed_bytes)
+        hashed_files += 1
+        return digest
+
+    sources_by_path = {source_path: sources for source_path, sources, _stamp in inputs}
+    verify_count = math.ceil(len(reused) * verify_fraction)
+    if verify_count:
+        # Sampling only chooses which unchanged-looking inputs to re-read; it is not a secret.
+        sample = random.sample(reused, verify_count)  # nosec B311
+        mismatched: list[str] = []
+        for source_path in sample:
+            digest = hash_input(sources_by_path[source_path])
+            if digest != fingerprints[source_path]:
+                fingerprints[source_path] = digest
+                mismatched.append(source_path)
+        if mismatched:
+            logger.warning(
+                "PARSER: %d sampled inputs changed without a metadata change (first: %s); "
+                "hashing every input",
+                len(mismatched),
+                mismatched[0],
+            )
+            sampled = set(sample)
+            for source_path in reused:
+                if source_path not in sampled:
+                    fingerprints[source_path] = hash_input(sources_by_path[source_path])
+
+    for source_path, sources, _stamp in inputs:
+        if source_path not in fingerprints:
+            fingerprints[source_path] = hash_input(sources)
+
+    return InputScan(
+        fingerprints=tuple(
+            (source_path, fingerprints[source_path]) for source_path, _sources, _stamp in inputs
+        ),
+        stamps=tuple((source_path, stamp) for source_path, _sources, stamp in inputs),
+        hashed_files=hashed_files,
+    )
+
+
+def _content_digest(sources: Sequence[Path], hashed_bytes: int) -> tuple[str, int]:
+    """Return the SHA-256 of one input's sources and the updated aggregate hashed byte count."""
+    digest = hashlib.sha256()
+    for source in sources:
+        digest.update(source.name.encode("utf-8"))
+        digest.update(b"\0")
+        source_hashed_bytes = 0
+        with source.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                source_hashed_bytes += len(chunk)
+                hashed_bytes += len(chunk)
+                if source_hashed_bytes > MAX_PARSE_FILE_BYTES:
+                    raise RuntimeError(
+                        "PARSER: incremental input grew beyond the "
+                        f"{MAX_PARSE_FILE_BYTES // (1024 * 1024)} MiB per-file limit "
+                        f"while fingerprinting: {source}"
+                    )
+                if hashed_bytes > MAX_PARSE_TOTAL_BYTES:
+                    raise RuntimeError(
+                        "PARSER: incremental inputs grew beyond the "
+                        f"{MAX_PARSE_TOTAL_BYTES // (1024 * 1024 * 1024)} GiB "
+                        "aggregate limit while fingerprinting."
+                    )
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest(), hashed_bytes
+
+
+def _is_sqlite_file(path: Path) -> bool:
+    """Return whether ``path`` starts with the SQLite database header."""
+    with path.open("rb") as handle:
+        return handle.read(len(_SQLITE_HEADER)) == _SQLITE_HEADER
+
+
+def _decode_cells(blob: object, raw_size: object) -> dict[str, str]:
+    """Inflate one row's cells without trusting its stored size."""
+    if not isinstance(blob, bytes) or not isinstance(raw_size, int) or raw_size < 0:
+        raise ValueError("cache cells are malformed")
+    inflater = zlib.decompressobj()
+    raw = inflater.decompress(blob, raw_size + 1)
+    if len(raw) != raw_size or inflater.unconsumed_tail or not inflater.eof:
+        raise ValueError("cache cells do not match their recorded size")
+    cells = json.loads(raw.decode("utf-8"))
+    if (
+        not isinstance(cells, dict)
+        or len(cells) > MAX_INCREMENTAL_CACHE_COLUMNS
+        or not all(
+            isinstance(column, str) and column and isinstance(value, str)
+            for column, value in cells.items()
+        )
+    ):
+        raise ValueError("cache cells are malformed or exceed their bound")
+    return cells
 
 
 def load_cache(
     cache_path: Path,
     expected_configuration_hash: str,
-) -> tuple[list[str], dict[str, tuple[str, dict[str, str]]]]:
-    """Load a matching JSON cache; return an empty cache for stale or malformed content."""
+) -> tuple[list[str], dict[str, CachedFile]]:
+    """Load a matching SQLite cache; return an empty cache for stale or malformed content."""
     if not cache_path.is_file():
         return [], {}
     try:
-        size = cache_path.stat().st_size
-        if size > MAX_INCREMENTAL_CACHE_BYTES:
+        if cache_path.stat().st_size > MAX_INCREMENTAL_CACHE_BYTES:
             raise ValueError(
                 f"cache is larger than {MAX_INCREMENTAL_CACHE_BYTES // (1024 * 1024)} MiB"
             )
-        with cache_path.open("rb") as handle:
-            raw_payload = handle.read(MAX_INCREMENTAL_CACHE_BYTES + 1)
-        if len(raw_payload) > MAX_INCREMENTAL_CACHE_BYTES:
-            raise ValueError(
-                f"cache is larger than {MAX_INCREMENTAL_CACHE_BYTES // (1024 * 1024)} MiB"
-            )
-        payload = json.loads(raw_payload.decode("utf-8"))
-        if not isinstance(payload, dict):
-            raise ValueError("cache root is not an object")
-        if payload.get("schema_version") != CACHE_SCHEMA_VERSION:
-            return [], {}
-        if payload.get("configuration_hash") != expected_configuration_hash:
-            return [], {}
-
-        raw_names = payload.get("var_names")
-        raw_files = payload.get("files")
-        if (
-            not isinstance(raw_names, list)
-            or len(raw_names) > MAX_PARSE_VARIABLES
-            or not all(isinstance(name, str) and name for name in raw_names)
-        ):
-            raise ValueError("var_names must be non-empty strings")
-        if not isinstance(raw_files, dict) or len(raw_files) > MAX_PARSE_FILES:
-            raise ValueError("files must be a bounded object")
-
-        files: dict[str, tuple[str, dict[str, str]]] = {}
-        for source_path, record in raw_files.items():
-            if not isinstance(source_path, str) or not source_path or not isinstance(record, dict):
-                raise ValueError("cache file records are malformed")
-            fingerprint = record.get("fingerprint")
-            cells = record.get("cells")
+        if not _is_sqlite_file(cache_path):
+            raise ValueError("cache is not an SQLite database")
+        with closing(sqlite3.connect(f"{cache_path.as_uri()}?mode=ro", uri=True)) as connection:
+            meta = dict(connection.execute("SELECT key, value FROM meta").fetchall())
+            if meta.get("schema_version") != str(CACHE_SCHEMA_VERSION):
+                return [], {}
+            if meta.get("configuration_hash") != expected_configuration_hash:
+                return [], {}
+
+            raw_names = json.loads(meta.get("var_names", "null"))
             if (
-                not isinstance(fingerprint, str)
-                or len(fingerprint) != 64
-                or any(character not in "0123456789abcdef" for character in fingerprint)
+                not isinstance(raw_names, list)
+                or len(raw_names) > MAX_PARSE_VARIABLES
+                or not all(isinstance(name, str) and name for name in raw_names)
             ):
-                raise ValueError("cache fingerprint is malformed")
-            if (
-                not isinstance(cells, dict)
-                or len(cells) > MAX_INCREMENTAL_CACHE_COLUMNS
-                or not all(
-                    isinstance(column, str) and column and isinstance(value, str)
-                    for column, value in cells.items()
+                raise ValueError("var_names must be non-empty strings")
+            file_count, raw_total = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(raw_size), 0) FROM files"
+            ).fetchone()
+            if file_count > MAX_PARSE_FILES:
+                raise ValueError("files must be a bounded table")
+            if raw_total > MAX_INCREMENTAL_CACHE_BYTES:
+                raise ValueError(
+                    "cache cells exceed "
+                    f"{MAX_INCREMENTAL_CACHE_BYTES // (1024 * 1024)} MiB when inflated"
                 )
+
+            files: dict[str, CachedFile] = {}
+            for source_path, fingerprint, stamp, raw_size, blob in connection.execute(
+                "SELECT source_path, fingerprint, stamp, raw_size, cells FROM files"
             ):
-                raise ValueError("cache cells are malformed or exceed their bound")
-            files[source_path] = (fingerprint, dict(cells))
+                if not isinstance(source_path, str) or not source_path:
+                    raise ValueError("cache file records are malformed")
+                if (
+                    not isinstance(fingerprint, str)
+                    or len(fingerprint) != 64
+                    or any(character not in "0123456789abcdef" for character in fingerprint)
+                ):
+                    raise ValueError("cache fingerprint is malformed")
+                if not isinstance(stamp, str) or (
+                    stamp and _STAMP_PATTERN.fullmatch(stamp) is None
+                ):
+                    raise ValueError("cache stamp is malformed")
+                files[source_path] = CachedFile(
+                    fingerprint=fingerprint,
+                    stamp=stamp,
+                    cells=_decode_cells(blob, raw_size),
+                )
         return list(raw_names), files
-    except (OSError, UnicodeError, json.JSONDecodeError, ValueError) as exc:
+    except (OSError, UnicodeError, json.JSONDecodeError, ValueError, sqlite3.Error) as exc:
         logger.warning("PARSER: ignoring invalid incremental cache %s: %s", cache_path, exc)
         return [], {}
 
@@ -188,42 +342,103 @@ def write_cache(
     var_names: Sequence[str],
     fingerprints: Sequence[tuple[str, str]],
     rows: dict[str, dict[str, str]],
+    stamps: Sequence[tuple[str, str]] = (),
 ) -> None:
     # [impl->req~ring5.ingestion.incremental-parsing~1]
-    """Atomically persist a bounded JSON cache after the final CSV succeeds."""
-    files = {
-        source_path: {"fingerprint": fingerprint, "cells": rows[source_path]}
-        for source_path, fingerprint in fingerprints
-    }
-    payload = {
-        "schema_version": CACHE_SCHEMA_VERSION,
+    """Update a bounded SQLite cache in one transaction after the final CSV succeeds.
+
+    Only rows whose fingerprint changed are re-encoded, rows whose stamp alone changed get a
+    new stamp, and rows for removed inputs are deleted; an unchanged run writes nothing.
+    """
+    stamp_by_path = dict(stamps)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    if cache_path.is_file() and not _is_sqlite_file(cache_path):
+        # A previous JSON cache or foreign file at the cache path is rebuilt from scratch.
+        cache_path.unlink()
+
+    try:
+        with closing(sqlite3.connect(cache_path, isolation_level=None)) as connection:
+            page_size = connection.execute("PRAGMA page_size").fetchone()[0]
+            connection.execute(
+                f"PRAGMA max_page_count = {MAX_INCREMENTAL_CACHE_BYTES // page_size}"
+            )
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                _update_cache(connection, config_hash, var_names, fingerprints, rows, stamp_by_path)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+    except sqlite3.OperationalError as exc:
+        if "full" in str(exc):
+            raise RuntimeError(
+                "PARSER: incremental cache exceeds the "
+                f"{MAX_INCREMENTAL_CACHE_BYTES // (1024 * 1024)} MiB limit."
+            ) from exc
+        raise RuntimeError(f"PARSER: could not update incremental cache: {exc}") from exc
+    except sqlite3.Error as exc:
+        raise RuntimeError(f"PARSER: could not update incremental cache: {exc}") from exc
+
+
+def _update_cache(
+    connection: sqlite3.Connection,
+    config_hash: str,
+    var_names: Sequence[str],
+    fingerprints: Sequence[tuple[str, str]],
+    rows: dict[str, dict[str, str]],
+    stamp_by_path: Mapping[str, str],
+) -> None:
+    """Apply the current fingerprints and rows to an open cache transaction."""
+    for statement in _SCHEMA:
+        connection.execute(statement)
+    expected_meta = {
+        "schema_version": str(CACHE_SCHEMA_VERSION),
         "configuration_hash": config_hash,
-        "var_names": list(var_names),
-        "files": files,
+        "var_names": json.dumps(list(var_names), ensure_ascii=False, separators=(",", ":")),
+    }
+    meta = dict(connection.execute("SELECT key, value FROM meta").fetchall())
+    if (
+        meta.get("schema_version") != expected_meta["schema_version"]
+        or meta.get("configuration_hash") != config_hash
+    ):
+        connection.execute("DELETE FROM files")
+    if meta != expected_meta:
+        connection.execute("DELETE FROM meta")
+        connection.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", expected_meta.items())
+
+    stored = {
+        source_path: (fingerprint, stamp)
+        for source_path, fingerprint, stamp in connection.execute(
+            "SELECT source_path, fingerprint, stamp FROM files"
+        )
     }
-    encoded = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8") + b"\n"
-    if len(encoded) > MAX_INCREMENTAL_CACHE_BYTES:
+    current = dict(fingerprints)
+    connection.executemany(
+        "DELETE FROM files WHERE source_path = ?",
+        [(source_path,) for source_path in stored if source_path not in current],
+    )
+    for source_path, fingerprint in fingerprints:
+        stamp = stamp_by_path.get(source_path, "")
+        previous = stored.get(source_path)
+        if previous == (fingerprint, stamp):
+            continue
+        if previous is not None and previous[0] == fingerprint:
+            connection.execute(
+                "UPDATE files SET stamp = ? WHERE source_path = ?", (stamp, source_path)
+            )
+            continue
+        raw = json.dumps(rows[source_path], ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+        connection.execute(
+            "INSERT OR REPLACE INTO files (source_path, fingerprint, stamp, raw_size, cells) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (source_path, fingerprint, stamp, len(raw), zlib.compress(raw)),
+        )
+
+    raw_total = connection.execute("SELECT COALESCE(SUM(raw_size), 0) FROM files").fetchone()[0]
+    if raw_total > MAX_INCREMENTAL_CACHE_BYTES:
         raise RuntimeError(
             "PARSER: incremental cache exceeds the "
             f"{MAX_INCREMENTAL_CACHE_BYTES // (1024 * 1024)} MiB limit."
         )
-
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-    temporary_name: str | None = None
-    try:
-        with tempfile.NamedTemporaryFile(
-            mode="wb",
-            prefix=f".{cache_path.name}.",
-            suffix=".tmp",
-            dir=cache_path.parent,
-            delete=False,
-        ) as handle:
-            temporary_name = handle.name
-            handle.write(encoded)
-            handle.flush()
-            os.fsync(handle.fileno())
-        os.replace(temporary_name, cache_path)
-        temporary_name = None
-    finally:
-        if temporary_name is not None:
-            Path(temporary_name).unlink(missing_ok=True)
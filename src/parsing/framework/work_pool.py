@@ -24,10 +24,17 @@ DEFAULT_WORKERS = 2
 
 
 def _default_workers() -> int:
-    """Return the bounded worker count, honoring an explicit deployment override."""
+    """Return the bounded worker count, honoring an explicit deployment override.
+
+    ``RING5_WORK_POOL_SIZE=auto`` allows one thread per CPU, matching the upper bound of
+    an adaptive Perl pool. The executor only starts threads as work arrives, and they
+    mostly wait on the Perl workers, so an idle allowance costs little.
+    """
     value = os.environ.get("RING5_WORK_POOL_SIZE")
     if value is None:
         return DEFAULT_WORKERS
+    if value.strip().lower() == "auto":
+        return os.cpu_count() or DEFAULT_WORKERS
 
     try:
         workers = int(value)
@@ -6,10 +6,11 @@ import math
 import os
 import tempfile
 import time
-from concurrent.futures import Future
+from collections.abc import Sequence
+from concurrent.futures import Future, as_completed, wait
 from dataclasses import replace
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from src.core.common.safe_regex import (
     SafeRegexError,
@@ -43,13 +44,15 @@ from src.core.models import (
     StatConfig,
 )
 from src.core.models.csv_contract import MISSING_VALUE, validate_parser_csv
+from src.core.models.parsing_models import CONFIG_INI_STRATEGIES
 from src.core.models.pattern_index_service import PatternIndexService
 from src.parsing.framework.file_discovery import find_stats_files
 from src.parsing.framework.incremental_cache import (
     DEFAULT_CACHE_NAME,
+    ChangeDetection,
     configuration_hash,
-    fingerprint_inputs,
     load_cache,
+    scan_inputs,
     write_cache,
 )
 from src.parsing.gem5.impl.pool.pool import ParseWorkPool, ScanWorkPool
@@ -58,10 +61,14 @@ from src.parsing.gem5.impl.scanning.pattern_aggregator import PatternAggregator
 from src.parsing.gem5.impl.strategies.factory import StrategyFactory
 from src.parsing.gem5.impl.strategies.file_parser_strategy import INTERNAL_SIM_PATH_KEY
 from src.parsing.gem5.models import Gem5ScannedVariable
+from src.parsing.gem5.types.type_mapper import TypeMapper
 from src.parsing.parser_protocol import SimulationParser
 
 logger = logging.getLogger(__name__)
 
+# Rendered rows held while an earlier file's worker is still running in streaming assembly.
+STREAMING_REORDER_BUFFER_ROWS = 256
+
 
 def _render_value(val: Any) -> str:
     """Render a reduced stat value for the CSV, mapping missing → MISSING_VALUE.
@@ -77,6 +84,39 @@ def _render_value(val: Any) -> str:
     return str(val)
 
 
+def _render_csv_row(
+    file_stats: dict[str, Any],
+    ordered_names: list[str],
+    column_map: dict[str, list[str] | None],
+) -> list[str]:
+    """Render one file's results in ``ordered_names`` order against the header ``column_map``."""
+    row_parts: list[str] = []
+    for var_name in ordered_names:
+        entries = column_map[var_name]
+        if var_name not in file_stats:
+            # One cell per header column keeps the row aligned for vector variables.
+            row_parts.extend([MISSING_VALUE] * (len(entries) if entries else 1))
+            continue
+
+        var = file_stats[var_name]
+
+        # Handle Stat objects vs Raw Data (from ConfigAwareStrategy)
+        if hasattr(var, "balance_content"):
+            var.balance_content()
+            var.reduce_duplicates()
+
+            if entries is not None:
+                reduced = var.reduced_content
+                for e in entries:
+                    row_parts.append(_render_value(reduced.get(e)))
+            else:
+                row_parts.append(_render_value(var.reduced_content))
+        else:
+            # Raw data (string/int/etc.)
+            row_parts.append(str(var))
+    return row_parts
+
+
 class Gem5Parser(SimulationParser):
     """The gem5 simulation backend — parsing, scanning, and CSV assembly.
 
@@ -302,13 +342,29 @@ class Gem5Parser(SimulationParser):
             )
 
         var_names: list[str] = [v.name for v in processed_configs]
+        # Entry columns come from the same configs that build each file's stat objects, so a
+        # streaming writer can emit the header before any worker finishes.
+        column_schema = tuple(
+            (config.name, Gem5Parser._schema_entries(config)) for config in processed_configs
+        )
 
         pool = ParseWorkPool.get_instance()
         futures = pool.submit_batch_async(batch_work)
 
         t_total = time.perf_counter() - t_start
         logger.info(f"PERF: submit_parse_async total (pre-pool) took {t_total:.4f}s")
-        return ParseBatchResult(futures=futures, var_names=var_names)
+        return ParseBatchResult(futures=futures, var_names=var_names, column_schema=column_schema)
+
+    @staticmethod
+    def _schema_entries(config: StatConfig) -> tuple[str, ...] | None:
+        """Return the entry columns a config expands to, or None for a single column."""
+        try:
+            entries = TypeMapper.create_stat(config).entries
+        except (TypeError, ValueError):
+            # Configs the type registry cannot build never yield entry columns; the streaming
+            # writer rejects any unexpected column they produce instead.
+            return None
+        return tuple(entries) if entries else None
 
     @staticmethod
     def submit_incremental_parse_async(
@@ -319,11 +375,16 @@ class Gem5Parser(SimulationParser):
         strategy_type: str = "simple",
         scanned_vars: list[ScannedVariable] | None = None,
         cache_path: str | None = None,
+        change_detection: str = "content",
+        verify_fraction: float = 0.0,
     ) -> IncrementalParseBatchResult:
         # [impl->req~ring5.ingestion.incremental-parsing~1]
-        """Fingerprint a parse tree and submit workers only for new or changed files."""
+        """Fingerprint a parse tree and submit workers only for new or changed files.
+
+        ``change_detection="metadata"`` content-hashes only inputs whose ``(size, mtime_ns,
+        inode)`` stamp differs from the cache, plus a ``verify_fraction`` sample of the rest.
+        """
         files = find_stats_files(stats_path, stats_pattern, sort=True, raise_if_empty=True)
-        fingerprints = fingerprint_inputs(files, strategy_type)
         config_hash = configuration_hash(
             stats_pattern,
             strategy_type,
@@ -335,8 +396,8 @@ class Gem5Parser(SimulationParser):
             if cache_path
             else Path(output_dir).expanduser().resolve() / DEFAULT_CACHE_NAME
         )
-        protected_paths = {Path(source_path) for source_path, _fingerprint in fingerprints}
-        if strategy_type == "config_aware":
+        protected_paths = {Path(source_path).resolve() for source_path in files}
+        if strategy_type in CONFIG_INI_STRATEGIES:
             protected_paths.update(path.parent / "config.ini" for path in tuple(protected_paths))
         output_path = Path(output_dir).expanduser().resolve() / "results.csv"
         if (
@@ -349,14 +410,25 @@ class Gem5Parser(SimulationParser):
                 "simulator input."
             )
         cached_var_names, cached_files = load_cache(resolved_cache, config_hash)
+        scan = scan_inputs(
+            files,
+            strategy_type,
+            change_detection=cast(ChangeDetection, change_detection),
+            known={
+                source_path: (cached.stamp, cached.fingerprint)
+                for source_path, cached in cached_files.items()
+            },
+            verify_fraction=verify_fraction,
+        )
+        fingerprints = scan.fingerprints
         current_fingerprints = dict(fingerprints)
 
         cached_rows: list[tuple[str, tuple[tuple[str, str], ...]]] = []
         changed_files: list[str] = []
         for source_path, fingerprint in fingerprints:
             cached = cached_files.get(source_path)
-            if cached is not None and cached[0] == fingerprint:
-                cached_rows.append((source_path, tuple(cached[1].items())))
+            if cached is not None and cached.fingerprint == fingerprint:
+                cached_rows.append((source_path, tuple(cached.cells.items())))
             else:
                 changed_files.append(source_path)
 
@@ -379,10 +451,12 @@ class Gem5Parser(SimulationParser):
             raise RuntimeError("PARSER: incremental parse has no resolved variable names.")
 
         logger.info(
-            "PARSER: incremental plan has %d changed, %d reused, and %d removed files",
+            "PARSER: incremental plan has %d changed, %d reused, and %d removed files "
+            "(%d content-hashed)",
             len(changed_files),
             len(cached_rows),
             len(removed_files),
+            scan.hashed_files,
         )
         return IncrementalParseBatchResult(
             futures=futures,
@@ -395,6 +469,8 @@ class Gem5Parser(SimulationParser):
             cached_rows=tuple(cached_rows),
             changed_files=tuple(changed_files),
             removed_files=removed_files,
+            stamps=scan.stamps,
+            change_detection=change_detection,
         )
 
     @staticmethod
@@ -602,6 +678,8 @@ class Gem5Parser(SimulationParser):
         csv_path = Gem5Parser.construct_final_csv(
             output_dir, processed_results, var_names=var_names
         )
+        if csv_path:
+            Gem5Parser._write_side_tables(strategy, Path(csv_path))
 
         # Enforce the inter-layer CSV contract (logged, non-fatal).
         if csv_path and Path(csv_path).exists():
@@ -613,12 +691,147 @@ class Gem5Parser(SimulationParser):
         return csv_path
 
     @staticmethod
-    def _flatten_incremental_result(
+    def finalize_parsing_streaming(
+        output_dir: str,
+        futures: Sequence[Future[dict[str, Any]]],
+        column_schema: Sequence[tuple[str, tuple[str, ...] | None]],
+        strategy_type: str = "simple",
+        *,
+        timeout: float | None = None,
+        max_buffered_rows: int = STREAMING_REORDER_BUFFER_ROWS,
+    ) -> str | None:
+        """
+        Write the final CSV while workers are still running.
+
+        The header comes from ``column_schema`` plus the strategy's metadata columns. Each
+        result is post-processed and rendered as soon as its future completes, then cleared so
+        the worker's stat objects can be freed; rows reach the file in ``futures`` order. Rows
+        that finish ahead of an unfinished predecessor wait in a reorder buffer; once it holds
+        ``max_buffered_rows`` rows the writer waits for that predecessor first.
+
+        Raises:
+            TimeoutError: ``timeout`` seconds passed before every future completed.
+            RuntimeError: A worker failed, or a result has columns outside the schema.
+        """
+        # [impl->req~ring5.ingestion.async-parse~1]
+        t_start = time.perf_counter()
+        if not futures:
+            logger.warning("PARSER: No results to persist.")
+            return None
+        if max_buffered_rows < 1:
+            raise ValueError("PARSER: max_buffered_rows must be at least 1.")
+
+        strategy = StrategyFactory.create(strategy_type)
+        column_map: dict[str, list[str] | None] = {
+            var_name: list(entries) if entries else None for var_name, entries in column_schema
+        }
+        for metadata_column in getattr(strategy, "metadata_columns", ()):
+            column_map.setdefault(metadata_column, None)
+        ordered_names = list(column_map)
+        header_parts: list[str] = []
+        for var_name in ordered_names:
+            entries = column_map[var_name]
+            if entries:
+                header_parts.extend(f"{var_name}..{e}" for e in entries)
+            else:
+                header_parts.append(var_name)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        positions = {future: index for index, future in enumerate(futures)}
+        buffered: dict[int, list[str]] = {}
+        next_index = 0
+        peak_buffered = 0
+
+        def render(index: int) -> list[str]:
+            try:
+                result = futures[index].result()
+            except Exception as exc:
+                raise RuntimeError(f"PARSER: parse worker failed: {exc}") from exc
+            processed = strategy.post_process([result])
+            if len(processed) != 1:
+                raise RuntimeError("PARSER: streaming strategy changed the per-file row count.")
+            unexpected = sorted(
+                name
+                for name, value in processed[0].items()
+                if name not in column_map and not hasattr(value, "balance_content")
+            )
+            if unexpected:
+                raise RuntimeError(
+                    "PARSER: streaming result has columns outside the parse schema: "
+                    + ", ".join(unexpected)
+                )
+            row = _render_csv_row(processed[0], ordered_names, column_map)
+            # The future keeps its result alive; clearing it releases the stat objects.
+            result.clear()
+            return row
+
+        output_root = normalize_user_path(output_dir)
+        output_root.mkdir(parents=True, exist_ok=True)
+        output_path = output_root / "results.csv"
+        temporary_name: str | None = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                newline="",
+                prefix=".results.",
+                suffix=".csv.tmp",
+                dir=output_root,
+                delete=False,
+            ) as handle:
+                temporary_name = handle.name
+                writer = csv.writer(handle, quoting=csv.QUOTE_MINIMAL)
+                writer.writerow(header_parts)
+
+                def accept(index: int) -> None:
+                    nonlocal next_index, peak_buffered
+                    if index < next_index or index in buffered:
+                        return
+                    buffered[index] = render(index)
+                    peak_buffered = max(peak_buffered, len(buffered))
+                    while next_index in buffered:
+                        writer.writerow(buffered.pop(next_index))
+                        next_index += 1
+
+                for future in as_completed(futures, timeout=timeout):
+                    accept(positions[future])
+                    while len(buffered) >= max_buffered_rows:
+                        remaining = (
+                            None if deadline is None else max(0.0, deadline - time.monotonic())
+                        )
+                        wait([futures[next_index]], timeout=remaining)
+                        if not futures[next_index].done():
+                            raise TimeoutError(
+                                f"PARSER: parse batch did not finish within {timeout:g} seconds."
+                            )
+                        accept(next_index)
+            os.replace(temporary_name, output_path)
+            temporary_name = None
+        finally:
+            if temporary_name is not None:
+                Path(temporary_name).unlink(missing_ok=True)
+        Gem5Parser._write_side_tables(strategy, output_path)
+
+        for warning in validate_parser_csv(output_path):
+            logger.warning("CSV contract: %s", warning)
+        logger.info(
+            "PERF: streaming CSV assembly of %d files took %.4fs (peak reorder buffer %d rows)",
+            len(futures),
+            time.perf_counter() - t_start,
+            peak_buffered,
+        )
+        return str(output_path)
+
+    @staticmethod
+    def _flatten_result_row(
         result: dict[str, Any],
         strategy_type: str,
         var_names: list[str],
     ) -> tuple[str, dict[str, str]]:
-        """Reduce one worker result into safe JSON/CSV scalar cells."""
+        """Reduce one worker result into safe JSON/CSV scalar cells.
+
+        Used for the incremental cache and for background parse checkpoints.
+        """
         source_value = result.get(INTERNAL_SIM_PATH_KEY)
         if not isinstance(source_value, str) or not source_value:
             raise RuntimeError("PARSER: incremental result is missing simulation provenance.")
@@ -673,6 +886,7 @@ class Gem5Parser(SimulationParser):
             batch.var_names,
             batch.fingerprints,
             rows,
+            batch.stamps,
         )
         return IncrementalParseResult(
             csv_path=str(output_path),
@@ -703,10 +917,16 @@ class Gem5Parser(SimulationParser):
         require_complete: bool,
     ) -> tuple[list[str], dict[str, dict[str, str]]]:
         """Validate worker provenance and combine it with reusable scalar rows."""
-        current_fingerprints = fingerprint_inputs(
+        submitted_stamps = dict(batch.stamps)
+        current_fingerprints = scan_inputs(
             [source_path for source_path, _fingerprint in batch.fingerprints],
             batch.strategy_type,
-        )
+            change_detection=cast(ChangeDetection, batch.change_detection),
+            known={
+                source_path: (submitted_stamps.get(source_path, ""), fingerprint)
+                for source_path, fingerprint in batch.fingerprints
+            },
+        ).fingerprints
         if current_fingerprints != batch.fingerprints:
             raise RuntimeError(
                 "PARSER: simulator inputs changed during incremental parsing; submit again "
@@ -725,7 +945,7 @@ class Gem5Parser(SimulationParser):
 
         rows = {source_path: dict(cells) for source_path, cells in batch.cached_rows}
         for result in results:
-            source_path, row = Gem5Parser._flatten_incremental_result(
+            source_path, row = Gem5Parser._flatten_result_row(
                 result,
                 batch.strategy_type,
                 batch.var_names,
@@ -759,8 +979,47 @@ class Gem5Parser(SimulationParser):
         rows: dict[str, dict[str, str]],
     ) -> Path:
         """Atomically write ordered incremental rows to the attempt CSV."""
+        return Gem5Parser._write_row_csv(
+            batch.output_dir,
+            batch.var_names,
+            current_paths,
+            rows,
+            strategy_type=batch.strategy_type,
+        )
+
+    @staticmethod
+    def _finalize_checkpoint_rows(
+        output_dir: str,
+        var_names: list[str],
+        rows: list[tuple[str, dict[str, str]]],
+        strategy_type: str = "simple",
+    ) -> str | None:
+        """Write a background job's checkpointed ``(source_path, cells)`` rows as its CSV."""
+        if not rows:
+            logger.warning("PARSER: No results to persist.")
+            return None
+        return str(
+            Gem5Parser._write_row_csv(
+                output_dir,
+                var_names,
+                [source_path for source_path, _cells in rows],
+                dict(rows),
+                strategy_type=strategy_type,
+            )
+        )
+
+    @staticmethod
+    def _write_row_csv(
+        output_dir: str,
+        var_names: list[str],
+        current_paths: list[str],
+        rows: dict[str, dict[str, str]],
+        *,
+        strategy_type: str = "simple",
+    ) -> Path:
+        """Atomically write flattened rows, in ``current_paths`` order, to ``results.csv``."""
         columns: list[str] = []
-        for var_name in batch.var_names:
+        for var_name in var_names:
             matching = [
                 column
                 for source_path in current_paths
@@ -780,9 +1039,9 @@ class Gem5Parser(SimulationParser):
                 f"{MAX_INCREMENTAL_CACHE_COLUMNS}-column limit."
             )
 
-        output_dir = Path(batch.output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_path = output_dir / "results.csv"
+        output_root = Path(output_dir)
+        output_root.mkdir(parents=True, exist_ok=True)
+        output_path = output_root / "results.csv"
         temporary_name: str | None = None
         try:
             with tempfile.NamedTemporaryFile(
@@ -791,7 +1050,7 @@ class Gem5Parser(SimulationParser):
                 newline="",
                 prefix=".results.",
                 suffix=".csv.tmp",
-                dir=output_dir,
+                dir=output_root,
                 delete=False,
             ) as handle:
                 temporary_name = handle.name
@@ -808,11 +1067,19 @@ class Gem5Parser(SimulationParser):
         finally:
             if temporary_name is not None:
                 Path(temporary_name).unlink(missing_ok=True)
+        Gem5Parser._write_side_tables(StrategyFactory.create(strategy_type), output_path)
 
         for warning in validate_parser_csv(output_path):
             logger.warning("CSV contract: %s", warning)
         return output_path
 
+    @staticmethod
+    def _write_side_tables(strategy: object, csv_path: Path) -> None:
+        """Let a strategy that keeps data outside the CSV write it beside *csv_path*."""
+        write_side_tables = getattr(strategy, "write_side_tables", None)
+        if callable(write_side_tables):
+            write_side_tables(csv_path)
+
     @staticmethod
     def finalize_parser_playground(
         batch: ParserPlaygroundBatchResult,
@@ -942,31 +1209,7 @@ class Gem5Parser(SimulationParser):
             writer.writerow(header_parts)
 
             for file_stats in results:
-                row_parts: list[str] = []
-                for var_name in ordered_names:
-                    if var_name not in file_stats:
-                        row_parts.append(MISSING_VALUE)
-                        continue
-
-                    var = file_stats[var_name]
-
-                    # Handle Stat objects vs Raw Data (from ConfigAwareStrategy)
-                    if hasattr(var, "balance_content"):
-                        var.balance_content()
-                        var.reduce_duplicates()
-
-                        entries = column_map[var_name]
-                        if entries is not None:
-                            reduced = var.reduced_content
-                            for e in entries:
-                                row_parts.append(_render_value(reduced.get(e)))
-                        else:
-                            row_parts.append(_render_value(var.reduced_content))
-                    else:
-                        # Raw data (string/int/etc.)
-                        row_parts.append(str(var))
-
-                writer.writerow(row_parts)
+                writer.writerow(_render_csv_row(file_stats, ordered_names, column_map))
         t_write_end = time.perf_counter()
         logger.info(f"PERF: CSV writing loop took {t_write_end - t_write_start:.4f}s")
 
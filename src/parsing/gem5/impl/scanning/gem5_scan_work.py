@@ -32,7 +32,7 @@ class Gem5ScanWork(ScanWork):
 
     def __call__(self) -> ScanFileResult:
         """
-        Execute scanning using the Gem5StatsScanner.
+        Execute scanning through the Gem5StatsScanner's persistent server pool.
 
         Returns a ``ScanFileResult`` carrying the discovered variables on
         success, or the error message on a fatal scan failure (Perl crash,
@@ -41,7 +41,7 @@ class Gem5ScanWork(ScanWork):
         """
         try:
             scanner = Gem5StatsScanner.get_instance()
-            variables = scanner.scan_file(Path(self.file_path))
+            variables = scanner.scan_file_persistent(Path(self.file_path))
             return ScanFileResult(file_path=self.file_path, variables=variables)
         except (OSError, RuntimeError) as e:
             logger.warning(
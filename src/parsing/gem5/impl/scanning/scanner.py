@@ -20,6 +20,7 @@ from src.core.common.security_limits import MAX_SCAN_FILE_BYTES, MAX_SCAN_LINE_C
 from src.core.common.safe_regex import MAX_INPUT_LENGTH
 from src.core.common.utils import sanitize_log_value
 from src.core.models import ScannedVariable
+from src.parsing.gem5.impl.strategies.perl_worker_pool import get_scanner_pool
 from src.parsing.gem5.models import Gem5ScannedVariable
 from src.parsing.gem5.types.type_mapper import TypeMapper
 
@@ -73,7 +74,10 @@ class Gem5StatsScanner:
         self, file_path: Path, config_vars: list[str] | None = None
     ) -> list[ScannedVariable]:
         """
-        Scan a single stats file to discover variable schemas.
+        Scan a single stats file in a one-shot Perl process.
+
+        Prefer ``scan_file_persistent`` for bulk discovery; this path forks
+        ``statsScanner.pl`` per call and suits isolated, one-off scans.
 
         Args:
             file_path: Absolute path to the gem5 stats.txt file.
@@ -87,21 +91,12 @@ class Gem5StatsScanner:
             RuntimeError: If the Perl scanner returns invalid output or crashes.
         """
         # [impl->req~ring5.ingestion.variable-scan~1]
-        display_path = sanitize_log_value(file_path)
-        if not file_path.exists():
-            raise FileNotFoundError(f"SCANNER: File not found: {display_path}")
-        file_size = file_path.stat().st_size
-        if file_size > MAX_SCAN_FILE_BYTES:
-            raise RuntimeError(
-                f"Scanner input exceeds the {MAX_SCAN_FILE_BYTES // (1024 * 1024)} MiB limit: "
-                f"{display_path}"
-            )
+        display_path = self._validate_input(file_path)
 
         cmd = [str(self._perl_exe), str(self._script_path), str(file_path)]
         if config_vars:
             cmd.append(",".join(str(v) for v in config_vars))
 
-        result: subprocess.CompletedProcess[str] | None = None
         try:
             # Command constructed from validated paths, shell=False enforced for safety
             result = subprocess.run(
@@ -113,61 +108,6 @@ class Gem5StatsScanner:
                 timeout=15,
                 env={**os.environ, "RING5_MAX_SCAN_LINES": str(MAX_SCAN_LINE_COUNT)},
             )
-
-            if not result.stdout.strip():
-                return []
-
-            results = json.loads(result.stdout)
-            if not isinstance(results, list):
-                raise RuntimeError("Perl scanner produced a non-list JSON result.")
-
-            variables: list[ScannedVariable] = []
-            for index, item in enumerate(results):
-                if not isinstance(item, dict):
-                    raise RuntimeError(f"Perl scanner result {index} is not a variable object.")
-                try:
-                    name = item.get("name")
-                    type_name = item.get("type")
-                    entries = item.get("entries", [])
-                    pattern_indices = item.get("pattern_indices", [])
-                    if not isinstance(name, str) or not name:
-                        raise ValueError("name must be a non-empty string")
-                    if len(name) > MAX_INPUT_LENGTH:
-                        raise ValueError("name exceeds the scanner string limit")
-                    if type_name not in {
-                        "configuration",
-                        "distribution",
-                        "histogram",
-                        "scalar",
-                        "vector",
-                    }:
-                        raise ValueError("type is not supported")
-                    if not isinstance(entries, list) or any(
-                        not isinstance(entry, str) or len(entry) > MAX_INPUT_LENGTH
-                        for entry in entries
-                    ):
-                        raise ValueError("entries must be a list of bounded strings")
-                    if not isinstance(pattern_indices, list) or any(
-                        not isinstance(pattern_id, str) or len(pattern_id) > MAX_INPUT_LENGTH
-                        for pattern_id in pattern_indices
-                    ):
-                        raise ValueError("pattern_indices must be a list of bounded strings")
-                    for range_name in ("minimum", "maximum"):
-                        range_value = item.get(range_name)
-                        if range_value is not None and (
-                            isinstance(range_value, bool)
-                            or not isinstance(range_value, (int, float))
-                            or not math.isfinite(range_value)
-                        ):
-                            raise ValueError(f"{range_name} must be a finite number")
-                    mapped = TypeMapper.map_scan_result(item)
-                    variables.append(Gem5ScannedVariable.from_dict(mapped))
-                except (KeyError, TypeError, ValueError) as exc:
-                    raise RuntimeError(
-                        f"Perl scanner result {index} has an invalid variable schema."
-                    ) from exc
-            return variables
-
         except subprocess.TimeoutExpired as e:
             logger.error("SCANNER: Timeout scanning %s", display_path)
             raise RuntimeError(f"Scanner timed out on {display_path}") from e
@@ -175,10 +115,116 @@ class Gem5StatsScanner:
             stderr = sanitize_log_value(str(e.stderr or "")[:1000])
             logger.error("SCANNER: Perl script failed: %s", stderr)
             raise RuntimeError(f"Perl scanner failed for {display_path}: {stderr}") from e
+
+        return self._decode_results(result.stdout)
+
+    def scan_file_persistent(
+        self, file_path: Path, config_vars: list[str] | None = None
+    ) -> list[ScannedVariable]:
+        """
+        Scan a single stats file through the persistent scanner server pool.
+
+        Avoids per-file Perl startup and module compilation; the pool provides
+        the same health monitoring, restart and timeout handling as parsing.
+
+        Args:
+            file_path: Absolute path to the gem5 stats.txt file.
+            config_vars: Optional list of regex hints for variable detection.
+
+        Returns:
+            List of discovered variables.
+
+        Raises:
+            FileNotFoundError: If the target stats file does not exist.
+            RuntimeError: If every scanner worker fails or returns invalid output.
+        """
+        # [impl->req~ring5.ingestion.variable-scan~1]
+        display_path = self._validate_input(file_path)
+        try:
+            lines = get_scanner_pool().scan_file(
+                str(file_path), [str(v) for v in config_vars or []], timeout=15.0
+            )
+        except TimeoutError as e:
+            logger.error("SCANNER: Timeout scanning %s", display_path)
+            raise RuntimeError(f"Scanner timed out on {display_path}") from e
+        except (RuntimeError, ValueError) as e:
+            raise RuntimeError(f"Perl scanner failed for {display_path}: {e}") from e
+
+        return self._decode_results("\n".join(lines))
+
+    @staticmethod
+    def _validate_input(file_path: Path) -> str:
+        """Check the stats file exists and is within limits; return its display path."""
+        display_path = sanitize_log_value(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"SCANNER: File not found: {display_path}")
+        file_size = file_path.stat().st_size
+        if file_size > MAX_SCAN_FILE_BYTES:
+            raise RuntimeError(
+                f"Scanner input exceeds the {MAX_SCAN_FILE_BYTES // (1024 * 1024)} MiB limit: "
+                f"{display_path}"
+            )
+        return display_path
+
+    @staticmethod
+    def _decode_results(stdout: str) -> list[ScannedVariable]:
+        """Decode and validate the scanner's JSON output."""
+        if not stdout.strip():
+            return []
+
+        try:
+            results = json.loads(stdout)
         except json.JSONDecodeError as e:
-            raw_output = result.stdout[:200] if result is not None else "<no output>"
             logger.error(
                 "SCANNER: Invalid JSON output from script: %s",
-                sanitize_log_value(raw_output),
+                sanitize_log_value(stdout[:200]),
             )
             raise RuntimeError("Perl scanner produced corrupt JSON output.") from e
+        if not isinstance(results, list):
+            raise RuntimeError("Perl scanner produced a non-list JSON result.")
+
+        variables: list[ScannedVariable] = []
+        for index, item in enumerate(results):
+            if not isinstance(item, dict):
+                raise RuntimeError(f"Perl scanner result {index} is not a variable object.")
+            try:
+                name = item.get("name")
+                type_name = item.get("type")
+                entries = item.get("entries", [])
+                pattern_indices = item.get("pattern_indices", [])
+                if not isinstance(name, str) or not name:
+                    raise ValueError("name must be a non-empty string")
+                if len(name) > MAX_INPUT_LENGTH:
+                    raise ValueError("name exceeds the scanner string limit")
+                if type_name not in {
+                    "configuration",
+                    "distribution",
+                    "histogram",
+                    "scalar",
+                    "vector",
+                }:
+                    raise ValueError("type is not supported")
+                if not isinstance(entries, list) or any(
+                    not isinstance(entry, str) or len(entry) > MAX_INPUT_LENGTH for entry in entries
+                ):
+                    raise ValueError("entries must be a list of bounded strings")
+                if not isinstance(pattern_indices, list) or any(
+                    not isinstance(pattern_id, str) or len(pattern_id) > MAX_INPUT_LENGTH
+                    for pattern_id in pattern_indices
+                ):
+                    raise ValueError("pattern_indices must be a list of bounded strings")
+                for range_name in ("minimum", "maximum"):
+                    range_value = item.get(range_name)
+                    if range_value is not None and (
+                        isinstance(range_value, bool)
+                        or not isinstance(range_value, (int, float))
+                        or not math.isfinite(range_value)
+                    ):
+                        raise ValueError(f"{range_name} must be a finite number")
+                mapped = TypeMapper.map_scan_result(item)
+                variables.append(Gem5ScannedVariable.from_dict(mapped))
+            except (KeyError, TypeError, ValueError) as exc:
+                raise RuntimeError(
+                    f"Perl scanner result {index} has an invalid variable schema."
+                ) from exc
+        return variables
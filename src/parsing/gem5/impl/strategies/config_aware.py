@@ -35,6 +35,8 @@ class ConfigAwareStrategy(SimpleStatsStrategy):
 
     # [impl->req~ring5.ingestion.config-aware-strategy~1]
 
+    metadata_columns = ("config_json", "sim_path")
+
     def post_process(self, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
         Augment results with config data.
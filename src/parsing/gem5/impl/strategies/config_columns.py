@@ -0,0 +1,294 @@
+"""
+Config Columns Strategy - Columnar config.ini Extraction.
+
+``ConfigAwareStrategy`` parses every ``config.ini`` serially in the main
+thread and repeats the whole configuration as a ``config_json`` cell in every
+row. Sweeps with thousands of runs and large configurations turn that column
+into the bulk of the CSV, although most runs share a handful of distinct
+configurations.
+
+This strategy instead:
+- Parses ``config.ini`` inside each parse worker, right after its stats file
+- Interns configurations by the SHA-256 of their bytes, so each distinct
+  file is parsed once however many runs share it
+- Materializes only the selected ``section.key`` paths as typed columns
+- Writes every distinct configuration once, to a ``config_table.json`` side
+  table beside ``results.csv`` keyed by the ``config_hash`` column
+
+Columns are selected with ordinary parse variables whose params carry
+``configIni: True``; their ``source_name`` (or ``name``) is the path, split
+at the last dot because gem5 section names contain dots themselves.
+"""
+
+from __future__ import annotations
+
+import configparser
+import csv
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ClassVar
+
+from src.core.common.security_limits import MAX_PARSE_FILE_BYTES
+from src.core.models import StatConfig
+from src.core.models.csv_contract import MISSING_VALUE
+from src.parsing.gem5.impl.pool.parse_work import ParsedVarsDict, ParseWork
+from src.parsing.gem5.impl.strategies.file_parser_strategy import INTERNAL_SIM_PATH_KEY
+from src.parsing.gem5.impl.strategies.simple import SimpleStatsStrategy
+
+logger = logging.getLogger(__name__)
+
+CONFIG_HASH_COLUMN = "config_hash"
+CONFIG_TABLE_NAME = "config_table.json"
+# Distinct configurations kept parsed in memory; misses re-read the file.
+MAX_INTERNED_CONFIGS = 256
+
+_INTEGER = re.compile(r"^[+-]?[0-9]+$")
+_DECIMAL = re.compile(r"^[+-]?([0-9]+\.[0-9]*|\.[0-9]+|[0-9]+)([eE][+-]?[0-9]+)?$")
+
+
+def _typed(raw: str) -> int | float | str:
+    """Return *raw* as an int or float when it is a plain decimal literal."""
+    if _INTEGER.fullmatch(raw):
+        return int(raw)
+    if _DECIMAL.fullmatch(raw):
+        return float(raw)
+    return raw
+
+
+def _split_path(path: str) -> tuple[str, str]:
+    """Split a ``section.key`` path at its last dot."""
+    section, _, key = path.rpartition(".")
+    if not section or not key:
+        raise ValueError(f"PARSER: config.ini column {path!r} must be a 'section.key' path.")
+    return section, key
+
+
+@dataclass(frozen=True)
+class InternedConfig:
+    """One distinct parsed ``config.ini``.
+
+    Attributes:
+        fingerprint: SHA-256 of the file's bytes.
+        sections: Section name to key/value text, as ``configparser`` reads it.
+    """
+
+    fingerprint: str
+    sections: Mapping[str, Mapping[str, str]]
+
+    def value(self, section: str, key: str) -> int | float | str:
+        """Return one typed value, or the CSV missing marker when absent."""
+        raw = self.sections.get(section, {}).get(key)
+        return MISSING_VALUE if raw is None else _typed(raw)
+
+
+class ConfigInterner:
+    """Thread-safe, bounded cache of parsed configurations keyed by content hash."""
+
+    def __init__(self, max_entries: int = MAX_INTERNED_CONFIGS) -> None:
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._configs: OrderedDict[str, InternedConfig] = OrderedDict()
+
+    def load(self, config_path: Path) -> InternedConfig:
+        """Return the parsed configuration at *config_path*, parsing it only if unseen.
+
+        Raises:
+            FileNotFoundError: The file does not exist.
+            RuntimeError: The file is too large or is not a usable configuration.
+        """
+        if not config_path.is_file():
+            raise FileNotFoundError(f"PARSER: config.ini not found at {config_path}")
+        if config_path.stat().st_size > MAX_PARSE_FILE_BYTES:
+            raise RuntimeError(
+                f"PARSER: config.ini exceeds the {MAX_PARSE_FILE_BYTES // (1024 * 1024)} MiB "
+                f"per-file limit: {config_path}"
+            )
+        raw = config_path.read_bytes()
+        fingerprint = hashlib.sha256(raw).hexdigest()
+        cached = self.get(fingerprint)
+        if cached is not None:
+            return cached
+        config = InternedConfig(fingerprint, self._parse(raw, config_path))
+        with self._lock:
+            # A concurrent worker may have parsed the same bytes; keep one instance.
+            config = self._configs.setdefault(fingerprint, config)
+            self._configs.move_to_end(fingerprint)
+            while len(self._configs) > self._max_entries:
+                self._configs.popitem(last=False)
+        return config
+
+    def get(self, fingerprint: str) -> InternedConfig | None:
+        """Return an already interned configuration, if it is still cached."""
+        with self._lock:
+            config = self._configs.get(fingerprint)
+            if config is not None:
+                self._configs.move_to_end(fingerprint)
+            return config
+
+    @staticmethod
+    def _parse(raw: bytes, config_path: Path) -> dict[str, dict[str, str]]:
+        parser = configparser.ConfigParser()
+        try:
+            parser.read_string(raw.decode("utf-8"), source=str(config_path))
+            if not parser.sections():
+                raise configparser.Error("configuration contains no sections")
+            return {section: dict(parser.items(section)) for section in parser.sections()}
+        except (configparser.Error, UnicodeDecodeError) as e:
+            logger.error("PARSER: Failed to parse %s: %s", config_path, e)
+            raise RuntimeError(f"PARSER: Failed to parse {config_path}: {e}") from e
+
+
+_INTERNER = ConfigInterner()
+
+
+class ConfigColumnsParseWork(ParseWork):
+    """Parse one stats file, then read the selected columns of its ``config.ini``."""
+
+    def __init__(
+        self,
+        stats_work: ParseWork,
+        config_columns: Sequence[tuple[str, str, str]],
+    ) -> None:
+        """
+        Initialize the work unit.
+
+        Args:
+            stats_work: Work unit that parses the statistics file.
+            config_columns: ``(column, section, key)`` triples to materialize.
+        """
+        self._stats_work = stats_work
+        self._config_columns = tuple(config_columns)
+        super().__init__()
+
+    def __str__(self) -> str:
+        return f"ConfigColumnsParseWork({self._stats_work.source_path})"
+
+    @property
+    def source_path(self) -> str:
+        """Return the exact statistics file parsed by this worker."""
+        return self._stats_work.source_path
+
+    def __call__(self) -> ParsedVarsDict:
+        """Return parsed statistics plus ``config_hash`` and the selected config values."""
+        result = self._stats_work()
+        config = _INTERNER.load(Path(self.source_path).parent / "config.ini")
+        result[CONFIG_HASH_COLUMN] = config.fingerprint
+        for column, section, key in self._config_columns:
+            result[column] = config.value(section, key)
+        return result
+
+
+class ConfigColumnsStrategy(SimpleStatsStrategy):
+    """
+    Parsing strategy that turns selected ``config.ini`` keys into typed columns.
+
+    Statistics are parsed exactly as by SimpleStatsStrategy. Each row also
+    carries ``config_hash`` and ``sim_path``; the full configurations are
+    written once each to the side table by :meth:`write_side_tables`.
+    """
+
+    # [impl->req~ring5.ingestion.config-aware-strategy~1]
+
+    metadata_columns: ClassVar[tuple[str, ...]] = (CONFIG_HASH_COLUMN, "sim_path")
+
+    def get_work_items(
+        self,
+        stats_path: str,
+        stats_pattern: str,
+        variables: Sequence[StatConfig],
+        *,
+        file_paths: list[str] | None = None,
+    ) -> Sequence[ConfigColumnsParseWork]:
+        """Return stats work items that also extract the selected config.ini columns."""
+        stats_variables: list[StatConfig] = []
+        config_columns: list[tuple[str, str, str]] = []
+        for var in variables:
+            if var.params.get("configIni") is True:
+                if var.name in self.metadata_columns:
+                    raise ValueError(
+                        f"PARSER: config.ini column {var.name!r} collides with a metadata column."
+                    )
+                config_columns.append((var.name, *_split_path(var.source_name or var.name)))
+            else:
+                stats_variables.append(var)
+        if not stats_variables:
+            raise ValueError("PARSER: select at least one statistic besides config.ini columns.")
+        works = super().get_work_items(
+            stats_path, stats_pattern, stats_variables, file_paths=file_paths
+        )
+        return [ConfigColumnsParseWork(work, config_columns) for work in works]
+
+    def post_process(self, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Replace worker-only provenance with the public ``sim_path`` column."""
+        processed: list[dict[str, Any]] = []
+        for result in results:
+            if INTERNAL_SIM_PATH_KEY not in result or CONFIG_HASH_COLUMN not in result:
+                raise RuntimeError("PARSER: config-column result is missing its provenance.")
+            if "sim_path" in result:
+                raise ValueError(
+                    "PARSER: config-aware metadata columns collide with requested statistics."
+                )
+            public_result = {
+                key: value for key, value in result.items() if key != INTERNAL_SIM_PATH_KEY
+            }
+            public_result["sim_path"] = str(result[INTERNAL_SIM_PATH_KEY])
+            processed.append(public_result)
+        return processed
+
+    def write_side_tables(self, csv_path: Path) -> Path:
+        """Write ``config_table.json`` for the configurations referenced by *csv_path*.
+
+        Configurations the workers interned are reused; any other is re-read
+        from beside its row's ``sim_path`` and must still hash to the same
+        ``config_hash``.
+
+        Raises:
+            RuntimeError: A configuration changed after its row was parsed.
+        """
+        tables: dict[str, Mapping[str, Mapping[str, str]]] = {}
+        with csv_path.open("r", encoding="utf-8", newline="") as handle:
+            for row in csv.DictReader(handle):
+                fingerprint = row.get(CONFIG_HASH_COLUMN)
+                if not fingerprint or fingerprint == MISSING_VALUE or fingerprint in tables:
+                    continue
+                config = _INTERNER.get(fingerprint)
+                if config is None:
+                    sim_path = row.get("sim_path") or ""
+                    config = _INTERNER.load(Path(sim_path).parent / "config.ini")
+                    if config.fingerprint != fingerprint:
+                        raise RuntimeError(
+                            f"PARSER: config.ini beside {sim_path} changed during parsing."
+                        )
+                tables[fingerprint] = config.sections
+
+        output_path = csv_path.parent / CONFIG_TABLE_NAME
+        temporary_name: str | None = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                prefix=".config_table.",
+                suffix=".json.tmp",
+                dir=csv_path.parent,
+                delete=False,
+            ) as handle:
+                temporary_name = handle.name
+                json.dump(tables, handle, sort_keys=True, separators=(",", ":"))
+            os.replace(temporary_name, output_path)
+            temporary_name = None
+        finally:
+            if temporary_name is not None:
+                Path(temporary_name).unlink(missing_ok=True)
+        logger.info(
+            "PARSER: wrote %d distinct configurations to %s", len(tables), output_path.name
+        )
+        return output_path
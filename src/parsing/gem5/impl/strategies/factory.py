@@ -7,6 +7,8 @@ consumer) never needs inline imports or if/elif chains.
 Usage:
     >>> strategy = StrategyFactory.create("simple")
     >>> strategy = StrategyFactory.create("config_aware")
+    >>> strategy = StrategyFactory.create("config_columns")
+    >>> strategy = StrategyFactory.create("python_mmap")
 """
 
 from src.parsing.gem5.impl.strategies.file_parser_strategy import (
@@ -22,7 +24,8 @@ class StrategyFactory:
         """Return a strategy instance for the given type key.
 
         Args:
-            strategy_type: One of ``"simple"`` or ``"config_aware"``.
+            strategy_type: One of ``"simple"``, ``"config_aware"``,
+                ``"config_columns"``, or ``"python_mmap"``.
 
         Returns:
             A concrete strategy implementing :class:`FileParserStrategy`.
@@ -43,7 +46,19 @@ class StrategyFactory:
 
             return ConfigAwareStrategy()
 
+        if strategy_type == "config_columns":
+            from src.parsing.gem5.impl.strategies.config_columns import (
+                ConfigColumnsStrategy,
+            )
+
+            return ConfigColumnsStrategy()
+
+        if strategy_type == "python_mmap":
+            from src.parsing.gem5.impl.strategies.python_mmap import PythonMmapStrategy
+
+            return PythonMmapStrategy()
+
         raise ValueError(
             f"Unknown strategy type: '{strategy_type}'. "
-            f"Supported types: 'simple', 'config_aware'"
+            f"Supported types: 'simple', 'config_aware', 'config_columns', 'python_mmap'"
         )
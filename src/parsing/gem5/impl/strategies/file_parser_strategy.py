@@ -35,6 +35,7 @@ class FileParserStrategy(Protocol):
     Implementations:
         - SimpleStatsStrategy: Basic stats.txt parsing
         - ConfigAwareStrategy: Stats + config.ini parsing
+        - ConfigColumnsStrategy: Stats + selected config.ini columns
 
     Usage Example:
         >>> strategy = SimpleStatsStrategy()
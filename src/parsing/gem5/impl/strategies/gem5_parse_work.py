@@ -1,11 +1,14 @@
 """
 Perl Parse Work - Worker unit for parsing a single gem5 stats file.
-Executed in parallel across multiple stats files.
+Executed in parallel across multiple stats files; work units may share a
+``Gem5ParseBatch`` so that one Perl request parses a chunk of files.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -15,12 +18,17 @@ import src.core.common.utils as utils
 from src.core.common.safe_regex import (
     SafeRegexError,
     escape_perl_stat_filter,
+    normalize_stat_pattern,
     numeric_pattern_id,
 )
 from src.core.common.security_limits import MAX_PARSE_VARIABLES
 from src.parsing.gem5.impl.pool.parse_work import ParsedVarsDict, ParseWork
 from src.parsing.gem5.impl.strategies.file_parser_strategy import INTERNAL_SIM_PATH_KEY
-from src.parsing.gem5.impl.strategies.perl_worker_pool import get_worker_pool
+from src.parsing.gem5.impl.strategies.perl_worker_pool import (
+    FileParseOutput,
+    _default_pool_size,
+    get_worker_pool,
+)
 from src.parsing.gem5.types.type_mapper import TypeMapper
 
 # Type aliases for clarity
@@ -32,6 +40,102 @@ VarsDictType = dict[str, "StatType"]
 
 logger = logging.getLogger(__name__)
 
+# Per-file budget for a Perl parse request; batches scale it by their file count.
+PARSE_TIMEOUT_SECONDS = 120.0
+# Files named in one PARSE_BATCH request.
+PARSE_BATCH_FILES = 16
+
+
+class Gem5ParseBatch:
+    # [impl->req~ring5.ingestion.persistent-workers~1]
+    """
+    A chunk of stats files parsed by one ``PARSE_BATCH`` request.
+
+    Every ``Gem5ParseWork`` sharing a batch still produces its own result. Whichever
+    member runs first parses the whole chunk; the others then take their framed output.
+    """
+
+    def __init__(self, file_paths: Sequence[str]) -> None:
+        self._file_paths: list[str] = list(file_paths)
+        self._lock = threading.Lock()
+        self._outputs: dict[str, FileParseOutput] | None = None
+        self._error: Exception | None = None
+
+    @property
+    def file_paths(self) -> tuple[str, ...]:
+        """Files parsed by this batch, in request order."""
+        return tuple(self._file_paths)
+
+    def output_for(self, file_path: str, filters: list[str]) -> list[str]:
+        """
+        Return the Perl output lines for one member file, parsing the batch if needed.
+
+        Members share one variable map template, so the first caller's ``filters``
+        stand for the whole batch.
+
+        Raises:
+            TimeoutError: The batch request timed out.
+            RuntimeError: The batch request failed, or the server reported an error for
+                this file.
+        """
+        with self._lock:
+            if self._outputs is None and self._error is None:
+                try:
+                    outputs = get_worker_pool().parse_files(
+                        self._file_paths,
+                        filters,
+                        timeout=PARSE_TIMEOUT_SECONDS * len(self._file_paths),
+                    )
+                    self._outputs = {output.file_path: output for output in outputs}
+                except Exception as exc:
+                    self._error = exc
+            if self._outputs is None:
+                if isinstance(self._error, TimeoutError):
+                    raise TimeoutError(str(self._error)) from self._error
+                raise RuntimeError(f"Parse batch failed: {self._error}") from self._error
+            # Each member reads its output once; dropping it bounds what the batch retains.
+            output = self._outputs.pop(file_path, None)
+        if output is None:
+            raise RuntimeError(f"File is not part of this parse batch: {file_path}")
+        if output.error is not None:
+            raise RuntimeError(f"Perl parser error: {output.error}")
+        return output.lines
+
+
+def plan_parse_batches(
+    file_paths: Sequence[str],
+    *,
+    batch_size: int = PARSE_BATCH_FILES,
+    parallelism: int | None = None,
+) -> list[Gem5ParseBatch]:
+    """
+    Assign every file a shared batch; the result is aligned with ``file_paths``.
+
+    Files are taken in windows of ``batch_size * parallelism`` and striped across
+    ``parallelism`` batches per window. Work items run in file order, so the first
+    ``parallelism`` items of a window each lead a different batch (keeping every Perl
+    worker busy), and at most one window of parser output waits for its work item.
+
+    Args:
+        file_paths: Files in work-item order.
+        batch_size: Maximum files per batch.
+        parallelism: Batches led concurrently per window; defaults to the Perl pool size.
+    """
+    if batch_size < 1:
+        raise ValueError("Parse batch size must be at least 1.")
+    lanes = parallelism if parallelism is not None else _default_pool_size()
+    if lanes < 1:
+        raise ValueError("Parse batch parallelism must be at least 1.")
+
+    window = batch_size * lanes
+    assigned: list[Gem5ParseBatch] = []
+    for start in range(0, len(file_paths), window):
+        chunk = file_paths[start : start + window]
+        stripes = min(lanes, len(chunk))
+        batches = [Gem5ParseBatch(chunk[lane::stripes]) for lane in range(stripes)]
+        assigned.extend(batches[offset % stripes] for offset in range(len(chunk)))
+    return assigned
+
 
 class Gem5ParseWork(ParseWork):
     """
@@ -41,13 +145,20 @@ class Gem5ParseWork(ParseWork):
     startup overhead (54x speedup). The Perl output format is: Type/VarID::Entry/Value
     """
 
-    def __init__(self, fileToParse: str, varsToParse: VarsDictType) -> None:
+    def __init__(
+        self,
+        fileToParse: str,
+        varsToParse: VarsDictType,
+        batch: Gem5ParseBatch | None = None,
+    ) -> None:
         """
         Initialize the gem5 parse work unit.
 
         Args:
             fileToParse: Absolute path to the gem5 stats.txt file
             varsToParse: Dictionary mapping variable IDs to StatType instances
+            batch: Shared batch containing ``fileToParse``; without one the file is
+                parsed by its own ``PARSE`` request
 
         Raises:
             RuntimeError: If varsToParse is empty
@@ -57,6 +168,7 @@ class Gem5ParseWork(ParseWork):
         self._fileToParse: str = fileToParse
         self._varsToParse: VarsDictType = varsToParse
         self._entryBuffer: EntryBufferType = {}  # Unified buffer for entry-based types
+        self._batch: Gem5ParseBatch | None = batch
         super().__init__()
 
     def __str__(self) -> str:
@@ -136,13 +248,13 @@ class Gem5ParseWork(ParseWork):
     ) -> tuple[str, str] | None:
         """Resolve a concrete scalar alias to its logical vector entry."""
         # [impl->req~ring5.ingestion.configuration-fallbacks~1]
-        target_content = target_var.content
         target_entries = target_var.entries or []
         for logical_id, logical_var in vars_to_parse.items():
             entry = cls._numeric_pattern_id(logical_id, var_id)
-            if entry is None:
+            if entry is None or entry not in target_entries:
                 continue
-            if logical_var.content is target_content and entry in target_entries:
+            # Template aliases share their content; compact row views share the view.
+            if logical_var is target_var or logical_var.content is target_var.content:
                 return logical_id, entry
         return None
 
@@ -172,12 +284,13 @@ class Gem5ParseWork(ParseWork):
         Get the normalized type name from a StatType variable object.
 
         Args:
-            var: StatType instance.
+            var: StatType instance, or a compact row view of one.
 
         Returns:
             Normalized type name (e.g., 'scalar', 'vector', 'distribution')
         """
-        return TypeMapper.normalize_type(type(var).__name__)
+        var_class = type(var)
+        return TypeMapper.normalize_type(getattr(var_class, "_type_name", var_class.__name__))
 
     def _processEntryType(
         self, varType: str, varID: str, varValue: str, varsToParse: VarsDictType
@@ -258,10 +371,24 @@ class Gem5ParseWork(ParseWork):
         Raises:
             RuntimeError: If variable type mismatch or unknown type encountered
         """
-        rawType: str
-        varID: str
-        varValue: str
         rawType, varID, varValue = self._parseLine(line)
+        self._processRecord(rawType, varID, varValue, varsToParse)
+
+    def _processRecord(
+        self, rawType: str, varID: str, varValue: str, varsToParse: VarsDictType
+    ) -> None:
+        """
+        Apply one parsed ``(type, varID, value)`` record to the variables.
+
+        Args:
+            rawType: Type name as reported by the parser backend
+            varID: Variable identifier (may include ::entry_key)
+            varValue: Value as string
+            varsToParse: Dictionary of variables being parsed
+
+        Raises:
+            RuntimeError: If variable type mismatch or unknown type encountered
+        """
         if not rawType:
             return  # Malformed line, skip
         normalizedType: str = TypeMapper.normalize_type(rawType)
@@ -344,49 +471,57 @@ class Gem5ParseWork(ParseWork):
         return varsToParse
 
     # Output processing
-    def _processOutput(self, output: str, varsToParse: VarsDictType) -> VarsDictType:
+    def _processRecords(
+        self, records: Iterable[tuple[str, str, str]], varsToParse: VarsDictType
+    ) -> VarsDictType:
         """
-        Process the complete Perl script output with optimizations.
+        Apply parsed ``(type, varID, value)`` records, then validate the variables.
 
         Args:
-            output: Complete stdout from Perl parser script
+            records: Parsed records in file order
             varsToParse: Dictionary of variables to populate
 
         Returns:
             Dictionary of variables with parsed and validated content
         """
         self._entryBuffer = {}
-
-        # More efficient: splitlines() is faster than split('\n')
-        # Strip whitespace and filter empty lines in one pass
-        lines = [line for line in output.splitlines() if line.strip()]
-
-        for line in lines:
-            self._processLine(line, varsToParse)
+        for rawType, varID, varValue in records:
+            self._processRecord(rawType, varID, varValue, varsToParse)
 
         self._applyBufferedEntries(varsToParse)
         return self._validateVars(varsToParse)
 
-    def _runPerlScript(self) -> str:
+    def _processOutput(self, output: str, varsToParse: VarsDictType) -> VarsDictType:
         """
-        Execute parsing using the worker pool (eliminates subprocess startup overhead).
+        Process the complete Perl script output with optimizations.
+
+        Args:
+            output: Complete stdout from Perl parser script
+            varsToParse: Dictionary of variables to populate
 
         Returns:
-            Complete output from the Perl worker pool
+            Dictionary of variables with parsed and validated content
+        """
+        # More efficient: splitlines() is faster than split('\n')
+        # Strip whitespace and filter empty lines in one pass
+        lines = [line for line in output.splitlines() if line.strip()]
+        return self._processRecords((self._parseLine(line) for line in lines), varsToParse)
+
+    def _statFilters(self) -> list[str]:
+        r"""
+        Return the normalized stat filters to request for this file.
+
+        User-visible names are reduced to a deliberately tiny grammar: literals
+        plus the scanner-generated ``\d+`` placeholder. The parser backends
+        never receive arbitrary regex grouping or quantifiers.
 
         Raises:
-            RuntimeError: If file doesn't exist or worker pool fails
-            TimeoutError: If parsing exceeds timeout
+            RuntimeError: A filter is unsafe, none remain, or there are too many
         """
-        utils.checkFileExistsOrException(self._fileToParse)
-
-        # Convert user-visible names into a deliberately tiny regex grammar:
-        # literals plus the scanner-generated \d+ placeholder. The Perl backend
-        # never receives arbitrary regex grouping or quantifiers.
         request_keys = list(
             dict.fromkeys(self._request_key(var_id) for var_id in self._varsToParse)
         )
-        safe_keys: list[str] = []
+        filters: list[str] = []
         for key in request_keys:
             # Regex-expanded variables also have concrete aliases in the map.
             # Request those anchored literals and omit the broader pattern.
@@ -397,27 +532,46 @@ class Gem5ParseWork(ParseWork):
             ):
                 continue
             try:
-                escaped_key = escape_perl_stat_filter(key)
+                normalized_key = normalize_stat_pattern(key)
             except SafeRegexError as exc:
                 raise RuntimeError(f"Unsafe parser stat filter {key!r}: {exc}") from exc
-            if escaped_key not in safe_keys:
-                safe_keys.append(escaped_key)
+            if normalized_key not in filters:
+                filters.append(normalized_key)
 
-        if not safe_keys:
+        if not filters:
             raise RuntimeError("No variable filters were provided for parsing.")
-        if len(safe_keys) > MAX_PARSE_VARIABLES:
+        if len(filters) > MAX_PARSE_VARIABLES:
             raise RuntimeError(
                 f"Parser request exceeds the {MAX_PARSE_VARIABLES}-variable filter limit."
             )
+        return filters
+
+    def _runPerlScript(self) -> str:
+        """
+        Execute parsing using the worker pool (eliminates subprocess startup overhead).
+
+        Returns:
+            Complete output from the Perl worker pool
+
+        Raises:
+            RuntimeError: If file doesn't exist or worker pool fails
+            TimeoutError: If parsing exceeds timeout
+        """
+        utils.checkFileExistsOrException(self._fileToParse)
+
+        safe_keys = [escape_perl_stat_filter(key) for key in self._statFilters()]
 
         # Use worker pool for parsing (54x faster than subprocess)
         logger.debug(f"Parsing {self._fileToParse} with {len(safe_keys)} variables via worker pool")
 
         try:
-            pool = get_worker_pool()
-            output_lines = pool.parse_file(
-                self._fileToParse, safe_keys, timeout=120.0  # Match previous timeout
-            )
+            if self._batch is not None:
+                output_lines = self._batch.output_for(self._fileToParse, safe_keys)
+            else:
+                pool = get_worker_pool()
+                output_lines = pool.parse_file(
+                    self._fileToParse, safe_keys, timeout=PARSE_TIMEOUT_SECONDS
+                )
 
             # Convert list of lines back to string to match original interface
             return "\n".join(output_lines)
@@ -0,0 +1,203 @@
+"""
+Mmap Parse Work - Worker unit parsing a gem5 stats file without Perl.
+
+The scan itself (``mmap_stats_scanner.scan_stats_file``) runs in a shared
+process pool so the regex work escapes the GIL; the parse-pool thread that
+owns the work item then applies the returned records through the same
+``Gem5ParseWork`` pipeline the Perl backend feeds.
+
+The pool is sized by ``RING5_MMAP_PARSE_WORKERS`` (an integer >= 1) and
+defaults to one process per CPU. Workers use the ``spawn`` start method so no
+parent thread state is inherited.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+import src.core.common.utils as utils
+from src.core.common.security_limits import MAX_PARSE_LINE_COUNT
+from src.parsing.gem5.impl.pool.parse_work import ParsedVarsDict
+from src.parsing.gem5.impl.strategies.file_parser_strategy import INTERNAL_SIM_PATH_KEY
+from src.parsing.gem5.impl.strategies.gem5_parse_work import (
+    PARSE_TIMEOUT_SECONDS,
+    Gem5ParseWork,
+    VarsDictType,
+)
+from src.parsing.gem5.impl.strategies.mmap_stats_scanner import StatRecord, scan_stats_file
+
+logger = logging.getLogger(__name__)
+
+
+def _configured_workers() -> int:
+    """Resolve the scan process count from ``RING5_MMAP_PARSE_WORKERS``."""
+    value = os.environ.get("RING5_MMAP_PARSE_WORKERS")
+    if value is not None:
+        try:
+            workers = int(value)
+            if workers >= 1:
+                return workers
+        except ValueError:
+            pass
+        logger.warning("Ignoring invalid RING5_MMAP_PARSE_WORKERS=%r", value)
+    return os.cpu_count() or 1
+
+
+class MmapScanPool:
+    """A pool of worker processes running ``scan_stats_file``."""
+
+    def __init__(self, workers: int) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        with self._executor_lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def scan(self, file_path: str, filters: Sequence[str], timeout: float) -> list[StatRecord]:
+        """Scan one file in a worker process, blocking until its records are ready.
+
+        A crashed worker breaks the whole executor; the broken pool is
+        discarded so the next scan starts a fresh one, and the file is
+        retried once on it.
+
+        Raises:
+            TimeoutError: The scan did not finish within *timeout* seconds.
+            RuntimeError: The scanner rejected the file.
+        """
+        executor = self._get_executor()
+        try:
+            return self._await(executor, file_path, filters, timeout)
+        except BrokenProcessPool:
+            self._discard_executor(executor)
+            logger.warning("Mmap scan worker died; restarting the pool")
+        return self._await(self._get_executor(), file_path, filters, timeout)
+
+    @staticmethod
+    def _await(
+        executor: ProcessPoolExecutor, file_path: str, filters: Sequence[str], timeout: float
+    ) -> list[StatRecord]:
+        future = executor.submit(
+            scan_stats_file, file_path, list(filters), max_lines=MAX_PARSE_LINE_COUNT
+        )
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError as exc:
+            future.cancel()
+            raise TimeoutError(f"Scan timed out after {timeout:.0f}s: {file_path}") from exc
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_pool_instance: MmapScanPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_mmap_scan_pool() -> MmapScanPool:
+    """Return the process-wide scan pool, starting it on first use."""
+    global _pool_instance
+
+    with _pool_lock:
+        if _pool_instance is None:
+            _pool_instance = MmapScanPool(_configured_workers())
+            atexit.register(shutdown_mmap_scan_pool)
+        return _pool_instance
+
+
+def shutdown_mmap_scan_pool() -> None:
+    """Stop the process-wide scan pool, if one is running."""
+    global _pool_instance
+
+    with _pool_lock:
+        if _pool_instance is not None:
+            _pool_instance.shutdown()
+            _pool_instance = None
+
+
+class MmapParseWork(Gem5ParseWork):
+    """
+    Worker for parsing a single gem5 stats file with the pure-Python scanner.
+
+    Requests the same filters as the Perl backend and applies the scanner's
+    records through the inherited type handling, so both backends produce
+    identical variables for identical input.
+    """
+
+    def __init__(self, fileToParse: str, varsToParse: VarsDictType) -> None:
+        """
+        Initialize the mmap parse work unit.
+
+        Args:
+            fileToParse: Absolute path to the gem5 stats.txt file
+            varsToParse: Dictionary mapping variable IDs to StatType instances
+
+        Raises:
+            RuntimeError: If varsToParse is empty
+        """
+        super().__init__(fileToParse, varsToParse)
+
+    def __str__(self) -> str:
+        return f"MmapParseWork({self._fileToParse})"
+
+    def _scanRecords(self) -> list[StatRecord]:
+        """
+        Scan the stats file in the process pool.
+
+        Raises:
+            RuntimeError: If the file doesn't exist, times out, or fails to parse
+        """
+        utils.checkFileExistsOrException(self._fileToParse)
+        filters = self._statFilters()
+        logger.debug("Parsing %s with %d variables via mmap scan", self._fileToParse, len(filters))
+        try:
+            return get_mmap_scan_pool().scan(
+                self._fileToParse, filters, timeout=PARSE_TIMEOUT_SECONDS
+            )
+        except TimeoutError as e:
+            logger.error("Mmap scan timeout: %s", self._fileToParse)
+            raise RuntimeError(f"Parser timeout: {self._fileToParse}") from e
+        except Exception as e:
+            logger.error("Mmap scan error: %s", e)
+            raise RuntimeError(f"Mmap parse failed: {self._fileToParse}: {e}") from e
+
+    def __call__(self) -> ParsedVarsDict:
+        """
+        Execute the parse work and return populated variables.
+
+        Returns:
+            Dictionary mapping variable IDs to their populated StatType instances
+
+        Raises:
+            RuntimeError: If parsing fails or type mismatches occur
+        """
+        records = self._scanRecords()
+        result: ParsedVarsDict = dict(self._processRecords(records, self._varsToParse))
+        result[INTERNAL_SIM_PATH_KEY] = self._fileToParse
+        return result
@@ -0,0 +1,307 @@
+"""
+Memory-mapped gem5 stats scanner - a pure-Python twin of ``fileParserServer.pl``.
+
+``scan_stats_file`` maps one ``stats.txt`` read-only and yields the same
+``(type, varID, value)`` records the Perl server prints as
+``type/varID/value`` lines, so ``Gem5ParseWork`` can apply either without
+re-splitting text. The line grammar is a byte-level transcription of
+``TypesFormatRegex.pm`` and ``Scanning/RegexUtils.pm``, including its quirks
+(name extraction from the comment-stripped line, the summary-before-vector
+entry rule and one-line histograms); the Perl backend stays the reference
+and ``tests/unit/test_mmap_stats_scanner.py`` holds the two to parity.
+
+This module deliberately imports only the standard library: it is what the
+scan processes import.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import mmap
+import os
+import re
+from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+# (type, varID, value) as the Perl server would print it.
+StatRecord = tuple[str, str, str]
+
+# ---------- Grammar (mirrors Scanning/RegexUtils.pm and Scanning/Type/*.pm) ----------
+
+_FLOAT = rb"-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+_VAR_NAME = rb"[\d\.\w\_]+"
+_CONF_VALUE = rb"[\d\.\w\-\/\(\)\,]+"
+_SCALAR_VALUE = rb"(?:-?\d+|" + _FLOAT + rb")"
+_COMMENT = rb"\s*(?:#.*|\(Unspecified\)\s*)?$"
+_COMPLEX_VALUE = rb"-?\d+\s+" + _FLOAT + rb"%\s+" + _FLOAT + rb"%"
+_SUMMARIES_ENTRY = rb"::(?:samples|mean|gmean|stdev|total)"
+_HISTOGRAM_RANGE = rb"::\d+-\d+"
+_DIST_ENTRY = rb"(?:::-?\d+|::overflows|::underflows)"
+_VECTOR_ENTRY = rb"::[\w\.]+"
+
+# Checked in the Perl server's order; the first match decides the type.
+_LINE_TYPES: tuple[tuple[str, re.Pattern[bytes]], ...] = (
+    ("scalar", re.compile(rb"^" + _VAR_NAME + rb"\s+" + _SCALAR_VALUE + _COMMENT + rb"$")),
+    (
+        "vector",
+        re.compile(
+            rb"^" + _VAR_NAME + _VECTOR_ENTRY
+            + rb"\s+(?:" + _COMPLEX_VALUE + rb"|" + _SCALAR_VALUE + rb")" + _COMMENT + rb"$"
+        ),
+    ),
+    (
+        "histogram",
+        re.compile(
+            rb"^" + _VAR_NAME + _HISTOGRAM_RANGE + rb"\s+" + _COMPLEX_VALUE + _COMMENT + rb"$"
+        ),
+    ),
+    (
+        "distribution",
+        re.compile(rb"^" + _VAR_NAME + _DIST_ENTRY + rb"\s+" + _COMPLEX_VALUE + _COMMENT + rb"$"),
+    ),
+    (
+        "summary",
+        re.compile(
+            rb"^" + _VAR_NAME + _SUMMARIES_ENTRY + rb"\s+" + _SCALAR_VALUE + _COMMENT + rb"$"
+        ),
+    ),
+    ("configuration", re.compile(rb"^" + _VAR_NAME + rb"=" + _CONF_VALUE + rb"$")),
+)
+
+_HISTOGRAM_RANGE_SEARCH = re.compile(_HISTOGRAM_RANGE)
+_DIST_ENTRY_SEARCH = re.compile(_DIST_ENTRY)
+_VECTOR_ENTRY_SEARCH = re.compile(_VECTOR_ENTRY)
+_SUMMARIES_ENTRY_SEARCH = re.compile(_SUMMARIES_ENTRY)
+
+_ONELINE_METADATA = re.compile(
+    rb"^(" + _VAR_NAME + rb")::(bucket_size|max_bucket)\s+(-?\d+)" + _COMMENT + rb"$"
+)
+_ONELINE_ROW = re.compile(rb"^(" + _VAR_NAME + rb")\s+\|(.*)$")
+_ONELINE_SPLIT = re.compile(rb"\s*\|\s*")
+_ONELINE_BUCKET = re.compile(rb"^\s*(-?\d+)\s+" + _FLOAT + rb"%\s+" + _FLOAT + rb"%\s*$")
+
+_UNSPECIFIED_SUFFIX = re.compile(rb"\(Unspecified\)\s*$")
+_WHITESPACE = re.compile(rb"\s+")
+# Leading bytes a filter can match: the Perl filter must be followed by "::", space or "=".
+_HEAD = re.compile(rb"[^\s:=]*")
+_DIGITS = re.compile(rb"[0-9]+")
+_PLACEHOLDER = r"\d+"
+# Distinct stat names whose filter verdict an index remembers.
+MAX_MEMOIZED_NAMES = 1 << 18
+
+
+class StatFilterIndex:
+    r"""
+    Precompiled, byte-level lookup of the requested stat names.
+
+    Filters are normalized stat patterns (literals plus ``\d+`` placeholders,
+    see ``normalize_stat_pattern``). Instead of one alternation tried against
+    every line, literal names sit in a set and placeholder patterns are
+    bucketed by their *shape* (every digit run collapsed to ``#``), so a name
+    costs one dict lookup plus, at most, one regex shared by the patterns of
+    its shape. Verdicts are memoized per name, which makes every later file of
+    a sweep a pure dict lookup. Patterns containing ``:`` cannot be keyed by
+    the leading name and are tried directly, as the Perl filter would.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._literals: set[bytes] = set()
+        shapes: dict[bytes, list[bytes]] = {}
+        prefixed: list[bytes] = []
+        for pattern in patterns:
+            if not pattern:
+                raise ValueError("Stat filters must not be empty.")
+            segments = [segment.encode("ascii") for segment in pattern.split(_PLACEHOLDER)]
+            body = rb"[0-9]+".join(re.escape(segment) for segment in segments)
+            if b":" in body:
+                prefixed.append(body)
+            elif len(segments) == 1:
+                self._literals.add(segments[0])
+            else:
+                shape = _DIGITS.sub(b"#", b"#".join(segments))
+                shapes.setdefault(re.sub(rb"#+", b"#", shape), []).append(body)
+        self._shapes = {shape: _alternation(bodies) for shape, bodies in shapes.items()}
+        self._prefix = _alternation(prefixed, rb"(?=::|\s|=)") if prefixed else None
+        self._whole = _alternation(prefixed) if prefixed else None
+        self._verdicts: dict[bytes, bool] = {}
+
+    def admits(self, line: bytes) -> bool:
+        """Return whether a raw stats line starts with a requested stat name."""
+        end = _HEAD.match(line).end()  # type: ignore[union-attr]
+        follower = line[end : end + 2]
+        if end and follower and (follower[:1] != b":" or follower == b"::"):
+            if self.names(line[:end]):
+                return True
+        return self._prefix is not None and self._prefix.match(line) is not None
+
+    def names(self, candidate: bytes) -> bool:
+        """Return whether *candidate* is exactly one of the requested stat names."""
+        verdict = self._verdicts.get(candidate)
+        if verdict is None:
+            verdict = self._lookup(candidate)
+            if len(self._verdicts) >= MAX_MEMOIZED_NAMES:
+                self._verdicts.clear()
+            self._verdicts[candidate] = verdict
+        return verdict
+
+    def _lookup(self, candidate: bytes) -> bool:
+        if candidate in self._literals:
+            return True
+        if self._shapes:
+            shaped = self._shapes.get(_DIGITS.sub(b"#", candidate))
+            if shaped is not None and shaped.fullmatch(candidate):
+                return True
+        return self._whole is not None and self._whole.fullmatch(candidate) is not None
+
+
+def _alternation(bodies: list[bytes], suffix: bytes = b"") -> re.Pattern[bytes]:
+    return re.compile(rb"(?:" + b"|".join(bodies) + rb")" + suffix)
+
+
+@functools.lru_cache(maxsize=8)
+def _filter_index(patterns: tuple[str, ...]) -> StatFilterIndex:
+    """Return the index for a filter set, reused by every file parsed with it."""
+    return StatFilterIndex(patterns)
+
+
+def _remove_comment(line: bytes) -> bytes:
+    """Drop the ``#`` comment, a trailing ``(Unspecified)`` and trailing whitespace."""
+    comment = line.find(b"#")
+    if comment != -1:
+        line = line[:comment]
+    return _UNSPECIFIED_SUFFIX.sub(b"", line, count=1).rstrip()
+
+
+def _entry_name(clean: bytes) -> bytes:
+    """Return the ``::entry`` suffix the Perl formatter reports, or nothing."""
+    for pattern in (_HISTOGRAM_RANGE_SEARCH, _DIST_ENTRY_SEARCH):
+        match = pattern.search(clean)
+        if match:
+            return match.group()
+    vector = _VECTOR_ENTRY_SEARCH.search(clean)
+    summary = _SUMMARIES_ENTRY_SEARCH.search(clean)
+    if vector and not summary:
+        return vector.group()
+    return summary.group() if summary else b""
+
+
+def _format(line_type: str, clean: bytes, index: StatFilterIndex) -> StatRecord:
+    """Build the record ``formatLine`` would print for a classified line."""
+    separator = clean.find(b"::")
+    if separator == -1:
+        separator = clean.find(b" ")
+    if separator == -1:
+        separator = clean.find(b"=")
+    name_part = clean if separator == -1 else clean[:separator]
+    name = name_part if index.names(name_part) else b""
+
+    if b"=" in clean:
+        value = clean.split(b"=", 1)[1]
+    else:
+        fields = _WHITESPACE.split(clean, 2)
+        value = fields[1] if len(fields) > 1 else b""
+    return (
+        line_type,
+        (name + _entry_name(clean)).decode("utf-8", "replace"),
+        value.decode("utf-8", "replace"),
+    )
+
+
+def _oneline_histogram(
+    name: bytes, payload: bytes, metadata: dict[bytes, int]
+) -> list[StatRecord]:
+    """Expand a gem5 ``oneline`` histogram row into per-bucket records."""
+    label = name.decode("utf-8", "replace")
+    if b"bucket_size" not in metadata or b"max_bucket" not in metadata:
+        raise RuntimeError(f"Incomplete one-line histogram metadata for {label}")
+    bucket_size = metadata[b"bucket_size"]
+    max_bucket = metadata[b"max_bucket"]
+    if bucket_size <= 0 or max_bucket < 0:
+        raise RuntimeError(f"Invalid one-line histogram metadata for {label}")
+
+    groups = _ONELINE_SPLIT.split(payload)
+    while groups and not groups[-1]:
+        groups.pop()  # Perl's split drops trailing empty fields
+    values: list[str] = []
+    for group in groups:
+        match = _ONELINE_BUCKET.match(group)
+        if match is None:
+            raise RuntimeError(
+                f"Malformed one-line histogram bucket for {label}: "
+                f"{group.decode('utf-8', 'replace')}"
+            )
+        values.append(match.group(1).decode("ascii"))
+
+    expected = max_bucket // bucket_size + 1
+    if len(values) != expected:
+        raise RuntimeError(
+            f"One-line histogram bucket count mismatch for {label}: expected {expected}, "
+            f"found {len(values)}"
+        )
+    records: list[StatRecord] = []
+    for position, value in enumerate(values):
+        start = position * bucket_size
+        end = min(start + bucket_size - 1, max_bucket)
+        records.append(("histogram", f"{label}::{start}-{end}", value))
+    return records
+
+
+def scan_stats_file(path: str, patterns: Iterable[str], *, max_lines: int) -> list[StatRecord]:
+    r"""
+    Return the parse records of one gem5 stats file.
+
+    Args:
+        path: The ``stats.txt`` to read.
+        patterns: Normalized stat filters (literals and ``\d+`` placeholders).
+        max_lines: Line budget; mirrors the Perl server's ``RING5_MAX_PARSE_LINES``.
+
+    Returns:
+        ``(type, varID, value)`` records in file order, identical to the Perl
+        server's ``type/varID/value`` output lines.
+
+    Raises:
+        RuntimeError: The line budget is exceeded or a one-line histogram is
+            malformed (the cases in which the Perl server fails the file).
+    """
+    # [impl->req~ring5.ingestion.gem5-backend~1]
+    index = _filter_index(tuple(patterns))
+    records: list[StatRecord] = []
+    histograms: dict[bytes, dict[bytes, int]] = {}
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return records  # an empty file cannot be mapped
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            for count, raw in enumerate(iter(view.readline, b""), start=1):
+                if count > max_lines:
+                    raise RuntimeError(f"Parser line limit exceeded ({max_lines} lines): {path}")
+                line = raw[:-1] if raw.endswith(b"\n") else raw
+                if not index.admits(line):
+                    continue
+
+                metadata = _ONELINE_METADATA.match(line)
+                if metadata:
+                    histograms.setdefault(metadata.group(1), {})[metadata.group(2)] = int(
+                        metadata.group(3)
+                    )
+                    continue
+                clean = _remove_comment(line)
+                row = _ONELINE_ROW.match(clean)
+                if row and row.group(1) in histograms:
+                    records.extend(
+                        _oneline_histogram(row.group(1), row.group(2), histograms[row.group(1)])
+                    )
+                    continue
+
+                for line_type, pattern in _LINE_TYPES:
+                    if pattern.match(line):
+                        records.append(_format(line_type, clean, index))
+                        break
+                else:
+                    logger.warning(
+                        "PARSER: unclassifiable line matched filter in %s: %s",
+                        path,
+                        line[:200].decode("utf-8", "replace"),
+                    )
+    return records
@@ -1,17 +1,24 @@
 """
-Perl Worker Pool - Connection pooling for Perl parser processes.
+Perl Worker Pool - Connection pooling for Perl parser and scanner processes.
 
 Maintains a pool of persistent Perl processes to eliminate startup overhead.
+The parse pool runs ``fileParserServer.pl`` (PARSE verb, or FILTERS once per filter set
+followed by framed PARSE_BATCH requests); the scanner pool runs ``statsScannerServer.pl``
+(SCAN verb) over the same line protocol.
 Features:
 - Automatic worker health monitoring and restart
 - Comprehensive error handling and logging
 - Worker crash recovery
 - Request timeout handling
 - Statistics and monitoring
+- Optional adaptive sizing driven by queue depth, CPU count and an RSS budget
 """
 
 import atexit
+from collections import deque
+from collections.abc import Callable, Sequence
 from contextlib import suppress
+import hashlib
 import logging
 import os
 import queue
@@ -19,26 +26,123 @@ import shutil
 import subprocess
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
-from src.core.common.security_limits import MAX_PARSE_LINE_COUNT
+from src.core.common.security_limits import MAX_PARSE_LINE_COUNT, MAX_SCAN_LINE_COUNT
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_PERL_WORKERS = 2
+# ``RING5_PERL_POOL_SIZE`` value selecting an adaptive pool
+AUTO_POOL_SIZE = "auto"
+# Adaptive pools keep total worker RSS under this budget unless RING5_PERL_POOL_RSS_MB is set
+DEFAULT_PERL_POOL_RSS_MB = 1024
+# Assumed RSS of a worker whose memory cannot be measured (no /proc)
+ESTIMATED_WORKER_RSS_BYTES = 64 * 1024 * 1024
+# Resize events kept for get_stats()
+MAX_RESIZE_HISTORY = 32
+PARSER_SERVER_SCRIPT = "fileParserServer.pl"
+SCANNER_SERVER_SCRIPT = "statsScannerServer.pl"
+# Named filter sets each parser process keeps compiled; the server evicts the oldest
+# beyond this bound and PerlWorker mirrors that eviction.
+MAX_FILTER_SETS = 8
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class AdaptivePoolPolicy:
+    """Bounds within which an adaptive ``PerlWorkerPool`` grows and shrinks.
+
+    The pool adds a worker when a request finds none idle, up to ``max_workers`` and
+    while the measured RSS of all workers stays within ``rss_budget_bytes``. The health
+    monitor retires idle workers down to ``min_workers`` after ``idle_seconds``, or
+    sooner while the pool is over its RSS budget.
+    """
+
+    min_workers: int = 1
+    max_workers: int = DEFAULT_PERL_WORKERS
+    rss_budget_bytes: int = DEFAULT_PERL_POOL_RSS_MB * 1024 * 1024
+    idle_seconds: float = 60.0
+
+    def __post_init__(self) -> None:
+        if self.min_workers < 1:
+            raise ValueError("Adaptive pool min_workers must be at least 1.")
+        if self.max_workers < self.min_workers:
+            raise ValueError("Adaptive pool max_workers must be at least min_workers.")
+        if self.rss_budget_bytes < 1:
+            raise ValueError("Adaptive pool rss_budget_bytes must be positive.")
+        if self.idle_seconds < 0:
+            raise ValueError("Adaptive pool idle_seconds must not be negative.")
+
+    @classmethod
+    def from_environment(cls) -> "AdaptivePoolPolicy":
+        """Size the pool for this host: up to one worker per CPU within the RSS budget.
+
+        ``RING5_PERL_POOL_RSS_MB`` (an integer >= 1) overrides the default budget.
+        """
+        max_workers = os.cpu_count() or DEFAULT_PERL_WORKERS
+        budget_mb = DEFAULT_PERL_POOL_RSS_MB
+        override = os.environ.get("RING5_PERL_POOL_RSS_MB")
+        if override is not None:
+            try:
+                budget_mb = int(override)
+            except ValueError:
+                logger.warning("Ignoring non-integer RING5_PERL_POOL_RSS_MB=%r", override)
+            else:
+                if budget_mb < 1:
+                    logger.warning("Ignoring non-positive RING5_PERL_POOL_RSS_MB=%r", override)
+                    budget_mb = DEFAULT_PERL_POOL_RSS_MB
+        return cls(
+            min_workers=min(DEFAULT_PERL_WORKERS, max_workers),
+            max_workers=max_workers,
+            rss_budget_bytes=budget_mb * 1024 * 1024,
+        )
+
+
+@dataclass(frozen=True)
+class PoolResize:
+    """One change in the size of an adaptive pool."""
+
+    timestamp: float
+    old_size: int
+    new_size: int
+    reason: str
+
+
+def _adaptive_policy_from_environment() -> AdaptivePoolPolicy | None:
+    """Return the host policy when ``RING5_PERL_POOL_SIZE=auto``, else None."""
+    override = os.environ.get("RING5_PERL_POOL_SIZE")
+    if override is None or override.strip().lower() != AUTO_POOL_SIZE:
+        return None
+    return AdaptivePoolPolicy.from_environment()
+
+
+def _process_rss_bytes(pid: int) -> int | None:
+    """Resident set size of ``pid`` from ``/proc``, or None where unavailable."""
+    try:
+        with open(f"/proc/{pid}/statm", encoding="ascii") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
 
 
 def _default_pool_size() -> int:
     """Resolve the number of persistent Perl workers.
 
     Defaults to two persistent processes to bound memory on developer machines.
-    Override with ``RING5_PERL_POOL_SIZE`` (an integer >= 1).
+    Override with ``RING5_PERL_POOL_SIZE`` (an integer >= 1). ``auto`` selects an
+    adaptive pool; this then returns its upper bound.
     """
     override = os.environ.get("RING5_PERL_POOL_SIZE")
     if override is None:
         return DEFAULT_PERL_WORKERS
+    policy = _adaptive_policy_from_environment()
+    if policy is not None:
+        return policy.max_workers
 
     try:
         size = int(override)
@@ -52,6 +156,21 @@ def _default_pool_size() -> int:
     return size
 
 
+def filter_set_name(variables: Sequence[str]) -> str:
+    """Return the protocol name of a filter set, derived from its exact filter list."""
+    digest = hashlib.sha256("\n".join(variables).encode("utf-8")).hexdigest()
+    return f"fs-{digest[:24]}"
+
+
+@dataclass
+class FileParseOutput:
+    """Framed output of one file within a ``PARSE_BATCH`` response."""
+
+    file_path: str
+    lines: list[str] = field(default_factory=list)
+    error: str | None = None
+
+
 @dataclass
 class WorkerStats:
     """Statistics for a worker process."""
@@ -96,6 +215,8 @@ class PerlWorker:
         self._line_queue: queue.Queue[str | None] | None = None
         self._reader_thread: threading.Thread | None = None
         self._stderr_thread: threading.Thread | None = None
+        # Filter sets registered with the current process generation, oldest first.
+        self._filter_sets: dict[str, None] = {}
 
         # Start the worker
         self._start_worker()
@@ -122,7 +243,12 @@ class PerlWorker:
                     stderr=subprocess.PIPE,
                     text=True,
                     bufsize=1,  # line-buffered: correct for a text line protocol
-                    env={**os.environ, "RING5_MAX_PARSE_LINES": str(MAX_PARSE_LINE_COUNT)},
+                    env={
+                        **os.environ,
+                        "RING5_MAX_PARSE_LINES": str(MAX_PARSE_LINE_COUNT),
+                        "RING5_MAX_SCAN_LINES": str(MAX_SCAN_LINE_COUNT),
+                        "RING5_MAX_FILTER_SETS": str(MAX_FILTER_SETS),
+                    },
                 )
 
                 # Bind the reader to this process before publishing the generation.
@@ -134,6 +260,7 @@ class PerlWorker:
                 # Publish this generation.
                 self.process = process
                 self._line_queue = line_queue
+                self._filter_sets = {}
 
                 # Allow slow process startup on constrained hosts.
                 timeout = 30.0
@@ -267,17 +394,137 @@ class PerlWorker:
         if any("||" in field or "\n" in field or "\r" in field for field in protocol_fields):
             raise ValueError("Perl worker request contains a reserved protocol delimiter.")
 
+        # Build command with || separator to allow spaces in paths
+        args = [file_path] + variables
+        command = "PARSE " + "||".join(args) + "\n"
+        logger.debug(f"[Worker-{self.worker_id}] Parsing file: {file_path}")
+        return self._run_request(command, "END_PARSE", timeout)
+
+    def parse_batch(
+        self, file_paths: Sequence[str], variables: list[str], timeout: float = 120.0
+    ) -> tuple[list[FileParseOutput], bool]:
+        """
+        Parse several files with one request using this worker.
+
+        The filters are registered once per worker process as a named set (``FILTERS``),
+        so each ``PARSE_BATCH`` request names only the set and the files. A file the
+        server cannot read or parse comes back with ``error`` set; it does not fail the
+        other files of the batch.
+
+        Args:
+            file_paths: Paths to stats files
+            variables: List of variable patterns to extract
+            timeout: Maximum seconds for registration and parsing together
+
+        Returns:
+            Tuple of (one output per file in ``file_paths`` order, success)
+        """
+        protocol_fields = [*file_paths, *variables]
+        if any("||" in field or "\n" in field or "\r" in field for field in protocol_fields):
+            raise ValueError("Perl worker request contains a reserved protocol delimiter.")
+        if not file_paths:
+            return [], True
+
+        set_name = filter_set_name(variables)
+        start_time = time.time()
+        if set_name not in self._filter_sets:
+            command = "FILTERS " + "||".join([set_name, *variables]) + "\n"
+            _, registered = self._run_request(command, "END_FILTERS", timeout)
+            if not registered:
+                return [], False
+            self._filter_sets[set_name] = None
+            while len(self._filter_sets) > MAX_FILTER_SETS:
+                del self._filter_sets[next(iter(self._filter_sets))]
+
+        remaining = max(1.0, timeout - (time.time() - start_time))
+        command = "PARSE_BATCH " + "||".join([set_name, *file_paths]) + "\n"
+        logger.debug(f"[Worker-{self.worker_id}] Parsing batch of {len(file_paths)} files")
+        output_lines, success = self._run_request(command, "END_PARSE_BATCH", remaining)
+        if not success:
+            return [], False
+
+        outputs = self._split_batch_output(file_paths, output_lines)
+        if outputs is None:
+            logger.error(f"[Worker-{self.worker_id}] Malformed PARSE_BATCH response framing")
+            self.errors_encountered += 1
+            return [], False
+        for output in outputs:
+            if output.error is not None:
+                logger.error(f"[Worker-{self.worker_id}] Perl error: {output.error}")
+                self.errors_encountered += 1
+        return outputs, True
+
+    @staticmethod
+    def _split_batch_output(
+        file_paths: Sequence[str], output_lines: list[str]
+    ) -> list[FileParseOutput] | None:
+        """Split a ``PARSE_BATCH`` response into per-file frames, or None if malformed."""
+        outputs: list[FileParseOutput] = []
+        current: FileParseOutput | None = None
+        for line in output_lines:
+            if current is None:
+                if len(outputs) >= len(file_paths) or line != f"FILE {len(outputs)}":
+                    return None
+                current = FileParseOutput(file_paths[len(outputs)])
+            elif line == "END_FILE":
+                outputs.append(current)
+                current = None
+            elif line.startswith("FILE_ERROR "):
+                current.error = line[len("FILE_ERROR ") :]
+            else:
+                current.lines.append(line)
+        if current is not None or len(outputs) != len(file_paths):
+            return None
+        return outputs
+
+    def scan_file(
+        self, file_path: str, config_vars: list[str], timeout: float = 15.0
+    ) -> tuple[list[str], bool]:
+        """
+        Scan a file for its variable schema using this worker.
+
+        Only meaningful for workers running ``statsScannerServer.pl``.
+
+        Args:
+            file_path: Path to stats file
+            config_vars: Variable names to report as configuration values
+            timeout: Maximum seconds to wait for scanning
+
+        Returns:
+            Tuple of (JSON output lines, success)
+        """
+        reserved = ("||", "\n", "\r")
+        if any(token in file_path for token in reserved) or any(
+            token in name for name in config_vars for token in (*reserved, ",")
+        ):
+            raise ValueError("Perl worker request contains a reserved protocol delimiter.")
+
+        command = "SCAN " + file_path
+        if config_vars:
+            command += "||" + ",".join(config_vars)
+        logger.debug(f"[Worker-{self.worker_id}] Scanning file: {file_path}")
+        return self._run_request(command + "\n", "END_SCAN", timeout)
+
+    def _run_request(self, command: str, end_marker: str, timeout: float) -> tuple[list[str], bool]:
+        """
+        Send one protocol command and collect its output up to ``end_marker``.
+
+        Args:
+            command: Newline-terminated protocol command
+            end_marker: Line that terminates this command's output
+            timeout: Maximum seconds to wait for the whole response
+
+        Returns:
+            Tuple of (output_lines, success)
+
+        Raises:
+            RuntimeError: If worker is not healthy
+        """
         with self._lock:
             if not self.is_healthy:
                 raise RuntimeError(f"Worker-{self.worker_id} is not healthy")
 
             try:
-                logger.debug(f"[Worker-{self.worker_id}] Parsing file: {file_path}")
-
-                # Build command with || separator to allow spaces in paths
-                args = [file_path] + variables
-                command = "PARSE " + "||".join(args) + "\n"
-
                 # Send command
                 if not self.process or not self.process.stdin:
                     raise RuntimeError("Worker stdin not available")
@@ -285,7 +532,7 @@ class PerlWorker:
                 self.process.stdin.write(command)
                 self.process.stdin.flush()
 
-                # Read output lines until END_PARSE marker
+                # Read output lines until the end marker
                 output_lines = []
                 protocol_error: str | None = None
                 start_time = time.time()
@@ -296,17 +543,17 @@ class PerlWorker:
                         logger.error(f"[Worker-{self.worker_id}] TIMEOUT after {timeout}s")
                         self.errors_encountered += 1
                         self.is_healthy = False
-                        raise TimeoutError(f"Parse timeout after {timeout}s")
+                        raise TimeoutError(f"Request timeout after {timeout}s")
 
                     line = self._read_line_with_timeout(timeout=min(30.0, timeout - elapsed))
 
-                    if line == "END_PARSE":
+                    if line == end_marker:
                         break
                     elif line.startswith("ERROR"):
                         logger.error(f"[Worker-{self.worker_id}] Perl error: {line}")
                         self.errors_encountered += 1
                         protocol_error = line
-                        # Continue reading to END_PARSE
+                        # Continue reading to the end marker
                     elif line == "RESTART_NEEDED":
                         logger.warning(f"[Worker-{self.worker_id}] Worker needs restart")
                         self.is_healthy = False
@@ -319,7 +566,7 @@ class PerlWorker:
 
                 if protocol_error is not None:
                     logger.error(
-                        "[Worker-%s] Parse request failed: %s",
+                        "[Worker-%s] Request failed: %s",
                         self.worker_id,
                         protocol_error,
                     )
@@ -333,7 +580,7 @@ class PerlWorker:
                 return output_lines, True
 
             except Exception as e:
-                logger.error(f"[Worker-{self.worker_id}] Parse failed: {e}", exc_info=True)
+                logger.error(f"[Worker-{self.worker_id}] Request failed: {e}", exc_info=True)
                 self.errors_encountered += 1
                 self.is_healthy = False
                 return [], False
@@ -458,20 +705,47 @@ class PerlWorkerPool:
 
     # [impl->req~ring5.ingestion.persistent-workers~1]
 
-    def __init__(self, pool_size: int | None = None):
+    def __init__(
+        self,
+        pool_size: int | None = None,
+        script_name: str = PARSER_SERVER_SCRIPT,
+        *,
+        adaptive: AdaptivePoolPolicy | None = None,
+    ):
         """Initialize the persistent worker pool.
 
         Args:
             pool_size: Number of worker processes to maintain. When ``None``,
-                defaults to two (see ``_default_pool_size``).
+                defaults to two (see ``_default_pool_size``), or to an adaptive
+                pool when ``RING5_PERL_POOL_SIZE=auto``.
+            script_name: Perl server script under ``gem5/perl/`` that every
+                worker runs (the parser server by default).
+            adaptive: Resize between these bounds instead of keeping a fixed
+                size; the pool starts at ``adaptive.min_workers``.
+
+        Raises:
+            ValueError: Both ``pool_size`` and ``adaptive`` were given.
         """
-        self.pool_size = pool_size if pool_size is not None else _default_pool_size()
+        if pool_size is not None and adaptive is not None:
+            raise ValueError("Pass either pool_size or adaptive, not both.")
+        if pool_size is None and adaptive is None:
+            adaptive = _adaptive_policy_from_environment()
+        self.adaptive = adaptive
+        if adaptive is not None:
+            self.pool_size = adaptive.min_workers
+        else:
+            self.pool_size = pool_size if pool_size is not None else _default_pool_size()
         self.workers: list[PerlWorker] = []
         self.worker_queue: queue.Queue[PerlWorker] = queue.Queue()
         self._lock = threading.Lock()
         self._shutdown_event = threading.Event()
         self._health_check_interval = 30.0  # seconds
         self._health_monitor_thread: threading.Thread | None = None
+        self._next_worker_id = 0
+        # Serializes adaptive grow/shrink decisions; never held while self._lock is held.
+        self._resize_lock = threading.Lock()
+        self._waiting_requests = 0
+        self._resizes: deque[PoolResize] = deque(maxlen=MAX_RESIZE_HISTORY)
 
         # Locate Perl executable (full path for security)
         perl_exe_path = shutil.which("perl")
@@ -480,8 +754,8 @@ class PerlWorkerPool:
             raise RuntimeError("Perl executable not found in PATH")
         self.perl_exe: str = perl_exe_path
 
-        # Locate Perl server script (in src/parsing/perl/)
-        self.script_path = str(Path(__file__).parent.parent.parent / "perl" / "fileParserServer.pl")
+        # Locate Perl server script (in src/parsing/gem5/perl/)
+        self.script_path = str(Path(__file__).parent.parent.parent / "perl" / script_name)
 
         if not Path(self.script_path).exists():
             logger.error(f"Perl server script not found: {self.script_path}")
@@ -495,7 +769,9 @@ class PerlWorkerPool:
         """Initialize worker processes."""
         logger.info(f"Initializing {self.pool_size} Perl workers...")
 
-        for i in range(self.pool_size):
+        for _ in range(self.pool_size):
+            i = self._next_worker_id
+            self._next_worker_id += 1
             try:
                 worker = PerlWorker(
                     worker_id=i, script_path=self.script_path, perl_exe=self.perl_exe
@@ -523,6 +799,7 @@ class PerlWorkerPool:
                 # Interruptible sleep: returns immediately when event is set
                 self._shutdown_event.wait(timeout=self._health_check_interval)
                 if not self._shutdown_event.is_set():
+                    self._shrink_idle_workers()
                     self._check_worker_health()
 
         self._health_monitor_thread = threading.Thread(target=monitor, daemon=True)
@@ -561,6 +838,122 @@ class PerlWorkerPool:
                     else:
                         logger.error(f"Worker-{worker.worker_id} restart failed!")
 
+    def _pool_rss_bytes(self) -> int:
+        """Total resident memory of the live workers (estimated where unmeasurable)."""
+        with self._lock:
+            pids = [w.process.pid for w in self.workers if w.process is not None]
+        return sum(_process_rss_bytes(pid) or ESTIMATED_WORKER_RSS_BYTES for pid in pids)
+
+    def _record_resize(self, old_size: int, new_size: int, reason: str) -> None:
+        self._resizes.append(PoolResize(time.time(), old_size, new_size, reason))
+        logger.info("Perl worker pool resized %d -> %d: %s", old_size, new_size, reason)
+
+    def _maybe_grow(self) -> None:
+        """Add one worker for a request that found none idle, within the policy bounds."""
+        policy = self.adaptive
+        if policy is None:
+            return
+        with self._resize_lock:
+            if not self.worker_queue.empty():
+                return  # A worker came back while we waited for the lock.
+            with self._lock:
+                size = len(self.workers)
+                waiting = self._waiting_requests
+            if size >= policy.max_workers:
+                return
+            rss = self._pool_rss_bytes()
+            per_worker = rss // size if size else ESTIMATED_WORKER_RSS_BYTES
+            if rss + per_worker > policy.rss_budget_bytes:
+                logger.debug(
+                    "Not growing Perl pool: %d MiB RSS would exceed the %d MiB budget",
+                    (rss + per_worker) // (1024 * 1024),
+                    policy.rss_budget_bytes // (1024 * 1024),
+                )
+                return
+
+            worker_id = self._next_worker_id
+            self._next_worker_id += 1
+            try:
+                worker = PerlWorker(
+                    worker_id=worker_id, script_path=self.script_path, perl_exe=self.perl_exe
+                )
+            except Exception as e:
+                logger.error(f"Failed to add worker {worker_id}: {e}")
+                return
+            # Count the new worker as fresh so the idle check cannot retire it at once.
+            worker.last_used = time.time()
+            with self._lock:
+                self.workers.append(worker)
+                new_size = len(self.workers)
+            self._record_resize(size, new_size, f"queue depth {waiting} with no idle worker")
+            self.worker_queue.put(worker)
+
+    def _shrink_idle_workers(self) -> None:
+        """Retire idle workers that are surplus to the policy minimum.
+
+        Only workers parked in the idle queue are retired, so none can be mid-request.
+        Over the RSS budget, the least recently used idle workers go first; otherwise a
+        worker goes once it has been idle for ``idle_seconds``.
+        """
+        policy = self.adaptive
+        if policy is None:
+            return
+        with self._resize_lock:
+            idle: list[PerlWorker] = []
+            while True:
+                try:
+                    idle.append(self.worker_queue.get_nowait())
+                except queue.Empty:
+                    break
+            idle.sort(key=lambda w: w.last_used)
+
+            rss = self._pool_rss_bytes()
+            now = time.time()
+            keep: list[PerlWorker] = []
+            for worker in idle:
+                with self._lock:
+                    size = len(self.workers)
+                    waiting = self._waiting_requests
+                reason: str | None = None
+                if size > policy.min_workers and waiting == 0:
+                    if rss > policy.rss_budget_bytes:
+                        reason = (
+                            f"RSS {rss // (1024 * 1024)} MiB over the "
+                            f"{policy.rss_budget_bytes // (1024 * 1024)} MiB budget"
+                        )
+                    elif now - worker.last_used >= policy.idle_seconds:
+                        reason = f"idle for {now - worker.last_used:.0f}s"
+                if reason is None:
+                    keep.append(worker)
+                    continue
+                if worker.process is not None:
+                    rss -= _process_rss_bytes(worker.process.pid) or ESTIMATED_WORKER_RSS_BYTES
+                with self._lock:
+                    self.workers.remove(worker)
+                worker.shutdown()
+                self._record_resize(size, size - 1, reason)
+            for worker in keep:
+                self.worker_queue.put(worker)
+
+    def _acquire_worker(self, timeout: float) -> PerlWorker:
+        """Take an idle worker, growing an adaptive pool when none is idle.
+
+        Raises:
+            queue.Empty: No worker became available within ``timeout``.
+        """
+        try:
+            return self.worker_queue.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            self._waiting_requests += 1
+        try:
+            self._maybe_grow()
+            return self.worker_queue.get(timeout=timeout)
+        finally:
+            with self._lock:
+                self._waiting_requests -= 1
+
     def parse_file(self, file_path: str, variables: list[str], timeout: float = 120.0) -> list[str]:
         """
         Parse a file using the worker pool.
@@ -576,6 +969,86 @@ class PerlWorkerPool:
         Returns:
             List of output lines from Perl parser
 
+        Raises:
+            RuntimeError: If all workers fail
+            TimeoutError: If no workers available within timeout
+        """
+        return self._dispatch(
+            lambda worker, attempt_timeout: worker.parse_file(
+                file_path, variables, attempt_timeout
+            ),
+            timeout,
+        )
+
+    def parse_files(
+        self, file_paths: Sequence[str], variables: list[str], timeout: float = 120.0
+    ) -> list[FileParseOutput]:
+        """
+        Parse several files in one ``PARSE_BATCH`` request on a single worker.
+
+        Retry and circuit-breaker semantics match ``parse_file``; a retry resends the
+        whole batch. Per-file failures are reported through ``FileParseOutput.error``.
+
+        Args:
+            file_paths: Paths to stats files
+            variables: List of variable patterns
+            timeout: Maximum total batch time across all retries
+
+        Returns:
+            One output per file, in ``file_paths`` order
+
+        Raises:
+            RuntimeError: If all workers fail
+            TimeoutError: If no workers available within timeout
+        """
+        paths = list(file_paths)
+        return self._dispatch(
+            lambda worker, attempt_timeout: worker.parse_batch(paths, variables, attempt_timeout),
+            timeout,
+        )
+
+    def scan_file(
+        self, file_path: str, config_vars: list[str] | None = None, timeout: float = 15.0
+    ) -> list[str]:
+        """
+        Scan a file for its variable schema using the worker pool.
+
+        Requires a pool started with ``SCANNER_SERVER_SCRIPT``; retry and
+        circuit-breaker semantics match ``parse_file``.
+
+        Args:
+            file_path: Path to stats file
+            config_vars: Variable names to report as configuration values
+            timeout: Maximum total scan time across all retries
+
+        Returns:
+            JSON output lines from the Perl scanner
+
+        Raises:
+            RuntimeError: If all workers fail
+            TimeoutError: If no workers available within timeout
+        """
+        hints = list(config_vars or [])
+        return self._dispatch(
+            lambda worker, attempt_timeout: worker.scan_file(file_path, hints, attempt_timeout),
+            timeout,
+        )
+
+    def _dispatch(
+        self,
+        request: Callable[[PerlWorker, float], tuple[_T, bool]],
+        timeout: float,
+    ) -> _T:
+        """
+        Run one request on the first healthy worker, retrying on other workers.
+
+        Args:
+            request: Callable issuing the request on a worker with a per-attempt timeout
+            timeout: Maximum total time across all retries
+
+        Returns:
+            Output lines of the first successful attempt
+
         Raises:
             RuntimeError: If all workers fail
             TimeoutError: If no workers available within timeout
@@ -596,7 +1069,7 @@ class PerlWorkerPool:
 
             try:
                 # Get available worker with per-attempt timeout
-                worker = self.worker_queue.get(timeout=per_attempt_timeout)
+                worker = self._acquire_worker(per_attempt_timeout)
 
                 try:
                     # Note: is_busy is a simple boolean attribute. Python's GIL
@@ -604,11 +1077,9 @@ class PerlWorkerPool:
                     # this flag to skip busy workers (best-effort), so no
                     # additional synchronization is required.
                     worker.is_busy = True
-                    # Use the per-attempt budget for the parse too (not the full timeout),
+                    # Use the per-attempt budget for the request too (not the full timeout),
                     # so N retries cannot block for N × timeout as the docstring promises.
-                    output_lines, success = worker.parse_file(
-                        file_path, variables, per_attempt_timeout
-                    )
+                    output_lines, success = request(worker, per_attempt_timeout)
                     worker.is_busy = False
 
                     if success:
@@ -623,7 +1094,7 @@ class PerlWorkerPool:
                 except Exception as e:
                     failures += 1
                     last_exc = e
-                    logger.error(f"Parse error with worker-{worker.worker_id}: {e}")
+                    logger.error(f"Request error with worker-{worker.worker_id}: {e}")
                 finally:
                     # Ensure busy flag is cleared even on exception
                     worker.is_busy = False
@@ -639,13 +1110,27 @@ class PerlWorkerPool:
                 raise TimeoutError("No workers available within timeout") from e
 
         # All workers failed
-        logger.error("All workers failed to parse the file")
+        logger.error("All workers failed to handle the request")
         raise RuntimeError("All workers failed") from last_exc
 
     def get_stats(self) -> dict[str, Any]:
-        """Get pool statistics."""
+        """Get pool statistics.
+
+        ``pool_size`` is the current number of workers. Adaptive pools also report their
+        bounds, measured RSS, and recent ``resizes`` with the reason for each.
+        """
+        policy = self.adaptive
+        rss = self._pool_rss_bytes()
         with self._lock:
             return {
+                "mode": "fixed" if policy is None else "adaptive",
+                "min_workers": self.pool_size if policy is None else policy.min_workers,
+                "max_workers": self.pool_size if policy is None else policy.max_workers,
+                "rss_bytes": rss,
+                "rss_budget_bytes": None if policy is None else policy.rss_budget_bytes,
+                "waiting_requests": self._waiting_requests,
+                "resizes": list(self._resizes),
+                "last_resize_reason": self._resizes[-1].reason if self._resizes else None,
                 "pool_size": len(self.workers),
                 "healthy_workers": sum(1 for w in self.workers if w.is_healthy),
                 "total_requests": sum(w.requests_served for w in self.workers),
@@ -686,7 +1171,7 @@ def get_worker_pool(pool_size: int | None = None) -> PerlWorkerPool:
 
     Args:
         pool_size: Number of workers (only used on first call). ``None`` resolves
-            to two (override via ``RING5_PERL_POOL_SIZE``).
+            to two (override via ``RING5_PERL_POOL_SIZE``; ``auto`` is adaptive).
 
     Returns:
         PerlWorkerPool instance
@@ -709,3 +1194,42 @@ def shutdown_worker_pool() -> None:
         if _worker_pool_instance is not None:
             _worker_pool_instance.shutdown()
             _worker_pool_instance = None
+
+
+# Scanner singleton, kept separate so scans never queue behind long parses
+_scanner_pool_instance: PerlWorkerPool | None = None
+_scanner_pool_lock = threading.Lock()
+
+
+def get_scanner_pool(pool_size: int | None = None) -> PerlWorkerPool:
+    # [impl->req~ring5.api.process-lifecycle~1]
+    """
+    Return the singleton scanner pool, creating it when necessary.
+
+    Args:
+        pool_size: Number of workers (only used on first call). ``None`` resolves
+            to two (override via ``RING5_PERL_POOL_SIZE``; ``auto`` is adaptive).
+
+    Returns:
+        PerlWorkerPool running ``statsScannerServer.pl``
+    """
+    global _scanner_pool_instance
+
+    with _scanner_pool_lock:
+        if _scanner_pool_instance is None:
+            _scanner_pool_instance = PerlWorkerPool(
+                pool_size=pool_size, script_name=SCANNER_SERVER_SCRIPT
+            )
+            atexit.register(shutdown_scanner_pool)
+        return _scanner_pool_instance
+
+
+def shutdown_scanner_pool() -> None:
+    # [impl->req~ring5.api.process-lifecycle~1]
+    """Shutdown the global scanner pool."""
+    global _scanner_pool_instance
+
+    with _scanner_pool_lock:
+        if _scanner_pool_instance is not None:
+            _scanner_pool_instance.shutdown()
+            _scanner_pool_instance = None
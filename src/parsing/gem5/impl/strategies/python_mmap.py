@@ -0,0 +1,42 @@
+"""
+Python Mmap Strategy - gem5 stats parsing without the Perl server.
+
+Selects the same files and builds the same variable maps as
+``SimpleStatsStrategy``, but each work item scans its ``stats.txt`` with the
+memory-mapped, pure-Python scanner in a process pool instead of sending it
+through ``fileParserServer.pl``. Results are interchangeable with the
+``simple`` strategy; the Perl backend remains the reference implementation.
+
+Instead of deep-copying the template ``StatType`` map per file, every file is
+parsed into one dense ``StatRow`` aligned to a ``StatSchema`` built once from
+the template (see ``src.parsing.gem5.types.compact``).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from src.parsing.gem5.types.base import StatType
+
+from src.parsing.gem5.impl.strategies.gem5_parse_work import Gem5ParseWork, VarsDictType
+from src.parsing.gem5.impl.strategies.mmap_parse_work import MmapParseWork
+from src.parsing.gem5.impl.strategies.simple import SimpleStatsStrategy
+from src.parsing.gem5.types.compact import StatSchema
+
+
+class PythonMmapStrategy(SimpleStatsStrategy):
+    """Parsing strategy that scans stats files with the pure-Python mmap backend."""
+
+    # [impl->req~ring5.ingestion.simple-strategy~1]
+
+    def _create_works(
+        self, file_names: list[str], template_map: dict[str, StatType]
+    ) -> list[Gem5ParseWork]:
+        """Return one mmap work item per file, each parsing into its own compact row."""
+        schema = StatSchema(template_map)
+        # Row views implement the StatType surface the parse pipeline relies on.
+        return [
+            MmapParseWork(file_name, cast(VarsDictType, schema.new_row().variables()))
+            for file_name in file_names
+        ]
@@ -8,7 +8,7 @@ import os
 import time
 from collections.abc import Sequence
 from dataclasses import replace
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
     from src.parsing.gem5.types.base import StatType
@@ -24,7 +24,8 @@ from src.core.common.safe_regex import SafeRegexError, numeric_pattern_id
 from src.core.common.utils import sanitize_log_value
 from src.core.models import StatConfig
 from src.parsing.framework.file_discovery import find_stats_files
-from src.parsing.gem5.impl.strategies.gem5_parse_work import Gem5ParseWork
+from src.parsing.gem5.impl.pool.parse_work import ParseWork
+from src.parsing.gem5.impl.strategies.gem5_parse_work import Gem5ParseWork, plan_parse_batches
 from src.parsing.gem5.impl.strategies.file_parser_strategy import INTERNAL_SIM_PATH_KEY
 from src.parsing.gem5.types.type_mapper import TypeMapper
 
@@ -63,6 +64,9 @@ class SimpleStatsStrategy:
 
     # [impl->req~ring5.ingestion.simple-strategy~1]
 
+    # Non-statistic columns ``post_process`` adds to every result, in CSV order.
+    metadata_columns: ClassVar[tuple[str, ...]] = ()
+
     def get_work_items(
         self,
         stats_path: str,
@@ -70,12 +74,13 @@ class SimpleStatsStrategy:
         variables: Sequence[StatConfig],
         *,
         file_paths: list[str] | None = None,
-    ) -> Sequence[Gem5ParseWork]:
+    ) -> Sequence[ParseWork]:
         """Return a list of work items for parallel execution.
 
         Each work item receives its own independent copy of the variable
         map so that concurrent threads cannot corrupt shared mutable
-        ``StatType`` objects.
+        ``StatType`` objects. Work items share ``Gem5ParseBatch`` chunks so
+        the Perl workers parse several files per request.
         """
         t_start = time.perf_counter()
         if file_paths is None:
@@ -105,7 +110,7 @@ class SimpleStatsStrategy:
         logger.info(f"PERF: Variable map creation took {t_map_end - t_map_start:.4f}s")
 
         t_copy_start = time.perf_counter()
-        works = [Gem5ParseWork(str(file_path), copy.deepcopy(template_map)) for file_path in files]
+        works = self._create_works([str(file_path) for file_path in files], template_map)
         t_copy_end = time.perf_counter()
         logger.info(
             f"PERF: Total deepcopy cost for {len(files)} files: {t_copy_end - t_copy_start:.4f}s"
@@ -113,6 +118,15 @@ class SimpleStatsStrategy:
 
         return works
 
+    def _create_works(
+        self, file_names: list[str], template_map: dict[str, StatType]
+    ) -> list[Gem5ParseWork]:
+        """Return one work item per file, each with its own copy of *template_map*."""
+        return [
+            Gem5ParseWork(file_name, copy.deepcopy(template_map), batch=batch)
+            for file_name, batch in zip(file_names, plan_parse_batches(file_names), strict=True)
+        ]
+
     def post_process(self, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Remove worker-only provenance before writing the public CSV."""
         processed: list[dict[str, Any]] = []
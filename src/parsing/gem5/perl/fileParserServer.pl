@@ -38,6 +38,61 @@ my $request_count = 0;
 my $max_requests = 1000; # Restart after N requests to prevent memory leaks
 my $max_lines = $ENV{RING5_MAX_PARSE_LINES} // 10_000_000;
 die "Invalid parser line limit\n" unless $max_lines =~ /^\d+$/ && $max_lines > 0;
+# Registered filter sets, oldest first; the client mirrors this bound and eviction order
+my $max_filter_sets = $ENV{RING5_MAX_FILTER_SETS} // 8;
+die "Invalid filter set limit\n" unless $max_filter_sets =~ /^\d+$/ && $max_filter_sets > 0;
+my %filter_sets;
+my @filter_set_order;
+
+# Parse one stats file with the active filter set, printing one line per match.
+# Returns an error message, or undef on success.
+sub parse_stats_file {
+    my ($filename) = @_;
+
+    # Validate file exists
+    unless (-f $filename) {
+        log_error("File not found: $filename");
+        return "File not found: $filename";
+    }
+
+    # Validate file is readable
+    unless (-r $filename) {
+        log_error("File not readable: $filename");
+        return "File not readable: $filename";
+    }
+    resetLineContext();
+
+    # Open and parse file
+    my $line_count = 0;
+
+    eval {
+        open(my $fh, '<:raw', $filename) or die "Cannot open file: $!";
+
+        while (my $line = <$fh>) {
+            chomp $line;
+            if (++$line_count > $max_lines) {
+                die "Parser line limit exceeded ($max_lines lines): $filename\n";
+            }
+
+            # Skip empty lines
+            next if $line =~ /^\s*$/;
+
+            # Parse and print - parseAndPrintLineWithFormat outputs directly
+            parseAndPrintLineWithFormat($line);
+        }
+
+        close($fh);
+    };
+
+    if ($@) {
+        my $error = $@;
+        chomp $error;
+        log_error("Error during parsing: $error");
+        return "Parsing failed: $error";
+    }
+    log_info("Completed parsing: $line_count lines processed");
+    return undef;
+}
 
 # Main command loop
 while (my $command = <STDIN>) {
@@ -68,22 +123,6 @@ while (my $command = <STDIN>) {
 
         log_info("Processing request #$request_count: file=$filename, filters=" . scalar(@filters));
 
-        # Validate file exists
-        unless (-f $filename) {
-            log_error("File not found: $filename");
-            print "ERROR File not found: $filename\n";
-            print "END_PARSE\n";
-            next;
-        }
-
-        # Validate file is readable
-        unless (-r $filename) {
-            log_error("File not readable: $filename");
-            print "ERROR File not readable: $filename\n";
-            print "END_PARSE\n";
-            next;
-        }
-
         # Set filter regexes
         eval {
             setFilterRegexes(@filters);
@@ -94,42 +133,72 @@ while (my $command = <STDIN>) {
             print "END_PARSE\n";
             next;
         }
-        resetLineContext();
-
-        # Open and parse file
-        my $line_count = 0;
-        my $match_count = 0;
-
-        eval {
-            open(my $fh, '<:raw', $filename) or die "Cannot open file: $!";
 
-            while (my $line = <$fh>) {
-                chomp $line;
-                if (++$line_count > $max_lines) {
-                    die "Parser line limit exceeded ($max_lines lines): $filename\n";
-                }
+        my $error = parse_stats_file($filename);
+        print "ERROR $error\n" if defined $error;
 
-                # Skip empty lines
-                next if $line =~ /^\s*$/;
+        # Signal completion
+        print "END_PARSE\n";
+    }
+    elsif ($command =~ /^FILTERS\s+(.+)$/) {
+        # Register a named filter set once so PARSE_BATCH requests need not resend it
+        my @args = split /\|\|/, $1;
+        my $name = shift @args;
 
-                # Parse and print - parseAndPrintLineWithFormat outputs directly
-                my $before_count = $match_count;
-                parseAndPrintLineWithFormat($line);
+        if (!defined $name || $name !~ /^[A-Za-z0-9_-]+$/ || !@args) {
+            log_error("Invalid FILTERS command format: expected 'FILTERS <name>||<filter1>...'");
+            print "ERROR Invalid command format\n";
+            print "END_FILTERS\n";
+            next;
+        }
 
-            }
+        my $set = eval { compileFilterSet(@args) };
+        if ($@) {
+            log_error("Failed to compile filter regexes: $@");
+            print "ERROR Invalid regex filters: $@\n";
+            print "END_FILTERS\n";
+            next;
+        }
 
-            close($fh);
-        };
+        push @filter_set_order, $name unless exists $filter_sets{$name};
+        $filter_sets{$name} = $set;
+        while (@filter_set_order > $max_filter_sets) {
+            delete $filter_sets{shift @filter_set_order};
+        }
+        log_info("Registered filter set $name: filters=" . scalar(@args));
+        print "END_FILTERS\n";
+    }
+    elsif ($command =~ /^PARSE_BATCH\s+(.+)$/) {
+        # Parse many files with one registered filter set; output is framed per file:
+        # FILE <index>, its lines, an optional FILE_ERROR <message>, then END_FILE.
+        my @args = split /\|\|/, $1;
+        my $name = shift @args;
+
+        if (!defined $name || !@args) {
+            log_error("Invalid PARSE_BATCH command format: expected 'PARSE_BATCH <name>||<file1>...'");
+            print "ERROR Invalid command format\n";
+            print "END_PARSE_BATCH\n";
+            next;
+        }
+        unless (exists $filter_sets{$name}) {
+            log_error("Unknown filter set: $name");
+            print "ERROR Unknown filter set: $name\n";
+            print "END_PARSE_BATCH\n";
+            next;
+        }
 
-        if ($@) {
-            log_error("Error during parsing: $@");
-            print "ERROR Parsing failed: $@\n";
-        } else {
-            log_info("Completed parsing: $line_count lines processed");
+        log_info("Processing batch #$request_count: files=" . scalar(@args) . ", filter set=$name");
+        useFilterSet($filter_sets{$name});
+        for my $index (0 .. $#args) {
+            print "FILE $index\n";
+            my $error = parse_stats_file($args[$index]);
+            print "FILE_ERROR $error\n" if defined $error;
+            print "END_FILE\n";
         }
+        # Each file counts toward the restart budget
+        $request_count += $#args;
 
-        # Signal completion
-        print "END_PARSE\n";
+        print "END_PARSE_BATCH\n";
     }
     elsif ($command eq "PING") {
         # Health check
@@ -0,0 +1,181 @@
+package Scanning::StatsScan;
+
+use strict;
+use warnings;
+use Exporter 'import';
+use TypesFormatRegex;
+
+our @EXPORT_OK = qw(scanStatsFile formatScanResults);
+
+# Variable discovery shared by the one-shot scanner (statsScanner.pl) and the
+# persistent scanner server (statsScannerServer.pl).
+#
+# Discovered variables are held as:
+# { name => { type => type, entries => { entry => 1, ... } } }
+
+sub processSummary {
+    my ($name, $entry, $vars) = @_;
+
+    # Check if variable already exists
+    if (exists $vars->{$name}) {
+         addEntry($name, $entry, $vars);
+
+         if ($vars->{$name}{type} eq 'scalar') {
+             $vars->{$name}{type} = 'vector';
+         }
+         # Upgrade Vector to Distribution if summary implies advanced stats
+         # BUT: Do NOT downgrade Histogram to Distribution!
+         # Histograms with summary stats remain Histograms
+         if ($vars->{$name}{type} eq 'vector' &&
+            ($entry eq 'samples' || $entry eq 'mean' || $entry eq 'stdev' || $entry eq 'gmean')) {
+             $vars->{$name}{type} = 'distribution';
+         }
+         # Note: If type is already 'histogram', we keep it as histogram
+    } else {
+         # First time seeing it. Check if summary implies distribution
+         my $init_type = 'vector';
+         if ($entry eq 'samples' || $entry eq 'mean' || $entry eq 'stdev' || $entry eq 'gmean') {
+             $init_type = 'distribution';
+         }
+         $vars->{$name} = { type => $init_type, entries => { $entry => 1 } };
+    }
+}
+
+sub manageType {
+    my ($name, $new_type, $vars) = @_;
+
+    if (!exists $vars->{$name}) {
+        $vars->{$name} = { type => $new_type, entries => {} };
+        return;
+    }
+
+    my $current_type = $vars->{$name}{type};
+
+    # Type conflict / evolution
+    # Upgrade Scalar -> Vector or Distribution or Histogram
+    if ($current_type eq 'scalar' && ($new_type eq 'vector' || $new_type eq 'distribution' || $new_type eq 'histogram')) {
+        $vars->{$name}{type} = $new_type;
+    }
+    # Upgrade Vector -> Distribution or Histogram
+    elsif ($current_type eq 'vector' && ($new_type eq 'distribution' || $new_type eq 'histogram')) {
+        $vars->{$name}{type} = $new_type;
+    }
+    # Upgrade Distribution -> Histogram (FIX for Issue 1900)
+    elsif ($current_type eq 'distribution' && $new_type eq 'histogram') {
+        $vars->{$name}{type} = $new_type;
+    }
+}
+
+sub addEntry {
+    my ($name, $entry, $vars) = @_;
+    if (defined $entry) {
+        $vars->{$name}{entries}->{$entry} = 1;
+    }
+}
+
+# Scan one stats file and return the discovered variables.
+# Dies on open failure or when the line limit is exceeded.
+sub scanStatsFile {
+    my ($filename, $config_vars, $max_lines) = @_;
+
+    open(my $fh, '<', $filename) or die "Could not open file '$filename' $!";
+
+    # We access regexes indirectly by calling classifyLine provided by TypesFormatRegex.
+    # We set a catch-all filter to scan all lines.
+    TypesFormatRegex::setFilterRegexes(".*");
+    TypesFormatRegex::resetLineContext();
+
+    my %discovered_vars;
+    my $line_count = 0;
+
+    while (my $line = <$fh>) {
+        if (++$line_count > $max_lines) {
+            close($fh);
+            die "Scanner line limit exceeded ($max_lines lines): $filename\n";
+        }
+        chomp $line;
+        next if $line =~ /^$/;
+        next if $line =~ /^---/; # standard gem5 divider
+
+        my $info = TypesFormatRegex::classifyLine($line);
+        next unless $info;
+
+        next if $info->{type} eq 'oneline_metadata';
+
+        my $name = $info->{name};
+        my $type = $info->{type};
+        my $entry = $info->{entry};
+
+        if ($info->{entries}) {
+            manageType($name, $type, \%discovered_vars);
+            foreach my $item (@{$info->{entries}}) {
+                addEntry($name, $item->{entry}, \%discovered_vars);
+            }
+            next;
+        }
+
+        if ($type eq 'summary') {
+            processSummary($name, $entry, \%discovered_vars);
+            next;
+        }
+
+        # Config hint check
+        if ($type eq 'scalar' && exists $config_vars->{$name}) {
+            $type = 'configuration';
+        }
+
+        manageType($name, $type, \%discovered_vars);
+        addEntry($name, $entry, \%discovered_vars);
+    }
+
+    close($fh);
+    return \%discovered_vars;
+}
+
+# Render discovered variables as the JSON array consumed by the Python scanner.
+sub formatScanResults {
+    my ($vars) = @_;
+    my $out = "[\n";
+    my $first = 1;
+    foreach my $name (sort keys %$vars) {
+        $out .= ",\n" unless $first;
+        $first = 0;
+
+        my $data = $vars->{$name};
+        my $type = $data->{type};
+
+        $out .= "  {\n";
+        $out .= "    \"name\": \"$name\",\n";
+        $out .= "    \"type\": \"$type\"";
+
+        if (scalar keys %{$data->{entries}}) {
+            $out .= ",\n    \"entries\": [";
+            my @entries = sort keys %{$data->{entries}};
+            $out .= join(", ", map { "\"$_\"" } @entries);
+            $out .= "]";
+
+            # For distributions, calculate min and max from integer entries
+            if ($type eq "distribution") {
+                my $min = undef;
+                my $max = undef;
+                foreach my $e (@entries) {
+                    # Check for integer buckets (allow negative)
+                    if ($e =~ /^-?\d+$/) {
+                        if (!defined $min || $e < $min) { $min = $e; }
+                        if (!defined $max || $e > $max) { $max = $e; }
+                    }
+                }
+                if (defined $min) {
+                    $out .= ",\n    \"minimum\": $min";
+                    $out .= ",\n    \"maximum\": $max";
+                }
+            }
+        }
+
+        $out .= "\n  }";
+    }
+    $out .= "\n]\n";
+    return $out;
+}
+
+1;
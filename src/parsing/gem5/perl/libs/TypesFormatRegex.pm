@@ -5,7 +5,10 @@ use strict;
 use warnings;
 use Exporter 'import';
 our $VERSION = '1.00';
-our @EXPORT  = qw(parseAndPrintLineWithFormat setFilterRegexes classifyLine resetLineContext);
+our @EXPORT  = qw(
+    parseAndPrintLineWithFormat setFilterRegexes compileFilterSet useFilterSet
+    classifyLine resetLineContext
+);
 
 # Imports from new modular packages
 use Scanning::RegexUtils qw(:all);
@@ -21,6 +24,7 @@ use Scanning::Type::Summary qw($summaryRegex);
 
 my $filtersRegexes;
 my @storedFilters;
+my @storedFilterRegexes;
 my %onelineHistogramMetadata;
 
 sub resetLineContext {
@@ -100,9 +104,9 @@ sub getRealVariableNameFromLine {
         return $namePart if $namePart eq $filter;
     }
 
-    # Then try anchored regex match
-    foreach my $filter (@storedFilters) {
-        return $namePart if $namePart =~ /^(?:$filter)$/;
+    # Then try anchored regex match (compiled once per filter set)
+    foreach my $filter (@storedFilterRegexes) {
+        return $namePart if $namePart =~ $filter;
     }
 
     # parseAndPrintLineWithFormat already performed the same anchored filter
@@ -187,17 +191,31 @@ sub formatLine {
     return "$varName" . "$entryName" .  "/$value";
 }
 
-sub setFilterRegexes {
+sub compileFilterSet {
+    # Compile filters once into a reusable set for useFilterSet
     my (@regexes) = @_;
     die "Too many filter expressions" if scalar(@regexes) > 2048;
     foreach my $filter (@regexes) {
         die "Filter expression is too long" if length($filter) > 1024;
     }
-    @storedFilters = @regexes;
     # Add all filters to same regex
-    $filtersRegexes = join("|", map { "(?:$_)" } @regexes);
-    # Compile regexes
-    $filtersRegexes = qr/^(?:$filtersRegexes)(?=::|\s|=)/;
+    my $combined = join("|", map { "(?:$_)" } @regexes);
+    return {
+        filters  => [@regexes],
+        combined => qr/^(?:$combined)(?=::|\s|=)/,
+        anchored => [map { qr/^(?:$_)$/ } @regexes],
+    };
+}
+
+sub useFilterSet {
+    my ($set) = @_;
+    @storedFilters = @{$set->{filters}};
+    @storedFilterRegexes = @{$set->{anchored}};
+    $filtersRegexes = $set->{combined};
+}
+
+sub setFilterRegexes {
+    useFilterSet(compileFilterSet(@_));
 }
 
 sub parseAndPrintLineWithFormat {
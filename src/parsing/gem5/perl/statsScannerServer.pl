@@ -0,0 +1,99 @@
+#!/usr/bin/perl
+#
+# Persistent Perl Scanner Server
+# Stays alive to process multiple scan requests without restart overhead.
+# Speaks the same STDIN/STDOUT protocol as fileParserServer.pl, with a SCAN
+# verb in place of PARSE.
+#
+
+use strict;
+use warnings;
+use FindBin;
+use lib "$FindBin::Bin/libs";
+use Scanning::StatsScan qw(scanStatsFile formatScanResults);
+
+# Enable autoflush for immediate output
+$| = 1;
+
+# Log to STDERR for debugging (STDOUT is reserved for results)
+sub log_info {
+    my ($msg) = @_;
+    print STDERR "[PERL-SCANNER] INFO: $msg\n";
+}
+
+sub log_error {
+    my ($msg) = @_;
+    print STDERR "[PERL-SCANNER] ERROR: $msg\n";
+}
+
+sub log_warn {
+    my ($msg) = @_;
+    print STDERR "[PERL-SCANNER] WARN: $msg\n";
+}
+
+# Signal readiness
+print "READY\n";
+log_info("Scanner server started and ready for commands");
+
+my $request_count = 0;
+my $max_requests = 1000; # Restart after N requests to prevent memory leaks
+my $max_lines = $ENV{RING5_MAX_SCAN_LINES} // 1_000_000;
+die "Invalid scanner line limit\n" unless $max_lines =~ /^\d+$/ && $max_lines > 0;
+
+# Main command loop
+while (my $command = <STDIN>) {
+    chomp $command;
+    $request_count++;
+
+    # Check if we should restart (prevent memory bloat)
+    if ($request_count > $max_requests) {
+        log_warn("Reached max requests ($max_requests), signaling restart needed");
+        print "RESTART_NEEDED\n";
+        last;
+    }
+
+    # SCAN <file>[||<config_var1>,<config_var2>...]
+    if ($command =~ /^SCAN\s+(.+)$/) {
+        my ($filename, $config_vars_str) = split /\|\|/, $1, 2;
+        my %config_vars = map { $_ => 1 } split(',', $config_vars_str // "");
+
+        log_info("Processing request #$request_count: file=$filename");
+
+        unless (-f $filename && -r $filename) {
+            log_error("File not readable: $filename");
+            print "ERROR File not readable: $filename\n";
+            print "END_SCAN\n";
+            next;
+        }
+
+        my $output = eval { formatScanResults(scanStatsFile($filename, \%config_vars, $max_lines)) };
+        if ($@) {
+            my $error = $@;
+            $error =~ s/\s+$//;
+            log_error("Error during scanning: $error");
+            print "ERROR Scanning failed: $error\n";
+        } else {
+            print $output;
+        }
+
+        # Signal completion
+        print "END_SCAN\n";
+    }
+    elsif ($command eq "PING") {
+        # Health check
+        print "PONG\n";
+        log_info("Health check: PONG");
+    }
+    elsif ($command eq "SHUTDOWN") {
+        log_info("Shutdown command received, exiting gracefully");
+        print "GOODBYE\n";
+        last;
+    }
+    else {
+        log_warn("Unknown command: $command");
+        print "ERROR Unknown command: $command\n";
+    }
+}
+
+log_info("Scanner server shutting down after $request_count requests");
+exit 0;
@@ -0,0 +1,578 @@
+"""
+Compact Stat Storage - Schema-Aligned, Array-Backed Parse Results.
+
+``StatType`` instances keep their samples in Python lists (or dicts of lists),
+guard every attribute access, and are deep-copied once per variable per parsed
+file. On large sweeps those objects dominate parse time and memory.
+
+``StatSchema`` is built once from a template variable map and gives every
+numeric bucket (a scalar, a vector entry, a distribution or histogram bucket)
+a column with ``repeat`` sample slots. Each file then gets one ``StatRow``: a
+dense float64 sample array and a count array aligned to that schema. The row
+hands out small ``__slots__`` views that expose the ``StatType`` surface the
+parse pipeline and CSV assembly use (``content`` assignment,
+``balance_content``, ``reduce_duplicates``, ``reduced_content``, ``entries``,
+``padded_count``).
+
+Validation, aggregation and histogram rebinning are delegated to the template
+``StatType``, so both representations accept the same input and reduce to the
+same values. Configuration strings are kept as lists, as they are not numeric.
+Histogram buckets first seen while parsing are appended to the shared schema.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import Any, override
+
+import numpy as np
+
+from src.parsing.gem5.types.base import StatType
+
+_NUMERIC_KINDS = frozenset({"scalar", "vector", "distribution", "histogram"})
+_BALANCED = 1
+_REDUCED = 2
+
+
+class _Layout:
+    """Where one logical variable lives in a schema."""
+
+    __slots__ = ("stat", "kind", "repeat", "index", "keys", "fixed", "slot")
+
+    def __init__(self, stat: StatType, kind: str, slot: int) -> None:
+        self.stat = stat
+        self.kind = kind
+        self.repeat = stat.repeat
+        # Bucket key -> schema column, and the keys in column order.
+        self.index: dict[str, int] = {}
+        self.keys: list[str] = []
+        # Leading columns present in every row even without values (histogram statistics).
+        self.fixed = 0
+        self.slot = slot
+
+
+class StatSchema:
+    """
+    Column layout shared by every file parsed with one template variable map.
+
+    Aliases in the template (ids sharing one content object, such as the
+    concrete names of a regex variable) map to one layout, as they do to one
+    content in the template.
+    """
+
+    # [impl->req~ring5.ingestion.pattern-aggregation~1]
+
+    def __init__(self, template: Mapping[str, StatType]) -> None:
+        """
+        Build the schema from a template variable map.
+
+        Raises:
+            ValueError: If a variable's type has no compact representation.
+        """
+        self._lock = threading.Lock()
+        self._offsets: list[int] = []
+        self._repeats: list[int] = []
+        self._slots = 0
+        self._layouts: list[_Layout] = []
+        self._names: dict[str, int] = {}
+
+        by_content: dict[int, int] = {}
+        for name, stat in template.items():
+            content_id = id(stat.content)
+            if content_id in by_content:
+                self._names[name] = by_content[content_id]
+                continue
+            kind = type(stat)._type_name
+            if kind not in _NUMERIC_KINDS and kind != "configuration":
+                raise ValueError(f"Stat type '{kind}' of {name!r} has no compact representation")
+            layout = _Layout(stat, kind, len(self._layouts))
+            if kind == "scalar":
+                self._add_column(layout, "")
+            elif kind in ("vector", "distribution"):
+                for key in stat.entries or []:
+                    self._add_column(layout, key)
+            elif kind == "histogram":
+                for key in stat.content:
+                    self._add_column(layout, key)
+                layout.fixed = len(layout.keys)
+            self._layouts.append(layout)
+            by_content[content_id] = layout.slot
+            self._names[name] = layout.slot
+
+    @property
+    def column_count(self) -> int:
+        """Number of numeric bucket columns registered so far."""
+        return len(self._offsets)
+
+    def new_row(self) -> StatRow:
+        """Return an empty row for one file."""
+        return StatRow(self)
+
+    def _add_column(self, layout: _Layout, key: str) -> int:
+        """Append a column for *key* to *layout*; the caller holds the lock or owns the schema."""
+        column = len(self._offsets)
+        self._offsets.append(self._slots)
+        self._repeats.append(layout.repeat)
+        self._slots += layout.repeat
+        # Published in order: readers without the lock only see complete columns.
+        layout.index[key] = column
+        layout.keys.append(key)
+        return column
+
+    def _histogram_column(self, layout: _Layout, key: str) -> int:
+        """Return the column of a histogram bucket, registering it on first sight."""
+        with self._lock:
+            column = layout.index.get(key)
+            if column is None:
+                column = self._add_column(layout, key)
+            return column
+
+    def _extent(self) -> tuple[int, int]:
+        """Return a consistent ``(columns, sample slots)`` snapshot."""
+        with self._lock:
+            return len(self._offsets), self._slots
+
+
+class StatRow:
+    """One file's parse results, stored densely against a ``StatSchema``."""
+
+    __slots__ = (
+        "_schema",
+        "_samples",
+        "_counts",
+        "_overflow",
+        "_padded",
+        "_state",
+        "_reduced",
+        "_texts",
+    )
+
+    def __init__(self, schema: StatSchema) -> None:
+        columns, slots = schema._extent()
+        layouts = len(schema._layouts)
+        self._schema = schema
+        # Unfilled slots are NaN: absent measurements never read as 0.
+        self._samples = np.full(slots, np.nan)
+        self._counts = np.zeros(columns, dtype=np.int64)
+        # Values beyond ``repeat``, kept only to report them when balancing fails.
+        self._overflow: dict[int, list[float]] = {}
+        self._padded = [0] * layouts
+        self._state = bytearray(layouts)
+        self._reduced: list[Any] = [None] * layouts
+        self._texts: dict[int, list[str]] = {}
+
+    def variables(self) -> dict[str, CompactStat]:
+        """Return a variable map over this row, keyed like the schema's template."""
+        views: list[CompactStat] = [
+            _VIEW_TYPES[layout.kind](self, layout) for layout in self._schema._layouts
+        ]
+        return {name: views[slot] for name, slot in self._schema._names.items()}
+
+    def _grow(self) -> None:
+        """Extend the arrays to columns registered after this row was created."""
+        columns, slots = self._schema._extent()
+        samples = np.full(slots, np.nan)
+        samples[: len(self._samples)] = self._samples
+        counts = np.zeros(columns, dtype=np.int64)
+        counts[: len(self._counts)] = self._counts
+        self._samples, self._counts = samples, counts
+
+    def _count(self, column: int) -> int:
+        return int(self._counts[column]) if column < len(self._counts) else 0
+
+    def _append(self, column: int, value: float) -> None:
+        if column >= len(self._counts):
+            self._grow()
+        count = int(self._counts[column])
+        if count < self._schema._repeats[column]:
+            self._samples[self._schema._offsets[column] + count] = value
+        else:
+            self._overflow.setdefault(column, []).append(value)
+        self._counts[column] = count + 1
+
+    def _values(self, column: int) -> list[float]:
+        """Return the values stored for *column*, in arrival order."""
+        count = self._count(column)
+        if not count:
+            return []
+        offset = self._schema._offsets[column]
+        repeat = self._schema._repeats[column]
+        if count <= repeat:
+            stored: list[float] = self._samples[offset : offset + count].tolist()
+            return stored
+        head: list[float] = self._samples[offset : offset + repeat].tolist()
+        return head + self._overflow[column]
+
+    def _fill(self, column: int, pad: float) -> int:
+        """Pad *column* to ``repeat`` values and return how many were added."""
+        if column >= len(self._counts):
+            self._grow()
+        count = int(self._counts[column])
+        repeat = self._schema._repeats[column]
+        if count >= repeat:
+            return 0
+        if not math.isnan(pad):
+            offset = self._schema._offsets[column]
+            self._samples[offset + count : offset + repeat] = pad
+        self._counts[column] = repeat
+        return repeat - count
+
+
+class CompactStat(ABC):
+    """
+    ``StatType``-compatible view of one variable in a ``StatRow``.
+
+    Content assignment validates and aggregates through the template
+    ``StatType`` and appends into the row; ``content`` reads return a copy.
+    ``reduced_content`` is only readable after ``balance_content()`` and
+    ``reduce_duplicates()``, as for ``StatType``. Each stat kind implements
+    the storage hooks in a subclass.
+    """
+
+    __slots__ = ("_row", "_layout")
+    _type_name = "base"
+
+    def __init__(self, row: StatRow, layout: _Layout) -> None:
+        self._row = row
+        self._layout = layout
+
+    @property
+    def repeat(self) -> int:
+        """Return the expected number of statistic samples."""
+        return self._layout.repeat
+
+    @property
+    def is_balanced(self) -> bool:
+        """Whether balance_content() has been called."""
+        return bool(self._row._state[self._layout.slot] & _BALANCED)
+
+    @property
+    def is_reduced(self) -> bool:
+        """Whether reduce_duplicates() has been called."""
+        return bool(self._row._state[self._layout.slot] & _REDUCED)
+
+    @property
+    def padded_count(self) -> int:
+        """Number of missing entries padded with NaN during balancing (0 if none)."""
+        return self._row._padded[self._layout.slot]
+
+    @property
+    def entries(self) -> list[str] | None:
+        """Return entry keys for complex types; None for scalars and configurations."""
+        return None
+
+    @property
+    def content(self) -> Any:
+        """Return a copy of the unreduced content, shaped like the ``StatType`` content."""
+        return self._read()
+
+    @content.setter
+    def content(self, value: Any) -> None:
+        """Validate one file's value(s) and append them to the row."""
+        self._store(value)
+
+    @property
+    def reduced_content(self) -> Any:
+        """Return content after balancing and duplicate reduction."""
+        if self._row._state[self._layout.slot] != _BALANCED | _REDUCED:
+            raise AttributeError(
+                f"{self._type_name.upper()}: Cannot access reduced_content before calling "
+                f"balance_content() AND reduce_duplicates()"
+            )
+        return self._row._reduced[self._layout.slot]
+
+    def balance_content(self) -> None:
+        """Ensure every bucket holds exactly ``repeat`` values."""
+        self._row._state[self._layout.slot] |= _BALANCED
+        self._balance()
+
+    def reduce_duplicates(self) -> None:
+        """Reduce the balanced values to one value per bucket."""
+        self._row._state[self._layout.slot] |= _REDUCED
+        self._row._reduced[self._layout.slot] = self._reduce()
+
+    @abstractmethod
+    def _read(self) -> Any:
+        """Return a copy of the unreduced content."""
+
+    @abstractmethod
+    def _store(self, value: Any) -> None:
+        """Validate one file's value(s) and append them to the row."""
+
+    def _balance(self) -> None:
+        """Pad buckets holding fewer than ``repeat`` values; fail on more."""
+
+    @abstractmethod
+    def _reduce(self) -> Any:
+        """Return the reduced content of the balanced values."""
+
+    def _number(self, key: str, value: float | str | int) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError) as e:
+            raise TypeError(
+                f"{self._type_name.upper()}: Value non-convertible to number. "
+                f"Key: {key}, Value: {value}"
+            ) from e
+
+    def _mean(self, column: int) -> float:
+        """Return the population mean of a balanced column, NaN if it is empty."""
+        values = self._row._values(column)
+        if not values:
+            return math.nan
+        return sum(values[: self._layout.repeat]) / self._layout.repeat
+
+    def _padded_buckets(self, keys: list[str], pad: float) -> int:
+        """Pad *keys* to ``repeat`` values, failing like ``StatType`` on extra values."""
+        layout = self._layout
+        padded = 0
+        for key in keys:
+            column = layout.index[key]
+            count = self._row._count(column)
+            if count > layout.repeat:
+                raise RuntimeError(self._overflow_message(key, column, count))
+            padded += self._row._fill(column, pad)
+        return padded
+
+    @abstractmethod
+    def _overflow_message(self, key: str, column: int, count: int) -> str:
+        """Return the ``StatType`` error text for a bucket with too many values."""
+
+    def __str__(self) -> str:
+        return f"{self._type_name}({self.content})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class CompactScalar(CompactStat):
+    """Row view of a ``Scalar``."""
+
+    # [impl->req~ring5.ingestion.scalar~1]
+
+    __slots__ = ()
+    _type_name = "scalar"
+
+    @override
+    def _read(self) -> list[float]:
+        return self._row._values(self._layout.index[""])
+
+    @override
+    def _store(self, value: Any) -> None:
+        stat = self._layout.stat
+        stat._validate_content(value)
+        self._row._append(self._layout.index[""], stat._to_float(value))
+
+    @override
+    def _balance(self) -> None:
+        padded = self._padded_buckets(self._layout.keys, math.nan)
+        if padded:
+            self._row._padded[self._layout.slot] = padded
+
+    @override
+    def _overflow_message(self, key: str, column: int, count: int) -> str:
+        return (
+            f"SCALAR: More values ({count}) than expected ({self._layout.repeat}). "
+            f"Values: {self._row._values(column)}"
+        )
+
+    @override
+    def _reduce(self) -> float:
+        return self._mean(self._layout.index[""])
+
+
+class CompactVector(CompactStat):
+    """Row view of a ``Vector``."""
+
+    # [impl->req~ring5.ingestion.vector~1]
+
+    __slots__ = ()
+    _type_name = "vector"
+
+    @property
+    @override
+    def entries(self) -> list[str]:
+        """Return configured vector entry names."""
+        return self._layout.keys
+
+    @override
+    def _read(self) -> dict[str, list[float]]:
+        row, index = self._row, self._layout.index
+        return {key: row._values(index[key]) for key in self._layout.keys}
+
+    @override
+    def _store(self, value: Any) -> None:
+        index = self._layout.index
+        for key, val in self._layout.stat._aggregate(value).items():
+            self._row._append(index[key], self._number(key, val))
+
+    @override
+    def _balance(self) -> None:
+        self._row._padded[self._layout.slot] += self._padded_buckets(self._layout.keys, math.nan)
+
+    @override
+    def _overflow_message(self, key: str, column: int, count: int) -> str:
+        return (
+            f"VECTOR: Entry '{key}' has more values than expected. "
+            f"Values: {self._row._values(column)}, "
+            f"Length: {count}, Repeat: {self._layout.repeat}"
+        )
+
+    @override
+    def _reduce(self) -> dict[str, float]:
+        return {key: self._mean(self._layout.index[key]) for key in self._layout.keys}
+
+
+class CompactDistribution(CompactStat):
+    """Row view of a ``Distribution``."""
+
+    # [impl->req~ring5.ingestion.distribution~1]
+
+    __slots__ = ()
+    _type_name = "distribution"
+
+    @property
+    @override
+    def entries(self) -> list[str]:
+        """Return all bucket names in order for layout reconstruction."""
+        return self._layout.keys
+
+    @override
+    def _read(self) -> dict[str, list[float]]:
+        row, index = self._row, self._layout.index
+        return {key: row._values(index[key]) for key in self._layout.keys}
+
+    @override
+    def _store(self, value: Any) -> None:
+        index = self._layout.index
+        for key, val in self._layout.stat._aggregate(value).items():
+            self._row._append(index[key], val)
+
+    @override
+    def _balance(self) -> None:
+        self._padded_buckets(self._layout.keys, 0.0)
+
+    @override
+    def _overflow_message(self, key: str, column: int, count: int) -> str:
+        return (
+            f"DISTRIBUTION: Bucket '{key}' has more values than expected ({count})."
+            f" Repeat count: {self._layout.repeat}"
+        )
+
+    @override
+    def _reduce(self) -> dict[str, float]:
+        repeat = self._layout.repeat
+        reduced: dict[str, float] = {}
+        for key in self._layout.keys:
+            values = self._row._values(self._layout.index[key])
+            reduced[key] = math.fsum(values[:repeat]) / repeat if values else 0.0
+        return reduced
+
+
+class CompactHistogram(CompactStat):
+    """Row view of a ``Histogram``; only buckets seen in this file are present."""
+
+    # [impl->req~ring5.ingestion.histogram~1]
+
+    __slots__ = ()
+    _type_name = "histogram"
+
+    def _present(self) -> list[str]:
+        """Return the configured statistics plus every bucket holding a value."""
+        layout, row = self._layout, self._row
+        return [
+            key
+            for position, key in enumerate(list(layout.keys))
+            if position < layout.fixed or row._count(layout.index[key])
+        ]
+
+    @property
+    @override
+    def entries(self) -> list[str]:
+        """Return the expected output keys for the buckets seen in this file."""
+        stat = self._layout.stat
+        present: list[str] = stat._entries_for(self._present())
+        return present
+
+    @override
+    def _read(self) -> dict[str, list[float]]:
+        row, index = self._row, self._layout.index
+        return {key: row._values(index[key]) for key in self._present()}
+
+    @override
+    def _store(self, value: Any) -> None:
+        layout = self._layout
+        for key, val in layout.stat._aggregate(value).items():
+            column = layout.index.get(key)
+            if column is None:
+                column = self._row._schema._histogram_column(layout, key)
+            self._row._append(column, val)
+
+    @override
+    def _balance(self) -> None:
+        self._padded_buckets(self._present(), 0.0)
+
+    @override
+    def _overflow_message(self, key: str, column: int, count: int) -> str:
+        return (
+            f"HISTOGRAM: Bucket '{key}' has more values than expected. "
+            f"Length: {count}, Repeat: {self._layout.repeat}"
+        )
+
+    @override
+    def _reduce(self) -> dict[str, float]:
+        stat = self._layout.stat
+        if stat._bins > 0 and stat._max_range > 0:
+            rebinned: dict[str, float] = stat._rebin(self.content)
+            return rebinned
+        repeat = self._layout.repeat
+        reduced: dict[str, float] = {}
+        for key in self._present():
+            values = self._row._values(self._layout.index[key])
+            reduced[key] = sum(values[:repeat]) / repeat if values else 0.0
+        return reduced
+
+
+class CompactConfiguration(CompactStat):
+    """Row view of a ``Configuration``; values stay strings."""
+
+    # [impl->req~ring5.ingestion.configuration~1]
+
+    __slots__ = ()
+    _type_name = "configuration"
+
+    @property
+    def onEmpty(self) -> str:
+        """Return the value used when configuration content is empty."""
+        return str(self._layout.stat.onEmpty)
+
+    @override
+    def _read(self) -> list[str]:
+        return list(self._row._texts.get(self._layout.slot, []))
+
+    @override
+    def _store(self, value: Any) -> None:
+        self._layout.stat._validate_content(value)
+        self._row._texts.setdefault(self._layout.slot, []).append(str(value))
+
+    @override
+    def _overflow_message(self, key: str, column: int, count: int) -> str:
+        # Configurations are never padded, so no bucket can overflow.
+        return f"CONFIGURATION: Unexpected value count ({count}) for {key!r}."
+
+    @override
+    def _reduce(self) -> str:
+        texts = self._row._texts.get(self._layout.slot)
+        return texts[0] if texts else self.onEmpty
+
+
+_VIEW_TYPES: dict[str, type[CompactStat]] = {
+    "scalar": CompactScalar,
+    "vector": CompactVector,
+    "distribution": CompactDistribution,
+    "histogram": CompactHistogram,
+    "configuration": CompactConfiguration,
+}
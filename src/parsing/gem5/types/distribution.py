@@ -133,8 +133,18 @@ class Distribution(StatType):
 
     @content.setter
     def content(self, value: dict[str, list[str | int | float] | str | int | float]) -> None:
+        """Append one file's aggregated frequencies to their buckets."""
+        for str_key, aggregated_val in self._aggregate(value).items():
+            # Initialize key in content if not present (for statistics_only mode)
+            if str_key not in self._content:
+                self._content[str_key] = []
+            self._content[str_key].append(aggregated_val)
+
+    def _aggregate(
+        self, value: dict[str, list[str | int | float] | str | int | float]
+    ) -> dict[str, float]:
         """
-        Set and aggregate content from a dictionary.
+        Validate one file's bucket dict and return the summed value per bucket.
 
         Handles aggregation of multiple matches from the same file.
         Fails loudly if critical buckets (under/overflows) are missing (unless statistics_only).
@@ -167,6 +177,7 @@ class Distribution(StatType):
             expected.update(str(i) for i in range(self._minimum, self._maximum + 1))
             expected.update(stats_keys)
 
+        aggregated: dict[str, float] = {}
         for key, vals in value.items():
             str_key = str(key)
 
@@ -184,10 +195,6 @@ class Distribution(StatType):
                     # It's a non-numeric extra stat we're not tracking, skip it
                     continue
 
-            # Initialize key in content if not present (for statistics_only mode)
-            if str_key not in self._content:
-                self._content[str_key] = []
-
             if isinstance(vals, list):
                 val_list = vals
             else:
@@ -195,13 +202,13 @@ class Distribution(StatType):
 
             try:
                 float_vals = [float(v) for v in val_list]
-                aggregated_val = math.fsum(float_vals)
+                aggregated[str_key] = math.fsum(float_vals)
             except (TypeError, ValueError) as e:
                 raise TypeError(
                     f"DISTRIBUTION: Value error at key {str_key}. Expected numbers, got: {val_list}"
                 ) from e
 
-            self._content[str_key].append(aggregated_val)
+        return aggregated
 
     @override
     def balance_content(self) -> None:
@@ -2,6 +2,7 @@
 
 import logging
 import re
+from collections.abc import Iterable, Mapping, Sequence
 from typing import override
 
 from src.core.models.parsing_models import StatParamValue
@@ -83,6 +84,10 @@ class Histogram(StatType):
     @property
     def entries(self) -> list[str]:
         """Get the expected output entry keys for this histogram."""
+        return self._entries_for(object.__getattribute__(self, "_content"))
+
+    def _entries_for(self, raw_keys: Iterable[str]) -> list[str]:
+        """Return the output entry keys given the raw bucket keys collected so far."""
         result = []
         # Priority 1: User-selected specific buckets
         if self._entries:
@@ -103,8 +108,7 @@ class Histogram(StatType):
                 )
         # Priority 3: Discovered raw buckets
         else:
-            raw_content = object.__getattribute__(self, "_content")
-            result.extend(sorted(list(raw_content.keys())))
+            result.extend(sorted(raw_keys))
 
         # Always include extra statistics if they were discovered or configured
         for stat in self._statistics:
@@ -121,8 +125,18 @@ class Histogram(StatType):
 
     @content.setter
     def content(self, value: dict[str, list[str | int | float] | str | int | float]) -> None:
+        """Append one file's aggregated values, creating buckets on first sight."""
+        for str_key, aggregated_val in self._aggregate(value).items():
+            if str_key not in self._content:
+                self._content[str_key] = []
+
+            self._content[str_key].append(aggregated_val)
+
+    def _aggregate(
+        self, value: dict[str, list[str | int | float] | str | int | float]
+    ) -> dict[str, float]:
         """
-        Set and aggregate content from a dictionary.
+        Validate one file's bucket dict and return the summed value per bucket.
 
         Multiple occurrences in one file are summed, such as a regex spanning CPU cores.
         """
@@ -130,6 +144,7 @@ class Histogram(StatType):
             raise TypeError(f"HISTOGRAM: Content must be dict, got {type(value).__name__}")
 
         # Validate values are numeric and aggregate matches
+        aggregated: dict[str, float] = {}
         for key, vals in value.items():
             if isinstance(vals, list):
                 val_list = vals
@@ -147,12 +162,9 @@ class Histogram(StatType):
                         f"HISTOGRAM: Value non-convertible to number. Key: {key}, Value: {v}"
                     ) from e
 
-            # Update content
-            str_key = str(key)
-            if str_key not in self._content:
-                self._content[str_key] = []
+            aggregated[str(key)] = aggregated_val
 
-            self._content[str_key].append(aggregated_val)
+        return aggregated
 
     @override
     def balance_content(self) -> None:
@@ -203,19 +215,23 @@ class Histogram(StatType):
 
     def _reduce_with_rebinning(self) -> None:
         """Perform reduction by rebinning each simulation's data into target uniform buckets."""
+        object.__setattr__(self, "_reduced_content", self._rebin(self._content))
+
+    def _rebin(self, content: Mapping[str, Sequence[float]]) -> dict[str, float]:
+        """Rebin balanced per-bucket *content* into the target buckets and average it."""
         # [impl->req~ring5.ingestion.histogram-rebinning~1]
         num_bins = self._bins
         max_val = self._max_range
 
         # Pre-compute bin mapping once (same for all simulations)
-        bin_mapping = self._compute_bin_mapping(num_bins, max_val)
+        bin_mapping = self._compute_bin_mapping(num_bins, max_val, content)
 
         # Initialize target result set from expected entries
         target_reduced = {key: 0.0 for key in self.entries}
 
         # Process each simulation using pre-computed mapping
         for i in range(self._repeat):
-            for raw_key, values in self._content.items():
+            for raw_key, values in content.items():
                 value = float(values[i]) if i < len(values) else 0.0
                 if value == 0:
                     continue
@@ -236,16 +252,17 @@ class Histogram(StatType):
         for key in target_reduced:
             target_reduced[key] /= self._repeat
 
-        object.__setattr__(self, "_reduced_content", target_reduced)
+        return target_reduced
 
     def _compute_bin_mapping(
-        self, num_bins: int, max_val: float
+        self, num_bins: int, max_val: float, raw_keys: Iterable[str] | None = None
     ) -> dict[str, list[tuple[str, float]] | None]:
         """Pre-compute the mapping from raw buckets to target bins.
 
-        Returns a dict mapping each raw_key to a list of (target_key, proportion)
-        tuples, or None for non-range keys (summary stats preserved as-is).
-        Computed once and reused across all repeat iterations.
+        Returns a dict mapping each raw_key (the content keys by default) to a
+        list of (target_key, proportion) tuples, or None for non-range keys
+        (summary stats preserved as-is). Computed once and reused across all
+        repeat iterations.
         """
         if num_bins > 1:
             num_std_bins = num_bins - 1
@@ -258,7 +275,7 @@ class Histogram(StatType):
 
         mapping: dict[str, list[tuple[str, float]] | None] = {}
 
-        for raw_key in self._content:
+        for raw_key in self._content if raw_keys is None else raw_keys:
             bounds = self._parse_range_key(raw_key)
             if not bounds:
                 mapping[raw_key] = None
@@ -45,13 +45,17 @@ class Scalar(StatType):
     @override
     def _set_content(self, value: Any) -> None:
         """Convert to numeric and append to content list (preserve precision)."""
+        self._content.append(self._to_float(value))
+
+    @staticmethod
+    def _to_float(value: Any) -> float:
+        """Convert a validated value to float without truncating fractions."""
         # float() first so fractional values are NOT truncated; fall back to
         # int() only for inputs that float() rejects (same acceptance set).
         try:
-            numeric_value: float = float(value)
+            return float(value)
         except (TypeError, ValueError):
-            numeric_value = float(int(value))
-        self._content.append(numeric_value)
+            return float(int(value))
 
     @override
     def reduce_duplicates(self) -> None:
@@ -74,8 +74,15 @@ class Vector(StatType):
 
     @content.setter
     def content(self, value: dict[str, list[str | int | float] | str | int | float]) -> None:
+        """Append one file's values to the configured entries."""
+        for key, val in self._aggregate(value).items():
+            self._content[key].append(val)
+
+    def _aggregate(
+        self, value: dict[str, list[str | int | float] | str | int | float]
+    ) -> dict[str, float | str | int]:
         """
-        Set content from dict, extending existing entries.
+        Validate one file's entry dict and return the value to append per entry.
 
         Validates:
         - Keys can be converted to strings
@@ -128,21 +135,22 @@ class Vector(StatType):
             )
 
         # Only keep entries that are in our configured list
+        aggregated: dict[str, float | str | int] = {}
         for key, vals in value.items():
             str_key = str(key)
             if str_key in self._entries:
                 if isinstance(vals, list):
                     # Sum multiple matches from a single file (aggregation)
                     try:
-                        aggregated_val = sum(float(v) for v in vals)
+                        aggregated[str_key] = sum(float(v) for v in vals)
                     except (TypeError, ValueError) as e:
                         raise TypeError(
                             f"VECTOR: Value non-convertible to number. "
                             f"Key: {key}, Values: {vals}"
                         ) from e
-                    self._content[str_key].append(aggregated_val)
                 else:
-                    self._content[str_key].append(vals)
+                    aggregated[str_key] = vals
+        return aggregated
 
     @override
     def balance_content(self) -> None:
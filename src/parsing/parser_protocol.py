@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from concurrent.futures import Future
 from typing import Any, Protocol, runtime_checkable
 
@@ -50,6 +51,8 @@ class SimulationParser(Protocol):
         strategy_type: str = "simple",
         scanned_vars: list[ScannedVariable] | None = None,
         cache_path: str | None = None,
+        change_detection: str = "content",
+        verify_fraction: float = 0.0,
     ) -> IncrementalParseBatchResult:
         """Submit only new or changed files while retaining an explicit reuse plan."""
         raise NotImplementedError
@@ -66,6 +69,18 @@ class SimulationParser(Protocol):
         """
         raise NotImplementedError
 
+    def finalize_parsing_streaming(
+        self,
+        output_dir: str,
+        futures: Sequence[Future[dict[str, Any]]],
+        column_schema: Sequence[tuple[str, tuple[str, ...] | None]],
+        strategy_type: str = "simple",
+        *,
+        timeout: float | None = None,
+    ) -> str | None:
+        """Write the canonical CSV in submission order as parse futures complete."""
+        raise NotImplementedError
+
     def finalize_incremental_parsing(
         self,
         batch: IncrementalParseBatchResult,
@@ -224,6 +224,22 @@ GEM5_INFO = SimulatorInfo(
                 "Config-Aware strategy allows extracting metadata " "from simulation config files."
             ),
         ),
+        ParsingStrategy(
+            name="config_columns",
+            display_name="Config Columns (selected config.ini keys)",
+            description=(
+                "Reads config.ini in the parse workers, adds the selected section.key values as "
+                "columns, and writes each distinct configuration once to config_table.json."
+            ),
+        ),
+        ParsingStrategy(
+            name="python_mmap",
+            display_name="Python mmap (no Perl)",
+            description=(
+                "Same output as Simple, scanned by a memory-mapped pure-Python parser in a "
+                "process pool instead of the Perl server."
+            ),
+        ),
     ],
 )
 
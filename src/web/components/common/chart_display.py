@@ -14,6 +14,7 @@ The controller orchestrates figure generation and delegates all
 """
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
 import matplotlib.pyplot as plt
@@ -99,9 +100,14 @@ class ChartDisplayComponent:
         *,
         capture_click: bool = False,
         component_generation: int = 0,
+        export_figure: Callable[[], go.Figure] | None = None,
     ) -> dict[str, Any] | None:
         # [impl->req~ring5.export.plotly-scale~1]
-        """Render an interactive Plotly chart with relayout feedback."""
+        """Render an interactive Plotly chart with relayout feedback.
+
+        ``export_figure`` rebuilds the chart at full resolution for downloads
+        when the displayed figure has reduced large traces.
+        """
         plotly_config: dict[str, Any] = {
             "responsive": False,
             "editable": True,
@@ -137,7 +143,7 @@ class ChartDisplayComponent:
             capture_click=capture_click,
         )
 
-        render_download_section(plot_id, plot_name, fig, source_data)
+        render_download_section(plot_id, plot_name, fig, source_data, export_figure=export_figure)
 
         return relayout_data
 
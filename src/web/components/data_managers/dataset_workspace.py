@@ -412,6 +412,9 @@ class DatasetWorkspaceManager:
                         "Rows": [revision.row_count for revision in revisions],
                         "Columns": [revision.column_count for revision in revisions],
                         "Fingerprint": [revision.fingerprint for revision in revisions],
+                        "Stored": [
+                            "" if revision.retained else "Evicted" for revision in revisions
+                        ],
                     }
                 ),
                 width="stretch",
@@ -452,13 +455,21 @@ class DatasetWorkspaceManager:
                 revision for revision in revisions if revision.revision_id == selected_revision
             )
             st.code(selected_info.fingerprint, language=None)
-            snapshot = self.api.get_dataset_revision(selected_revision)
-            st.dataframe(snapshot.head(100), width="stretch")
-            if len(snapshot) > 100:
-                st.caption(f"Showing the first 100 of {len(snapshot)} stored rows.")
+            if selected_info.retained:
+                snapshot = self.api.get_dataset_revision(selected_revision)
+                st.dataframe(snapshot.head(100), width="stretch")
+                if len(snapshot) > 100:
+                    st.caption(f"Showing the first 100 of {len(snapshot)} stored rows.")
+            else:
+                st.caption(
+                    "This revision's data was evicted to stay within the revision memory and "
+                    "disk budgets; its lineage metadata is kept."
+                )
             if st.button(
                 "Restore This Revision",
-                disabled=selected_revision == lineage.current_revision_id,
+                disabled=(
+                    selected_revision == lineage.current_revision_id or not selected_info.retained
+                ),
                 key=WidgetKeyBuilder.manager_key("workspace", "lineage_restore"),
             ):
                 self.api.restore_dataset_revision(selected_revision)
@@ -96,7 +96,7 @@ def _render_parse_job_panel_snapshot(
         return
 
     if snapshot.status == ParseJobStatus.PARTIAL:
-        load_col, retry_col, dismiss_col = st.columns(3)
+        load_col, resume_col, retry_col, dismiss_col = st.columns(4)
         with load_col:
             if st.button(
                 "Load Partial",
@@ -116,6 +116,8 @@ def _render_parse_job_panel_snapshot(
                     st.error(f"Could not load the partial parse result: {exc}")
                 else:
                     _complete_job(job_id, f"Loaded partial CSV: {receipt.csv_path}")
+        with resume_col:
+            _render_resume_button(api, snapshot)
         with retry_col:
             _render_retry_button(api, snapshot)
         with dismiss_col:
@@ -123,7 +125,9 @@ def _render_parse_job_panel_snapshot(
         return
 
     if snapshot.status in {ParseJobStatus.FAILED, ParseJobStatus.CANCELLED}:
-        retry_col, dismiss_col = st.columns(2)
+        resume_col, retry_col, dismiss_col = st.columns(3)
+        with resume_col:
+            _render_resume_button(api, snapshot)
         with retry_col:
             _render_retry_button(api, snapshot)
         with dismiss_col:
@@ -193,6 +197,22 @@ def _render_snapshot(snapshot: ParseJobSnapshot, *, compact: bool) -> None:
                     st.code(error, language=None)
 
 
+def _render_resume_button(
+    api: ApplicationAPI,
+    snapshot: ParseJobSnapshot,
+) -> None:
+    """Render the resume action, which reparses only files without a checkpoint."""
+    if st.button(
+        "Resume",
+        key=f"resume_parse_job_{snapshot.job_id}",
+        help="Keep files that already finished and parse only the rest",
+        width="stretch",
+    ):
+        resumed = api.resume_parse_job(snapshot.job_id)
+        remember_parse_job(resumed)
+        st.rerun(scope="app")
+
+
 def _render_retry_button(
     api: ApplicationAPI,
     snapshot: ParseJobSnapshot,
@@ -20,6 +20,7 @@ Architecture Note — Streamlit usage:
 import hashlib
 import json
 import logging
+from contextlib import nullcontext
 from copy import deepcopy
 from collections.abc import Mapping
 from typing import Any, cast
@@ -30,6 +31,7 @@ import streamlit as st
 
 from src.core.application_api import ApplicationAPI
 from src.core.models.visualization.engine import EngineMode
+from src.core.services.visualization.downsampling_service import interactive_display
 from src.web.components.common.chart_display import ChartDisplayComponent
 from src.web.components.plotting.drill_down_panel import DrillDownPanel, point_label
 from src.web.models.plot_models import PlotConfig
@@ -278,20 +280,29 @@ class PlotRenderController:
                     ChartDisplayComponent.render_error(exc)
                     return
 
+        def build_figure() -> go.Figure:
+            # create_figure relabels legend names engine-agnostically
+            # (on TraceConfig.name), so both engines stay consistent — no
+            # Plotly-only for_each_trace pass here.
+            if multiples_spec is not None:
+                return cast(
+                    go.Figure,
+                    render_small_multiples([cast(Any, plot)], multiples_spec, engine="plotly"),
+                )
+            data = plot.processed_data
+            if data is None:
+                raise ValueError(f"Plot '{plot.name}' has no processed data.")
+            fig = plot.create_figure(data, plot.config)
+            return plot.apply_common_layout(fig, plot.config)
+
         # Generate figure if needed
         if should_generate or not cache_matches:
             try:
-                # create_figure relabels legend names engine-agnostically
-                # (on TraceConfig.name), so both engines stay consistent — no
-                # Plotly-only for_each_trace pass here.
-                if multiples_spec is not None:
-                    fig = cast(
-                        go.Figure,
-                        render_small_multiples([cast(Any, plot)], multiples_spec, engine="plotly"),
-                    )
-                else:
-                    fig = plot.create_figure(plot.processed_data, plot.config)
-                    fig = plot.apply_common_layout(fig, plot.config)
+                # Large traces are reduced and drawn with WebGL only for the
+                # interactive Plotly chart. The Matplotlib engine renders from
+                # last_traces and keeps every point.
+                with interactive_display() if active_engine == "plotly" else nullcontext():
+                    fig = build_figure()
                 plot.last_generated_fig = fig
                 plot.last_figure_cache_key = cache_key
             except Exception as e:
@@ -365,6 +376,7 @@ class PlotRenderController:
                     plot.processed_data,
                     capture_click=drill_enabled,
                     component_generation=generation,
+                    export_figure=build_figure,
                 )
                 if (
                     drill_enabled
@@ -180,6 +180,9 @@ class PlotDisplayConfig(TypedDict, total=False):
     marker_symbol: str
     connect_gaps: bool
 
+    # Large-data rendering (line, scatter, area)
+    large_data_threshold: int  # Points per trace before WebGL + downsampling (0 = off)
+
     # Box-specific
     orientation: str
     quartile_method: str
@@ -1,5 +1,6 @@
 """Base plot class with common functionality."""
 
+import itertools
 from abc import ABC, abstractmethod
 from dataclasses import replace
 from typing import Any
@@ -10,12 +11,15 @@ import plotly.graph_objects as go
 from src.core.models.data_models import PipelineStep
 from src.core.models.visualization.trace_build_result import TraceBuildResult
 from src.core.services.managers.semantic_metadata_service import SemanticMetadataService
+from src.core.services.portfolio_container import PortfolioFrameRef
 from src.core.services.visualization.accessibility_service import AccessibilityService
 from src.web.models.plot_models import PlotConfig
 from src.web.rendering.relayout import update_config_from_relayout
 from src.web.pages.ui.plotting.plot_config_ui import PlotConfigUIMixin
 from src.web.pages.ui.plotting.styles import StyleApplicator, StyleUIFactory
 
+_DATA_VERSIONS = itertools.count(1)
+
 
 def _relabel_traces(
     result: TraceBuildResult, legend_labels: dict[str, str] | None
@@ -52,7 +56,9 @@ class BasePlot(PlotConfigUIMixin, ABC):
         self.plot_type: str = plot_type
         self.config: PlotConfig = {}
         self.source_data: pd.DataFrame | None = None
-        self.processed_data: pd.DataFrame | None = None
+        self._processed_data: pd.DataFrame | None = None
+        self._pending_processed_data: PortfolioFrameRef | None = None
+        self._data_version = next(_DATA_VERSIONS)
         self.last_generated_fig: go.Figure | None = None
         self.last_traces: TraceBuildResult | None = None
         self.last_figure_cache_key: str | None = None
@@ -65,6 +71,49 @@ class BasePlot(PlotConfigUIMixin, ABC):
         self._style_ui = StyleUIFactory.get_strategy(self.plot_id, self.plot_type)
         self._applicator = StyleApplicator(self.plot_type)
 
+    @property
+    def processed_data(self) -> pd.DataFrame | None:
+        """Transformed data this plot renders.
+
+        A plot restored from a portfolio decodes its table here, on first access.
+        """
+        pending = self._pending_processed_data
+        if pending is not None:
+            self._processed_data = pending.load()
+            self._pending_processed_data = None
+        return self._processed_data
+
+    @processed_data.setter
+    def processed_data(self, data: pd.DataFrame | None) -> None:
+        """Replace the data, dropping any pending portfolio table and bumping ``data_version``."""
+        self._pending_processed_data = None
+        self._processed_data = data
+        self._data_version = next(_DATA_VERSIONS)
+
+    @property
+    def data_version(self) -> int:
+        """Token that changes whenever processed data is replaced; unique across plots.
+
+        Decoding a deferred table on first access does not change it.
+        """
+        return self._data_version
+
+    @property
+    def pending_processed_data(self) -> PortfolioFrameRef | None:
+        """Portfolio table that has not been decoded yet, if any."""
+        return self._pending_processed_data
+
+    def defer_processed_data(self, pending: PortfolioFrameRef) -> None:
+        """Load processed data from a restored portfolio when it is first needed.
+
+        Args:
+            pending: Reference to the plot's table in the restored portfolio.
+        """
+        self._processed_data = None
+        self._pending_processed_data = pending
+        self._data_version = next(_DATA_VERSIONS)
+        self.invalidate_figure()
+
     @abstractmethod
     def create_traces(self, data: pd.DataFrame, config: PlotConfig) -> TraceBuildResult:
         """
@@ -200,34 +249,38 @@ class BasePlot(PlotConfigUIMixin, ABC):
         self.last_figure_cache_key = None
         return fig
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, *, include_data: bool = True) -> dict[str, Any]:
         # [impl->req~ring5.portfolio.save~1]
         # [impl->req~ring5.data.semantic-units~1]
         """
         Convert plot to dictionary for serialization.
 
+        Args:
+            include_data: Embed processed data as CSV text with its semantics.
+                Portfolio containers pass ``False`` and store the table
+                separately, which also leaves an undecoded table untouched.
+
         Returns:
             Dictionary representation (without Figure objects)
         """
-        return {
+        serialized: dict[str, Any] = {
             "id": self.plot_id,
             "name": self.name,
             "plot_type": self.plot_type,
             "config": self.config,
-            "processed_data": (
-                self.processed_data.to_csv(index=False)
-                if isinstance(self.processed_data, pd.DataFrame)
-                else None
-            ),
-            "processed_semantics": (
-                SemanticMetadataService.to_payload(
-                    SemanticMetadataService.inspect(self.processed_data)
-                )
-                if isinstance(self.processed_data, pd.DataFrame)
-                else {}
-            ),
             "pipeline": self.pipeline,
             "pipeline_counter": self.pipeline_counter,
             "legend_mappings_by_column": self.legend_mappings_by_column,
             "legend_mappings": self.legend_mappings,
         }
+        if include_data:
+            processed = self.processed_data
+            serialized["processed_data"] = (
+                processed.to_csv(index=False) if isinstance(processed, pd.DataFrame) else None
+            )
+            serialized["processed_semantics"] = (
+                SemanticMetadataService.to_payload(SemanticMetadataService.inspect(processed))
+                if isinstance(processed, pd.DataFrame)
+                else {}
+            )
+        return serialized
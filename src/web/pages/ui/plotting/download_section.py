@@ -9,6 +9,7 @@ package); this module is exclusively the Streamlit presentation around them.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import cast
 
 import pandas as pd
@@ -53,6 +54,8 @@ def render_download_section(
     plot_name: str,
     fig: go.Figure,
     source_data: pd.DataFrame | None = None,
+    *,
+    export_figure: Callable[[], go.Figure] | None = None,
 ) -> None:
     # [impl->req~ring5.workspace.guided-analysis~1]
     # [impl->req~ring5.export.web-download~1]
@@ -70,12 +73,14 @@ def render_download_section(
         fig: The Plotly figure (used directly for Plotly exports).
         source_data: Processed dataframe used to create the figure. Included
             as an interactive table in Plotly HTML downloads.
+        export_figure: Optional factory for the full-resolution figure, called
+            when a Plotly download is generated. Defaults to *fig*.
     """
     with st.expander("📥 Download", expanded=False):
         if EngineManager.is_matplotlib():
             _render_mpl_download(plot_id, plot_name)
         else:
-            _render_plotly_download(plot_id, plot_name, fig, source_data)
+            _render_plotly_download(plot_id, plot_name, fig, source_data, export_figure)
 
 
 def _render_plotly_download(
@@ -83,6 +88,7 @@ def _render_plotly_download(
     plot_name: str,
     fig: go.Figure,
     source_data: pd.DataFrame | None,
+    export_figure: Callable[[], go.Figure] | None = None,
 ) -> None:
     # [impl->req~ring5.export.plotly-html-source-data~1]
     # [impl->req~ring5.export.web-download~1]
@@ -112,7 +118,7 @@ def _render_plotly_download(
         """Generate the selected export in Streamlit's download worker."""
         try:
             return plotly_download_bytes(
-                fig,
+                export_figure() if export_figure is not None else fig,
                 fmt_typed,
                 width=width,
                 height=height,
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Any, TypedDict
 
 import pandas as pd
 
+from src.core.services.portfolio_container import PortfolioFrameRef
+
 if TYPE_CHECKING:
     from .base_plot import BasePlot
 
@@ -142,7 +144,8 @@ class PlotFactory:
         """Restore a plot and its state from :meth:`BasePlot.to_dict` output.
 
         Args:
-            data: Serialized plot mapping.
+            data: Serialized plot mapping. A :class:`PortfolioFrameRef` under
+                ``processed_data_ref`` defers decoding until the plot needs it.
 
         Returns:
             Restored plot instance.
@@ -158,6 +161,9 @@ class PlotFactory:
         plot.legend_mappings_by_column = data.get("legend_mappings_by_column", {})
         plot.legend_mappings = data.get("legend_mappings", {})
 
+        pending = data.get("processed_data_ref")
+        if isinstance(pending, PortfolioFrameRef):
+            plot.defer_processed_data(pending)
         processed_data = data.get("processed_data")
         if processed_data:
             from src.core.services.managers.semantic_metadata_service import (
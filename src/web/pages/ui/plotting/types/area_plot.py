@@ -9,7 +9,13 @@ import pandas as pd
 
 from src.core.models.visualization.trace_build_result import TraceBuildResult
 from src.core.models.visualization.trace_config import LineTraceConfig
+from src.core.services.visualization.downsampling_service import (
+    display_rows,
+    is_large,
+    large_data_threshold,
+)
 from src.core.services.visualization.palette_service import resolve_palette
+from src.core.services.visualization.row_partition import RowPartition
 from src.web.components.plotting.config import area_config
 from src.web.models.plot_models import PlotConfig
 from src.web.pages.ui.plotting.base_plot import BasePlot
@@ -32,12 +38,8 @@ def _ordered_values(series: pd.Series, configured: object = None) -> list[Any]:
     return available
 
 
-def _mask(series: pd.Series, value: Any) -> pd.Series:
-    return series.isna() if pd.isna(value) else series == value
-
-
 def _resolve_missing(
-    values: list[float], mode: MissingMode
+    values: np.ndarray[Any, np.dtype[np.float64]], mode: MissingMode
 ) -> np.ndarray[Any, np.dtype[np.float64]]:
     series = pd.Series(values, dtype=float)
     if mode == "zero":
@@ -92,13 +94,12 @@ class AreaPlot(BasePlot):
         series_styles = config.get("series_styles", {})
         prepared: list[tuple[Any, str, str, np.ndarray[Any, np.dtype[np.float64]]]] = []
 
+        partition = RowPartition(data, [color_col] if color_col else [])
         for group_index, group in enumerate(groups):
-            subset = data[_mask(data[color_col], group)] if color_col else data
+            subset = partition.rows(group) if color_col else data
             y_numeric = pd.to_numeric(subset[y_col], errors="coerce")
-            raw_values: list[float] = []
-            for x_value in x_values:
-                matching = y_numeric.loc[_mask(subset[x_col], x_value)]
-                raw_values.append(float(matching.mean()) if matching.notna().any() else np.nan)
+            means = y_numeric.groupby(subset[x_col], dropna=False, sort=False).mean()
+            raw_values = means.reindex(x_values).to_numpy(dtype=float, na_value=np.nan)
             resolved = _resolve_missing(raw_values, missing)
             if not np.isfinite(resolved).any():
                 continue
@@ -117,8 +118,8 @@ class AreaPlot(BasePlot):
         safe_values = [np.nan_to_num(values, nan=0.0) for _, _, _, values in prepared]
         totals = np.sum(safe_values, axis=0) if safe_values else np.zeros(len(x_values))
         baseline = np.zeros(len(x_values), dtype=float)
-        traces: list[LineTraceConfig] = []
-        for index, (group, name, color, values) in enumerate(prepared):
+        layers: list[tuple[np.ndarray[Any, Any], np.ndarray[Any, Any]]] = []
+        for index, (_, _, _, values) in enumerate(prepared):
             if mode == "normalize":
                 contribution = np.divide(
                     safe_values[index] * 100.0,
@@ -131,10 +132,29 @@ class AreaPlot(BasePlot):
                 upper = baseline + safe_values[index]
             else:
                 upper = values
-            fill_base = (
-                baseline.astype(float).tolist() if mode != "overlay" else [0.0] * len(x_values)
-            )
+            fill_base = baseline.astype(float) if mode != "overlay" else np.zeros(len(x_values))
+            layers.append((upper, fill_base))
+            if mode != "overlay":
+                baseline = upper
 
+        # Reduce every layer on the same rows so stacked fills stay aligned.
+        threshold = large_data_threshold(config)
+        large = is_large(len(x_values), threshold)
+        rows = display_rows(
+            pd.Series(x_values),
+            [upper for upper, _ in layers],
+            kind="line",
+            threshold=threshold,
+            x_range=config.get("range_x"),
+        )
+        if rows is not None:
+            x_values = [x_values[row] for row in rows]
+            layers = [(upper[rows], fill_base[rows]) for upper, fill_base in layers]
+
+        traces: list[LineTraceConfig] = []
+        for index, ((group, name, color, _), (upper, fill_base)) in enumerate(
+            zip(prepared, layers, strict=True)
+        ):
             drill_frame = pd.DataFrame({x_col: x_values})
             drill_columns = [x_col]
             if color_col:
@@ -150,13 +170,12 @@ class AreaPlot(BasePlot):
                     line_shape=interpolation,
                     show_markers=False,
                     fill="tozeroy" if index == 0 or mode == "overlay" else "tonexty",
-                    fill_base=fill_base,
+                    fill_base=fill_base.tolist(),
+                    webgl=large,
                     legendgroup=name,
                     custom_data={"drilldown": build_drill_down_payload(drill_frame, drill_columns)},
                 )
             )
-            if mode != "overlay":
-                baseline = upper
         return TraceBuildResult(traces=traces)
 
     @override
@@ -10,6 +10,7 @@ import pandas as pd
 from src.core.models.visualization.trace_build_result import TraceBuildResult
 from src.core.models.visualization.trace_config import BoxTraceConfig
 from src.core.services.visualization.palette_service import resolve_palette
+from src.core.services.visualization.row_partition import RowPartition
 from src.web.components.plotting.config import box_config
 from src.web.models.plot_models import PlotConfig
 from src.web.pages.ui.plotting.base_plot import BasePlot
@@ -29,10 +30,6 @@ def _ordered_values(series: pd.Series, configured: object = None) -> list[Any]:
     return ordered + [value for value in available if str(value) not in configured_labels]
 
 
-def _mask(series: pd.Series, value: Any) -> pd.Series:
-    return series.isna() if pd.isna(value) else series == value
-
-
 def _quartiles(values: np.ndarray, method: QuartileMethod) -> tuple[float, float, float]:
     if method == "linear" or len(values) == 1:
         result = np.quantile(values, (0.25, 0.5, 0.75), method="linear")
@@ -143,13 +140,11 @@ class BoxPlot(BasePlot):
         series_styles = config.get("series_styles", {})
         traces: list[BoxTraceConfig] = []
 
+        partition = RowPartition(data, [x_col, color_col] if color_col else [x_col])
         for category_index, category in enumerate(categories):
-            category_data = data[_mask(data[x_col], category)]
             for group_index, group in enumerate(groups):
                 subset = (
-                    category_data[_mask(category_data[color_col], group)]
-                    if color_col
-                    else category_data
+                    partition.rows(category, group) if color_col else partition.rows(category)
                 )
                 numeric = pd.to_numeric(subset[y_col], errors="coerce")
                 valid = numeric.notna()
@@ -10,6 +10,7 @@ import pandas as pd
 from src.core.models.visualization.trace_build_result import TraceBuildResult
 from src.core.models.visualization.trace_config import LineTraceConfig
 from src.core.services.visualization.palette_service import resolve_palette
+from src.core.services.visualization.row_partition import RowPartition
 from src.web.components.plotting.config import ecdf_config
 from src.web.models.plot_models import PlotConfig
 from src.web.pages.ui.plotting.base_plot import BasePlot
@@ -28,10 +29,6 @@ def _ordered_groups(series: pd.Series, configured: object = None) -> list[Any]:
     return ordered + [value for value in available if str(value) not in labels]
 
 
-def _mask(series: pd.Series, value: Any) -> pd.Series:
-    return series.isna() if pd.isna(value) else series == value
-
-
 class EcdfPlot(BasePlot):
     """Plot cumulative or complementary empirical distributions by group."""
 
@@ -69,8 +66,9 @@ class EcdfPlot(BasePlot):
         series_styles = config.get("series_styles", {})
         traces: list[LineTraceConfig] = []
 
+        partition = RowPartition(data, [color_col] if color_col else [])
         for group_index, group in enumerate(groups):
-            subset = data[_mask(data[color_col], group)] if color_col else data
+            subset = partition.rows(group) if color_col else data
             numeric = pd.to_numeric(subset[x_col], errors="coerce")
             values = numeric.loc[numeric.notna()].to_numpy(dtype=float)
             if not len(values):
@@ -94,8 +92,8 @@ class EcdfPlot(BasePlot):
             traces.append(
                 LineTraceConfig(
                     name=name,
-                    x=thresholds.astype(float).tolist(),
-                    y=ordinates.astype(float).tolist(),
+                    x=thresholds,
+                    y=ordinates,
                     color=color,
                     line_shape="hv",
                     show_markers=show_markers,
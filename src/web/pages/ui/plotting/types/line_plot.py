@@ -12,6 +12,11 @@ from src.core.models.visualization.trace_config import (
     LINE_SHAPES,
     LineTraceConfig,
 )
+from src.core.services.visualization.downsampling_service import (
+    is_large,
+    large_data_threshold,
+    reduce_for_display,
+)
 from src.web.components.plotting.config.base_plot_config import render_common_with_color
 from src.web.models.plot_models import PlotConfig
 from src.web.pages.ui.plotting.base_plot import BasePlot
@@ -154,6 +159,7 @@ class LinePlot(BasePlot):
         # Sort by x-axis to ensure correct line drawing order
         if x_col in data.columns:
             data = data.sort_values(by=x_col)
+        threshold = large_data_threshold(config)
 
         def _make_trace(
             grp_data: pd.DataFrame,
@@ -169,10 +175,19 @@ class LinePlot(BasePlot):
                 raise ValueError(f"Unknown line pattern: {line_dash!r}.")
             if marker_symbol not in LINE_MARKER_SYMBOLS:
                 raise ValueError(f"Unknown line marker symbol: {marker_symbol!r}.")
+            large = is_large(len(grp_data), threshold)
+            grp_data = reduce_for_display(
+                grp_data,
+                x_col,
+                y_col,
+                kind="line",
+                threshold=threshold,
+                x_range=config.get("range_x"),
+            )
             return LineTraceConfig(
                 name=str(group_name) if group_name is not None else y_col,
-                x=grp_data[x_col].tolist(),
-                y=grp_data[y_col].tolist(),
+                x=grp_data[x_col].to_numpy(),
+                y=grp_data[y_col].to_numpy(),
                 line_width=float(config.get("line_width", 2.0)),
                 line_dash=line_dash,
                 show_markers=bool(config.get("show_markers", True)),
@@ -180,7 +195,8 @@ class LinePlot(BasePlot):
                 marker_symbol=marker_symbol,
                 marker_size=int(config.get("marker_size", 6)),
                 connect_gaps=bool(config.get("connect_gaps", False)),
-                error_y=grp_data[sd_col].tolist() if sd_col else None,
+                error_y=grp_data[sd_col].to_numpy() if sd_col else None,
+                webgl=large,
                 custom_data={
                     "drilldown": build_drill_down_payload(
                         grp_data,
@@ -6,6 +6,11 @@ import pandas as pd
 
 from src.core.models.visualization.trace_build_result import TraceBuildResult
 from src.core.models.visualization.trace_config import ScatterTraceConfig
+from src.core.services.visualization.downsampling_service import (
+    is_large,
+    large_data_threshold,
+    reduce_for_display,
+)
 from src.web.components.plotting.config.base_plot_config import render_common_with_color
 from src.web.models.plot_models import PlotConfig
 from src.web.pages.ui.plotting.base_plot import BasePlot
@@ -32,17 +37,28 @@ class ScatterPlot(BasePlot):
         # [impl->req~ring5.plot.scatter~1]
         x_col: str = config["x"]
         y_col: str = config["y"]
+        threshold = large_data_threshold(config)
 
         def _make_trace(
             grp_data: pd.DataFrame,
             group_name: str | None,
             sd_col: str | None,
         ) -> ScatterTraceConfig:
+            large = is_large(len(grp_data), threshold)
+            grp_data = reduce_for_display(
+                grp_data,
+                x_col,
+                y_col,
+                kind="scatter",
+                threshold=threshold,
+                x_range=config.get("range_x"),
+            )
             return ScatterTraceConfig(
                 name=str(group_name) if group_name is not None else y_col,
-                x=grp_data[x_col].tolist(),
-                y=grp_data[y_col].tolist(),
-                error_y=grp_data[sd_col].tolist() if sd_col else None,
+                x=grp_data[x_col].to_numpy(),
+                y=grp_data[y_col].to_numpy(),
+                error_y=grp_data[sd_col].to_numpy() if sd_col else None,
+                webgl=large,
                 custom_data={
                     "drilldown": build_drill_down_payload(
                         grp_data,
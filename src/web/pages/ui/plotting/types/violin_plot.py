@@ -11,6 +11,7 @@ import pandas as pd
 from src.core.models.visualization.trace_build_result import TraceBuildResult
 from src.core.models.visualization.trace_config import ViolinTraceConfig
 from src.core.services.visualization.palette_service import resolve_palette
+from src.core.services.visualization.row_partition import RowPartition
 from src.web.components.plotting.config import violin_config
 from src.web.models.plot_models import PlotConfig
 from src.web.pages.ui.plotting.base_plot import BasePlot
@@ -47,10 +48,6 @@ def _ordered_values(series: pd.Series, configured: object = None) -> list[Any]:
     return ordered + [value for value in available if str(value) not in labels]
 
 
-def _mask(series: pd.Series, value: Any) -> pd.Series:
-    return series.isna() if pd.isna(value) else series == value
-
-
 def _kernel_bandwidth(
     values: np.ndarray[Any, np.dtype[np.float64]],
     method: BandwidthMethod,
@@ -151,13 +148,11 @@ class ViolinPlot(BasePlot):
         series_styles = config.get("series_styles", {})
         distributions: list[_Distribution] = []
 
+        partition = RowPartition(data, [x_col, color_col] if color_col else [x_col])
         for category_index, category in enumerate(categories):
-            category_data = data[_mask(data[x_col], category)]
             for group_index, group in enumerate(groups):
                 subset = (
-                    category_data[_mask(category_data[color_col], group)]
-                    if color_col
-                    else category_data
+                    partition.rows(category, group) if color_col else partition.rows(category)
                 )
                 numeric = pd.to_numeric(subset[y_col], errors="coerce")
                 valid = numeric.notna()
@@ -0,0 +1,332 @@
+"""Content-addressed, size-bounded on-disk cache for exported figure bytes.
+
+Reports, scheduled reports and recipe runs re-export the same figures over
+and over while the plot config and processed data stay unchanged. This cache
+stores each encoded artifact under a SHA-256 key built from everything that
+can change its bytes: the processed-data fingerprint and column semantics,
+plot type and config, engine, format, size/resolution options, the
+deterministic flag, the theme, and the renderer library versions (so an
+upgrade never serves stale output).
+
+Entries are plain files, ``<dir>/<key[:2]>/<key>.bin``, written atomically
+(temp file + ``os.replace``), so several processes may share one directory.
+A hit refreshes the entry's mtime; when the directory exceeds its byte
+budget the least recently used entries are evicted.
+
+The cache is opt-in: set ``RING5_EXPORT_CACHE_DIR`` (and optionally
+``RING5_EXPORT_CACHE_MB``, default 256) or call :func:`configure_export_cache`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from src.core.services.managers.semantic_metadata_service import SemanticMetadataService
+
+logger = logging.getLogger(__name__)
+
+EXPORT_CACHE_SCHEMA = 1
+DEFAULT_EXPORT_CACHE_MB = 256
+_ENTRY_SUFFIX = ".bin"
+_RENDERER_PACKAGES = ("kaleido", "matplotlib", "plotly")
+
+
+@dataclass(frozen=True)
+class ExportCacheStats:
+    """Counters for one cache instance plus the current on-disk footprint."""
+
+    hits: int
+    misses: int
+    stores: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def data_fingerprint(data: pd.DataFrame) -> str:
+    """Return a full-content SHA-256 digest of a DataFrame (schema, index and values)."""
+    schema = json.dumps(
+        {
+            "shape": data.shape,
+            "columns": [str(column) for column in data.columns],
+            "dtypes": [str(dtype) for dtype in data.dtypes],
+        },
+        sort_keys=True,
+    ).encode()
+    digest = hashlib.sha256(schema)
+    try:
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    except (TypeError, ValueError):
+        # Unhashable object cells: JSON still inspects every value deterministically.
+        digest.update(data.to_json(orient="split", date_format="iso", default_handler=str).encode())
+    return digest.hexdigest()
+
+
+def plot_identity(data: pd.DataFrame, plot_type: str, config: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the cache identity of a plot rendered from *data* with *config*.
+
+    The config is serialized immediately, so later edits to the live dict
+    cannot change the identity of an already rendered figure. Column labels
+    and units live in ``data.attrs`` rather than the values, and they feed the
+    axis titles, so they are part of the identity too.
+    """
+    semantics = SemanticMetadataService.to_payload(SemanticMetadataService.inspect(data))
+    return {
+        "data": data_fingerprint(data),
+        "semantics": json.dumps(semantics, sort_keys=True),
+        "plot_type": plot_type,
+        "config": json.dumps(dict(config), sort_keys=True, default=str),
+    }
+
+
+def active_theme(engine: str) -> str:
+    """Return a digest of the process-global styling that a config does not capture.
+
+    Matplotlib output depends on the live ``rcParams`` (``plt.style.use`` and
+    friends); Plotly output depends on the default template name.
+    """
+    if engine == "matplotlib":
+        import matplotlib
+
+        state = repr(sorted((key, repr(value)) for key, value in matplotlib.rcParams.items()))
+        return "mpl-" + hashlib.sha256(state.encode()).hexdigest()[:16]
+    import plotly.io as pio
+
+    return f"plotly-{pio.templates.default}"
+
+
+def _renderer_versions() -> dict[str, str]:
+    versions: dict[str, str] = {}
+    for package in _RENDERER_PACKAGES:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = "missing"
+    return versions
+
+
+_RENDERER_VERSIONS = _renderer_versions()
+
+
+def export_cache_key(
+    *,
+    identity: Mapping[str, Any],
+    engine: str,
+    fmt: str,
+    options: Mapping[str, Any],
+    deterministic: bool,
+    theme: str | None = None,
+) -> str:
+    """Return the content address of one export.
+
+    Args:
+        identity: What was drawn, e.g. ``{"data": data_fingerprint(df),
+            "plot_type": ..., "config": ...}`` or a figure's own serialization.
+        engine: ``"plotly"`` or ``"matplotlib"``.
+        fmt: Output format.
+        options: Size and resolution options (width/height/scale or dpi).
+        deterministic: Whether deterministic output was requested.
+        theme: Optional global theme identifier applied outside the config.
+
+    Returns:
+        A 64-character hex SHA-256 key.
+    """
+    payload = {
+        "schema": EXPORT_CACHE_SCHEMA,
+        "renderers": _RENDERER_VERSIONS,
+        "identity": identity,
+        "engine": engine,
+        "format": fmt,
+        "options": dict(options),
+        "deterministic": deterministic,
+        "theme": theme,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class ExportArtifactCache:
+    # [impl->req~ring5.export.batch-reports~1]
+    """Directory of encoded export artifacts, evicted least-recently-used first."""
+
+    def __init__(self, directory: str | Path, max_bytes: int) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+        self._estimated_bytes: int | None = None
+
+    def _entry_path(self, key: str) -> Path:
+        if len(key) != 64 or any(char not in "0123456789abcdef" for char in key):
+            raise ValueError(f"Invalid export cache key {key!r}")
+        return self.directory / key[:2] / f"{key}{_ENTRY_SUFFIX}"
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.directory.glob(f"??/*{_ENTRY_SUFFIX}"):
+            try:
+                status = path.stat()
+            except OSError:  # Evicted concurrently
+                continue
+            entries.append((status.st_mtime, status.st_size, path))
+        return entries
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached bytes for *key*, or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            data = None
+        with self._lock:
+            if data is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store *data* under *key*, then evict until the byte budget holds.
+
+        Artifacts larger than the whole budget are not stored. Write failures
+        are logged and ignored: the cache must never fail an export.
+        """
+        if len(data) > self.max_bytes:
+            return
+        path = self._entry_path(key)
+        temporary: Path | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=path.parent, prefix=".tmp-", suffix=".part", delete=False
+            ) as handle:
+                temporary = Path(handle.name)
+                handle.write(data)
+            os.replace(temporary, path)
+        except OSError as exc:
+            logger.warning("Could not store export cache entry %s: %s", key[:12], exc)
+            if temporary is not None:
+                temporary.unlink(missing_ok=True)
+            return
+        with self._lock:
+            self._stores += 1
+            # Rescan the directory only once the running estimate crosses the
+            # budget; other processes sharing it make the estimate approximate.
+            if self._estimated_bytes is None:
+                self._estimated_bytes = sum(size for _mtime, size, _path in self._entries())
+            else:
+                self._estimated_bytes += len(data)
+            if self._estimated_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _mtime, size, _path in entries)
+        self._estimated_bytes = total
+        if total <= self.max_bytes:
+            return
+        for _mtime, size, path in sorted(entries, key=lambda entry: entry[0]):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            self._evictions += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+        self._estimated_bytes = total
+
+    def clear(self) -> None:
+        """Remove every cached entry (counters are kept)."""
+        with self._lock:
+            for _mtime, _size, path in self._entries():
+                path.unlink(missing_ok=True)
+            self._estimated_bytes = 0
+
+    def stats(self) -> ExportCacheStats:
+        """Return hit/miss/store/eviction counters and the current footprint."""
+        entries = self._entries()
+        with self._lock:
+            return ExportCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stores=self._stores,
+                evictions=self._evictions,
+                entries=len(entries),
+                bytes=sum(size for _mtime, size, _path in entries),
+                max_bytes=self.max_bytes,
+            )
+
+
+def _configured_max_bytes() -> int:
+    value = os.environ.get("RING5_EXPORT_CACHE_MB", "").strip()
+    try:
+        megabytes = int(value) if value else DEFAULT_EXPORT_CACHE_MB
+    except ValueError:
+        logger.warning("Ignoring non-integer RING5_EXPORT_CACHE_MB=%r", value)
+        megabytes = DEFAULT_EXPORT_CACHE_MB
+    return max(1, megabytes) * 1024 * 1024
+
+
+_cache_instance: ExportArtifactCache | None = None
+_cache_lock = threading.Lock()
+
+
+def configure_export_cache(
+    directory: str | Path | None, *, max_bytes: int | None = None
+) -> ExportArtifactCache | None:
+    """Install (or, with ``directory=None``, remove) the process-wide export cache.
+
+    Args:
+        directory: Cache directory, created on first store.
+        max_bytes: Byte budget; ``None`` reads ``RING5_EXPORT_CACHE_MB``.
+
+    Returns:
+        The installed cache, or None when disabled.
+    """
+    global _cache_instance
+
+    with _cache_lock:
+        _cache_instance = (
+            None
+            if directory is None
+            else ExportArtifactCache(directory, max_bytes or _configured_max_bytes())
+        )
+        return _cache_instance
+
+
+def get_export_cache() -> ExportArtifactCache | None:
+    """Return the configured cache, creating it from ``RING5_EXPORT_CACHE_DIR`` if set."""
+    global _cache_instance
+
+    with _cache_lock:
+        if _cache_instance is None:
+            directory = os.environ.get("RING5_EXPORT_CACHE_DIR", "").strip()
+            if directory:
+                _cache_instance = ExportArtifactCache(directory, _configured_max_bytes())
+        return _cache_instance
@@ -5,8 +5,9 @@ deterministic-output knobs CI regression needs. The download UI
 (``src/web/pages/ui/plotting/download_section.py``) and the public
 ``ring5`` package both build on this module.
 
-**Plotly path**: Kaleido v1 (``kaleido.calc_fig_sync``) for PNG/SVG/PDF,
-``fig.to_html()`` for interactive HTML.
+**Plotly path**: Kaleido v1 (``kaleido.calc_fig_sync``, or the warm browsers
+of ``kaleido_render_service`` when enabled) for PNG/SVG/PDF, ``fig.to_html()``
+for interactive HTML.
 **Matplotlib path**: ``savefig`` for PDF/PGF/PNG/SVG.
 
 Determinism notes (byte-identical re-exports of the same figure):
@@ -26,7 +27,7 @@ import logging
 import os
 import re
 import threading
-from typing import TYPE_CHECKING, Any, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, Sequence, cast
 
 import kaleido
 import matplotlib.pyplot as plt
@@ -35,6 +36,7 @@ from kaleido.errors import ChromeNotFoundError
 from matplotlib.figure import Figure as MplFigure
 
 from src.core.models.visualization.figure_config import FigureConfig
+from src.web.rendering.kaleido_render_service import get_render_service
 from src.web.rendering.latex_security import disabled_figure_usetex, escaped_figure_text
 
 if TYPE_CHECKING:
@@ -52,8 +54,8 @@ MatplotlibFormat = Literal["pdf", "pgf", "png", "svg"]
 # can intermittently stall under load. Plotly's ``fig.to_image()`` hardcodes a
 # single 90s-timeout attempt, so a stall blocks for ~90s and then fails. We
 # instead drive Kaleido directly with a short per-attempt timeout and retry —
-# each attempt is a fresh oneshot Chrome (the app starts no persistent Kaleido
-# server), so a retry recovers from a wedged browser.
+# each attempt is a fresh oneshot Chrome, or a pooled browser that the render
+# service relaunches after a stall, so a retry recovers from a wedged browser.
 _KALEIDO_ATTEMPT_TIMEOUT_S: int = 25
 _KALEIDO_ATTEMPTS: int = 3
 
@@ -239,8 +241,79 @@ def plotly_download_bytes(
     # Raster/vector via Kaleido — driven directly (not via fig.to_image) so we
     # can bound each attempt and retry with a fresh Chrome on a stall. For
     # vector formats scale has no effect, but the API accepts it.
-    fig_dict = fig.to_dict()
     opts = {"format": fmt, "width": width, "height": height, "scale": scale}
+    data = _render_with_retries(fig.to_dict(), opts, fmt)
+    return _finish_plotly_bytes(data, fmt, deterministic)
+
+
+def plotly_download_batch(
+    figs: Sequence[go.Figure],
+    fmt: PlotlyFormat,
+    *,
+    width: int = 700,
+    height: int = 400,
+    scale: int = 2,
+    deterministic: bool = False,
+) -> list[bytes]:
+    # [impl->req~ring5.export.plotly-static~1]
+    """Export several Plotly figures in one format, preserving input order.
+
+    With the Kaleido render service running (``RING5_KALEIDO_WORKERS``), the
+    whole batch is queued at once and spread across the warm browsers; a
+    figure whose pooled render fails falls back to the per-figure retry path.
+    Without the service each figure goes through :func:`plotly_download_bytes`.
+
+    Raises:
+        ValueError: If *fmt* is not a supported format.
+        kaleido.errors.ChromeNotFoundError: No Chrome-family browser is available.
+    """
+    if fmt not in _FORMAT_MIME:
+        raise ValueError(
+            f"Unsupported format {fmt!r}. " f"Choose from {list(_FORMAT_MIME.keys())}."
+        )
+    service = get_render_service()
+    if fmt == "html" or service is None:
+        return [
+            plotly_download_bytes(
+                fig, fmt, width=width, height=height, scale=scale, deterministic=deterministic
+            )
+            for fig in figs
+        ]
+
+    opts = {"format": fmt, "width": width, "height": height, "scale": scale}
+    fig_dicts = [fig.to_dict() for fig in figs]
+    futures = [service.submit(fig_dict, opts) for fig_dict in fig_dicts]
+    results: list[bytes] = []
+    for fig_dict, future in zip(fig_dicts, futures):
+        try:
+            data = future.result()
+        except ChromeNotFoundError:
+            raise
+        except Exception as exc:  # Recycled browser; retry this figure alone
+            logger.warning("Pooled Kaleido %s render failed (%s); retrying", fmt, exc)
+            data = _render_with_retries(fig_dict, opts, fmt)
+        results.append(_finish_plotly_bytes(data, fmt, deterministic))
+    return results
+
+
+def _finish_plotly_bytes(data: bytes, fmt: PlotlyFormat, deterministic: bool) -> bytes:
+    """Apply the deterministic SVG/PDF normalization to rendered bytes."""
+    if deterministic:
+        if fmt == "svg":
+            return _normalize_plotly_svg(data)
+        if fmt == "pdf":
+            return _normalize_plotly_pdf(data)
+    return data
+
+
+def _render_with_retries(fig_dict: dict[str, Any], opts: dict[str, Any], fmt: str) -> bytes:
+    """Render through the warm service when running, else a oneshot Chrome.
+
+    Each failed attempt is retried up to ``_KALEIDO_ATTEMPTS`` times: the
+    service recycles the browser that failed, and the oneshot path starts a
+    fresh one, so a retry never reuses a wedged Chrome.
+    """
+    service = get_render_service()
     kaleido_options: dict[str, Any] = {"timeout": _KALEIDO_ATTEMPT_TIMEOUT_S}
     configured_browser = os.environ.get("BROWSER_PATH")
     if configured_browser:
@@ -248,7 +321,9 @@ def plotly_download_bytes(
     last_exc: Exception | None = None
     for attempt in range(1, _KALEIDO_ATTEMPTS + 1):
         try:
-            data = cast(
+            if service is not None:
+                return service.render(fig_dict, opts)
+            return cast(
                 bytes,
                 kaleido.calc_fig_sync(
                     fig_dict,
@@ -256,12 +331,6 @@ def plotly_download_bytes(
                     kopts=kaleido_options,
                 ),
             )
-            if deterministic:
-                if fmt == "svg":
-                    data = _normalize_plotly_svg(data)
-                elif fmt == "pdf":
-                    data = _normalize_plotly_pdf(data)
-            return data
         except ChromeNotFoundError:
             # No browser installed — retrying cannot help; propagate the
             # upstream error (its message carries the install instructions).
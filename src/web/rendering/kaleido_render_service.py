@@ -0,0 +1,352 @@
+"""Long-lived Kaleido render service for Plotly static exports.
+
+``kaleido.calc_fig_sync`` launches a oneshot Chrome per figure, so a batch
+of exports pays the browser start-up cost once per image. This service keeps
+``workers`` Chrome processes warm, each owned by one slot thread with its own
+asyncio loop, and feeds them figures from a shared FIFO queue.
+
+A slot recycles its browser (close + relaunch) when a render stalls past the
+per-render timeout, when a render fails (browser state is unknown), and after
+``recycle_after`` successful renders to bound Chrome's memory growth.
+
+The service is opt-in: set ``RING5_KALEIDO_WORKERS`` to a positive count (or
+call :func:`start_render_service`) and ``plotly_download_bytes`` routes its
+attempts through it; otherwise exports keep the oneshot path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import os
+import queue
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Sequence, cast
+
+import kaleido
+from kaleido.errors import ChromeNotFoundError
+
+logger = logging.getLogger(__name__)
+
+#: Per-render timeout before a render counts as a stall.
+DEFAULT_RENDER_TIMEOUT_S = 25.0
+#: Successful renders before a browser is relaunched.
+DEFAULT_RECYCLE_AFTER = 100
+#: Upper bound on waiting for a browser to close during recycling.
+BROWSER_CLOSE_TIMEOUT_S = 10.0
+#: Recent render latencies kept for the statistics window.
+MAX_LATENCY_SAMPLES = 256
+
+RenderOptions = dict[str, Any]
+
+
+@dataclass
+class _RenderJob:
+    """One queued figure with the future its caller waits on."""
+
+    fig_dict: dict[str, Any]
+    opts: RenderOptions
+    future: Future[bytes] = field(default_factory=Future)
+
+
+class _BrowserSlot(threading.Thread):
+    """A worker thread that owns one warm Kaleido browser."""
+
+    def __init__(self, service: KaleidoRenderService, index: int) -> None:
+        super().__init__(name=f"ring5-kaleido-{index}", daemon=True)
+        self._service = service
+        self._loop = asyncio.new_event_loop()
+        self._browser: kaleido.Kaleido | None = None
+        self._renders_since_launch = 0
+
+    def run(self) -> None:
+        """Warm a browser, then serve queued renders until the shutdown sentinel.
+
+        A failed warm-up is logged and retried by the first job. The browser is
+        recycled after a stall, a render error, or ``recycle_after`` renders,
+        and is closed together with the slot's event loop on exit.
+        """
+        try:
+            self._ensure_browser()
+        except Exception as exc:  # Warm-up failure; retried on the first job
+            logger.warning("Kaleido warm-up failed: %s", exc)
+        try:
+            while True:
+                job = self._service._jobs.get()
+                if job is None:
+                    break
+                self._render(job)
+        finally:
+            self._close_browser()
+            self._loop.close()
+
+    def _ensure_browser(self) -> kaleido.Kaleido:
+        if self._browser is None:
+            self._browser = self._loop.run_until_complete(self._open_browser())
+            self._renders_since_launch = 0
+            self._service._record_launch()
+        return self._browser
+
+    async def _open_browser(self) -> kaleido.Kaleido:
+        # Kaleido allocates asyncio primitives, so build it inside this loop.
+        browser = kaleido.Kaleido(**self._service._kaleido_options())
+        await browser.__aenter__()
+        return browser
+
+    def _close_browser(self) -> None:
+        browser, self._browser = self._browser, None
+        if browser is None:
+            return
+        try:
+            self._loop.run_until_complete(
+                asyncio.wait_for(browser.__aexit__(None, None, None), BROWSER_CLOSE_TIMEOUT_S)
+            )
+        except Exception as exc:  # A wedged browser must not block the slot
+            logger.warning("Kaleido browser did not close cleanly: %s", exc)
+
+    def _recycle(self, reason: str) -> None:
+        self._close_browser()
+        self._service._record_recycle(reason)
+
+    def _render(self, job: _RenderJob) -> None:
+        if not job.future.set_running_or_notify_cancel():
+            return
+        service = self._service
+        service._render_started()
+        started = time.perf_counter()
+        try:
+            browser = self._ensure_browser()
+            coro = browser.calc_fig(job.fig_dict, opts=cast(Any, job.opts))
+            data = self._loop.run_until_complete(asyncio.wait_for(coro, service.render_timeout))
+        except ChromeNotFoundError as exc:
+            service._render_finished(None)
+            job.future.set_exception(exc)
+            return
+        except (asyncio.TimeoutError, TimeoutError) as exc:
+            service._render_finished(None)
+            self._recycle("stall")
+            job.future.set_exception(
+                TimeoutError(f"Kaleido render stalled for {service.render_timeout:g}s")
+            )
+            logger.debug("Kaleido render stalled: %s", exc)
+            return
+        except Exception as exc:
+            service._render_finished(None)
+            self._recycle("error")
+            job.future.set_exception(exc)
+            return
+        service._render_finished(time.perf_counter() - started)
+        job.future.set_result(cast(bytes, data))
+        self._renders_since_launch += 1
+        if self._renders_since_launch >= service.recycle_after:
+            self._recycle("render-limit")
+
+
+class KaleidoRenderService:
+    # [impl->req~ring5.export.plotly-static~1]
+    """Pool of warm Kaleido browsers serving Plotly static renders."""
+
+    def __init__(
+        self,
+        workers: int = 1,
+        *,
+        render_timeout: float = DEFAULT_RENDER_TIMEOUT_S,
+        recycle_after: int = DEFAULT_RECYCLE_AFTER,
+        browser_path: str | None = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if render_timeout <= 0:
+            raise ValueError("render_timeout must be positive")
+        if recycle_after < 1:
+            raise ValueError("recycle_after must be at least 1")
+        self.workers = workers
+        self.render_timeout = render_timeout
+        self.recycle_after = recycle_after
+        self.browser_path = browser_path
+        self._jobs: queue.Queue[_RenderJob | None] = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=MAX_LATENCY_SAMPLES)
+        self._active = 0
+        self._renders = 0
+        self._failures = 0
+        self._launches = 0
+        self._recycles: dict[str, int] = {}
+        self._closed = False
+        self._slots = [_BrowserSlot(self, index) for index in range(workers)]
+        for slot in self._slots:
+            slot.start()
+
+    def _kaleido_options(self) -> dict[str, Any]:
+        options: dict[str, Any] = {"n": 1, "timeout": self.render_timeout}
+        if self.browser_path:
+            options["path"] = self.browser_path
+        return options
+
+    def submit(self, fig_dict: dict[str, Any], opts: RenderOptions) -> Future[bytes]:
+        """Queue one figure dictionary and return a future for its bytes."""
+        if self._closed:
+            raise RuntimeError("Kaleido render service is shut down")
+        job = _RenderJob(fig_dict, dict(opts))
+        self._jobs.put(job)
+        return job.future
+
+    def render(self, fig_dict: dict[str, Any], opts: RenderOptions) -> bytes:
+        """Render one figure dictionary, blocking until its bytes are ready."""
+        return self.submit(fig_dict, opts).result()
+
+    def render_batch(self, items: Sequence[tuple[dict[str, Any], RenderOptions]]) -> list[bytes]:
+        """Render ``(fig_dict, opts)`` pairs across the warm browsers.
+
+        All figures are queued before any result is awaited, so the batch
+        spreads over every slot. Results keep the input order; the first
+        failure is raised after the remaining renders have been queued.
+        """
+        futures = [self.submit(fig_dict, opts) for fig_dict, opts in items]
+        return [future.result() for future in futures]
+
+    def _record_launch(self) -> None:
+        with self._stats_lock:
+            self._launches += 1
+
+    def _record_recycle(self, reason: str) -> None:
+        with self._stats_lock:
+            self._recycles[reason] = self._recycles.get(reason, 0) + 1
+        logger.debug("Recycled a Kaleido browser (%s)", reason)
+
+    def _render_started(self) -> None:
+        with self._stats_lock:
+            self._active += 1
+
+    def _render_finished(self, latency: float | None) -> None:
+        with self._stats_lock:
+            self._active -= 1
+            if latency is None:
+                self._failures += 1
+            else:
+                self._renders += 1
+                self._latencies.append(latency)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return queue depth, render counts, recycles and recent latency."""
+        with self._stats_lock:
+            latencies = sorted(self._latencies)
+            stats: dict[str, Any] = {
+                "workers": self.workers,
+                "alive_workers": sum(1 for slot in self._slots if slot.is_alive()),
+                "queue_depth": self._jobs.qsize(),
+                "active_renders": self._active,
+                "renders": self._renders,
+                "failures": self._failures,
+                "browser_launches": self._launches,
+                "recycles": dict(self._recycles),
+                "latency_samples": len(latencies),
+                "last_latency_s": self._latencies[-1] if latencies else None,
+                "mean_latency_s": statistics.fmean(latencies) if latencies else None,
+                "p95_latency_s": (
+                    latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+                    if latencies
+                    else None
+                ),
+                "max_latency_s": latencies[-1] if latencies else None,
+            }
+        return stats
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Fail queued renders, stop the slots and close their browsers."""
+        if self._closed:
+            return
+        self._closed = True
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None and job.future.set_running_or_notify_cancel():
+                job.future.set_exception(RuntimeError("Kaleido render service is shut down"))
+        for _ in self._slots:
+            self._jobs.put(None)
+        for slot in self._slots:
+            slot.join(timeout)
+
+
+def _configured_workers() -> int:
+    """Return ``RING5_KALEIDO_WORKERS`` (0, the default, disables the service)."""
+    raw = os.environ.get("RING5_KALEIDO_WORKERS", "").strip()
+    if not raw:
+        return 0
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("Ignoring invalid RING5_KALEIDO_WORKERS=%r", raw)
+        return 0
+
+
+def _configured_recycle_after() -> int:
+    raw = os.environ.get("RING5_KALEIDO_RECYCLE_RENDERS", "").strip()
+    try:
+        return max(1, int(raw)) if raw else DEFAULT_RECYCLE_AFTER
+    except ValueError:
+        logger.warning("Ignoring invalid RING5_KALEIDO_RECYCLE_RENDERS=%r", raw)
+        return DEFAULT_RECYCLE_AFTER
+
+
+_service_instance: KaleidoRenderService | None = None
+_service_lock = threading.Lock()
+
+
+def start_render_service(
+    workers: int | None = None,
+    *,
+    render_timeout: float = DEFAULT_RENDER_TIMEOUT_S,
+    recycle_after: int | None = None,
+) -> KaleidoRenderService:
+    """Start (or return) the process-wide render service.
+
+    Args:
+        workers: Warm browsers to keep. ``None`` reads ``RING5_KALEIDO_WORKERS``
+            and falls back to one.
+        render_timeout: Seconds before a render counts as a stall.
+        recycle_after: Renders per browser before relaunch. ``None`` reads
+            ``RING5_KALEIDO_RECYCLE_RENDERS`` (default 100).
+
+    Returns:
+        The running KaleidoRenderService (options apply only on first start).
+    """
+    global _service_instance
+
+    with _service_lock:
+        if _service_instance is None:
+            _service_instance = KaleidoRenderService(
+                workers or _configured_workers() or 1,
+                render_timeout=render_timeout,
+                recycle_after=recycle_after or _configured_recycle_after(),
+                browser_path=os.environ.get("BROWSER_PATH") or None,
+            )
+            atexit.register(shutdown_render_service)
+        return _service_instance
+
+
+def get_render_service() -> KaleidoRenderService | None:
+    """Return the running service, starting it when ``RING5_KALEIDO_WORKERS`` asks for one."""
+    if _service_instance is not None:
+        return _service_instance
+    if _configured_workers() > 0:
+        return start_render_service()
+    return None
+
+
+def shutdown_render_service() -> None:
+    """Stop the process-wide render service, if one is running."""
+    global _service_instance
+
+    with _service_lock:
+        if _service_instance is not None:
+            _service_instance.shutdown()
+            _service_instance = None
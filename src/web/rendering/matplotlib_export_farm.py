@@ -0,0 +1,265 @@
+"""Process-pool Matplotlib export farm.
+
+``matplotlib_download_bytes`` serializes every export on ``_MPL_EXPORT_LOCK``
+because ``savefig``, ``rc_context`` and the ``SOURCE_DATE_EPOCH`` round-trip
+are process-global. The farm sidesteps the lock rather than loosening it:
+it ships a picklable figure description (the plot config, plot type and
+engine-agnostic ``TraceBuildResult``) to worker processes, each of which
+rebuilds the figure with ``build_matplotlib_figure_from_traces`` and exports
+it with ``matplotlib_download_bytes`` under its own, uncontended lock. The
+builder and exporter are the same code the in-process path runs, and the
+worker applies the ``rcParams`` that were live when the figure was rendered,
+so deterministic exports are byte-identical either way. A figure whose style
+changed between rendering and export is exported in-process instead.
+
+The farm is opt-in: set ``RING5_MPL_EXPORT_WORKERS`` to a worker count (or
+``auto`` for one per CPU), or call :func:`start_export_farm`. Workers use the
+``spawn`` start method so no parent thread or pyplot state is inherited.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import matplotlib
+from matplotlib.figure import Figure as MplFigure
+
+from src.core.models.visualization.trace_build_result import TraceBuildResult
+from src.web.rendering.figure_export import MatplotlibFormat
+
+if TYPE_CHECKING:
+    from matplotlib.typing import RcKeyType
+
+logger = logging.getLogger(__name__)
+
+#: Figure attribute carrying the render-time :class:`MatplotlibFigureSource`.
+FIGURE_SOURCE_ATTR = "_ring5_source"
+# Workers pin their own headless backend, so it is never copied from the parent.
+_PROCESS_RC_KEYS = frozenset({"backend"})
+
+
+def rc_params_snapshot() -> dict[RcKeyType, Any]:
+    """Return the live Matplotlib ``rcParams`` a worker needs to reproduce a figure."""
+    return {
+        key: value for key, value in matplotlib.rcParams.items() if key not in _PROCESS_RC_KEYS
+    }
+
+
+@dataclass(frozen=True)
+class MatplotlibFigureSource:
+    """Picklable inputs ``build_matplotlib_figure_from_traces`` needs to rebuild a figure.
+
+    Attributes:
+        config: The plot's config dict at render time.
+        plot_type: Plot registry key.
+        traces: Engine-agnostic trace build result (post legend relabel).
+        fingerprint: :func:`figure_fingerprint` of the rendered figure, used to
+            detect edits made to the figure after rendering.
+        rc_params: :func:`rc_params_snapshot` taken at render time; spawned
+            workers start from the defaults, so they rebuild under these.
+    """
+
+    config: dict[str, Any]
+    plot_type: str
+    traces: TraceBuildResult
+    fingerprint: tuple[Any, ...] = ()
+    rc_params: dict[RcKeyType, Any] = field(default_factory=rc_params_snapshot)
+
+
+@dataclass(frozen=True)
+class MatplotlibExportJob:
+    """One farm export: a figure description plus the export options."""
+
+    source: MatplotlibFigureSource
+    fmt: MatplotlibFormat
+    dpi: int = 300
+    deterministic: bool = False
+
+
+def figure_fingerprint(fig: MplFigure) -> tuple[Any, ...]:
+    """Return a cheap summary of a figure's visible state.
+
+    Covers size, axes count and each axes' titles, labels, limits and artist
+    count, which is enough to notice the usual post-render edits (retitling,
+    relabelling, rescaling, adding artists) that a rebuilt figure would lose.
+    """
+    axes_state = tuple(
+        (
+            ax.get_title(),
+            ax.get_xlabel(),
+            ax.get_ylabel(),
+            tuple(ax.get_xlim()),
+            tuple(ax.get_ylim()),
+            len(ax.get_children()),
+        )
+        for ax in fig.axes
+    )
+    return (tuple(fig.get_size_inches()), len(fig.texts), axes_state)
+
+
+def figure_source(fig: MplFigure) -> MatplotlibFigureSource | None:
+    """Return the figure's render-time source, or None if absent or edited since.
+
+    A source is also rejected once the live ``rcParams`` differ from its
+    render-time snapshot: the in-process export then saves under the new
+    style, which a rebuilt figure could not reproduce.
+    """
+    source = getattr(fig, FIGURE_SOURCE_ATTR, None)
+    if not isinstance(source, MatplotlibFigureSource):
+        return None
+    if source.fingerprint != figure_fingerprint(fig):
+        return None
+    if source.rc_params != rc_params_snapshot():
+        return None
+    return source
+
+
+def _initialize_worker() -> None:
+    """Pin the headless backend before any pyplot import in the worker."""
+    matplotlib.use("Agg")
+
+
+def export_job_bytes(job: MatplotlibExportJob) -> bytes:
+    """Build the described figure and export it (the worker-side entry point)."""
+    import matplotlib.pyplot as plt
+
+    from src.web.rendering.figure_export import matplotlib_download_bytes
+    from src.web.rendering.matplotlib_figure_builder import build_matplotlib_figure_from_traces
+
+    source = job.source
+    with matplotlib.rc_context(source.rc_params):
+        fig, spec = build_matplotlib_figure_from_traces(
+            source.config, source.plot_type, source.traces
+        )
+        try:
+            return matplotlib_download_bytes(
+                fig, job.fmt, dpi=job.dpi, spec=spec, deterministic=job.deterministic
+            )
+        finally:
+            plt.close(fig)
+
+
+def _configured_workers() -> int:
+    """Return ``RING5_MPL_EXPORT_WORKERS`` (unset or 0 leaves the farm off)."""
+    value = os.environ.get("RING5_MPL_EXPORT_WORKERS", "").strip().lower()
+    if not value:
+        return 0
+    if value == "auto":
+        return os.cpu_count() or 1
+    try:
+        return max(0, int(value))
+    except ValueError:
+        logger.warning("Ignoring non-integer RING5_MPL_EXPORT_WORKERS=%r", value)
+        return 0
+
+
+class MatplotlibExportFarm:
+    # [impl->req~ring5.export.matplotlib-standard~1]
+    """A pool of worker processes exporting described Matplotlib figures."""
+
+    def __init__(self, workers: int) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_initialize_worker,
+                )
+            return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        with self._executor_lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, job: MatplotlibExportJob) -> Future[bytes]:
+        """Queue one export and return a future for its bytes."""
+        return self._get_executor().submit(export_job_bytes, job)
+
+    def export(self, job: MatplotlibExportJob) -> bytes:
+        """Export one described figure, blocking until the bytes are ready.
+
+        A crashed worker breaks the whole executor; the broken pool is
+        discarded so the next export starts a fresh one, and the job is
+        retried once on it.
+        """
+        executor = self._get_executor()
+        try:
+            return executor.submit(export_job_bytes, job).result()
+        except BrokenProcessPool:
+            self._discard_executor(executor)
+            logger.warning("Matplotlib export worker died; restarting the farm")
+        return self._get_executor().submit(export_job_bytes, job).result()
+
+    def export_many(self, jobs: Sequence[MatplotlibExportJob]) -> list[bytes]:
+        """Export several described figures in parallel, preserving input order."""
+        futures = [self.submit(job) for job in jobs]
+        return [future.result() for future in futures]
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_farm_instance: MatplotlibExportFarm | None = None
+_farm_lock = threading.Lock()
+
+
+def start_export_farm(workers: int | None = None) -> MatplotlibExportFarm:
+    """Start (or return) the process-wide export farm.
+
+    Args:
+        workers: Worker processes (only used on first call). ``None`` reads
+            ``RING5_MPL_EXPORT_WORKERS`` and falls back to one per CPU.
+
+    Returns:
+        The running MatplotlibExportFarm.
+    """
+    global _farm_instance
+
+    with _farm_lock:
+        if _farm_instance is None:
+            _farm_instance = MatplotlibExportFarm(
+                workers or _configured_workers() or os.cpu_count() or 1
+            )
+            atexit.register(shutdown_export_farm)
+        return _farm_instance
+
+
+def get_export_farm() -> MatplotlibExportFarm | None:
+    """Return the running farm, starting it when ``RING5_MPL_EXPORT_WORKERS`` asks for one."""
+    if _farm_instance is not None:
+        return _farm_instance
+    if _configured_workers() > 0:
+        return start_export_farm()
+    return None
+
+
+def shutdown_export_farm() -> None:
+    """Stop the process-wide export farm, if one is running."""
+    global _farm_instance
+
+    with _farm_lock:
+        if _farm_instance is not None:
+            _farm_instance.shutdown()
+            _farm_instance = None
@@ -30,6 +30,7 @@ from matplotlib.cm import ScalarMappable
 from matplotlib.colors import Normalize
 from matplotlib.patches import PathPatch, Rectangle
 from matplotlib.path import Path
+from numpy.typing import NDArray
 
 from src.core.models.visualization.trace_config import (
     BarTraceConfig,
@@ -51,13 +52,34 @@ from src.web.rendering._render_result import MatplotlibRenderResult
 logger = logging.getLogger(__name__)
 
 
+def _float_values(values: Any) -> NDArray[np.float64]:
+    """Return point data as a float array with ``None``/non-numeric entries as NaN."""
+    try:
+        return np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        cleaned: list[float] = []
+        for value in values:
+            try:
+                cleaned.append(float(value))
+            except (TypeError, ValueError):
+                cleaned.append(float("nan"))
+        return np.asarray(cleaned, dtype=float)
+
+
+def _take(values: Any, indices: NDArray[np.intp]) -> Any:
+    """Select *indices* from a list or array without boxing array elements."""
+    if isinstance(values, np.ndarray):
+        return values[indices]
+    return [values[index] for index in indices]
+
+
 def _spline_coordinates(
     ax: Axes,
-    x_values: list[Any],
-    y_values: list[float],
+    x_values: Any,
+    y_values: NDArray[np.float64],
 ) -> tuple[list[float], list[float], list[int], list[float]] | None:
     """Return a smooth curve containing every original marker coordinate."""
-    if len(x_values) < 3 or not all(np.isfinite(y_values)):
+    if len(x_values) < 3 or not np.all(np.isfinite(y_values)):
         return None
     try:
         ax.xaxis.update_units(x_values)
@@ -71,7 +93,7 @@ def _spline_coordinates(
 
     dense_x = np.linspace(source_x[0], source_x[-1], max(80, len(source_x) * 24))
     dense_x = np.unique(np.concatenate((dense_x, source_x)))
-    spline = make_interp_spline(source_x, np.asarray(y_values), k=min(3, len(source_x) - 1))
+    spline = make_interp_spline(source_x, y_values, k=min(3, len(source_x) - 1))
     dense_y = spline(dense_x)
     marker_indices = [int(np.searchsorted(dense_x, value)) for value in source_x]
     return dense_x.tolist(), dense_y.tolist(), marker_indices, source_x.tolist()
@@ -424,21 +446,16 @@ class MatplotlibTraceRenderer:
             if spec.marker_size:
                 props["markersize"] = float(spec.marker_size)
 
-        y_clean: list[float] = []
-        for value in spec.y:
-            try:
-                y_clean.append(float(value))
-            except (TypeError, ValueError):
-                y_clean.append(float("nan"))
-        source_indices = list(range(len(y_clean)))
-        x_values: list[Any] = list(spec.x)
+        y_clean = _float_values(spec.y)
+        source_indices = np.arange(len(y_clean))
+        x_values: Any = spec.x
         if spec.connect_gaps:
-            source_indices = [index for index, value in enumerate(y_clean) if np.isfinite(value)]
-            x_values = [x_values[index] for index in source_indices]
-            y_clean = [y_clean[index] for index in source_indices]
+            source_indices = np.flatnonzero(np.isfinite(y_clean))
+            x_values = _take(spec.x, source_indices)
+            y_clean = y_clean[source_indices]
 
-        rendered_x: list[Any] = x_values
-        rendered_y = y_clean
+        rendered_x: Any = x_values
+        rendered_y: Any = y_clean
         source_x: list[float] | None = None
         if spec.line_shape == "spline":
             smoothed = _spline_coordinates(ax, x_values, y_clean)
@@ -449,10 +466,13 @@ class MatplotlibTraceRenderer:
 
         ax.plot(rendered_x, rendered_y, label=spec.name, **props)
         if spec.fill != "none":
-            raw_baseline = spec.fill_base or [0.0] * len(spec.y)
-            baseline = [float(raw_baseline[index]) for index in source_indices]
+            baseline = (
+                _float_values(spec.fill_base)[source_indices]
+                if spec.fill_base is not None and len(spec.fill_base)
+                else np.zeros(len(source_indices))
+            )
             if source_x is not None:
-                baseline = np.interp(rendered_x, source_x, baseline).tolist()
+                baseline = np.interp(rendered_x, source_x, baseline)
             step: Literal["pre", "post", "mid"] | None = None
             if spec.line_shape == "hv":
                 step = "post"
@@ -850,8 +870,7 @@ class MatplotlibTraceRenderer:
         if spec.marker_size:
             props["s"] = spec.marker_size
 
-        y_clean = [float(v) if v is not None else np.nan for v in spec.y]
-        ax.scatter(spec.x, y_clean, label=spec.name, **props)
+        ax.scatter(spec.x, _float_values(spec.y), label=spec.name, **props)
 
     # histogram
     @staticmethod
@@ -866,8 +885,7 @@ class MatplotlibTraceRenderer:
         if color:
             props["color"] = color
 
-        x_clean = [float(v) if v is not None else np.nan for v in spec.x]
-        ax.hist(x_clean, bins=spec.nbins, label=spec.name, **props)
+        ax.hist(_float_values(spec.x), bins=spec.nbins, label=spec.name, **props)
 
     # heatmap
     @staticmethod
@@ -8,6 +8,7 @@ import base64
 import io
 import textwrap
 from collections.abc import Sequence
+from dataclasses import asdict
 from datetime import datetime, timezone
 from html import escape
 from typing import Literal, cast
@@ -24,6 +25,12 @@ from src.core.services.managers.semantic_metadata_service import SemanticMetadat
 from src.core.services.visualization.accessibility_service import AccessibilityService
 from src.web.pages.ui.plotting.base_plot import BasePlot, _relabel_traces
 from src.web.rendering.dashboard_builder import render_dashboard
+from src.web.rendering.export_cache import (
+    active_theme,
+    export_cache_key,
+    get_export_cache,
+    plot_identity,
+)
 from src.web.rendering.interactive_html_export import (
     interactive_source_data_assets,
     interactive_source_data_section,
@@ -31,6 +38,8 @@ from src.web.rendering.interactive_html_export import (
 from src.web.rendering.matplotlib_figure_builder import build_matplotlib_figure_from_traces
 from src.web.rendering.trace_to_plotly import traces_to_plotly
 
+_REPORT_FIGURE_DPI = 144
+
 ReportFormat = Literal["html", "pdf"]
 ReportHtmlMode = Literal["document", "gallery"]
 
@@ -63,6 +72,38 @@ def _single_plot_plotly(plot: BasePlot) -> go.Figure:
     return plot.apply_common_layout(figure, effective)
 
 
+def _cached_figure_png(
+    plots: Sequence[BasePlot], by_id: dict[int, BasePlot], item: ReportFigure
+) -> bytes:
+    """Return one report figure's PNG, reusing the export cache when enabled."""
+    cache = get_export_cache()
+    if cache is None:
+        return _figure_png(plots, by_id, item)
+    members = []
+    for plot_id in item.plot_ids:
+        plot = by_id[plot_id]
+        if plot.processed_data is None:
+            return _figure_png(plots, by_id, item)
+        members.append(plot_identity(plot.processed_data, plot.plot_type, plot.config))
+    key = export_cache_key(
+        identity={
+            "report_figure": members,
+            "dashboard": asdict(item.dashboard) if item.dashboard is not None else None,
+        },
+        engine="matplotlib",
+        fmt="png",
+        options={"dpi": _REPORT_FIGURE_DPI},
+        deterministic=True,
+        theme=active_theme("matplotlib"),
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    data = _figure_png(plots, by_id, item)
+    cache.put(key, data)
+    return data
+
+
 def _figure_png(plots: Sequence[BasePlot], by_id: dict[int, BasePlot], item: ReportFigure) -> bytes:
     """Render one report figure to deterministic PNG bytes."""
     if item.dashboard is None:
@@ -77,7 +118,7 @@ def _figure_png(plots: Sequence[BasePlot], by_id: dict[int, BasePlot], item: Rep
         figure.savefig(
             output,
             format="png",
-            dpi=144,
+            dpi=_REPORT_FIGURE_DPI,
             bbox_inches="tight",
             facecolor=figure.get_facecolor(),
             metadata={"Software": "RING-5"},
@@ -586,7 +627,7 @@ def render_report(
         raise ValueError("Report plots are no longer available: " + ", ".join(map(str, missing)))
     if fmt == "html" and html_mode == "gallery":
         return _html_gallery(plots, by_id, report)
-    images = tuple(_figure_png(plots, by_id, item) for item in report.figures)
+    images = tuple(_cached_figure_png(plots, by_id, item) for item in report.figures)
     if fmt == "html":
         return _html_report(report, images)
     return _pdf_report(report, images)
@@ -5,27 +5,15 @@ from __future__ import annotations
 import copy
 from collections.abc import Sequence
 
-import pandas as pd
 import plotly.graph_objects as go
 
 from src.core.models.visualization.dashboard_spec import DashboardSpec
-from src.core.models.visualization.small_multiples_spec import FacetPanel, SmallMultiplesSpec
+from src.core.models.visualization.small_multiples_spec import SmallMultiplesSpec
+from src.core.services.visualization.row_partition import RowPartition
 from src.web.pages.ui.plotting.base_plot import BasePlot
 from src.web.rendering.dashboard_builder import DashboardEngine, DashboardFigure, render_dashboard
 
 
-def _panel_rows(
-    data: pd.DataFrame,
-    facet_columns: tuple[str, ...],
-    panel: FacetPanel,
-) -> pd.DataFrame:
-    """Return a defensive subset for one exact facet combination."""
-    mask = pd.Series(True, index=data.index, dtype=bool)
-    for column, value in zip(facet_columns, panel.values):
-        mask &= data[column].isna() if value is None else data[column].eq(value).fillna(False)
-    return data.loc[mask].copy(deep=True)
-
-
 def _facet_views(plot: BasePlot, spec: SmallMultiplesSpec) -> list[BasePlot]:
     """Create transient plot views without changing the registered source plot."""
     if plot.processed_data is None:
@@ -36,9 +24,12 @@ def _facet_views(plot: BasePlot, spec: SmallMultiplesSpec) -> list[BasePlot]:
             "Small-multiples facet columns are no longer available: " + ", ".join(missing)
         )
 
+    # One grouping pass serves every panel; the panel frames share the source
+    # rows under copy-on-write, so the source plot's data is never mutated.
+    partition = RowPartition(plot.processed_data, spec.facet_columns)
     views: list[BasePlot] = []
     for index, panel in enumerate(spec.panels):
-        rows = _panel_rows(plot.processed_data, spec.facet_columns, panel)
+        rows = partition.rows(*panel.values)
         if rows.empty:
             raise ValueError(f"Small-multiples panel '{panel.title}' no longer has matching rows.")
         view = copy.copy(plot)
@@ -22,6 +22,7 @@ from src.core.models.visualization.trace_config import (
     HeatmapTraceConfig,
     HistogramTraceConfig,
     LineTraceConfig,
+    NumericValues,
     ParallelCoordinatesTraceConfig,
     RadarTraceConfig,
     SankeyTraceConfig,
@@ -33,9 +34,14 @@ from src.core.models.visualization.trace_config import (
 from src.web.rendering._heatmap_utils import is_dark_cell
 
 
-def _error_y_dict(error_y: list[float] | None) -> dict[str, Any] | None:
+def _has_values(values: NumericValues | None) -> bool:
+    """Return whether an optional list or array carries any points."""
+    return values is not None and len(values) > 0
+
+
+def _error_y_dict(error_y: NumericValues | None) -> dict[str, Any] | None:
     """Build the Plotly error_y dict if error data is present."""
-    if not error_y:
+    if not _has_values(error_y):
         return None
     return {"type": "data", "array": error_y, "visible": True}
 
@@ -481,11 +487,14 @@ def _parallel_coordinates_trace(trace: ParallelCoordinatesTraceConfig) -> go.Par
     )
 
 
-def _line_trace(trace: LineTraceConfig) -> go.Scatter:
+def _line_trace(trace: LineTraceConfig) -> go.Scatter | go.Scattergl:
     # [impl->req~ring5.plot.ecdf~1]
     # [impl->req~ring5.plot.area~1]
     # [impl->req~ring5.figure.line-styles~1]
-    """Convert a ``LineTraceConfig`` to ``go.Scatter`` with lines mode."""
+    """Convert a ``LineTraceConfig`` to ``go.Scatter`` with lines mode.
+
+    Large-data traces (``webgl``) become ``go.Scattergl`` unless they use splines.
+    """
     mode = "lines+markers" if trace.show_markers else "lines"
 
     kwargs: dict[str, Any] = {
@@ -526,14 +535,20 @@ def _line_trace(trace: LineTraceConfig) -> go.Scatter:
     if error_y := _error_y_dict(trace.error_y):
         kwargs["error_y"] = error_y
 
-    return go.Scatter(**{k: v for k, v in kwargs.items() if v is not None})
+    # WebGL lines cannot draw splines, so smoothed traces stay on SVG.
+    webgl = trace.webgl and trace.line_shape != "spline"
+    trace_class = go.Scattergl if webgl else go.Scatter
+    return trace_class(**{k: v for k, v in kwargs.items() if v is not None})
+
 
+def _scatter_trace(trace: ScatterTraceConfig) -> go.Scatter | go.Scattergl:
+    """Convert a ``ScatterTraceConfig`` to ``go.Scatter`` with markers mode.
 
-def _scatter_trace(trace: ScatterTraceConfig) -> go.Scatter:
-    """Convert a ``ScatterTraceConfig`` to ``go.Scatter`` with markers mode."""
+    Large-data traces (``webgl``) become ``go.Scattergl`` with the same properties.
+    """
     marker: dict[str, Any] = {
         "symbol": trace.marker_symbol,
-        "size": trace.size_values or trace.marker_size,
+        "size": trace.size_values if _has_values(trace.size_values) else trace.marker_size,
     }
     if trace.color:
         marker["color"] = trace.color
@@ -563,7 +578,8 @@ def _scatter_trace(trace: ScatterTraceConfig) -> go.Scatter:
     if error_y := _error_y_dict(trace.error_y):
         kwargs["error_y"] = error_y
 
-    return go.Scatter(**{k: v for k, v in kwargs.items() if v is not None})
+    trace_class = go.Scattergl if trace.webgl else go.Scatter
+    return trace_class(**{k: v for k, v in kwargs.items() if v is not None})
 
 
 def _histogram_trace(trace: HistogramTraceConfig) -> go.Histogram:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from dataclasses import replace
 from pathlib import Path
 from typing import cast
 from unittest.mock import patch
@@ -11,6 +12,7 @@ import pandas as pd
 import pytest
 
 import ring5
+from ring5 import _export
 from src.core.services.data_services.path_service import PathService
 
 pytestmark = [pytest.mark.public_api, pytest.mark.xdist_group("ring5_analysis_recipes")]
@@ -99,6 +101,86 @@ def test_matrix_runs_in_stable_order_with_collision_free_outputs(tmp_path: Path)
     assert all(path.parent.name == case.case_id for path, case in zip(paths, result.cases))
 
 
+def test_matrix_cases_share_stages_with_identical_inputs(tmp_path: Path) -> None:
+    # [test->req~ring5.automation.batch-matrices~1]
+    source_csv = tmp_path / "source.csv"
+    pd.DataFrame({"benchmark": ["a", "b"], "value": [1.0, 2.0]}).to_csv(source_csv, index=False)
+    recipe = replace(
+        _matrix_recipe(),
+        parameters=(
+            *_matrix_recipe().parameters,
+            ring5.RecipeParameter("label", "string", default="run"),
+        ),
+        exports=(
+            ring5.RecipeExport(
+                plot="Values",
+                path="{{label}}.html",
+                engine="plotly",
+                format="html",
+                deterministic=True,
+            ),
+        ),
+    )
+
+    with ring5.Session() as session:
+        result = session.run_analysis_recipe_matrix(
+            recipe,
+            {"input_csv": [str(source_csv)], "label": ["first", "second", "third"]},
+            output_directory=str(tmp_path / "outputs"),
+            max_workers=2,
+        )
+
+    assert result.complete is True
+    assert result.stages == (
+        ("source", 1, 2),
+        ("dataset", 1, 2),
+        ("plot", 1, 2),
+        ("artifact", 1, 2),
+    )
+    paths = [Path(case.result.exported_paths[0]) for case in result.cases if case.result]
+    assert len(set(paths)) == 3
+    assert len({path.read_bytes() for path in paths}) == 1
+
+
+def test_static_plotly_exports_render_as_one_batch_per_case(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # [test->req~ring5.export.plotly-static~1]
+    source_csv = tmp_path / "source.csv"
+    pd.DataFrame({"benchmark": ["a", "b"], "value": [1.0, 2.0]}).to_csv(source_csv, index=False)
+    batches: list[int] = []
+
+    def fake_batch(figs: list[object], fmt: str, **_: object) -> list[bytes]:
+        batches.append(len(figs))
+        return [f"<svg>{fmt}</svg>".encode() for _ in figs]
+
+    monkeypatch.setattr(_export, "plotly_download_batch", fake_batch)
+    plot = _matrix_recipe().plots[0]
+    recipe = replace(
+        _matrix_recipe(),
+        plots=(plot, replace(plot, name="Again", config={"x": "benchmark", "y": "value"})),
+        exports=tuple(
+            ring5.RecipeExport(
+                plot=name, path=str(tmp_path / f"{name}.svg"), engine="plotly", format="svg"
+            )
+            for name in ("Values", "Again")
+        ),
+    )
+
+    with ring5.Session() as session:
+        single = session.run_analysis_recipe(recipe, {"input_csv": str(source_csv)})
+        result = session.run_analysis_recipe_matrix(
+            recipe,
+            {"input_csv": [str(source_csv)], "minimum": [0.0, 1.5]},
+            output_directory=str(tmp_path / "outputs"),
+            max_workers=1,
+        )
+
+    assert len(single.exported_paths) == 2
+    assert result.complete is True
+    assert batches == [2, 2, 2]
+
+
 def test_matrix_failures_are_per_case_and_invalid_inputs_are_typed(tmp_path: Path) -> None:
     # [test->req~ring5.automation.batch-matrices~1]
     valid_csv = tmp_path / "valid.csv"
@@ -9,6 +9,7 @@ from typing import Any
 import pytest
 
 import ring5
+from src.core.services.portfolio_container import PortfolioContainer
 
 pytestmark = [pytest.mark.public_api, pytest.mark.xdist_group("ring5_portfolios")]
 
@@ -20,8 +21,10 @@ def test_saved_environment_is_public_and_matches_same_runtime(portfolios_dir: Pa
         session.save_portfolio("environment_probe")
         comparison = session.compare_portfolio_environment("environment_probe")
 
-    document = json.loads((portfolios_dir / "environment_probe.json").read_text())
-    assert document["schema_version"] == 4
+    document = PortfolioContainer.read_document(
+        (portfolios_dir / "environment_probe.json").read_bytes()
+    )
+    assert document["schema_version"] == 5
     assert document["environment_metadata"] == current.to_dict()
     assert isinstance(current, ring5.EnvironmentMetadata)
     assert isinstance(comparison, ring5.EnvironmentComparison)
@@ -52,7 +55,7 @@ def test_portfolio_environment_errors_remain_in_public_error_hierarchy(
     (portfolios_dir / "bad_environment.json").write_text(
         json.dumps({"schema_version": 3, "environment_metadata": [], "plots": []})
     )
-    (portfolios_dir / "future_environment.json").write_text(json.dumps({"schema_version": 5}))
+    (portfolios_dir / "future_environment.json").write_text(json.dumps({"schema_version": 6}))
 
     with ring5.Session() as session:
         with pytest.raises(ring5.PortfolioError, match="invalid environment metadata"):
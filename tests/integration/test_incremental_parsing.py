@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
 
 import pandas as pd
@@ -37,7 +38,7 @@ def test_incremental_parse_reuses_updates_and_removes_exact_source_rows(tmp_path
         assert (initial.parsed_files, initial.reused_files, initial.removed_files) == (2, 0, 0)
         assert sorted(pd.read_csv(initial.csv_path)["simTicks"].tolist()) == [100, 200]
         initial_csv = Path(initial.csv_path).read_bytes()
-        initial_cache = (output / ".ring5-incremental-parse.json").read_bytes()
+        initial_cache = (output / ".ring5-incremental-parse.sqlite").read_bytes()
 
         unchanged = session.parse(
             str(inputs),
@@ -52,7 +53,7 @@ def test_incremental_parse_reuses_updates_and_removes_exact_source_rows(tmp_path
             0,
         )
         assert Path(unchanged.csv_path).read_bytes() == initial_csv
-        assert (output / ".ring5-incremental-parse.json").read_bytes() == initial_cache
+        assert (output / ".ring5-incremental-parse.sqlite").read_bytes() == initial_cache
 
         second_source.write_text("simTicks 250 # ticks\n", encoding="utf-8")
         updated = session.parse(
@@ -76,9 +77,41 @@ def test_incremental_parse_reuses_updates_and_removes_exact_source_rows(tmp_path
         assert (removed.parsed_files, removed.reused_files, removed.removed_files) == (0, 1, 1)
         assert pd.read_csv(removed.csv_path)["simTicks"].tolist() == [250]
 
-    cache = output / ".ring5-incremental-parse.json"
+    cache = output / ".ring5-incremental-parse.sqlite"
     assert cache.is_file()
-    assert "simTicks" in cache.read_text(encoding="utf-8")
+    with sqlite3.connect(cache) as connection:
+        (var_names,) = connection.execute(
+            "SELECT value FROM meta WHERE key = 'var_names'"
+        ).fetchone()
+    assert "simTicks" in var_names
+
+
+def test_metadata_change_detection_reuses_rows_without_rehashing(tmp_path: Path) -> None:
+    inputs = tmp_path / "inputs"
+    _write_run(inputs, "run-a", 100)
+    second_source = _write_run(inputs, "run-b", 200)
+    output = tmp_path / "output"
+
+    def parse(session: ring5.Session) -> ring5.ParseResult:
+        return session.parse(
+            str(inputs),
+            ["simTicks"],
+            output_dir=str(output),
+            scan_limit=0,
+            incremental=True,
+            change_detection="metadata",
+            verify_fraction=0.5,
+        )
+
+    with ring5.Session() as session:
+        assert parse(session).parsed_files == 2
+        unchanged = parse(session)
+        assert (unchanged.parsed_files, unchanged.reused_files) == (0, 2)
+
+        second_source.write_text("simTicks 2500 # ticks\n", encoding="utf-8")
+        updated = parse(session)
+        assert (updated.parsed_files, updated.reused_files) == (1, 1)
+        assert sorted(pd.read_csv(updated.csv_path)["simTicks"].tolist()) == [100, 2500]
 
 
 def test_incremental_finalize_rejects_a_source_changed_after_submission(tmp_path: Path) -> None:
@@ -98,7 +131,7 @@ def test_incremental_finalize_rejects_a_source_changed_after_submission(tmp_path
         with pytest.raises(ring5.ParseError, match="changed during incremental parsing"):
             job.finalize()
 
-    assert not (output / ".ring5-incremental-parse.json").exists()
+    assert not (output / ".ring5-incremental-parse.sqlite").exists()
 
 
 def test_incremental_cache_cannot_replace_output_or_simulator_input(tmp_path: Path) -> None:
@@ -34,14 +34,15 @@ def test_public_linked_selection_highlights_dashboard_copy() -> None:
         dashboard = session.create_dashboard(plots)
         spec = session.create_linked_selection(dashboard, axis="x", mode="highlight")
         figure = session.render_dashboard(dashboard, engine="plotly")
-        snapshot = figure.to_plotly_json()
+        # Traces carry NumPy arrays, so compare the serialized figure.
+        snapshot = figure.to_json()
 
         linked = ring5.apply_linked_selection(figure, spec, ["B"])
 
         assert isinstance(spec, ring5.LinkedSelectionSpec)
         assert spec.plot_ids == dashboard.plot_ids
         assert all(list(trace.selectedpoints) == [1] for trace in linked.data)
-        assert figure.to_plotly_json() == snapshot
+        assert figure.to_json() == snapshot
 
 
 def test_public_linked_selection_filters_and_translates_invalid_inputs() -> None:
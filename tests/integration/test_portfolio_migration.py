@@ -37,7 +37,7 @@ class TestV1LoadAndMigrate:
             ],
         }
         result = PortfolioMigrator.migrate(v1)
-        assert result["schema_version"] == 4
+        assert result["schema_version"] == 5
         assert result["environment_metadata"] is None
         assert result["integrity_manifest"] is None
         cfg = result["plots"][0]["config"]
@@ -84,7 +84,7 @@ class TestV2Migration:
             ],
         }
         result = PortfolioMigrator.migrate(original)
-        assert result["schema_version"] == 4
+        assert result["schema_version"] == 5
         assert result["environment_metadata"] is None
         assert result["integrity_manifest"] is None
         assert result["plots"][0]["config"]["engine"] == "matplotlib"
@@ -129,7 +129,7 @@ class TestRoundtrip:
         loaded: Dict[str, Any] = json.loads(json_str)
         migrated = PortfolioMigrator.migrate(loaded)
 
-        assert migrated["schema_version"] == 4
+        assert migrated["schema_version"] == 5
         assert migrated["integrity_manifest"] is None
         assert migrated["plots"][0]["config"]["width"] == 800
         assert migrated["plots"][0]["config"]["engine"] == "plotly"
@@ -1,4 +1,3 @@
-import io
 from collections.abc import Generator
 from typing import Any
 from unittest.mock import patch
@@ -9,6 +8,7 @@ import pytest
 from src.core.models import ColumnSemantics, DatasetSemantics
 from src.core.services.data_services.portfolio_service import PortfolioService
 from src.core.services.managers.semantic_metadata_service import SemanticMetadataService
+from src.core.services.portfolio_container import PortfolioFrames
 from src.core.state.repository_state_manager import RepositoryStateManager
 from src.web.pages.ui.plotting.plot_factory import PlotFactory
 
@@ -82,8 +82,8 @@ def test_save_and_load_portfolio(
     loaded_data = portfolio_service.load_portfolio("test_portfolio")
 
     # Verify Content
-    assert loaded_data["schema_version"] == 4
-    assert loaded_data["version"] == "4.0"
+    assert loaded_data["schema_version"] == 5
+    assert loaded_data["version"] == "5.0"
     environment = loaded_data["environment_metadata"]
     assert environment is not None
     assert environment["format_version"] == 1
@@ -101,10 +101,11 @@ def test_save_and_load_portfolio(
     assert loaded_data["scanned_variables"] == [{"name": "ipc", "type": "scalar"}]
     assert loaded_data["manager_history"][0]["operation"] == "derive B"
 
-    # Verify Data CSV reconstruction
-    loaded_df_csv = loaded_data["data_csv"]
-    loaded_df = pd.read_csv(io.StringIO(loaded_df_csv))
-    pd.testing.assert_frame_equal(df, loaded_df)
+    # Verify data reconstruction; the plot shares the data's stored frame
+    frames = loaded_data["frames"]
+    assert isinstance(frames, PortfolioFrames)
+    assert len(frames) == 1
+    pd.testing.assert_frame_equal(df, frames.load(str(loaded_data["data_ref"])))
 
     # Verify Plots
     assert len(loaded_data["plots"]) == 1
@@ -113,7 +114,7 @@ def test_save_and_load_portfolio(
     assert loaded_plot["id"] == 1
     assert loaded_plot["plot_type"] == "bar"
     assert loaded_plot["config"] == plot_config
-    assert pd.read_csv(io.StringIO(loaded_plot["processed_data"])).equals(df)
+    assert loaded_plot["processed_data_ref"] == loaded_data["data_ref"]
     assert loaded_plot["pipeline"] == []
     assert loaded_plot["pipeline_counter"] == 0
 
@@ -836,7 +836,7 @@ class TestPortfolioReplay:
     def test_future_portfolio_refused(self, tmp_path: Path, portfolios_dir: Path) -> None:
         # [test->req~ring5.portfolio.migration~1]
         """Forward-version files are refused, never silently downgraded."""
-        (portfolios_dir / "future.json").write_text(json.dumps({"schema_version": 5}))
+        (portfolios_dir / "future.json").write_text(json.dumps({"schema_version": 6}))
         with pytest.raises(ring5.PortfolioVersionError, match="newer than this RING-5"):
             ring5.render_portfolio("future", str(tmp_path / "figs"))
 
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 import pytest
 
 import ring5
+from src.core.services.portfolio_container import PortfolioContainer
 
 pytestmark = [pytest.mark.public_api, pytest.mark.xdist_group("ring5_portfolios")]
 
@@ -64,9 +64,9 @@ def test_modified_portfolio_is_reported_and_never_restored(portfolios_dir: Path)
     with ring5.Session() as session:
         session.save_portfolio("modified")
         path = portfolios_dir / "modified.json"
-        document = json.loads(path.read_text(encoding="utf-8"))
+        document = PortfolioContainer.read_document(path.read_bytes())
         document["config"]["unexpected"] = True
-        path.write_text(json.dumps(document), encoding="utf-8")
+        path.write_bytes(PortfolioContainer.replace_document(path.read_bytes(), document))
 
         report = session.verify_portfolio("modified")
         assert report.status == "modified"
@@ -22,6 +22,7 @@ from src.core.application_api import ApplicationAPI
 from src.core.models.data_models import ParseVariableConfig, ScannedVariableDict
 from src.core.services.data_services.path_service import PathService
 from src.core.services.data_services.portfolio_service import PortfolioService
+from src.core.services.portfolio_container import PortfolioFrames
 from src.core.state.repositories.parser_state_repository import ParserStateRepository
 from src.core.state.repository_state_manager import RepositoryStateManager
 from src.web.pages.ui.plotting.types.grouped_bar_plot import GroupedBarPlot
@@ -115,18 +116,12 @@ class TestStateManagement:
 
         # Verify data integrity
         assert loaded is not None
-        assert "data_csv" in loaded or "data" in loaded
+        assert loaded["data_ref"] in loaded["frames"]
         assert "plots" in loaded
         assert "config" in loaded
 
         # Verify data matches
-        if "data_csv" in loaded:
-            import io
-
-            loaded_data = pd.read_csv(io.StringIO(loaded["data_csv"]))
-        else:
-            loaded_any = cast(dict[str, Any], loaded)
-            loaded_data = loaded_any["data"]
+        loaded_data = cast(PortfolioFrames, loaded["frames"]).load(str(loaded["data_ref"]))
 
         pd.testing.assert_frame_equal(
             data.reset_index(drop=True), loaded_data.reset_index(drop=True)
@@ -201,13 +196,9 @@ class TestStateManagement:
         assert len(recovered["plots"]) > 0
 
         # Verify can continue work
-        if "data_csv" in recovered:
-            import io
-
-            recovered_data = pd.read_csv(io.StringIO(recovered["data_csv"]))
-        else:
-            recovered_any = cast(dict[str, Any], recovered)
-            recovered_data = recovered_any["data"]
+        recovered_data = cast(PortfolioFrames, recovered["frames"]).load(
+            str(recovered["data_ref"])
+        )
 
         new_row = pd.DataFrame({"benchmark": ["lbm"], "config": ["baseline"], "ipc": [2.0]})
 
@@ -0,0 +1,73 @@
+"""End-to-end contract for streaming CSV assembly of simulator parses."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import ring5
+
+pytestmark = [pytest.mark.public_api, pytest.mark.xdist_group("perl_pool")]
+
+
+def _write_runs(root: Path, count: int) -> Path:
+    for index in range(count):
+        run = root / f"run-{index:02d}"
+        run.mkdir(parents=True)
+        (run / "stats.txt").write_text(
+            "---------- Begin Simulation Statistics ----------\n"
+            f"simTicks {100 + index} # ticks\n"
+            f"system.cpu.bp::0 {index} # vector\n"
+            f"system.cpu.bp::1 {2 * index} # vector\n"
+            f"system.cpu.bp::total {3 * index} # vector\n"
+            "---------- End Simulation Statistics   ----------\n",
+            encoding="utf-8",
+        )
+        (run / "config.ini").write_text(f"[system]\ncpus={index}\n", encoding="utf-8")
+    return root
+
+
+@pytest.mark.parametrize("strategy", ["simple", "config_aware"])
+def test_streaming_parse_writes_the_same_csv_as_buffered_assembly(
+    tmp_path: Path, strategy: str
+) -> None:
+    # [test->req~ring5.ingestion.async-parse~1]
+    inputs = _write_runs(tmp_path / "inputs", 6)
+    variables: list[str | ring5.StatConfig] = ["simTicks", "system.cpu.bp"]
+
+    with ring5.Session() as session:
+        buffered = session.parse(
+            str(inputs),
+            variables,
+            strategy=strategy,
+            output_dir=str(tmp_path / "buffered"),
+            scan_limit=0,
+        )
+        streamed = session.parse(
+            str(inputs),
+            variables,
+            strategy=strategy,
+            output_dir=str(tmp_path / "streamed"),
+            scan_limit=0,
+            streaming=True,
+        )
+
+    assert streamed.missing_stats == []
+    assert streamed.parsed_files == 6
+    assert Path(streamed.csv_path).read_bytes() == Path(buffered.csv_path).read_bytes()
+
+
+def test_streaming_is_rejected_for_incremental_parses(tmp_path: Path) -> None:
+    inputs = _write_runs(tmp_path / "inputs", 1)
+
+    with ring5.Session() as session:
+        with pytest.raises(ring5.ParseError, match="not available for incremental"):
+            session.parse_submit(
+                str(inputs),
+                ["simTicks"],
+                output_dir=str(tmp_path / "output"),
+                scan_limit=0,
+                incremental=True,
+                streaming=True,
+            )
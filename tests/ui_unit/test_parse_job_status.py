@@ -36,7 +36,7 @@ def _snapshot(status: ParseJobStatus, *, job_id: str = "job-1") -> ParseJobSnaps
 def mock_st() -> Any:
     with patch.object(parse_job_status, "st") as streamlit:
         streamlit.session_state = {parse_job_status._JOB_ID_KEY: "job-1"}
-        columns = [MagicMock(), MagicMock(), MagicMock()]
+        columns = [MagicMock(), MagicMock(), MagicMock(), MagicMock()]
         for column in columns:
             column.__enter__.return_value = column
             column.__exit__.return_value = False
@@ -140,6 +140,21 @@ def test_failed_job_can_retry(mock_st: Any) -> None:
     assert mock_st.session_state[parse_job_status._JOB_ID_KEY] == "job-2"
 
 
+def test_cancelled_job_can_resume(mock_st: Any) -> None:
+    api = MagicMock()
+    cancelled = _snapshot(ParseJobStatus.CANCELLED)
+    resumed = _snapshot(ParseJobStatus.QUEUED, job_id="job-2")
+    api.get_parse_job.return_value = cancelled
+    api.resume_parse_job.return_value = resumed
+    mock_st.button.side_effect = lambda label, **_kwargs: label == "Resume"
+
+    parse_job_status._render_parse_job_panel_snapshot(api, cancelled)
+
+    api.resume_parse_job.assert_called_once_with("job-1")
+    api.retry_parse_job.assert_not_called()
+    assert mock_st.session_state[parse_job_status._JOB_ID_KEY] == "job-2"
+
+
 def test_sidebar_keeps_cancel_accessible_during_navigation(mock_st: Any) -> None:
     api = MagicMock()
     api.get_parse_job.return_value = _snapshot(ParseJobStatus.RUNNING)
@@ -0,0 +1,124 @@
+"""Process-based analysis-recipe matrix execution with recycled warm workers."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+import ring5
+from src.core.models import (
+    AnalysisRecipe,
+    AnalysisRecipeMatrixCase,
+    AnalysisRecipeRunResult,
+    RecipeParameter,
+    RecipeScalar,
+    RecipeSource,
+)
+from src.core.services.analysis_recipe_matrix_pool import RecipeMatrixProcessPool
+from src.core.services.analysis_recipe_matrix_service import AnalysisRecipeMatrixService
+
+Runner = Callable[[AnalysisRecipe, Mapping[str, RecipeScalar]], AnalysisRecipeRunResult]
+
+
+@contextmanager
+def _pid_worker() -> Iterator[Runner]:
+    """Answer each case with the worker's process id; ``crash`` kills the worker."""
+
+    def run(recipe: AnalysisRecipe, values: Mapping[str, RecipeScalar]) -> AnalysisRecipeRunResult:
+        if values["value"] == "crash":
+            os._exit(3)
+        if values["value"] == "fail":
+            raise ValueError("case failed")
+        return AnalysisRecipeRunResult(
+            recipe_name=recipe.name,
+            parameter_values=tuple(values.items()),
+            rows=os.getpid(),
+            columns=(str(values["value"]),),
+        )
+
+    yield run
+
+
+def _recipe() -> AnalysisRecipe:
+    return AnalysisRecipe(
+        name="Process matrix",
+        parameters=(RecipeParameter("value", "string", default="a"),),
+        source=RecipeSource(kind="csv", path="data.csv"),
+    )
+
+
+def test_cases_stream_in_order_and_workers_recycle(tmp_path: Path) -> None:
+    # [test->req~ring5.automation.batch-matrices~1]
+    streamed: list[AnalysisRecipeMatrixCase] = []
+
+    result = AnalysisRecipeMatrixService.execute_in_processes(
+        _recipe(),
+        {"value": ["a", "fail", "c", "d"]},
+        str(tmp_path),
+        _pid_worker,
+        max_workers=2,
+        max_cases_per_worker=1,
+        on_case=streamed.append,
+    )
+
+    assert list(result.cases) == streamed
+    assert [case.result.columns[0] if case.result else None for case in result.cases] == [
+        "a",
+        None,
+        "c",
+        "d",
+    ]
+    assert result.cases[1].error == "case failed"
+    pids = [case.result.rows for case in result.cases if case.result]
+    assert len(set(pids)) == 3
+    assert os.getpid() not in pids
+
+
+def test_worker_crash_fails_only_its_case(tmp_path: Path) -> None:
+    result = AnalysisRecipeMatrixService.execute_in_processes(
+        _recipe(),
+        {"value": ["a", "crash", "c"]},
+        str(tmp_path),
+        _pid_worker,
+        max_workers=1,
+        memory_limit_mb=1_000_000,
+    )
+
+    assert [case.successful for case in result.cases] == [True, False, True]
+    assert "exited unexpectedly (exit code 3)" in (result.cases[1].error or "")
+    assert result.cases[0].result and result.cases[2].result
+    assert result.cases[0].result.rows != result.cases[2].result.rows
+
+
+def test_memory_ceiling_replaces_workers_between_cases(tmp_path: Path) -> None:
+    result = AnalysisRecipeMatrixService.execute_in_processes(
+        _recipe(),
+        {"value": ["a", "b"]},
+        str(tmp_path),
+        _pid_worker,
+        max_workers=1,
+        memory_limit_mb=1,
+    )
+
+    assert result.complete is True
+    assert len({case.result.rows for case in result.cases if case.result}) == 2
+
+
+def test_process_options_are_validated(tmp_path: Path) -> None:
+    with pytest.raises(TypeError, match="must be picklable"):
+        RecipeMatrixProcessPool(lambda: _pid_worker(), 1)
+    with pytest.raises(ValueError, match="max_cases_per_worker must be positive"):
+        RecipeMatrixProcessPool(_pid_worker, 1, max_cases_per_worker=0)
+    with pytest.raises(TypeError, match="memory_limit_mb must be an integer"):
+        RecipeMatrixProcessPool(_pid_worker, 1, memory_limit_mb=1.5)  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="between 1 and 32"):
+        AnalysisRecipeMatrixService.execute_in_processes(
+            _recipe(), {}, str(tmp_path), _pid_worker, max_workers=33
+        )
+    with ring5.Session() as session:
+        with pytest.raises(ring5.RecipeError, match="require processes=True"):
+            session.run_analysis_recipe_matrix(_recipe(), {}, max_cases_per_worker=2)
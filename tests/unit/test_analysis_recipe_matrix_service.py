@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import threading
+from collections.abc import Callable, Mapping
 from pathlib import Path
 
 import pytest
@@ -13,9 +14,14 @@ from src.core.models import (
     RecipeExport,
     RecipeParameter,
     RecipePlot,
+    RecipeScalar,
     RecipeSource,
 )
-from src.core.services.analysis_recipe_matrix_service import AnalysisRecipeMatrixService
+from src.core.services.analysis_recipe_matrix_service import (
+    AnalysisRecipeMatrixService,
+    RecipeStageContext,
+    StagedRecipeRunner,
+)
 
 
 def _recipe() -> AnalysisRecipe:
@@ -108,6 +114,91 @@ def test_execute_is_bounded_ordered_and_retains_per_case_failures(tmp_path: Path
     assert result.cases[1].error == "failed\\ncase"
 
 
+def _staged_runner(calls: list[str]) -> StagedRecipeRunner:
+    lock = threading.Lock()
+
+    def compute(kind: str, value: str) -> Callable[[], str]:
+        def run() -> str:
+            with lock:
+                calls.append(kind)
+            return value
+
+        return run
+
+    def runner(
+        recipe: AnalysisRecipe,
+        values: Mapping[str, RecipeScalar],
+        stages: RecipeStageContext,
+    ) -> AnalysisRecipeRunResult:
+        source = stages.source(compute("source", recipe.source.path))
+        dataset = stages.dataset(compute("dataset", f"{source}:shaped"))
+        stages.plot(0, compute("plot", f"{dataset}:plot"))
+        artifact = stages.artifact(0, compute("artifact", f"{dataset}:bytes"))
+        return AnalysisRecipeRunResult(
+            recipe_name=recipe.name,
+            parameter_values=tuple(values.items()),  # type: ignore[arg-type]
+            rows=1,
+            columns=(artifact,),
+        )
+
+    return runner
+
+
+def test_execute_shares_stages_with_identical_materialized_inputs(tmp_path: Path) -> None:
+    # [test->req~ring5.automation.batch-matrices~1]
+    calls: list[str] = []
+
+    result = AnalysisRecipeMatrixService.execute(
+        _recipe(),
+        {"input_csv": ["a.csv", "b.csv"], "threshold": [1.0, 2.0, 3.0]},
+        str(tmp_path),
+        _staged_runner(calls),
+        max_workers=4,
+        share_stages=True,
+    )
+
+    assert result.complete is True
+    assert sorted(calls) == ["artifact"] * 2 + ["dataset"] * 2 + ["plot"] * 2 + ["source"] * 2
+    assert result.stages == (
+        ("source", 2, 4),
+        ("dataset", 2, 4),
+        ("plot", 2, 4),
+        ("artifact", 2, 4),
+    )
+    assert [case.result.columns for case in result.cases if case.result] == [
+        ("a.csv:shaped:bytes",)
+    ] * 3 + [("b.csv:shaped:bytes",)] * 3
+
+
+def test_shared_stage_failures_reach_every_dependent_case(tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    def runner(
+        recipe: AnalysisRecipe,
+        values: Mapping[str, RecipeScalar],
+        stages: RecipeStageContext,
+    ) -> AnalysisRecipeRunResult:
+        def load() -> str:
+            calls.append(recipe.source.path)
+            raise ValueError("unreadable source")
+
+        stages.source(load)
+        raise AssertionError("unreachable")
+
+    result = AnalysisRecipeMatrixService.execute(
+        _recipe(),
+        {"input_csv": ["a.csv"], "threshold": [1.0, 2.0]},
+        str(tmp_path),
+        runner,
+        max_workers=2,
+        share_stages=True,
+    )
+
+    assert calls == ["a.csv"]
+    assert [case.error for case in result.cases] == ["unreadable source"] * 2
+    assert result.stages == (("source", 1, 1),)
+
+
 @pytest.mark.parametrize(
     ("matrix", "message"),
     [
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 from unittest.mock import MagicMock
+from zipfile import ZipFile
 
 import pandas as pd
 import pytest
@@ -11,6 +12,9 @@ import pytest
 from src.core.services import autosave_recovery_service as recovery_module
 from src.core.services.autosave_recovery_service import AutosaveRecoveryService
 from src.core.services.data_services.path_service import PathService
+from src.core.services.data_services.portfolio_service import PortfolioService
+from src.core.services.portfolio_container import PortfolioContainer
+from src.core.state.repository_state_manager import RepositoryStateManager
 
 
 @pytest.fixture
@@ -47,10 +51,8 @@ def test_capture_deduplicates_lists_loads_and_isolates_owner_namespaces(recovery
     assert duplicate is not None and duplicate.created is False
     assert duplicate.draft.draft_id == first.draft.draft_id
     assert AutosaveRecoveryService.list_drafts("browser-secret-b") == ()
-    assert (
-        AutosaveRecoveryService.load("browser-secret-a", first.draft.draft_id)["data_csv"]
-        == "value\n1\n"
-    )
+    restored = AutosaveRecoveryService.load("browser-secret-a", first.draft.draft_id)
+    assert restored["frames"].load(str(restored["data_ref"]))["value"].tolist() == [1]
     owner_directory = recovery_dir / hashlib.sha256(b"browser-secret-a").hexdigest()
     assert owner_directory.stat().st_mode & 0o777 == 0o700
     assert next(owner_directory.glob("*.json")).stat().st_mode & 0o777 == 0o600
@@ -80,7 +82,9 @@ def test_modified_oversized_and_invalid_drafts_are_refused(recovery_dir, monkeyp
     assert captured is not None
     owner_directory = recovery_dir / hashlib.sha256(b"secure-owner").hexdigest()
     path = next(owner_directory.glob("*.json"))
-    path.write_bytes(path.read_bytes().replace(b"draft_value", b"changed_value", 1))
+    document = PortfolioContainer.read_document(path.read_bytes())
+    document["config"] = {"changed_value": 1}
+    path.write_bytes(PortfolioContainer.replace_document(path.read_bytes(), document))
 
     with pytest.raises(ValueError, match="integrity manifest"):
         AutosaveRecoveryService.load("secure-owner", captured.draft.draft_id)
@@ -118,3 +122,47 @@ def test_owner_directory_symlinks_are_refused_before_capture(recovery_dir, tmp_p
     with pytest.raises(ValueError, match="owner storage must not be a symbolic link"):
         AutosaveRecoveryService.capture(_state(), "linked-owner")
     assert not tuple(outside.iterdir())
+
+
+def test_unchanged_state_is_not_serialized_again(recovery_dir, monkeypatch) -> None:
+    # [test->req~ring5.workspace.autosave-recovery~1]
+    state = RepositoryStateManager()
+    state.set_data(pd.DataFrame({"value": [1, 2]}))
+    first = AutosaveRecoveryService.capture(state, "tracked-owner")
+    version = state.state_version()
+
+    def fail(*_args: object, **_kwargs: object) -> bytes:
+        raise AssertionError("unchanged workspace was serialized")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(PortfolioService, "serialize_workspace", fail)
+        unchanged = AutosaveRecoveryService.capture(state, "tracked-owner")
+    state.update_config("draft_value", 2)
+    changed = AutosaveRecoveryService.capture(state, "tracked-owner")
+
+    assert first is not None and first.created is True
+    assert unchanged is not None and unchanged.created is False
+    assert unchanged.draft.draft_id == first.draft.draft_id
+    assert state.state_version() > version
+    assert changed is not None and changed.created is True
+
+
+def test_draft_tables_are_shared_by_fingerprint_and_collected(recovery_dir) -> None:
+    # [test->req~ring5.workspace.autosave-recovery~1]
+    first = AutosaveRecoveryService.capture(_state(), "shared-owner-a")
+    second = AutosaveRecoveryService.capture(_state(), "shared-owner-b")
+    assert first is not None and second is not None
+    blobs = tuple((recovery_dir / "frames").glob("*.ring5-snapshot"))
+
+    assert len(blobs) == 1
+    assert blobs[0].stat().st_mode & 0o777 == 0o600
+    for owner in ("shared-owner-a", "shared-owner-b"):
+        draft = next((recovery_dir / hashlib.sha256(owner.encode()).hexdigest()).glob("*.json"))
+        with ZipFile(draft) as archive:
+            assert archive.namelist() == ["portfolio.json"]
+    restored = AutosaveRecoveryService.load("shared-owner-b", second.draft.draft_id)
+    AutosaveRecoveryService.delete("shared-owner-a", first.draft.draft_id)
+    assert blobs[0].exists()
+    AutosaveRecoveryService.delete("shared-owner-b", second.draft.draft_id)
+    assert not blobs[0].exists()
+    assert restored["frames"].load(str(restored["data_ref"]))["value"].tolist() == [1]
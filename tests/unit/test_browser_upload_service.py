@@ -108,10 +108,11 @@ def test_portfolio_is_summarized_and_revalidated_before_restore(tmp_path: Path)
     )
 
     assert upload.kind == "portfolio"
-    assert upload.portfolio_schema_version == 4
+    assert upload.portfolio_schema_version == 5
     assert upload.portfolio_plot_count == 0
     assert upload.portfolio_has_data is True
-    assert BrowserUploadService.load_portfolio(upload)["data_csv"].startswith("benchmark")
+    restored = BrowserUploadService.load_portfolio(upload)
+    assert restored["frames"].load(str(restored["data_ref"]))["benchmark"].tolist() == ["alpha"]
 
     Path(upload.source_path).write_text("{}", encoding="utf-8")
     with pytest.raises(ValueError, match="changed after validation"):
@@ -152,7 +153,7 @@ def test_signed_portfolio_upload_requires_matching_secret_when_requested(tmp_pat
         signing_key="shared upload secret",
         require_signature=True,
     )
-    assert restored["data_csv"].startswith("benchmark")
+    assert restored["frames"].load(str(restored["data_ref"]))["benchmark"].tolist() == ["alpha"]
 
 
 def test_modified_manifest_portfolio_upload_is_rejected_before_staging(tmp_path: Path) -> None:
@@ -0,0 +1,260 @@
+"""
+Parity tests for the schema-aligned, array-backed stat storage.
+
+Every case feeds identical input to a template ``StatType`` copy and to a
+``StatRow`` view, then compares content, balancing, padding and reduction.
+"""
+
+from __future__ import annotations
+
+import copy
+import math
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from src.core.models import StatConfig
+from src.parsing.gem5.impl.strategies.gem5_parse_work import Gem5ParseWork
+from src.parsing.gem5.impl.strategies.simple import SimpleStatsStrategy
+from src.parsing.gem5.types.base import StatType
+from src.parsing.gem5.types.compact import CompactStat, StatSchema
+from src.parsing.gem5.types.type_mapper import TypeMapper
+
+
+def _same(left: Any, right: Any) -> bool:
+    """Compare reduced values, treating NaN as equal to NaN."""
+    if isinstance(left, dict) and isinstance(right, dict):
+        return left.keys() == right.keys() and all(_same(left[k], right[k]) for k in left)
+    if isinstance(left, list) and isinstance(right, list):
+        return len(left) == len(right) and all(_same(a, b) for a, b in zip(left, right))
+    if isinstance(left, float) and isinstance(right, float):
+        return (math.isnan(left) and math.isnan(right)) or left == right
+    return bool(left == right)
+
+
+def _pair(config: StatConfig) -> tuple[StatType, Any]:
+    """Return a reference stat and the compact view of the same variable."""
+    stat = TypeMapper.create_stat(config)
+    view = StatSchema({config.name: stat}).new_row().variables()[config.name]
+    return copy.deepcopy(stat), view
+
+
+def _reduce(var: Any) -> Any:
+    var.balance_content()
+    var.reduce_duplicates()
+    return var.reduced_content
+
+
+CASES: list[tuple[StatConfig, list[Any]]] = [
+    (StatConfig(name="ipc", type="scalar"), ["1.5"]),
+    (StatConfig(name="ipc", type="scalar", repeat=3), ["1", "2.5"]),
+    (StatConfig(name="ipc", type="scalar", repeat=2), []),
+    (
+        StatConfig(name="v", type="vector", repeat=2, params={"entries": ["0", "1"]}),
+        [{"0": ["1", "2"], "1": ["3"], "total": ["6"]}, {"0": ["4"]}],
+    ),
+    (
+        StatConfig(
+            name="d",
+            type="distribution",
+            repeat=2,
+            params={"minimum": 0, "maximum": 1, "statistics": ["mean"]},
+        ),
+        [{"underflows": ["0"], "0": ["2", "3"], "1": ["4"], "overflows": ["1"], "mean": ["5"]}],
+    ),
+    (
+        StatConfig(name="h", type="histogram", repeat=2, params={"statistics": ["samples"]}),
+        [{"0-9": ["1"], "10-19": ["2", "3"]}, {"0-9": ["4"], "20-29": ["5"]}],
+    ),
+    (
+        StatConfig(name="h", type="histogram", params={"bins": 3, "max_range": 20}),
+        [{"0-9": ["10"], "10-19": ["6"], "20-29": ["4"], "samples": ["20"]}],
+    ),
+    (StatConfig(name="mode", type="configuration", params={"onEmpty": "none"}), ["timing"]),
+    (StatConfig(name="mode", type="configuration", params={"onEmpty": "none"}), []),
+]
+
+
+class TestCompactStatParity:
+    # [test->req~ring5.ingestion.pattern-aggregation~1]
+
+    @pytest.mark.parametrize(("config", "values"), CASES)
+    def test_content_balance_and_reduction_match(
+        self, config: StatConfig, values: list[Any]
+    ) -> None:
+        reference, view = _pair(config)
+        for value in values:
+            reference.content = value
+            view.content = value
+
+        assert _same(view.content, reference.content)
+        assert view.entries == reference.entries
+        assert _same(_reduce(view), _reduce(reference))
+        assert _same(view.content, reference.content)
+        assert view.padded_count == reference.padded_count
+
+    @pytest.mark.parametrize(
+        ("config", "value"),
+        [
+            (StatConfig(name="ipc", type="scalar"), "1"),
+            (
+                StatConfig(name="v", type="vector", params={"entries": ["0"]}),
+                {"0": ["1"]},
+            ),
+            (StatConfig(name="h", type="histogram"), {"0-9": ["1"]}),
+        ],
+    )
+    def test_too_many_values_fail_like_stat_type(self, config: StatConfig, value: Any) -> None:
+        reference, view = _pair(config)
+        for var in (reference, view):
+            var.content = value
+            var.content = value
+
+        with pytest.raises(RuntimeError) as expected:
+            reference.balance_content()
+        with pytest.raises(RuntimeError) as actual:
+            view.balance_content()
+        assert str(actual.value) == str(expected.value)
+
+    def test_invalid_values_fail_like_stat_type(self) -> None:
+        for config, value in [
+            (StatConfig(name="ipc", type="scalar"), "abc"),
+            (StatConfig(name="v", type="vector", params={"entries": ["0"]}), {"0": ["x"]}),
+            (
+                StatConfig(name="d", type="distribution", params={"minimum": 0, "maximum": 1}),
+                {"0": ["1"]},
+            ),
+        ]:
+            reference, view = _pair(config)
+            with pytest.raises(TypeError) as expected:
+                reference.content = value
+            with pytest.raises(TypeError) as actual:
+                view.content = value
+            assert str(actual.value) == str(expected.value)
+
+
+class TestStatSchema:
+    # [test->req~ring5.ingestion.histogram~1]
+
+    def test_reduced_content_requires_balance_and_reduce(self) -> None:
+        _, view = _pair(StatConfig(name="ipc", type="scalar"))
+        view.content = "1"
+        view.reduce_duplicates()
+
+        with pytest.raises(AttributeError, match="Cannot access reduced_content"):
+            _ = view.reduced_content
+        view.balance_content()
+        assert view.reduced_content == 1.0
+
+    def test_rows_are_dense_and_independent(self) -> None:
+        schema = StatSchema(
+            SimpleStatsStrategy()._map_variables(
+                [
+                    StatConfig(name="a", type="scalar"),
+                    StatConfig(name="v", type="vector", repeat=2, params={"entries": ["0", "1"]}),
+                ]
+            )
+        )
+        first, second = schema.new_row(), schema.new_row()
+        first.variables()["a"].content = "3"
+
+        assert schema.column_count == 3
+        assert first._samples.shape == (5,)
+        assert first.variables()["a"].content == [3.0]
+        assert second.variables()["a"].content == []
+
+    def test_histogram_buckets_extend_the_shared_schema(self) -> None:
+        schema = StatSchema({"h": TypeMapper.create_stat(StatConfig(name="h", type="histogram"))})
+        first, second = schema.new_row(), schema.new_row()
+        first_h = first.variables()["h"]
+        first_h.content = {"0-9": ["1"]}
+        second_h = second.variables()["h"]
+        second_h.content = {"10-19": ["2"]}
+        first_h.content = {"20-29": ["3"]}
+
+        assert schema.column_count == 3
+        assert first_h.entries == ["0-9", "20-29"]
+        assert second_h.entries == ["10-19"]
+        assert _reduce(second_h) == {"10-19": 2.0}
+
+    def test_aliases_share_one_view(self) -> None:
+        template = SimpleStatsStrategy()._map_variables(
+            [
+                StatConfig(
+                    name=r"system.cpu\d+.ipc",
+                    type="vector",
+                    params={"entries": ["0", "1"], "parsed_ids": ["system.cpu0.ipc"]},
+                )
+            ]
+        )
+        variables = StatSchema(template).new_row().variables()
+
+        assert variables[r"system.cpu\d+.ipc"] is variables["system.cpu0.ipc"]
+
+    def test_unsupported_stat_type_is_rejected(self) -> None:
+        with pytest.raises(ValueError, match="no compact representation"):
+            StatSchema({"x": StatType()})
+
+    def test_base_view_cannot_be_instantiated(self) -> None:
+        row = StatSchema({}).new_row()
+        with pytest.raises(TypeError, match="abstract"):
+            CompactStat(row, None)  # type: ignore[abstract, arg-type]
+
+
+class TestCompactParseWork:
+    # [test->req~ring5.ingestion.simple-strategy~1]
+
+    @pytest.mark.parametrize(
+        "make_vars",
+        [
+            lambda template: copy.deepcopy(template),
+            lambda template: StatSchema(template).new_row().variables(),
+        ],
+        ids=["stat-type", "compact-row"],
+    )
+    def test_records_reduce_identically(self, make_vars: Callable[[Any], Any]) -> None:
+        template = SimpleStatsStrategy()._map_variables(
+            [
+                StatConfig(name="simTicks", type="scalar"),
+                StatConfig(
+                    name=r"system.cpu\d+.numCycles",
+                    type="vector",
+                    params={
+                        "entries": ["0", "1"],
+                        "parsed_ids": ["system.cpu0.numCycles", "system.cpu1.numCycles"],
+                    },
+                ),
+                StatConfig(
+                    name="system.mem.dist",
+                    type="distribution",
+                    params={"minimum": 0, "maximum": 0},
+                ),
+                StatConfig(name="system.mem.lat", type="histogram"),
+                StatConfig(name="sim_mode", type="configuration"),
+            ]
+        )
+        records = [
+            ("scalar", "simTicks", "1000"),
+            ("scalar", "system.cpu0.numCycles", "10"),
+            ("scalar", "system.cpu1.numCycles", "30"),
+            ("distribution", "system.mem.dist::underflows", "0"),
+            ("distribution", "system.mem.dist::0", "7"),
+            ("distribution", "system.mem.dist::overflows", "1"),
+            ("histogram", "system.mem.lat::0-9", "4"),
+            ("summary", "system.mem.lat::samples", "4"),
+        ]
+        work = Gem5ParseWork("stats.txt", make_vars(template))
+        parsed = work._processRecords(records, work._varsToParse)
+
+        reduced = {name: _reduce(parsed[name]) for name in template}
+
+        assert reduced == {
+            "simTicks": 1000.0,
+            r"system.cpu\d+.numCycles": {"0": 10.0, "1": 30.0},
+            "system.cpu0.numCycles": {"0": 10.0, "1": 30.0},
+            "system.cpu1.numCycles": {"0": 10.0, "1": 30.0},
+            "system.mem.dist": {"underflows": 0.0, "0": 7.0, "overflows": 1.0},
+            "system.mem.lat": {"0-9": 4.0, "samples": 4.0},
+            "sim_mode": "None",
+        }
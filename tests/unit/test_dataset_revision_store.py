@@ -0,0 +1,174 @@
+"""Tests for the budgeted, column-sharing dataset revision store."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.services.data_services.dataset_fingerprint import fingerprint_dataset
+from src.core.state.repositories.data_repository import DataRepository
+from src.core.state.repositories.dataset_revision_store import DatasetRevisionStore
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "value": np.arange(1000, dtype="float64"),
+            "count": pd.array(np.arange(1000), dtype="Int64"),
+            "config": pd.Categorical(["a", "b"] * 500),
+        },
+        index=pd.Index(np.arange(1000) * 2, name="row"),
+    )
+
+
+def test_child_revision_shares_unchanged_columns_with_parent(frame: pd.DataFrame) -> None:
+    store = DatasetRevisionStore(memory_budget_bytes=1 << 30)
+    parent = store.put("rev-1", frame)
+    base_bytes = store.memory_bytes
+
+    child = store.put(
+        "rev-2",
+        frame.assign(extra=np.ones(len(frame))),
+        base_revision_ids=("rev-1",),
+    )
+
+    assert np.shares_memory(child["value"].to_numpy(), parent["value"].to_numpy())
+    assert store.memory_bytes - base_bytes == child["extra"].memory_usage(index=False)
+    copied = store.put("rev-3", frame.copy(deep=True), base_revision_ids=("rev-2",))
+    assert np.shares_memory(copied["value"].to_numpy(), parent["value"].to_numpy())
+    assert store.memory_bytes - base_bytes == child["extra"].memory_usage(index=False)
+
+    child.loc[child.index[0], "value"] = -1.0
+    assert store.get("rev-2")["value"].iloc[0] == 0.0
+    assert fingerprint_dataset(store.get("rev-1")) == fingerprint_dataset(frame)
+
+
+def test_bitwise_distinct_values_are_not_shared() -> None:
+    store = DatasetRevisionStore(memory_budget_bytes=1 << 30)
+    store.put("rev-1", pd.DataFrame({"x": [0.0, 1.0]}))
+    changed = store.put("rev-2", pd.DataFrame({"x": [-0.0, 1.0]}), base_revision_ids=("rev-1",))
+
+    assert np.signbit(changed["x"].iloc[0])
+    assert not np.signbit(store.get("rev-1")["x"].iloc[0])
+
+
+def test_categories_in_a_different_order_are_not_shared() -> None:
+    store = DatasetRevisionStore(memory_budget_bytes=1 << 30)
+    store.put("rev-1", pd.DataFrame({"x": pd.Categorical(["a", "b"], categories=["a", "b"])}))
+    reordered = pd.DataFrame({"x": pd.Categorical(["b", "a"], categories=["b", "a"])})
+    changed = store.put("rev-2", reordered, base_revision_ids=("rev-1",))
+
+    assert changed["x"].tolist() == ["b", "a"]
+    assert store.get("rev-1")["x"].tolist() == ["a", "b"]
+
+
+def test_unchanged_string_and_object_columns_are_shared() -> None:
+    frame = pd.DataFrame(
+        {
+            "name": pd.array(["alpha", "beta", None], dtype="string"),
+            "mixed": pd.Series(["x", 1, None], dtype=object),
+        }
+    )
+    store = DatasetRevisionStore(memory_budget_bytes=1 << 30)
+    store.put("rev-1", frame)
+    base_bytes = store.memory_bytes
+
+    store.put("rev-2", frame.copy(deep=True), base_revision_ids=("rev-1",))
+    assert store.memory_bytes == base_bytes
+
+    retyped = frame.assign(mixed=pd.Series(["x", 1.0, None], dtype=object))
+    changed = store.put("rev-3", retyped, base_revision_ids=("rev-1",))
+    assert store.memory_bytes > base_bytes
+    assert type(changed["mixed"].iloc[1]) is float
+
+
+def test_over_budget_revisions_spill_to_disk_and_reload_exactly(frame: pd.DataFrame) -> None:
+    store = DatasetRevisionStore(memory_budget_bytes=0)
+    store.put("rev-1", frame)
+    store.put("rev-2", frame.assign(value=frame["value"] * 2), base_revision_ids=("rev-1",))
+    store.trim(["rev-2"])
+
+    assert store.disk_bytes > 0
+    assert store.contains("rev-1")
+    reloaded = store.get("rev-1")
+    pd.testing.assert_frame_equal(reloaded, frame)
+    assert fingerprint_dataset(reloaded) == fingerprint_dataset(frame)
+
+
+def test_revisions_beyond_disk_budget_are_evicted(frame: pd.DataFrame) -> None:
+    store = DatasetRevisionStore(memory_budget_bytes=0, disk_budget_bytes=0)
+    store.put("rev-1", frame)
+    store.put("rev-2", frame.assign(value=0.0), base_revision_ids=("rev-1",))
+    store.trim(["rev-2"])
+
+    assert not store.contains("rev-1")
+    assert store.disk_bytes == 0
+    with pytest.raises(KeyError, match="not retained"):
+        store.get("rev-1")
+    pd.testing.assert_frame_equal(store.get("rev-2"), frame.assign(value=0.0))
+
+
+def test_unspillable_revision_is_evicted_when_memory_stays_over_budget() -> None:
+    store = DatasetRevisionStore(memory_budget_bytes=0)
+    store.put("rev-1", pd.DataFrame({"objects": [object(), object()]}))
+    store.put("rev-2", pd.DataFrame({"objects": [1, 2]}), base_revision_ids=("rev-1",))
+    store.trim(["rev-2"])
+
+    assert not store.contains("rev-1")
+    assert store.contains("rev-2")
+
+
+def test_clear_removes_spill_files(frame: pd.DataFrame) -> None:
+    store = DatasetRevisionStore(memory_budget_bytes=0)
+    store.put("rev-1", frame)
+    store.put("rev-2", frame.iloc[:10], base_revision_ids=("rev-1",))
+    store.trim(["rev-2"])
+    spill_files = list(Path(store._spill_dir.name).iterdir())  # type: ignore[union-attr]
+    assert spill_files
+
+    store.clear()
+    assert store.memory_bytes == store.disk_bytes == 0
+    assert not any(path.exists() for path in spill_files)
+
+
+def test_budget_defaults_honor_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RING5_REVISION_MEMORY_MB", "3")
+    monkeypatch.setenv("RING5_REVISION_DISK_MB", "not-a-number")
+    store = DatasetRevisionStore()
+
+    assert store._memory_budget == 3 * 1024 * 1024
+    assert store._disk_budget == 8192 * 1024 * 1024
+    with pytest.raises(ValueError, match="negative"):
+        DatasetRevisionStore(memory_budget_bytes=-1)
+
+
+def test_repository_keeps_lineage_of_evicted_revisions(frame: pd.DataFrame) -> None:
+    # [test->req~ring5.data.lineage-undo-redo~1]
+    repo = DataRepository(DatasetRevisionStore(memory_budget_bytes=0, disk_budget_bytes=0))
+    repo.add_dataset("runs", frame, operation="Import runs")
+    repo.set_data(frame.assign(value=1.0), operation="Overwrite value")
+
+    lineage = repo.get_dataset_lineage()
+    assert [revision.retained for revision in lineage.revisions] == [False, True]
+    assert lineage.revisions[0].fingerprint == fingerprint_dataset(frame)
+    assert lineage.can_undo is False
+    with pytest.raises(ValueError, match="evicted"):
+        repo.undo_dataset()
+    with pytest.raises(ValueError, match="evicted"):
+        repo.get_dataset_revision(lineage.revisions[0].revision_id)
+    pd.testing.assert_frame_equal(repo.get_dataset(), frame.assign(value=1.0))
+
+
+def test_repository_undo_reloads_spilled_revision(frame: pd.DataFrame) -> None:
+    repo = DataRepository(DatasetRevisionStore(memory_budget_bytes=0))
+    repo.add_dataset("runs", frame, operation="Import runs")
+    repo.set_data(frame.assign(value=1.0), operation="Overwrite value")
+
+    undone = repo.undo_dataset()
+    assert undone.fingerprint == fingerprint_dataset(frame)
+    pd.testing.assert_frame_equal(repo.get_dataset(), frame)
+    redone = repo.redo_dataset()
+    assert redone.current is True
+    pd.testing.assert_frame_equal(repo.get_dataset(), frame.assign(value=1.0))
@@ -1,15 +1,18 @@
 """Exactness, integrity, and lifecycle tests for reusable dataset snapshots."""
 
+import hashlib
 import json
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import patch
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 import numpy as np
 import pandas as pd
 import pytest
 
 from src.core.models import ColumnSemantics, DatasetSemantics
+from src.core.services.data_services.dataset_fingerprint import fingerprint_dataset
 from src.core.services.data_services.dataset_snapshot_service import DatasetSnapshotService
 from src.core.services.data_services.path_service import PathService
 from src.core.services.managers.semantic_metadata_service import SemanticMetadataService
@@ -23,6 +26,15 @@ def snapshots_dir(tmp_path: Path) -> Path:
     return directory
 
 
+def _rewrite_members(path: Path, replacements: dict[str, bytes]) -> None:
+    """Rewrite a snapshot archive, keeping each member's original storage method."""
+    with ZipFile(path) as archive:
+        members = [(info, archive.read(info)) for info in archive.infolist()]
+    with ZipFile(path, "w", compression=ZIP_DEFLATED) as archive:
+        for info, data in members:
+            archive.writestr(info, replacements.get(info.filename, data))
+
+
 def _representative_frame() -> pd.DataFrame:
     data = pd.DataFrame(
         {
@@ -127,17 +139,16 @@ def test_load_rejects_checksum_and_fingerprint_tampering(snapshots_dir: Path) ->
         with ZipFile(path) as archive:
             manifest = archive.read("manifest.json")
             payload = archive.read("data.json")
-        with ZipFile(path, "w", compression=ZIP_DEFLATED) as archive:
-            archive.writestr("manifest.json", manifest)
-            archive.writestr("data.json", payload + b" ")
+        _rewrite_members(path, {"data.json": payload + b" "})
         with pytest.raises(ValueError, match="payload checksum"):
             DatasetSnapshotService.load_snapshot("verified")
 
         parsed_manifest = json.loads(manifest)
         parsed_manifest["fingerprint"] = f"sha256:{'0' * 64}"
-        with ZipFile(path, "w", compression=ZIP_DEFLATED) as archive:
-            archive.writestr("manifest.json", json.dumps(parsed_manifest))
-            archive.writestr("data.json", payload)
+        _rewrite_members(
+            path,
+            {"manifest.json": json.dumps(parsed_manifest).encode(), "data.json": payload},
+        )
         with pytest.raises(ValueError, match="fingerprint verification"):
             DatasetSnapshotService.load_snapshot("verified")
 
@@ -155,3 +166,121 @@ def test_snapshot_validation_and_unreadable_catalog_entries(snapshots_dir: Path)
 
         (snapshots_dir / "broken.ring5-snapshot").write_bytes(b"not a zip")
         assert DatasetSnapshotService.list_snapshots() == ()
+
+
+def test_columnar_snapshot_memory_maps_aligned_column_buffers(snapshots_dir: Path) -> None:
+    # [test->req~ring5.data.dataset-snapshots~1]
+    data = pd.DataFrame(
+        {
+            "ipc": np.linspace(0.5, 2.0, 1_000),
+            "cycles": np.arange(1_000, dtype=np.int64),
+            "valid": np.arange(1_000) % 2 == 0,
+            "benchmark": pd.Series([f"bench-{i % 7}" for i in range(1_000)], dtype="str"),
+        }
+    )
+    with patch.object(PathService, "get_dataset_snapshots_dir", return_value=snapshots_dir):
+        DatasetSnapshotService.save_snapshot("mapped", data, source_dataset="runs")
+        path = next(snapshots_dir.glob("*.ring5-snapshot"))
+        with ZipFile(path) as archive:
+            assert archive.getinfo("columns.bin").compress_type == ZIP_STORED
+            payload = json.loads(archive.read("data.json"))
+        _, loaded = DatasetSnapshotService.load_snapshot("mapped", memory_map=True)
+
+    assert [column["encoding"] for column in payload["values"]] == [
+        "buffer",
+        "buffer",
+        "buffer",
+        "strings",
+    ]
+    assert payload["index"]["kind"] == "range"
+    pd.testing.assert_frame_equal(loaded, data)
+    ipc = loaded["ipc"].to_numpy()
+    assert ipc.ctypes.data % ipc.dtype.alignment == 0
+    assert isinstance(ipc.base, np.memmap) or isinstance(getattr(ipc.base, "base", None), np.memmap)
+
+
+def test_columnar_snapshot_frames_are_writable_unless_memory_mapped(snapshots_dir: Path) -> None:
+    data = pd.DataFrame({"a": np.arange(4, dtype=np.int64), "b": np.linspace(0.0, 1.0, 4)})
+    with patch.object(PathService, "get_dataset_snapshots_dir", return_value=snapshots_dir):
+        DatasetSnapshotService.save_snapshot("writable", data, source_dataset="runs")
+        _, loaded = DatasetSnapshotService.load_snapshot("writable")
+        _, imported = DatasetSnapshotService._load_payload(
+            DatasetSnapshotService.export_snapshot("writable")
+        )
+        _, mapped = DatasetSnapshotService.load_snapshot("writable", memory_map=True)
+
+    for out in (loaded, imported):
+        out.loc[0, "a"] = 9
+        out.loc[1, "b"] = 5.0
+        assert out.loc[0, "a"] == 9
+        assert out.loc[1, "b"] == 5.0
+    with pytest.raises(ValueError, match="read-only"):
+        mapped.loc[0, "a"] = 9
+
+
+def test_columnar_snapshot_round_trips_through_portable_bytes(snapshots_dir: Path) -> None:
+    data = _representative_frame()
+    with patch.object(PathService, "get_dataset_snapshots_dir", return_value=snapshots_dir):
+        saved = DatasetSnapshotService.save_snapshot("portable", data, source_dataset="runs")
+        exported = DatasetSnapshotService.export_snapshot("portable")
+
+    assert saved.format_version == 2
+    assert DatasetSnapshotService.inspect_snapshot(exported) == replace(
+        saved, size_bytes=len(exported)
+    )
+
+
+def test_format_version_one_snapshots_remain_readable(snapshots_dir: Path) -> None:
+    rows = [[1.5, "a"], [{"$ring5": "nan"}, None]]
+    payload = json.dumps(
+        {
+            "columns": ["value", "label"],
+            "column_kind": "single",
+            "column_names": [None],
+            "dtypes": [{"name": "float64"}, {"name": "str"}],
+            "index": {
+                "kind": "single",
+                "names": [None],
+                "dtypes": [{"name": "int64"}],
+                "values": [0, 1],
+            },
+            "rows": rows,
+            "semantic_columns": {},
+        }
+    ).encode()
+    expected = pd.DataFrame({"value": [1.5, np.nan], "label": pd.Series(["a", None], dtype="str")})
+    manifest = {
+        "format": "ring5.dataset-snapshot",
+        "format_version": 1,
+        "name": "legacy",
+        "source_dataset": "runs",
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "row_count": 2,
+        "column_count": 2,
+        "fingerprint": fingerprint_dataset(expected),
+        "payload_sha256": hashlib.sha256(payload).hexdigest(),
+    }
+    with patch.object(PathService, "get_dataset_snapshots_dir", return_value=snapshots_dir):
+        path = DatasetSnapshotService._snapshot_path("legacy")
+        with ZipFile(path, "w", compression=ZIP_DEFLATED) as archive:
+            archive.writestr("manifest.json", json.dumps(manifest))
+            archive.writestr("data.json", payload)
+        info, loaded = DatasetSnapshotService.load_snapshot("legacy")
+
+    assert info.format_version == 1
+    pd.testing.assert_frame_equal(loaded, expected, check_index_type=False)
+
+
+def test_columnar_snapshot_rejects_tampered_column_buffer(snapshots_dir: Path) -> None:
+    with patch.object(PathService, "get_dataset_snapshots_dir", return_value=snapshots_dir):
+        DatasetSnapshotService.save_snapshot(
+            "buffer", pd.DataFrame({"value": [1.0, 2.0]}), source_dataset="runs"
+        )
+        path = next(snapshots_dir.glob("*.ring5-snapshot"))
+        with ZipFile(path) as archive:
+            buffer = bytearray(archive.read("columns.bin"))
+        buffer[0] ^= 0xFF
+        _rewrite_members(path, {"columns.bin": bytes(buffer)})
+
+        with pytest.raises(ValueError, match="invalid table data"):
+            DatasetSnapshotService.load_snapshot("buffer")
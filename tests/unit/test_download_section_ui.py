@@ -124,6 +124,34 @@ class TestRenderDownloadSectionPlotly:
         mock_callback_exported.assert_called_once_with()
         mock_st.rerun.assert_not_called()
 
+    @patch(
+        "src.web.pages.ui.plotting.download_section.plotly_download_bytes",
+        return_value=b"SVGDATA",
+    )
+    @patch("src.web.pages.ui.plotting.download_section.EngineManager")
+    @patch("src.web.pages.ui.plotting.download_section.st")
+    def test_plotly_download_uses_full_resolution_figure(
+        self,
+        mock_st: MagicMock,
+        mock_em: MagicMock,
+        mock_bytes: MagicMock,
+    ) -> None:
+        """A reduced display figure is rebuilt in full only when the download runs."""
+        from src.web.pages.ui.plotting.download_section import render_download_section
+
+        mock_em.is_matplotlib.return_value = False
+        mock_st.expander.return_value.__enter__ = lambda s: MagicMock()
+        mock_st.expander.return_value.__exit__ = MagicMock(return_value=False)
+        mock_st.pills.return_value = "svg"
+        full = _simple_plotly_fig()
+        export_figure = MagicMock(return_value=full)
+
+        render_download_section(1, "plot", _simple_plotly_fig(), export_figure=export_figure)
+
+        export_figure.assert_not_called()
+        mock_st.download_button.call_args.kwargs["data"]()
+        assert mock_bytes.call_args.args[0] is full
+
     @patch("src.web.pages.ui.plotting.download_section.EngineManager")
     @patch("src.web.pages.ui.plotting.download_section.st")
     def test_plotly_no_selection_no_download(self, mock_st: MagicMock, mock_em: MagicMock) -> None:
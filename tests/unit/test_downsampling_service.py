@@ -0,0 +1,124 @@
+"""Tests for large-data line/scatter reduction."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+import ring5
+from src.core.services.visualization.downsampling_service import (
+    DEFAULT_LARGE_DATA_THRESHOLD,
+    display_rows,
+    interactive_display,
+    large_data_threshold,
+    line_indices,
+    reduce_for_display,
+    scatter_indices,
+)
+from src.web.pages.ui.plotting.types.line_plot import LinePlot
+
+
+def _series(count: int) -> pd.DataFrame:
+    x = np.arange(count, dtype=float)
+    return pd.DataFrame({"tick": x, "ipc": np.sin(x / 500.0)})
+
+
+def test_small_frames_are_returned_unchanged() -> None:
+    data = _series(100)
+    assert reduce_for_display(data, "tick", "ipc", kind="line", threshold=1_000) is data
+    assert reduce_for_display(data, "tick", "ipc", kind="line", threshold=0) is data
+
+
+def test_line_reduction_keeps_bucket_extremes_and_endpoints() -> None:
+    data = _series(200_000)
+    data.loc[123_456, "ipc"] = 50.0
+    data.loc[7, "ipc"] = -50.0
+
+    reduced = reduce_for_display(data, "tick", "ipc", kind="line", threshold=10_000)
+
+    assert len(reduced) <= 4 * 2_000
+    assert reduced["tick"].is_monotonic_increasing
+    assert reduced["ipc"].max() == 50.0
+    assert reduced["ipc"].min() == -50.0
+    assert reduced.index[0] == 0 and reduced.index[-1] == 199_999
+
+
+def test_line_reduction_keeps_gaps_visible() -> None:
+    y = np.ones(100_000)
+    y[50_000] = np.nan
+
+    kept = line_indices(np.arange(100_000, dtype=float), y)
+
+    assert 50_000 in kept
+
+
+def test_scatter_reduction_keeps_one_point_per_occupied_cell() -> None:
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=300_000)
+    y = rng.normal(size=300_000)
+    y[5] = np.nan
+
+    kept = scatter_indices(x, y, grid=64)
+
+    assert len(kept) <= 64 * 64
+    assert 5 not in kept
+    assert np.all(np.diff(kept) > 0)
+
+
+def test_zoomed_range_resamples_only_the_visible_window() -> None:
+    data = _series(200_000)
+
+    rows = display_rows(
+        data["tick"], [data["ipc"]], kind="line", threshold=10_000, x_range=[1_000, 5_000]
+    )
+
+    assert rows is not None
+    # The window fits under the threshold, so its raw points come back in full.
+    assert rows.tolist() == list(range(999, 5_002))
+
+
+def test_threshold_config_is_validated() -> None:
+    with interactive_display():
+        assert large_data_threshold({}) == DEFAULT_LARGE_DATA_THRESHOLD
+        assert large_data_threshold({"large_data_threshold": 0}) == 0
+    assert large_data_threshold({}) == 0
+    with pytest.raises(ValueError, match="non-negative"):
+        large_data_threshold({"large_data_threshold": -1})
+
+
+def test_large_line_plot_switches_to_webgl_and_reduces_points() -> None:
+    # [test->req~ring5.render.plotly~1]
+    plot = LinePlot(1, "Per-tick IPC")
+    config = {"x": "tick", "y": "ipc", "large_data_threshold": 10_000, "show_markers": False}
+
+    with interactive_display():
+        fig = plot.create_figure(_series(200_000), config)
+
+    trace = fig.data[0]
+    assert isinstance(trace, go.Scattergl)
+    assert len(trace.x) <= 4 * 2_000
+
+    with interactive_display():
+        small = LinePlot(2, "IPC").create_figure(_series(500), config)
+    assert isinstance(small.data[0], go.Scatter)
+
+
+@pytest.mark.parametrize("engine", ["plotly", "matplotlib"])
+def test_rendered_and_exported_figures_keep_every_point(engine: str) -> None:
+    session = ring5.Session()
+    plot = session.create_plot(
+        "line",
+        data=_series(60_000),
+        config={"x": "tick", "y": "ipc", "show_markers": False},
+        name="Per-tick IPC",
+    )
+
+    fig = session.render(plot, engine=engine)  # type: ignore[arg-type]
+
+    if engine == "plotly":
+        assert isinstance(fig.data[0], go.Scatter)
+        assert len(fig.data[0].x) == 60_000
+    else:
+        assert len(fig.axes[0].lines[0].get_xdata()) == 60_000
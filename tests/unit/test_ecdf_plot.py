@@ -41,8 +41,8 @@ def test_grouped_ecdf_aggregates_duplicates_and_preserves_source() -> None:
     assert [trace.name for trace in result.traces] == ["new", "base"]
     base = result.traces[1]
     assert isinstance(base, LineTraceConfig)
-    assert base.x == [1.0, 2.0]
-    assert base.y == [1.0, 3.0]
+    assert list(base.x) == [1.0, 2.0]
+    assert list(base.y) == [1.0, 3.0]
     assert base.line_shape == "hv"
     assert base.show_markers and base.marker_size == 8
     assert base.color == "#336699"
@@ -66,8 +66,8 @@ def test_complementary_proportion_is_remaining_fraction_after_threshold() -> Non
     )
 
     assert isinstance(trace, LineTraceConfig)
-    assert trace.x == [1.0, 2.0, 3.0, 5.0]
-    assert trace.y == pytest.approx([5 / 6, 1 / 3, 1 / 6, 0.0])
+    assert list(trace.x) == [1.0, 2.0, 3.0, 5.0]
+    assert list(trace.y) == pytest.approx([5 / 6, 1 / 3, 1 / 6, 0.0])
     assert not trace.show_markers
     assert EcdfPlot(2, "ECDF").get_legend_column({}) is None
 
@@ -0,0 +1,173 @@
+"""Tests for the content-addressed export artifact cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Iterator
+
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+import ring5
+from ring5 import _export
+from src.core.services.managers.semantic_metadata_service import SemanticMetadataService
+from src.web.rendering import export_cache, report_builder
+from src.web.rendering.export_cache import ExportArtifactCache, configure_export_cache
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[ExportArtifactCache]:
+    installed = configure_export_cache(tmp_path / "exports", max_bytes=1024 * 1024)
+    assert installed is not None
+    yield installed
+    configure_export_cache(None)
+
+
+@pytest.fixture
+def session() -> Any:
+    return ring5.Session()
+
+
+def _bar_plot(session: Any, values: list[float]) -> Any:
+    df = pd.DataFrame({"x": ["A", "B"], "y": values})
+    return session.create_plot(
+        "bar",
+        data=df,
+        config={"x": "x", "y": "y", "title": "Cached", "xlabel": "X", "ylabel": "Y"},
+        name="Cached",
+    )
+
+
+def _key(index: int) -> str:
+    return f"{index:064x}"
+
+
+def test_lookups_count_hits_and_misses(tmp_path: Path) -> None:
+    cache = ExportArtifactCache(tmp_path, max_bytes=1024)
+
+    assert cache.get(_key(1)) is None
+    cache.put(_key(1), b"payload")
+
+    assert cache.get(_key(1)) == b"payload"
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.stores, stats.entries) == (1, 1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    cache = ExportArtifactCache(tmp_path, max_bytes=250)
+    for index in range(2):
+        cache.put(_key(index), bytes(100))
+        entry = tmp_path / _key(index)[:2] / f"{_key(index)}.bin"
+        os.utime(entry, (1_000 + index, 1_000 + index))
+    assert cache.get(_key(0)) is not None  # refreshes entry 0; entry 1 is now oldest
+
+    cache.put(_key(2), bytes(100))
+
+    assert cache.get(_key(1)) is None
+    assert cache.get(_key(0)) is not None
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.bytes <= 250
+
+
+def test_invalid_keys_are_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Invalid export cache key"):
+        ExportArtifactCache(tmp_path, max_bytes=1024).get("../../etc/passwd")
+
+
+def test_session_export_reuses_bytes_until_data_changes(
+    cache: ExportArtifactCache, session: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # [test->req~ring5.export.public-boundary~1]
+    calls: list[str] = []
+    original = _export._export_uncached
+
+    def counting(*args: Any, **kwargs: Any) -> bytes:
+        calls.append(args[1])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(_export, "_export_uncached", counting)
+    plot = _bar_plot(session, [10.0, 20.0])
+
+    first = session.export_bytes(session.render(plot, engine="matplotlib"), "svg")
+    second = session.export_bytes(session.render(plot, engine="matplotlib"), "svg")
+    assert first == second
+    assert calls == ["svg"]
+
+    changed = _bar_plot(session, [10.0, 25.0])
+    session.export_bytes(session.render(changed, engine="matplotlib"), "svg")
+    assert calls == ["svg", "svg"]
+    assert cache.stats().hits == 1
+
+
+def test_unit_changes_are_not_served_stale_bytes(
+    cache: ExportArtifactCache, session: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    frame = pd.DataFrame({"x": ["A", "B"], "y": [1.0, 2.0]})
+    renders: list[int] = []
+    original = report_builder._figure_png
+
+    def counting(*args: Any) -> bytes:
+        renders.append(1)
+        return original(*args)
+
+    monkeypatch.setattr(report_builder, "_figure_png", counting)
+    for unit in ("ns", "ms"):
+        semantics = ring5.DatasetSemantics((ring5.ColumnSemantics("y", "Latency", unit),))
+        plot = session.create_plot(
+            "bar",
+            data=SemanticMetadataService.attach(frame, semantics),
+            config={"x": "x", "y": "y"},
+            name="Latency",
+        )
+        session.report_bytes(session.create_report("Units", [plot]), fmt="html")
+
+    assert len(renders) == 2
+    assert cache.stats().hits == 0
+
+
+def test_edited_figures_are_not_served_stale_bytes(
+    cache: ExportArtifactCache, session: Any
+) -> None:
+    plotly_fig = go.Figure(go.Bar(x=["A"], y=[1]))
+    first = session.export_bytes(plotly_fig, "html", deterministic=True)
+    plotly_fig.update_layout(title_text="Edited")
+    assert session.export_bytes(plotly_fig, "html", deterministic=True) != first
+
+    mpl_fig = session.render(_bar_plot(session, [1.0, 2.0]), engine="matplotlib")
+    session.export_bytes(mpl_fig, "svg")
+    mpl_fig.axes[0].set_title("Edited")
+    assert b"Edited" in session.export_bytes(mpl_fig, "svg")
+    assert cache.stats().hits == 0
+
+
+def test_report_figures_are_cached(
+    cache: ExportArtifactCache, session: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # [test->req~ring5.export.batch-reports~1]
+    plot = _bar_plot(session, [3.0, 4.0])
+    report = session.create_report("Cached report", [plot])
+    renders: list[int] = []
+    original = report_builder._figure_png
+
+    def counting(*args: Any) -> bytes:
+        renders.append(1)
+        return original(*args)
+
+    monkeypatch.setattr(report_builder, "_figure_png", counting)
+
+    first = session.report_bytes(report, fmt="html")
+    second = session.report_bytes(report, fmt="html")
+
+    assert first == second
+    assert len(renders) == 1
+    assert cache.stats().hits == 1
+
+
+def test_cache_is_off_unless_configured(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("RING5_EXPORT_CACHE_DIR", raising=False)
+    configure_export_cache(None)
+    assert export_cache.get_export_cache() is None
@@ -1,6 +1,10 @@
 """Deterministic recursive statistics-file discovery."""
 
+import os
+import time
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -8,6 +12,32 @@ import src.parsing.framework.file_discovery as discovery
 from src.parsing.framework.file_discovery import FileDiscoveryLimitError, find_stats_files
 
 
+@pytest.fixture(autouse=True)
+def _fresh_discovery_cache() -> Iterator[None]:
+    discovery.clear_discovery_cache()
+    yield
+    discovery.clear_discovery_cache()
+
+
+def _age_directories(root: Path) -> None:
+    """Backdate directory mtimes so their listings are old enough to be cached."""
+    past = time.time() - 3600
+    for directory in [root, *(path for path in root.rglob("*") if path.is_dir())]:
+        os.utime(directory, (past, past))
+
+
+def _counting_scandir(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+    real_scandir = os.scandir
+
+    def scandir(path: Any) -> Any:
+        calls.append(str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(discovery.os, "scandir", scandir)
+    return calls
+
+
 @pytest.fixture
 def stats_tree(tmp_path: Path) -> Path:
     """Create matching files in an order different from lexical order."""
@@ -64,3 +94,74 @@ def test_entry_walk_is_bounded(stats_tree: Path, monkeypatch: pytest.MonkeyPatch
 
     with pytest.raises(FileDiscoveryLimitError, match="exceeded 1 entries"):
         find_stats_files(str(stats_tree), pattern="missing.txt")
+
+
+def test_unchanged_directories_reuse_cached_listings(
+    stats_tree: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _age_directories(stats_tree)
+    first = find_stats_files(str(stats_tree), sort=True)
+    calls = _counting_scandir(monkeypatch)
+
+    assert find_stats_files(str(stats_tree), sort=True) == first
+    assert calls == []
+
+
+def test_changed_directories_are_listed_again(
+    stats_tree: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # [test->req~ring5.ingestion.file-discovery~1]
+    _age_directories(stats_tree)
+    find_stats_files(str(stats_tree), sort=True)
+    (stats_tree / "m" / "deep" / "stats.txt").unlink()
+    (stats_tree / "a" / "b").mkdir()
+    (stats_tree / "a" / "b" / "stats.txt").write_text("new")
+    calls = _counting_scandir(monkeypatch)
+
+    paths = find_stats_files(str(stats_tree), sort=True)
+
+    assert [str(Path(path).relative_to(stats_tree)) for path in paths] == [
+        "a/b/stats.txt",
+        "a/stats.txt",
+        "z/run/stats.txt",
+    ]
+    assert sorted(Path(call).relative_to(stats_tree).as_posix() for call in calls) == [
+        "a",
+        "a/b",
+        "m/deep",
+    ]
+
+
+def test_recently_modified_directories_are_never_trusted(
+    stats_tree: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A listing read within the mtime granularity window could miss a same-tick change."""
+    find_stats_files(str(stats_tree))
+    calls = _counting_scandir(monkeypatch)
+
+    find_stats_files(str(stats_tree))
+
+    assert len(calls) == 6
+
+
+def test_cached_listings_still_count_toward_the_entry_bound(
+    stats_tree: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _age_directories(stats_tree)
+    find_stats_files(str(stats_tree))
+    monkeypatch.setattr(discovery, "MAX_DISCOVERY_ENTRIES", 3)
+
+    with pytest.raises(FileDiscoveryLimitError, match="exceeded 3 entries"):
+        find_stats_files(str(stats_tree))
+
+
+def test_use_cache_false_always_lists_directories(
+    stats_tree: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _age_directories(stats_tree)
+    find_stats_files(str(stats_tree))
+    calls = _counting_scandir(monkeypatch)
+
+    find_stats_files(str(stats_tree), use_cache=False)
+
+    assert len(calls) == 6
@@ -5,9 +5,12 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.parsing.gem5.impl.strategies.gem5_parse_work import (
+    Gem5ParseBatch,
     Gem5ParseWork,
     VarsDictType,
+    plan_parse_batches,
 )
+from src.parsing.gem5.impl.strategies.perl_worker_pool import FileParseOutput
 
 
 class MockType:
@@ -220,6 +223,81 @@ def test_call_subprocess(parser: Any) -> None:
             assert result["vector_var"].content["0"] == ["20"]
 
 
+def test_batched_works_share_one_parse_request() -> None:
+    # [test->req~ring5.ingestion.persistent-workers~1]
+    batch = Gem5ParseBatch(["a.txt", "b.txt"])
+    works = [
+        Gem5ParseWork(path, {"scalar_var": Scalar()}, batch=batch) for path in batch.file_paths
+    ]
+
+    with patch("src.parsing.gem5.impl.strategies.gem5_parse_work.get_worker_pool") as mock_get_pool:
+        with patch("src.core.common.utils.checkFileExistsOrException"):
+            mock_get_pool.return_value.parse_files.return_value = [
+                FileParseOutput("a.txt", ["scalar/scalar_var/1"]),
+                FileParseOutput("b.txt", ["scalar/scalar_var/2"]),
+            ]
+
+            results = [work() for work in works]
+
+    mock_get_pool.return_value.parse_files.assert_called_once()
+    assert mock_get_pool.return_value.parse_files.call_args.args[:2] == (
+        ["a.txt", "b.txt"],
+        ["scalar_var"],
+    )
+    assert [result["scalar_var"].content for result in results] == ["1", "2"]
+
+
+def test_batched_work_surfaces_only_its_own_file_error() -> None:
+    batch = Gem5ParseBatch(["a.txt", "b.txt"])
+    good = Gem5ParseWork("a.txt", {"scalar_var": Scalar()}, batch=batch)
+    bad = Gem5ParseWork("b.txt", {"scalar_var": Scalar()}, batch=batch)
+
+    with patch("src.parsing.gem5.impl.strategies.gem5_parse_work.get_worker_pool") as mock_get_pool:
+        with patch("src.core.common.utils.checkFileExistsOrException"):
+            mock_get_pool.return_value.parse_files.return_value = [
+                FileParseOutput("a.txt", ["scalar/scalar_var/1"]),
+                FileParseOutput("b.txt", error="Parsing failed: line limit"),
+            ]
+
+            with pytest.raises(RuntimeError, match="Worker pool parse failed: b.txt"):
+                bad()
+            assert good()["scalar_var"].content == "1"
+
+
+def test_batch_failure_is_reported_to_every_member() -> None:
+    batch = Gem5ParseBatch(["a.txt", "b.txt"])
+    works = [
+        Gem5ParseWork(path, {"scalar_var": Scalar()}, batch=batch) for path in batch.file_paths
+    ]
+
+    with patch("src.parsing.gem5.impl.strategies.gem5_parse_work.get_worker_pool") as mock_get_pool:
+        with patch("src.core.common.utils.checkFileExistsOrException"):
+            mock_get_pool.return_value.parse_files.side_effect = TimeoutError("slow")
+
+            for work in works:
+                with pytest.raises(RuntimeError, match="Parser timeout"):
+                    work()
+
+    mock_get_pool.return_value.parse_files.assert_called_once()
+
+
+def test_plan_parse_batches_stripes_each_window_across_lanes() -> None:
+    files = [f"f{i}" for i in range(10)]
+
+    batches = plan_parse_batches(files, batch_size=2, parallelism=2)
+
+    assert len(batches) == len(files)
+    assert [batch.file_paths for batch in dict.fromkeys(batches)] == [
+        ("f0", "f2"),
+        ("f1", "f3"),
+        ("f4", "f6"),
+        ("f5", "f7"),
+        ("f8",),
+        ("f9",),
+    ]
+    assert all(path in batch.file_paths for path, batch in zip(files, batches, strict=True))
+
+
 def test_distribution_with_stats(parser: Any) -> None:
 
     # Test processing distribution with stats entries (mean, samples)
@@ -346,3 +346,74 @@ class TestScanFileScanFile:
 
         with pytest.raises(RuntimeError, match="line limit exceeded"):
             scanner.scan_file(test_file)
+
+
+class TestScanFilePersistent:
+    """Test Gem5StatsScanner.scan_file_persistent via the scanner server pool."""
+
+    @pytest.fixture
+    def scanner(self, clean_scanner: Any) -> Gem5StatsScanner:
+        return Gem5StatsScanner()
+
+    @pytest.fixture
+    def mock_pool(self, monkeypatch: Any) -> Mock:
+        pool = Mock()
+        monkeypatch.setattr("src.parsing.gem5.impl.scanning.scanner.get_scanner_pool", lambda: pool)
+        return pool
+
+    def test_decodes_pool_output(
+        self, scanner: Gem5StatsScanner, mock_pool: Mock, tmp_path: Path
+    ) -> None:
+        test_file = tmp_path / "stats.txt"
+        test_file.write_text("dummy")
+        mock_pool.scan_file.return_value = ["[", '{"name": "simTicks", "type": "scalar"}', "]"]
+
+        result = scanner.scan_file_persistent(test_file, config_vars=["seed"])
+
+        assert [v.name for v in result] == ["simTicks"]
+        mock_pool.scan_file.assert_called_once_with(str(test_file), ["seed"], timeout=15.0)
+
+    def test_missing_file_never_reaches_pool(
+        self, scanner: Gem5StatsScanner, mock_pool: Mock, tmp_path: Path
+    ) -> None:
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            scanner.scan_file_persistent(tmp_path / "missing.txt")
+
+        mock_pool.scan_file.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "error,match",
+        [(TimeoutError("slow"), "timed out"), (RuntimeError("All workers failed"), "failed")],
+    )
+    def test_pool_failures_raise_runtime_error(
+        self,
+        scanner: Gem5StatsScanner,
+        mock_pool: Mock,
+        tmp_path: Path,
+        error: Exception,
+        match: str,
+    ) -> None:
+        test_file = tmp_path / "stats.txt"
+        test_file.write_text("dummy")
+        mock_pool.scan_file.side_effect = error
+
+        with pytest.raises(RuntimeError, match=match):
+            scanner.scan_file_persistent(test_file)
+
+    def test_real_scanner_server_matches_one_shot_scan(
+        self, scanner: Gem5StatsScanner, tmp_path: Path
+    ) -> None:
+        from src.parsing.gem5.impl.strategies.perl_worker_pool import shutdown_scanner_pool
+
+        test_file = tmp_path / "stats.txt"
+        test_file.write_text(
+            "simTicks 1000 # ticks\n"
+            "system.cpu.op_class::IntAlu 10 50.00% 50.00% # ops\n"
+            "system.cpu.op_class::total 20 # ops\n"
+        )
+        try:
+            persistent = scanner.scan_file_persistent(test_file)
+        finally:
+            shutdown_scanner_pool()
+
+        assert persistent == scanner.scan_file(test_file)
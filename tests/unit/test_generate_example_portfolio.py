@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
@@ -21,6 +20,7 @@ from scripts.generate_example_portfolio import (
 )
 from src.core.services.data_services.path_service import PathService
 from src.core.services.data_services.portfolio_service import PortfolioService
+from src.core.services.portfolio_container import PortfolioContainer
 from src.core.services.portfolio_migrator import PortfolioMigrator
 from src.core.state.repository_state_manager import RepositoryStateManager
 from src.web.pages.ui.plotting.plot_factory import PlotFactory
@@ -78,7 +78,7 @@ def test_generated_portfolio_round_trips(
 
     assert output == tmp_path / "Example Cases.json"
     assert output.is_file()
-    raw = json.loads(output.read_text())
+    raw = PortfolioContainer.read_document(output.read_bytes())
     assert raw["schema_version"] == PortfolioMigrator.CURRENT_VERSION
     assert len(raw["plots"]) == len(PlotFactory.get_available_plot_types())
     assert all("figure_spec" in plot for plot in raw["plots"])
@@ -2,37 +2,45 @@
 
 from __future__ import annotations
 
-import json
+import os
+import sqlite3
 from pathlib import Path
 
+import pytest
+
 from src.core.models import ScannedVariable, StatConfig
 from src.parsing.framework.incremental_cache import (
     configuration_hash,
     fingerprint_inputs,
     load_cache,
+    scan_inputs,
     write_cache,
 )
 
 
-def test_cache_is_plain_json_and_rejects_stale_or_malformed_records(tmp_path: Path) -> None:
+def test_cache_is_sqlite_and_rejects_stale_or_malformed_records(tmp_path: Path) -> None:
     # [test->req~ring5.ingestion.incremental-parsing~1]
     source = tmp_path / "stats.txt"
     source.write_text("simTicks 100\n", encoding="utf-8")
-    fingerprints = fingerprint_inputs([str(source)], "simple")
+    scan = scan_inputs([str(source)], "simple")
     config = StatConfig(name="simTicks", type="scalar")
     config_hash = configuration_hash("stats.txt", "simple", [config], None)
-    cache = tmp_path / "cache.json"
+    cache = tmp_path / "cache.sqlite"
 
     write_cache(
         cache,
         config_hash,
         ["simTicks"],
-        fingerprints,
+        scan.fingerprints,
         {str(source.resolve()): {"simTicks": "100"}},
+        scan.stamps,
     )
-    payload = json.loads(cache.read_text(encoding="utf-8"))
-    assert payload["files"][str(source.resolve())]["cells"] == {"simTicks": "100"}
-    assert load_cache(cache, config_hash)[1][str(source.resolve())][1] == {"simTicks": "100"}
+    with sqlite3.connect(cache) as connection:
+        paths = [row[0] for row in connection.execute("SELECT source_path FROM files")]
+    assert paths == [str(source.resolve())]
+    cached = load_cache(cache, config_hash)[1][str(source.resolve())]
+    assert cached.cells == {"simTicks": "100"}
+    assert cached.stamp == dict(scan.stamps)[str(source.resolve())]
 
     changed_config = configuration_hash(
         "stats.txt",
@@ -42,10 +50,90 @@ def test_cache_is_plain_json_and_rejects_stale_or_malformed_records(tmp_path: Pa
     )
     assert load_cache(cache, changed_config) == ([], {})
 
+    with sqlite3.connect(cache) as connection:
+        connection.execute("UPDATE files SET raw_size = raw_size + 1")
+    assert load_cache(cache, config_hash) == ([], {})
+
     cache.write_text('{"schema_version": 1, "files":', encoding="utf-8")
     assert load_cache(cache, config_hash) == ([], {})
 
 
+def test_cache_updates_changed_rows_in_place(tmp_path: Path) -> None:
+    sources = [tmp_path / f"run-{index}" / "stats.txt" for index in range(3)]
+    for index, source in enumerate(sources):
+        source.parent.mkdir()
+        source.write_text(f"simTicks {index}\n", encoding="utf-8")
+    paths = [str(source.resolve()) for source in sources]
+    cache = tmp_path / "cache.sqlite"
+    rows = {path: {"simTicks": str(index)} for index, path in enumerate(paths)}
+
+    scan = scan_inputs(paths, "simple")
+    write_cache(cache, "a" * 64, ["simTicks"], scan.fingerprints, rows, scan.stamps)
+    unchanged = cache.read_bytes()
+    write_cache(cache, "a" * 64, ["simTicks"], scan.fingerprints, rows, scan.stamps)
+    assert cache.read_bytes() == unchanged
+
+    sources[1].write_text("simTicks 10\n", encoding="utf-8")
+    rescan = scan_inputs(paths[:2], "simple")
+    write_cache(
+        cache,
+        "a" * 64,
+        ["simTicks"],
+        rescan.fingerprints,
+        {paths[0]: rows[paths[0]], paths[1]: {"simTicks": "10"}},
+        rescan.stamps,
+    )
+    _names, files = load_cache(cache, "a" * 64)
+    assert {path: cached.cells for path, cached in files.items()} == {
+        paths[0]: {"simTicks": "0"},
+        paths[1]: {"simTicks": "10"},
+    }
+
+
+def test_metadata_change_detection_hashes_only_restamped_inputs(tmp_path: Path) -> None:
+    first = tmp_path / "a" / "stats.txt"
+    second = tmp_path / "b" / "stats.txt"
+    for source in (first, second):
+        source.parent.mkdir()
+        source.write_text("simTicks 100\n", encoding="utf-8")
+    paths = [str(first), str(second)]
+    initial = scan_inputs(paths, "simple", change_detection="metadata")
+    assert initial.hashed_files == 2
+    known = {
+        path: (stamp, fingerprint)
+        for (path, stamp), (_path, fingerprint) in zip(
+            initial.stamps, initial.fingerprints, strict=True
+        )
+    }
+
+    assert scan_inputs(paths, "simple", change_detection="metadata", known=known).hashed_files == 0
+    assert scan_inputs(paths, "simple", known=known).hashed_files == 2
+
+    # A same-size rewrite with a restored mtime is invisible to metadata alone...
+    status = second.stat()
+    second.write_text("simTicks 999\n", encoding="utf-8")
+    os.utime(second, ns=(status.st_atime_ns, status.st_mtime_ns))
+    stale = scan_inputs(paths, "simple", change_detection="metadata", known=known)
+    assert stale.fingerprints == initial.fingerprints
+
+    # ...but a full verification sample catches it and rehashes every input.
+    verified = scan_inputs(
+        paths, "simple", change_detection="metadata", known=known, verify_fraction=1.0
+    )
+    assert verified.fingerprints == fingerprint_inputs(paths, "simple")
+    assert verified.fingerprints != initial.fingerprints
+
+    first.write_text("simTicks 1000\n", encoding="utf-8")
+    restamped = scan_inputs(paths, "simple", change_detection="metadata", known=known)
+    assert restamped.hashed_files == 1
+    assert dict(restamped.fingerprints)[str(first.resolve())] != known[str(first.resolve())][1]
+
+    with pytest.raises(ValueError, match="change detection"):
+        scan_inputs(paths, "simple", change_detection="mtime")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="verify_fraction"):
+        scan_inputs(paths, "simple", verify_fraction=2.0)
+
+
 def test_config_aware_fingerprint_includes_the_companion_configuration(tmp_path: Path) -> None:
     source = tmp_path / "stats.txt"
     config = tmp_path / "config.ini"
@@ -0,0 +1,155 @@
+"""Tests for the pooled Kaleido render service.
+
+Chrome is replaced by a fake ``kaleido.Kaleido`` so the pooling, recycling
+and statistics logic runs without a browser.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+import plotly.graph_objects as go
+import pytest
+from kaleido.errors import ChromeNotFoundError
+
+from src.web.rendering import figure_export, kaleido_render_service
+from src.web.rendering.kaleido_render_service import KaleidoRenderService
+
+
+class FakeKaleido:
+    """Async stand-in for ``kaleido.Kaleido`` recording its lifecycle."""
+
+    instances: list[FakeKaleido] = []
+    lock = threading.Lock()
+    stall_titles: set[str] = set()
+    missing_browser = False
+
+    def __init__(self, **options: Any) -> None:
+        if FakeKaleido.missing_browser:
+            raise ChromeNotFoundError("Chrome not found — run kaleido_get_chrome")
+        self.options = options
+        self.renders = 0
+        self.closed = False
+        with FakeKaleido.lock:
+            FakeKaleido.instances.append(self)
+
+    async def __aenter__(self) -> FakeKaleido:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        self.closed = True
+
+    async def calc_fig(self, fig: dict[str, Any], opts: dict[str, Any]) -> bytes:
+        title = fig.get("layout", {}).get("title", {}).get("text", "")
+        if title in FakeKaleido.stall_titles:
+            await asyncio.sleep(60)
+        self.renders += 1
+        if opts["format"] == "svg":
+            return b'<svg><defs id="defs-a1b2c3"/><g clip-path="url(#clipa1b2c3xyplot)"/></svg>'
+        return f"{opts['format']}:{title}".encode()
+
+
+@pytest.fixture(autouse=True)
+def fake_kaleido(monkeypatch: pytest.MonkeyPatch) -> type[FakeKaleido]:
+    FakeKaleido.instances = []
+    FakeKaleido.stall_titles = set()
+    FakeKaleido.missing_browser = False
+    monkeypatch.setattr(kaleido_render_service.kaleido, "Kaleido", FakeKaleido)
+    monkeypatch.delenv("RING5_KALEIDO_WORKERS", raising=False)
+    yield FakeKaleido
+    kaleido_render_service.shutdown_render_service()
+
+
+def _figure(title: str) -> dict[str, Any]:
+    return go.Figure(layout={"title": {"text": title}}).to_dict()
+
+
+PNG = {"format": "png", "width": 10, "height": 10, "scale": 1}
+
+
+def test_warm_browsers_serve_batches_in_order() -> None:
+    # [test->req~ring5.export.plotly-static~1]
+    service = KaleidoRenderService(workers=2)
+    try:
+        results = service.render_batch([(_figure(f"f{i}"), PNG) for i in range(6)])
+        stats = service.get_stats()
+    finally:
+        service.shutdown()
+
+    assert results == [f"png:f{i}".encode() for i in range(6)]
+    assert len(FakeKaleido.instances) == 2  # one launch per slot, reused across renders
+    assert FakeKaleido.instances[0].options == {"n": 1, "timeout": 25.0}
+    assert stats["renders"] == 6
+    assert stats["queue_depth"] == 0
+    assert stats["latency_samples"] == 6
+    assert stats["p95_latency_s"] is not None
+    assert all(instance.closed for instance in FakeKaleido.instances)
+
+
+def test_browser_is_recycled_after_render_limit() -> None:
+    # [test->req~ring5.export.plotly-static~1]
+    service = KaleidoRenderService(workers=1, recycle_after=2)
+    try:
+        for i in range(5):
+            service.render(_figure(f"f{i}"), PNG)
+        stats = service.get_stats()
+    finally:
+        service.shutdown()
+
+    assert [instance.renders for instance in FakeKaleido.instances] == [2, 2, 1]
+    assert stats["recycles"] == {"render-limit": 2}
+    assert stats["browser_launches"] == 3
+
+
+def test_stalled_render_recycles_the_browser() -> None:
+    FakeKaleido.stall_titles = {"stuck"}
+    service = KaleidoRenderService(workers=1, render_timeout=0.05)
+    try:
+        with pytest.raises(TimeoutError, match="stalled"):
+            service.render(_figure("stuck"), PNG)
+        assert service.render(_figure("ok"), PNG) == b"png:ok"
+        stats = service.get_stats()
+    finally:
+        service.shutdown()
+
+    assert FakeKaleido.instances[0].closed
+    assert stats["recycles"] == {"stall": 1}
+    assert stats["failures"] == 1
+    assert stats["renders"] == 1
+
+
+def test_missing_browser_is_reported_to_the_caller() -> None:
+    FakeKaleido.missing_browser = True
+    service = KaleidoRenderService(workers=1)
+    try:
+        with pytest.raises(ChromeNotFoundError):
+            service.render(_figure("f"), PNG)
+    finally:
+        service.shutdown()
+
+
+def test_export_routes_through_the_service_and_stays_deterministic(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("RING5_KALEIDO_WORKERS", "2")
+    monkeypatch.setattr(
+        figure_export.kaleido,
+        "calc_fig_sync",
+        lambda *args, **kwargs: pytest.fail("oneshot Kaleido used while the service runs"),
+    )
+    figs = [go.Figure(layout={"title": {"text": f"f{i}"}}) for i in range(3)]
+
+    svgs = figure_export.plotly_download_batch(figs, "svg", deterministic=True)
+    png = figure_export.plotly_download_bytes(figs[0], "png")
+
+    assert len(svgs) == 3
+    assert all(b"defs-000000" in svg and b"a1b2c3" not in svg for svg in svgs)
+    assert png == b"png:f0"
+    service = kaleido_render_service.get_render_service()
+    assert service is not None and service.workers == 2
+
+
+def test_service_is_off_unless_configured() -> None:
+    assert kaleido_render_service.get_render_service() is None
@@ -0,0 +1,125 @@
+"""Tests for the process-pool Matplotlib export farm."""
+
+from __future__ import annotations
+
+import pickle
+from typing import Any, Iterator
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+import ring5
+from src.web.rendering import matplotlib_export_farm
+from src.web.rendering.figure_export import matplotlib_download_bytes
+from src.web.rendering.matplotlib_export_farm import (
+    MatplotlibExportFarm,
+    MatplotlibExportJob,
+    figure_source,
+)
+
+
+@pytest.fixture(scope="module")
+def farm() -> Iterator[MatplotlibExportFarm]:
+    farm = MatplotlibExportFarm(workers=2)
+    yield farm
+    farm.shutdown()
+
+
+@pytest.fixture
+def session() -> Any:
+    return ring5.Session()
+
+
+def _bar_plot(session: Any, title: str) -> Any:
+    df = pd.DataFrame({"x": ["A", "B", "C"], "y": [10.0, 20.0, 15.0]})
+    return session.create_plot(
+        "bar",
+        data=df,
+        config={"x": "x", "y": "y", "title": title, "xlabel": "X", "ylabel": "Y"},
+        name=title,
+    )
+
+
+@pytest.mark.parametrize("fmt", ["svg", "pdf", "png"])
+def test_farm_export_matches_in_process_bytes(
+    farm: MatplotlibExportFarm, session: Any, fmt: str
+) -> None:
+    # [test->req~ring5.export.matplotlib-standard~1]
+    fig = session.render(_bar_plot(session, "Farm"), engine="matplotlib")
+    source = figure_source(fig)
+    assert source is not None
+
+    job = MatplotlibExportJob(source, fmt, deterministic=True)  # type: ignore[arg-type]
+    pooled = farm.export(job)
+    local = matplotlib_download_bytes(
+        fig, fmt, spec=fig._ring5_spec, deterministic=True  # type: ignore[arg-type]
+    )
+
+    assert pooled == local
+
+
+def test_farm_export_keeps_the_parent_style(farm: MatplotlibExportFarm, session: Any) -> None:
+    with plt.style.context("ggplot"):
+        fig = session.render(_bar_plot(session, "Styled"), engine="matplotlib")
+        source = figure_source(fig)
+        assert source is not None
+
+        pooled = farm.export(MatplotlibExportJob(source, "svg", deterministic=True))
+        local = matplotlib_download_bytes(
+            fig, "svg", spec=fig._ring5_spec, deterministic=True  # type: ignore[attr-defined]
+        )
+
+    assert pooled == local
+    # Restyling after render would make a rebuilt figure differ from the live one.
+    assert figure_source(fig) is None
+
+
+def test_export_many_preserves_order(farm: MatplotlibExportFarm, session: Any) -> None:
+    figs = [session.render(_bar_plot(session, f"Plot {i}"), engine="matplotlib") for i in range(4)]
+    sources = [figure_source(fig) for fig in figs]
+    jobs = [MatplotlibExportJob(src, "svg", deterministic=True) for src in sources if src]
+
+    results = farm.export_many(jobs)
+
+    for i, data in enumerate(results):
+        assert f"Plot {i}".encode() in data
+
+
+def test_figure_source_is_picklable_and_rejected_after_edits(session: Any) -> None:
+    fig = session.render(_bar_plot(session, "Edited"), engine="matplotlib")
+    source = figure_source(fig)
+    assert source is not None
+    assert pickle.loads(pickle.dumps(source)).plot_type == "bar"
+
+    fig.axes[0].set_title("Changed after render")
+
+    assert figure_source(fig) is None
+
+
+def test_session_export_routes_through_the_configured_farm(
+    session: Any, monkeypatch: pytest.MonkeyPatch, farm: MatplotlibExportFarm
+) -> None:
+    # [test->req~ring5.export.matplotlib-standard~1]
+    calls: list[MatplotlibExportJob] = []
+    original_export = farm.export
+
+    def recording_export(job: MatplotlibExportJob) -> bytes:
+        calls.append(job)
+        return original_export(job)
+
+    monkeypatch.setattr(farm, "export", recording_export)
+    monkeypatch.setattr(matplotlib_export_farm, "_farm_instance", farm)
+    fig = session.render(_bar_plot(session, "Session"), engine="matplotlib")
+
+    data = session.export_bytes(fig, "svg", deterministic=True)
+    fig.axes[0].set_xlabel("Edited")
+    session.export_bytes(fig, "svg", deterministic=True)
+
+    assert b"<svg" in data[:500]
+    assert len(calls) == 1  # the edited figure is exported in-process
+
+
+def test_farm_is_off_unless_configured(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("RING5_MPL_EXPORT_WORKERS", raising=False)
+    assert matplotlib_export_farm.get_export_farm() is None
@@ -352,6 +352,22 @@ class TestRender:
         count = MatplotlibTraceRenderer.render([trace], ax)
         assert count.trace_count == 1
 
+    def test_numpy_payloads_render_with_missing_values(self, ax: matplotlib.axes.Axes) -> None:
+        y = np.array([1.0, np.nan, 3.0, 4.0])
+        traces: list[TraceConfig] = [
+            LineTraceConfig(name="l", x=np.arange(4.0), y=y, connect_gaps=True),
+            ScatterTraceConfig(
+                name="s", x=np.arange(4.0), y=np.array([1, None, 3, 4], dtype=object)
+            ),
+        ]
+
+        result = MatplotlibTraceRenderer.render(traces, ax)
+
+        assert result.trace_count == 2
+        assert list(ax.lines[0].get_xdata()) == [0.0, 2.0, 3.0]
+        assert list(ax.lines[0].get_ydata()) == [1.0, 3.0, 4.0]
+        assert len(ax.collections) == 1
+
     def test_single_histogram(self, ax: matplotlib.axes.Axes) -> None:
         trace = HistogramTraceConfig(name="h1", x=[1, 2, 3, 4, 5])
         count = MatplotlibTraceRenderer.render([trace], ax)
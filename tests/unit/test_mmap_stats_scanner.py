@@ -0,0 +1,206 @@
+"""
+Parity tests for the pure-Python mmap stats backend.
+
+The Perl parser server is the reference: every fixture is parsed by both
+backends and their records must be identical, quirks included.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from src.core.common.safe_regex import escape_perl_stat_filter
+from src.core.models import StatConfig
+from src.parsing.gem5.impl.strategies.factory import StrategyFactory
+from src.parsing.gem5.impl.strategies.gem5_parse_work import Gem5ParseWork
+from src.parsing.gem5.impl.strategies.mmap_parse_work import (
+    MmapParseWork,
+    shutdown_mmap_scan_pool,
+)
+from src.parsing.gem5.impl.strategies.mmap_stats_scanner import StatFilterIndex, scan_stats_file
+from src.parsing.gem5.impl.strategies.perl_worker_pool import (
+    PerlWorkerPool,
+    shutdown_worker_pool,
+)
+from src.parsing.gem5.impl.strategies.simple import SimpleStatsStrategy
+
+pytestmark = pytest.mark.xdist_group("perl_pool")
+
+STATS = """
+---------- Begin Simulation Statistics ----------
+simSeconds                                   0.001234                       # Seconds (Second)
+simTicks                                   1234000000                       # Ticks (Tick)
+system.cpu.ipc                               1.523000                       # IPC: ((Count/Cycle))
+system.cpu.cpi                                    nan                       # CPI
+system.cpu0.numCycles                            1000                       # Number of cycles
+system.cpu1.numCycles                            2000                       # Number of cycles
+system.cpu12.numCycles                           3000                       # Number of cycles
+system.l2.tags.occ                               12.5 (Unspecified)
+system.cpu.op_class::No_OpClass                     5      0.50%      0.50% # Class
+system.cpu.op_class::IntAlu                       995     99.50%    100.00% # Class
+system.cpu.op_class::total                       1000                       # Class
+system.mem.lat::samples                           100                       # latency
+system.mem.lat::mean                            12.34                       # latency
+system.mem.lat::0-9                                10     10.00%     10.00% # latency
+system.mem.lat::10-19                              90     90.00%    100.00% # latency
+system.mem.lat::total                             100                       # latency
+system.mem.dist::underflows                         0      0.00%      0.00% # dist
+system.mem.dist::-1                                 1      1.00%      1.00% # dist
+system.mem.dist::0                                 98     98.00%     99.00% # dist
+system.mem.dist::overflows                          1      1.00%    100.00% # dist
+system.mem.dist::total                            100                       # dist
+system.one::bucket_size                             4                       # oneline
+system.one::max_bucket                             11                       # oneline
+system.one                  |  5 50.00% 50.00% |  3 30.00% 80.00% |  2 20.00% 100.00% # oneline
+system.weird                                      abc                       # unclassifiable
+system.tabbed\t7\t# tab separated
+system.cpu.MemDepUnit__0.insertedLoads             42                       # loads
+system.cpu.ipc_extra                                9                       # not requested
+sim_mode=timing
+system.cpu.workload=/path/to/bin,arg(1)
+system.cpu.ipc::extra\t3
+---------- End Simulation Statistics   ----------
+"""
+
+FILTERS = [
+    "simSeconds",
+    "simTicks",
+    "system.cpu.ipc",
+    "system.cpu.cpi",
+    r"system.cpu\d+.numCycles",
+    "system.l2.tags.occ",
+    "system.cpu.op_class",
+    "system.mem.lat",
+    "system.mem.dist",
+    "system.one",
+    "system.weird",
+    "system.tabbed",
+    r"system.cpu.MemDepUnit__\d+.insertedLoads",
+    "sim_mode",
+    "system.cpu.workload",
+]
+
+
+@pytest.fixture
+def perl_pool() -> Generator[PerlWorkerPool, None, None]:
+    pool = PerlWorkerPool(pool_size=1)
+    yield pool
+    pool.shutdown()
+
+
+def _write(tmp_path: Path, text: str, name: str = "stats.txt") -> str:
+    path = tmp_path / name
+    path.write_bytes(text.encode("utf-8"))
+    return str(path)
+
+
+def _scan(path: str, filters: list[str], max_lines: int = 10_000_000) -> list[str]:
+    return ["/".join(record) for record in scan_stats_file(path, filters, max_lines=max_lines)]
+
+
+class TestMmapScannerParity:
+    # [test->req~ring5.ingestion.gem5-backend~1]
+
+    @pytest.mark.parametrize(
+        "text",
+        [STATS, "system.cpu.ipc 2.0\r\nsimTicks 5", ""],
+        ids=["all-line-shapes", "crlf-no-final-newline", "empty"],
+    )
+    def test_records_match_perl_output(
+        self, tmp_path: Path, perl_pool: PerlWorkerPool, text: str
+    ) -> None:
+        path = _write(tmp_path, text)
+        perl_filters = [escape_perl_stat_filter(pattern) for pattern in FILTERS]
+
+        assert _scan(path, FILTERS) == perl_pool.parse_file(path, perl_filters)
+
+    def test_malformed_oneline_histogram_fails_like_perl(
+        self, tmp_path: Path, perl_pool: PerlWorkerPool
+    ) -> None:
+        path = _write(
+            tmp_path,
+            "h::bucket_size 4\nh::max_bucket 11\nh | 5 50% 50% | 3 30% 80%\n",
+        )
+
+        with pytest.raises(RuntimeError, match="bucket count mismatch for h: expected 3"):
+            _scan(path, ["h"])
+        with pytest.raises(RuntimeError):
+            perl_pool.parse_file(path, ["h"])
+
+    def test_line_limit_is_enforced(self, tmp_path: Path) -> None:
+        path = _write(tmp_path, "a 1\nb 2\nc 3\n")
+
+        assert _scan(path, ["c"], max_lines=3) == ["scalar/c/3"]
+        with pytest.raises(RuntimeError, match="line limit exceeded"):
+            _scan(path, ["c"], max_lines=2)
+
+    def test_filter_index_requires_a_name_boundary(self) -> None:
+        index = StatFilterIndex(["system.cpu.ipc", r"system.cpu\d+.numCycles", r"l2\d+"])
+
+        assert index.admits(b"system.cpu.ipc 1")
+        assert index.admits(b"system.cpu.ipc::0 1")
+        assert index.admits(b"system.cpu3.numCycles=4")
+        assert index.admits(b"l23 1")
+        assert not index.admits(b"l3 1")
+        assert not index.admits(b"system.cpu.ipc")
+        assert not index.admits(b"system.cpu.ipc:x 1")
+        assert not index.admits(b"system.cpu.ipcx 1")
+        assert not index.admits(b"system.cpux.numCycles 1")
+
+
+class TestMmapParseWork:
+    # [test->req~ring5.ingestion.simple-strategy~1]
+
+    @pytest.fixture(autouse=True)
+    def _stop_pools(self) -> Generator[None, None, None]:
+        yield
+        shutdown_mmap_scan_pool()
+        shutdown_worker_pool()
+
+    def test_variables_match_the_perl_backend(self, tmp_path: Path) -> None:
+        path = _write(tmp_path, STATS)
+        template = SimpleStatsStrategy()._map_variables(
+            [
+                StatConfig(name="simTicks", type="scalar"),
+                StatConfig(name="system.cpu.cpi", type="scalar"),
+                StatConfig(
+                    name="system.cpu.op_class",
+                    type="vector",
+                    params={"entries": ["No_OpClass", "IntAlu", "total"]},
+                ),
+                StatConfig(
+                    name="system.mem.dist",
+                    type="distribution",
+                    params={"minimum": -1, "maximum": 0},
+                ),
+                StatConfig(name="system.one", type="histogram"),
+                StatConfig(name="sim_mode", type="configuration"),
+                StatConfig(name="system.cpu.workload", type="configuration"),
+            ]
+        )
+
+        perl = Gem5ParseWork(path, copy.deepcopy(template))()
+        mmap = MmapParseWork(path, copy.deepcopy(template))()
+
+        assert mmap.keys() == perl.keys()
+        for var_id, var in perl.items():
+            if var_id in template:
+                assert mmap[var_id].content == var.content, var_id
+
+    def test_strategy_builds_mmap_work_items(self, tmp_path: Path) -> None:
+        path = _write(tmp_path, STATS)
+        strategy = StrategyFactory.create("python_mmap")
+
+        works = strategy.get_work_items(
+            str(tmp_path),
+            "stats.txt",
+            [StatConfig(name="simTicks", type="scalar")],
+            file_paths=[path],
+        )
+
+        assert [type(work) for work in works] == [MmapParseWork]
+        assert works[0]()["simTicks"].content == [1234000000.0]
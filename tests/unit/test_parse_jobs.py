@@ -26,7 +26,9 @@ from src.core.models import (
     ParseJobStatus,
 )
 from src.core.models.parse_job_models import JsonValue
+from src.core.services.parse_job_checkpoints import CHECKPOINT_FILE_NAME, ParseCheckpointLog
 from src.core.services.parse_job_service import (
+    ParseCheckpointHooks,
     ParseJobService,
     build_parse_job_request,
 )
@@ -36,6 +38,8 @@ from src.core.services.parse_job_store import (
     ParseJobStore,
 )
 from src.core.services.parse_job_workspace import ParseJobRuntimeWorkspace
+from src.parsing.gem5.impl.gem5_parser import Gem5Parser
+from src.parsing.gem5.impl.strategies.file_parser_strategy import INTERNAL_SIM_PATH_KEY
 
 
 def _stats_tree(root: Path, contents: Sequence[str] = ("simTicks 1\n",)) -> None:
@@ -93,6 +97,7 @@ class _ServiceFactory:
             | None
         ) = None,
         publish: Callable[[str, str], str] | None = None,
+        checkpoint_hooks: ParseCheckpointHooks | None = None,
     ) -> ParseJobService:
         pool = self.runtime.jobs_root.parent / "recent"
         pool.mkdir(exist_ok=True)
@@ -118,6 +123,7 @@ class _ServiceFactory:
             finalize or default_finalize,
             publish or default_publish,
             runtime_workspace=self.runtime,
+            checkpoint_hooks=checkpoint_hooks,
         )
         self.services.append(service)
         return service
@@ -1010,6 +1016,213 @@ class TestParseJobCancellationAndRetry:
         assert calls == 2
 
 
+class TestParseJobCheckpoints:
+    # [test->req~ring5.ingestion.session-background-parse~1]
+    @staticmethod
+    def _worker_result(stats_file: Path) -> dict[str, Any]:
+        value = stats_file.read_text().split()[1]
+        return {INTERNAL_SIM_PATH_KEY: str(stats_file.resolve()), "simTicks": value}
+
+    def test_resume_parses_only_files_without_a_checkpoint(
+        self, tmp_path: Path, service_factory: _ServiceFactory
+    ) -> None:
+        _stats_tree(tmp_path, ("simTicks 1\n", "simTicks 2\n", "simTicks 3\n"))
+        stats_files = sorted(tmp_path.glob("run-*/stats.txt"))
+        submitted: list[list[str]] = []
+
+        def submit(
+            _path: str,
+            _pattern: str,
+            _variables: Sequence[JsonValue],
+            _output: str,
+            _strategy: str,
+            _scanned: list[JsonValue] | None,
+            _incremental: bool,
+        ) -> ParseBatchResult:
+            submitted.append([str(path.resolve()) for path in stats_files])
+            futures = [_completed_future(self._worker_result(path)) for path in stats_files[:2]]
+            futures.append(_completed_future(error=RuntimeError("worker crashed")))
+            return ParseBatchResult(futures=futures, var_names=["simTicks"])
+
+        def submit_files(
+            _path: str,
+            _pattern: str,
+            _variables: Sequence[JsonValue],
+            _output: str,
+            _strategy: str,
+            _scanned: list[JsonValue] | None,
+            file_paths: list[str],
+        ) -> ParseBatchResult:
+            submitted.append(list(file_paths))
+            futures = [_completed_future(self._worker_result(Path(path))) for path in file_paths]
+            return ParseBatchResult(futures=futures, var_names=["simTicks"])
+
+        def finalize(*_args: Any) -> str:
+            raise AssertionError("checkpointed jobs finalize from their rows")
+
+        hooks = ParseCheckpointHooks(
+            submit_files=submit_files,
+            checkpoint_result=Gem5Parser._flatten_result_row,
+            finalize_rows=Gem5Parser._finalize_checkpoint_rows,
+        )
+        service = service_factory.create(submit, finalize=finalize, checkpoint_hooks=hooks)
+        job = service.submit(
+            stats_path=str(tmp_path),
+            stats_pattern="stats.txt",
+            variables=[{"name": "simTicks", "type": "scalar"}],
+            strategy_type="simple",
+        )
+        partial = _wait_for_status(service, job.job_id, {ParseJobStatus.PARTIAL})
+        assert partial.output_csv_path is not None
+        assert Path(partial.output_csv_path).read_text().splitlines() == ["simTicks", "1", "2"]
+
+        resumed = service.resume(job.job_id)
+        assert resumed.attempt == 2
+        assert service.get(job.job_id) is None
+        succeeded = _wait_for_status(service, resumed.job_id, {ParseJobStatus.SUCCEEDED})
+
+        assert submitted[1] == [str(stats_files[2].resolve())]
+        assert succeeded.completed_files == succeeded.total_files == 3
+        assert succeeded.published_csv_path is not None
+        assert Path(succeeded.published_csv_path).read_text().splitlines() == [
+            "simTicks",
+            "1",
+            "2",
+            "3",
+        ]
+
+    def test_resume_after_cancellation_keeps_finished_files(
+        self, tmp_path: Path, service_factory: _ServiceFactory
+    ) -> None:
+        _stats_tree(tmp_path, ("simTicks 1\n", "simTicks 2\n", "simTicks 3\n"))
+        stats_files = sorted(tmp_path.glob("run-*/stats.txt"))
+        release = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=1)
+        submitted: list[list[str]] = []
+
+        def blocked() -> dict[str, Any]:
+            release.wait(5)
+            return self._worker_result(stats_files[1])
+
+        def submit(
+            _path: str,
+            _pattern: str,
+            _variables: Sequence[JsonValue],
+            _output: str,
+            _strategy: str,
+            _scanned: list[JsonValue] | None,
+            _incremental: bool,
+        ) -> ParseBatchResult:
+            futures = [
+                _completed_future(self._worker_result(stats_files[0])),
+                pool.submit(blocked),
+                pool.submit(self._worker_result, stats_files[2]),
+            ]
+            return ParseBatchResult(futures=futures, var_names=["simTicks"])
+
+        def submit_files(
+            _path: str,
+            _pattern: str,
+            _variables: Sequence[JsonValue],
+            _output: str,
+            _strategy: str,
+            _scanned: list[JsonValue] | None,
+            file_paths: list[str],
+        ) -> ParseBatchResult:
+            submitted.append(list(file_paths))
+            futures = [_completed_future(self._worker_result(Path(path))) for path in file_paths]
+            return ParseBatchResult(futures=futures, var_names=["simTicks"])
+
+        hooks = ParseCheckpointHooks(
+            submit_files=submit_files,
+            checkpoint_result=Gem5Parser._flatten_result_row,
+            finalize_rows=Gem5Parser._finalize_checkpoint_rows,
+        )
+        service = service_factory.create(submit, checkpoint_hooks=hooks)
+        try:
+            job = service.submit(
+                stats_path=str(tmp_path),
+                stats_pattern="stats.txt",
+                variables=[{"name": "simTicks", "type": "scalar"}],
+                strategy_type="simple",
+            )
+            _wait_for_status(service, job.job_id, {ParseJobStatus.RUNNING})
+            deadline = time.monotonic() + 5
+            while service.get(job.job_id).completed_files < 1:  # type: ignore[union-attr]
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+            service.cancel(job.job_id)
+            release.set()
+            _wait_for_status(service, job.job_id, {ParseJobStatus.CANCELLED})
+
+            resumed = service.resume(job.job_id)
+            succeeded = _wait_for_status(service, resumed.job_id, {ParseJobStatus.SUCCEEDED})
+        finally:
+            release.set()
+            pool.shutdown()
+
+        # The running file finished after cancellation and was kept; the queued one was not.
+        assert submitted == [[str(stats_files[2].resolve())]]
+        assert succeeded.published_csv_path is not None
+        assert Path(succeeded.published_csv_path).read_text().splitlines() == [
+            "simTicks",
+            "1",
+            "2",
+            "3",
+        ]
+
+    def test_resume_requires_a_terminal_job(
+        self, tmp_path: Path, service_factory: _ServiceFactory
+    ) -> None:
+        _stats_tree(tmp_path)
+
+        def submit(
+            _path: str,
+            _pattern: str,
+            _variables: Sequence[JsonValue],
+            _output: str,
+            _strategy: str,
+            _scanned: list[JsonValue] | None,
+            _incremental: bool,
+        ) -> ParseBatchResult:
+            return ParseBatchResult(
+                futures=[_completed_future({"simTicks": {"value": 1}})],
+                var_names=["simTicks"],
+            )
+
+        service = service_factory.create(submit)
+        job = service.submit(
+            stats_path=str(tmp_path),
+            stats_pattern="stats.txt",
+            variables=[],
+            strategy_type="simple",
+        )
+        _wait_for_status(service, job.job_id, {ParseJobStatus.SUCCEEDED})
+        with pytest.raises(ParseJobNotConsumableError, match="cannot be resumed"):
+            service.resume(job.job_id)
+
+    def test_carry_over_drops_changed_files_and_torn_lines(self, tmp_path: Path) -> None:
+        source = ParseCheckpointLog(tmp_path / "old" / CHECKPOINT_FILE_NAME)
+        source.path.parent.mkdir()
+        kept = ParseFileSignature(path="/runs/a/stats.txt", size=10, mtime_ns=1)
+        changed = ParseFileSignature(path="/runs/b/stats.txt", size=10, mtime_ns=1)
+        source.start(["simTicks"])
+        source.append(kept, {"simTicks": "1"})
+        source.append(changed, {"simTicks": "2"})
+        source.close()
+        with open(source.path, "a", encoding="utf-8") as handle:
+            handle.write('{"path": "/runs/c/stats.txt", "cel')
+
+        destination = ParseCheckpointLog(tmp_path / CHECKPOINT_FILE_NAME)
+        carried = source.carry_over(
+            destination,
+            [kept, ParseFileSignature(path=changed.path, size=11, mtime_ns=2)],
+        )
+
+        assert carried == 1
+        assert destination.read() == (["simTicks"], {kept.path: {"simTicks": "1"}})
+
+
 class TestParseJobCleanup:
     def test_reset_discards_active_job_after_running_file_returns(
         self, tmp_path: Path, service_factory: _ServiceFactory
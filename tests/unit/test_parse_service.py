@@ -2,6 +2,8 @@
 
 import csv
 import os
+import threading
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
@@ -267,3 +269,96 @@ class TestConstructFinalCsv:
         path = ParseService.construct_final_csv(new_dir, results)
         assert path is not None
         assert os.path.exists(path)
+
+
+class TestFinalizeParsingStreaming:
+    """Tests for ParseService.finalize_parsing_streaming."""
+
+    @staticmethod
+    def _future(result: dict[str, Any] | None = None) -> "Future[dict[str, Any]]":
+        future: Future[dict[str, Any]] = Future()
+        if result is not None:
+            future.set_result(result)
+        return future
+
+    def test_returns_none_without_futures(self, tmp_path: Path) -> None:
+        assert ParseService.finalize_parsing_streaming(str(tmp_path), [], ()) is None
+
+    def test_header_comes_from_schema_and_rows_keep_submission_order(self, tmp_path: Path) -> None:
+        futures = [self._future() for _ in range(3)]
+        schema = (("ipc", None), ("cache", ("l1", "l2")))
+        results = [
+            {
+                "ipc": FakeStat(reduced_content=index),
+                "cache": FakeStat(reduced_content={"l1": index, "l2": None}, entries=["l1", "l2"]),
+            }
+            for index in range(3)
+        ]
+        # Complete out of order; only the last completion unblocks the first row.
+        futures[2].set_result(results[2])
+        futures[1].set_result(results[1])
+        futures[0].set_result(results[0])
+
+        path = ParseService.finalize_parsing_streaming(str(tmp_path), futures, schema)
+
+        assert path is not None
+        with open(path, newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows == [
+            ["ipc", "cache..l1", "cache..l2"],
+            ["0", "0", "NaN"],
+            ["1", "1", "NaN"],
+            ["2", "2", "NaN"],
+        ]
+        # Written results are released from their futures.
+        assert all(future.result() == {} for future in futures)
+
+    def test_full_reorder_buffer_waits_for_the_head_row(self, tmp_path: Path) -> None:
+        futures = [self._future() for _ in range(4)]
+        for index in (3, 2, 1):
+            futures[index].set_result({"ipc": FakeStat(reduced_content=index)})
+        timer = threading.Timer(0.05, futures[0].set_result, [{"ipc": FakeStat(reduced_content=0)}])
+        timer.start()
+        try:
+            path = ParseService.finalize_parsing_streaming(
+                str(tmp_path), futures, (("ipc", None),), max_buffered_rows=1
+            )
+        finally:
+            timer.join()
+
+        assert path is not None
+        with open(path, newline="") as f:
+            assert [row[0] for row in csv.reader(f)] == ["ipc", "0", "1", "2", "3"]
+
+    def test_missing_vector_variable_keeps_the_row_aligned(self, tmp_path: Path) -> None:
+        futures = [self._future({"ipc": FakeStat(reduced_content=1.5)})]
+
+        path = ParseService.finalize_parsing_streaming(
+            str(tmp_path), futures, (("ipc", None), ("cache", ("l1", "l2")))
+        )
+
+        assert path is not None
+        with open(path, newline="") as f:
+            assert list(csv.reader(f))[1] == ["1.5", "NaN", "NaN"]
+
+    def test_worker_failure_leaves_no_partial_csv(self, tmp_path: Path) -> None:
+        failed = self._future()
+        failed.set_exception(OSError("perl worker died"))
+        futures = [self._future({"ipc": FakeStat(reduced_content=1)}), failed]
+
+        with pytest.raises(RuntimeError, match="parse worker failed"):
+            ParseService.finalize_parsing_streaming(str(tmp_path), futures, (("ipc", None),))
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unknown_result_columns_are_rejected(self, tmp_path: Path) -> None:
+        futures = [self._future({"ipc": FakeStat(reduced_content=1), "extra": "x"})]
+
+        with pytest.raises(RuntimeError, match="outside the parse schema: extra"):
+            ParseService.finalize_parsing_streaming(str(tmp_path), futures, (("ipc", None),))
+
+    def test_unfinished_batch_times_out(self, tmp_path: Path) -> None:
+        with pytest.raises(TimeoutError):
+            ParseService.finalize_parsing_streaming(
+                str(tmp_path), [self._future()], (("ipc", None),), timeout=0.01
+            )
@@ -178,3 +178,105 @@ class TestConfigAwareStrategy:
         assert results[0]["ipc"] == 1.5
         assert results[0]["sim_path"] == str(stats_path)
         assert results[0]["config_json"] == '{"system":{"cores":"4"}}'
+
+
+class TestConfigColumnsStrategy:
+
+    @staticmethod
+    def _run(root: Path, name: str, config: str) -> Path:
+        run = root / name
+        run.mkdir()
+        (run / "stats.txt").write_text("dummy")
+        (run / "config.ini").write_text(config)
+        return run / "stats.txt"
+
+    # [test->req~ring5.ingestion.config-aware-strategy~1]
+    def test_workers_intern_configs_and_materialize_typed_columns(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import csv
+        import json
+
+        from src.core.models.csv_contract import MISSING_VALUE
+        from src.parsing.gem5.impl.strategies import config_columns
+        from src.parsing.gem5.impl.strategies.file_parser_strategy import (
+            INTERNAL_SIM_PATH_KEY,
+        )
+
+        interner = config_columns.ConfigInterner()
+        monkeypatch.setattr(config_columns, "_INTERNER", interner)
+        parse = MagicMock(wraps=config_columns.ConfigInterner._parse)
+        monkeypatch.setattr(config_columns.ConfigInterner, "_parse", parse)
+        shared = "[system.cpu]\nclock = 500\nwidth = 1.5\nmodel = o3\n"
+        paths = [
+            self._run(tmp_path, "a", shared),
+            self._run(tmp_path, "b", shared),
+            self._run(tmp_path, "c", "[system.cpu]\nclock = 250\n"),
+        ]
+        columns = [
+            ("clock", "system.cpu", "clock"),
+            ("width", "system.cpu", "width"),
+            ("model", "system.cpu", "model"),
+        ]
+        results = []
+        for path in paths:
+            stats_work = MagicMock(source_path=str(path))
+            stats_work.return_value = {INTERNAL_SIM_PATH_KEY: str(path), "ipc": 1.5}
+            results.append(config_columns.ConfigColumnsParseWork(stats_work, columns)())
+
+        rows = config_columns.ConfigColumnsStrategy().post_process(results)
+
+        assert parse.call_count == 2
+        assert rows[0]["config_hash"] == rows[1]["config_hash"] != rows[2]["config_hash"]
+        assert (rows[0]["clock"], rows[0]["width"], rows[0]["model"]) == (500, 1.5, "o3")
+        assert rows[2]["width"] == MISSING_VALUE
+        assert rows[2]["sim_path"] == str(paths[2])
+        assert "config_json" not in rows[0]
+
+        csv_path = tmp_path / "results.csv"
+        with csv_path.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=["ipc", "config_hash", "sim_path"])
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({key: row[key] for key in ("ipc", "config_hash", "sim_path")})
+        # A cold cache re-reads each distinct configuration from beside its row.
+        monkeypatch.setattr(config_columns, "_INTERNER", config_columns.ConfigInterner())
+        table_path = config_columns.ConfigColumnsStrategy().write_side_tables(csv_path)
+
+        table = json.loads(table_path.read_text(encoding="utf-8"))
+        assert table_path.name == "config_table.json"
+        assert set(table) == {rows[0]["config_hash"], rows[2]["config_hash"]}
+        assert table[rows[2]["config_hash"]] == {"system.cpu": {"clock": "250"}}
+
+    def test_config_columns_are_split_from_statistics(self, tmp_path: Path) -> None:
+        from src.parsing.gem5.impl.strategies.config_columns import (
+            ConfigColumnsParseWork,
+            ConfigColumnsStrategy,
+        )
+
+        stats_path = self._run(tmp_path, "run", "[system]\ncores = 4\n")
+        clock = StatConfig(
+            name="cores",
+            type="configuration",
+            source_name="system.cores",
+            params={"configIni": True},
+        )
+        strategy = ConfigColumnsStrategy()
+
+        works = strategy.get_work_items(
+            str(tmp_path),
+            "stats.txt",
+            [StatConfig(name="ipc", type="scalar"), clock],
+            file_paths=[str(stats_path)],
+        )
+
+        assert [type(work) for work in works] == [ConfigColumnsParseWork]
+        assert works[0].source_path == str(stats_path)
+        with pytest.raises(ValueError, match="at least one statistic"):
+            strategy.get_work_items(str(tmp_path), "stats.txt", [clock])
+        with pytest.raises(ValueError, match="section.key"):
+            strategy.get_work_items(
+                str(tmp_path),
+                "stats.txt",
+                [StatConfig(name="cores", type="configuration", params={"configIni": True})],
+            )
@@ -7,6 +7,7 @@ Tests connection pooling, error handling, worker recovery, and health monitoring
 import logging
 import shutil
 import tempfile
+import threading
 import time
 from collections.abc import Generator
 from pathlib import Path
@@ -15,9 +16,13 @@ from typing import Any
 import pytest
 
 from src.parsing.gem5.impl.strategies.perl_worker_pool import (
+    SCANNER_SERVER_SCRIPT,
+    AdaptivePoolPolicy,
     PerlWorker,
     PerlWorkerPool,
+    get_scanner_pool,
     get_worker_pool,
+    shutdown_scanner_pool,
     shutdown_worker_pool,
 )
 
@@ -135,6 +140,66 @@ class TestPerlWorker:
         finally:
             worker.shutdown()
 
+    def test_worker_parse_batch_frames_each_file_and_registers_filters_once(
+        self, test_stats_file: str, perl_exe: str, perl_script_path: str
+    ) -> None:
+        worker = PerlWorker(worker_id=0, script_path=perl_script_path, perl_exe=perl_exe)
+        missing = test_stats_file + ".missing"
+        filters = ["system.cpu.numCycles", "system.cpu.ipc"]
+
+        try:
+            outputs, success = worker.parse_batch(
+                [test_stats_file, missing, test_stats_file], filters, timeout=10.0
+            )
+
+            assert success
+            assert [output.file_path for output in outputs] == [
+                test_stats_file,
+                missing,
+                test_stats_file,
+            ]
+            assert outputs[0].error is None
+            assert sorted(outputs[0].lines) == [
+                "scalar/system.cpu.ipc/1.5",
+                "scalar/system.cpu.numCycles/1000",
+            ]
+            assert outputs[1].lines == []
+            assert outputs[1].error is not None and "File not found" in outputs[1].error
+            assert outputs[2].lines == outputs[0].lines
+            # FILTERS + PARSE_BATCH
+            assert worker.requests_served == 2
+
+            outputs, success = worker.parse_batch([test_stats_file], filters, timeout=10.0)
+
+            assert success
+            assert outputs[0].lines == [
+                "scalar/system.cpu.numCycles/1000",
+                "scalar/system.cpu.ipc/1.5",
+            ]
+            # The registered filter set is reused without another FILTERS request.
+            assert worker.requests_served == 3
+        finally:
+            worker.shutdown()
+
+    def test_worker_reregisters_filter_sets_after_restart(
+        self, test_stats_file: str, perl_exe: str, perl_script_path: str
+    ) -> None:
+        worker = PerlWorker(worker_id=0, script_path=perl_script_path, perl_exe=perl_exe)
+
+        try:
+            _, success = worker.parse_batch([test_stats_file], ["system.cpu.ipc"], timeout=10.0)
+            assert success
+            assert worker.restart()
+
+            outputs, success = worker.parse_batch(
+                [test_stats_file], ["system.cpu.ipc"], timeout=10.0
+            )
+
+            assert success
+            assert outputs[0].lines == ["scalar/system.cpu.ipc/1.5"]
+        finally:
+            worker.shutdown()
+
     def test_worker_rejects_protocol_delimiters(self, perl_exe: str, perl_script_path: str) -> None:
         worker = PerlWorker(worker_id=0, script_path=perl_script_path, perl_exe=perl_exe)
 
@@ -143,6 +208,8 @@ class TestPerlWorker:
                 worker.parse_file("/tmp/stats.txt\nPING", ["simTicks"])
             with pytest.raises(ValueError, match="reserved protocol delimiter"):
                 worker.parse_file("/tmp/stats.txt", ["simTicks||SHUTDOWN"])
+            with pytest.raises(ValueError, match="reserved protocol delimiter"):
+                worker.parse_batch(["/tmp/a.txt", "/tmp/b.txt\nPING"], ["simTicks"])
         finally:
             worker.shutdown()
 
@@ -205,6 +272,15 @@ class TestPerlWorkerPool:
         stats = worker_pool.get_stats()
         assert stats["total_requests"] == 5
 
+    def test_pool_parse_files_uses_one_batch_request(
+        self, worker_pool: PerlWorkerPool, test_stats_file: str
+    ) -> None:
+        outputs = worker_pool.parse_files([test_stats_file] * 4, ["system.mem.readReqs"])
+
+        assert [output.lines for output in outputs] == [["scalar/system.mem.readReqs/500"]] * 4
+        # One FILTERS registration plus one PARSE_BATCH.
+        assert worker_pool.get_stats()["total_requests"] == 2
+
     def test_pool_worker_failure_recovery(self, worker_pool: Any, test_stats_file: Any) -> None:
         """Pool should recover from worker failures."""
         # Kill one worker
@@ -254,6 +330,139 @@ class TestPerlWorkerPool:
             assert worker.process is None or worker.process.poll() is not None
 
 
+class TestAdaptivePool:
+    # [test->req~ring5.ingestion.persistent-workers~1]
+    """Adaptive pools resize between their policy bounds and report why."""
+
+    @pytest.fixture
+    def adaptive_pool(self) -> Generator[PerlWorkerPool, None, None]:
+        pool = PerlWorkerPool(
+            adaptive=AdaptivePoolPolicy(
+                min_workers=1, max_workers=2, rss_budget_bytes=1 << 40, idle_seconds=0.0
+            )
+        )
+        yield pool
+        pool.shutdown()
+
+    def test_grows_when_a_request_finds_no_idle_worker(
+        self, adaptive_pool: PerlWorkerPool, test_stats_file: str
+    ) -> None:
+        held = adaptive_pool.worker_queue.get_nowait()
+        try:
+            output = adaptive_pool.parse_file(test_stats_file, ["system.cpu.ipc"])
+        finally:
+            adaptive_pool.worker_queue.put(held)
+
+        stats = adaptive_pool.get_stats()
+        assert output == ["scalar/system.cpu.ipc/1.5"]
+        assert stats["mode"] == "adaptive"
+        assert stats["pool_size"] == 2
+        assert [(r.old_size, r.new_size) for r in stats["resizes"]] == [(1, 2)]
+        assert "no idle worker" in stats["last_resize_reason"]
+
+    def test_stops_growing_at_the_rss_budget(self, test_stats_file: str) -> None:
+        pool = PerlWorkerPool(
+            adaptive=AdaptivePoolPolicy(min_workers=1, max_workers=4, rss_budget_bytes=1)
+        )
+        try:
+            held = pool.worker_queue.get_nowait()
+            threading.Timer(0.2, pool.worker_queue.put, args=(held,)).start()
+
+            output = pool.parse_file(test_stats_file, ["system.cpu.ipc"])
+
+            assert output == ["scalar/system.cpu.ipc/1.5"]
+            assert pool.get_stats()["pool_size"] == 1
+            assert pool.get_stats()["resizes"] == []
+        finally:
+            pool.shutdown()
+
+    def test_retires_idle_workers_down_to_the_minimum(
+        self, adaptive_pool: PerlWorkerPool, test_stats_file: str
+    ) -> None:
+        held = adaptive_pool.worker_queue.get_nowait()
+        try:
+            adaptive_pool.parse_file(test_stats_file, ["system.cpu.ipc"])
+        finally:
+            adaptive_pool.worker_queue.put(held)
+
+        adaptive_pool._shrink_idle_workers()
+        adaptive_pool._shrink_idle_workers()
+
+        stats = adaptive_pool.get_stats()
+        assert stats["pool_size"] == 1
+        assert [(r.old_size, r.new_size) for r in stats["resizes"]] == [(1, 2), (2, 1)]
+        assert stats["last_resize_reason"].startswith("idle for")
+        assert adaptive_pool.parse_file(test_stats_file, ["system.cpu.ipc"]) == [
+            "scalar/system.cpu.ipc/1.5"
+        ]
+
+    def test_fixed_pools_report_no_resizes(self, worker_pool: PerlWorkerPool) -> None:
+        stats = worker_pool.get_stats()
+
+        assert stats["mode"] == "fixed"
+        assert stats["pool_size"] == stats["min_workers"] == stats["max_workers"] == 2
+        assert stats["resizes"] == []
+        assert stats["rss_bytes"] > 0
+
+    def test_policy_and_size_arguments_are_validated(self) -> None:
+        with pytest.raises(ValueError, match="max_workers"):
+            AdaptivePoolPolicy(min_workers=3, max_workers=2)
+        with pytest.raises(ValueError, match="either pool_size or adaptive"):
+            PerlWorkerPool(pool_size=2, adaptive=AdaptivePoolPolicy())
+
+
+class TestScannerPool:
+    """Test the persistent scanner server pool."""
+
+    # [test->req~ring5.ingestion.persistent-workers~1]
+
+    @pytest.fixture
+    def scanner_pool(self) -> Generator[PerlWorkerPool, None, None]:
+        pool = PerlWorkerPool(pool_size=1, script_name=SCANNER_SERVER_SCRIPT)
+        yield pool
+        pool.shutdown()
+
+    def test_scan_file_returns_json_schema(
+        self, scanner_pool: PerlWorkerPool, test_stats_file: str
+    ) -> None:
+        import json
+
+        first = json.loads("\n".join(scanner_pool.scan_file(test_stats_file)))
+        second = json.loads(
+            "\n".join(scanner_pool.scan_file(test_stats_file, ["system.cpu.numCycles"]))
+        )
+
+        names = {item["name"]: item["type"] for item in first}
+        assert names["system.cpu.ipc"] == "scalar"
+        assert {item["name"]: item["type"] for item in second}["system.cpu.numCycles"] == (
+            "configuration"
+        )
+        # Both requests were served by the same long-lived process.
+        assert scanner_pool.get_stats()["total_requests"] == 2
+        assert scanner_pool.get_stats()["total_restarts"] == 0
+
+    def test_scan_missing_file_fails(self, scanner_pool: PerlWorkerPool) -> None:
+        with pytest.raises(RuntimeError, match="All workers"):
+            scanner_pool.scan_file("/nonexistent/stats.txt")
+
+    def test_scan_rejects_protocol_delimiters(self, scanner_pool: PerlWorkerPool) -> None:
+        worker = scanner_pool.workers[0]
+        with pytest.raises(ValueError, match="reserved protocol delimiter"):
+            worker.scan_file("/tmp/stats.txt\nPING", [])
+        with pytest.raises(ValueError, match="reserved protocol delimiter"):
+            worker.scan_file("/tmp/stats.txt", ["a,b"])
+
+    def test_singleton_scanner_pool_is_independent(self) -> None:
+        # [test->req~ring5.api.process-lifecycle~1]
+        shutdown_scanner_pool()
+        try:
+            pool = get_scanner_pool(pool_size=1)
+            assert pool is get_scanner_pool()
+            assert pool.script_path.endswith(SCANNER_SERVER_SCRIPT)
+        finally:
+            shutdown_scanner_pool()
+
+
 class TestWorkerPoolIntegration:
     """Integration tests for worker pool."""
 
@@ -1,11 +1,14 @@
 """Tests for PipelineService — the canonical shaper-pipeline execution engine."""
 
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import cast
 
 import pandas as pd
 import pytest
 
 from src.core.models.shaper_models import ShaperStepConfig
+from src.core.services.shapers.pipeline_cache import PipelineCache
 from src.core.services.shapers.pipeline_service import PipelineService
 
 
@@ -101,3 +104,103 @@ class TestPipelineStepError:
         from src.core.services.shapers.pipeline_service import PipelineStepError
 
         assert issubclass(PipelineStepError, ValueError)
+
+
+class TestPipelinePrefixCache:
+    """Edited pipelines resume from the longest unchanged, cached prefix."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> Iterator[None]:
+        PipelineService.clear_cache()
+        yield
+        PipelineService.clear_cache()
+
+    @staticmethod
+    def _pipeline(threshold: float) -> list[ShaperStepConfig]:
+        return cast(
+            list[ShaperStepConfig],
+            [
+                {"type": "columnSelector", "columns": ["benchmark", "ipc"]},
+                {"type": "sort", "order_dict": {"benchmark": ["mcf", "gcc", "bzip2"]}},
+                {
+                    "type": "conditionSelector",
+                    "column": "ipc",
+                    "mode": "greater_than",
+                    "threshold": threshold,
+                },
+            ],
+        )
+
+    def test_edited_last_step_resumes_from_cached_prefix(self, sample_df: pd.DataFrame) -> None:
+        first = PipelineService.run_pipeline(sample_df, self._pipeline(1.0))
+        assert first.cached_steps == 0
+        assert [step.step_index for step in first.steps] == [0, 1, 2]
+
+        edited = PipelineService.run_pipeline(sample_df, self._pipeline(2.0))
+        assert [step.cached for step in edited.steps] == [True, True, False]
+        assert edited.steps[2].seconds > 0
+        uncached = PipelineService.run_pipeline(sample_df, self._pipeline(2.0), use_cache=False)
+        pd.testing.assert_frame_equal(edited.data, uncached.data)
+
+        repeated = PipelineService.run_pipeline(sample_df, self._pipeline(2.0))
+        assert repeated.cached_steps == 3
+        stats = PipelineService.cache_stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (2, 1, 4)
+
+    def test_cache_keys_cover_input_values_and_attrs(self, sample_df: pd.DataFrame) -> None:
+        PipelineService.run_pipeline(sample_df, self._pipeline(1.0))
+
+        changed = sample_df.assign(ipc=[1.5, 2.3, 0.5])
+        assert PipelineService.run_pipeline(changed, self._pipeline(1.0)).cached_steps == 0
+        annotated = sample_df.copy()
+        annotated.attrs["units"] = {"ipc": "instructions/cycle"}
+        assert PipelineService.run_pipeline(annotated, self._pipeline(1.0)).cached_steps == 0
+
+    def test_results_are_isolated_from_cache(self, sample_df: pd.DataFrame) -> None:
+        result = PipelineService.process_pipeline(sample_df, self._pipeline(1.0))
+        result.loc[result.index[0], "ipc"] = -1.0
+
+        again = PipelineService.process_pipeline(sample_df, self._pipeline(1.0))
+        assert (again["ipc"] > 0).all()
+
+    def test_byte_budget_evicts_least_recently_used(self) -> None:
+        frame = pd.DataFrame({"x": range(100)})
+        size = int(frame.memory_usage(index=True, deep=True).sum())
+        cache = PipelineCache(max_bytes=size * 2)
+        cache.set("a", frame)
+        cache.set("b", frame)
+        assert cache.longest_prefix(["a"])[0] == 1
+        cache.set("c", frame)
+
+        assert cache.longest_prefix(["b"]) == (0, None)
+        assert cache.longest_prefix(["a", "c"])[0] == 2
+        stats = cache.stats()
+        assert stats["bytes"] == size * 2 and stats["evictions"] == 1
+        PipelineCache(max_bytes=size - 1).set("too-big", frame)
+        assert not PipelineCache(max_bytes=0).enabled
+
+    def test_concurrent_use_keeps_byte_accounting_consistent(self) -> None:
+        frame = pd.DataFrame({"x": range(10)})
+        size = int(frame.memory_usage(index=True, deep=True).sum())
+        cache = PipelineCache(max_bytes=size * 5)
+
+        def worker(offset: int) -> None:
+            for item in range(50):
+                cache.set(f"{offset}-{item % 8}", frame)
+                cache.longest_prefix([f"{offset}-{item % 8}"])
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(worker, range(4)))
+
+        stats = cache.stats()
+        assert stats["bytes"] == stats["size"] * size <= size * 5
+        cache.clear()
+        assert cache.stats() == {
+            "hits": 0,
+            "misses": 0,
+            "size": 0,
+            "hit_rate": 0,
+            "bytes": 0,
+            "max_bytes": size * 5,
+            "evictions": 0,
+        }
@@ -289,7 +289,9 @@ class TestChartDisplayComponent:
             "scale": 3,
         }
         assert mock_chart.call_args.kwargs["capture_click"] is False
-        mock_download.assert_called_once_with(7, "ipc", mock_chart.call_args.args[0], source_data)
+        mock_download.assert_called_once_with(
+            7, "ipc", mock_chart.call_args.args[0], source_data, export_figure=None
+        )
 
     @patch("src.web.components.common.chart_display.st")
     def test_should_not_generate_when_no_auto_and_no_manual(
@@ -1,5 +1,6 @@
 from typing import Any, cast
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import pytest
@@ -66,6 +67,18 @@ class TestScatterPlot:
         # Check traces (3 benchmarks -> 3 traces)
         assert len(list(fig.data)) == 3
 
+    def test_create_traces_keeps_numpy_columns(self, sample_data: Any) -> None:
+        plot = ScatterPlot(2, "Test Scatter")
+        config = {"x": "Value2", "y": "Value", "show_error_bars": True}
+
+        trace = plot.create_traces(sample_data, config).traces[0]
+
+        assert isinstance(trace.x, np.ndarray)
+        assert isinstance(trace.y, np.ndarray)
+        assert isinstance(trace.error_y, np.ndarray)
+        assert list(trace.y) == [10, 20, 15, 25, 30]
+        assert list(trace.error_y) == [0.1, 0.2, 0.15, 0.25, 0.3]
+
 
 class TestGroupedStackedBarPlot:
     def test_create_figure_grouped(self, sample_data: Any) -> None:
@@ -0,0 +1,150 @@
+"""Tests for binary portfolio containers and lazily restored plot frames."""
+
+from __future__ import annotations
+
+import json
+from io import BytesIO
+from pathlib import Path
+from zipfile import ZipFile
+
+import pandas as pd
+import pytest
+
+from src.core.services.data_services.portfolio_service import PortfolioService
+from src.core.services.portfolio_container import PortfolioContainer, PortfolioFrames
+from src.core.services.portfolio_migrator import PortfolioMigrator
+from src.core.state.repository_state_manager import RepositoryStateManager
+from src.web.pages.ui.plotting.plot_factory import PlotFactory
+
+
+def _data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "benchmark": ["mcf", "lbm", "gcc"],
+            "ipc": [1.25, 2.5, None],
+            "runs": pd.Series([3, None, 5], dtype="Int64"),
+        }
+    )
+
+
+def _save(name: str, data: pd.DataFrame) -> None:
+    plots = []
+    for plot_id in (1, 2):
+        plot = PlotFactory.create_plot("bar", plot_id, f"Plot {plot_id}")
+        plot.processed_data = data
+        plot.config = {"x": "benchmark", "y": "ipc"}
+        plots.append(plot)
+    PortfolioService(RepositoryStateManager()).save_portfolio(name, data, plots, {}, 2)
+
+
+def test_identical_tables_share_one_member(portfolios_dir: Path) -> None:
+    # [test->req~ring5.portfolio.save~1]
+    data = _data()
+    _save("shared", data)
+
+    raw = (portfolios_dir / "shared.json").read_bytes()
+    document = PortfolioContainer.read_document(raw)
+    with ZipFile(BytesIO(raw)) as archive:
+        members = sorted(archive.namelist())
+
+    assert PortfolioContainer.is_container(raw)
+    assert "data_csv" not in document
+    assert [plot["processed_data_ref"] for plot in document["plots"]] == [document["data_ref"]] * 2
+    assert list(document["frames"]) == [document["data_ref"]]
+    digest = document["data_ref"].removeprefix("sha256:")
+    assert members == [f"frames/{digest}.ring5-snapshot", "portfolio.json"]
+    loaded = PortfolioService(RepositoryStateManager()).load_portfolio("shared")
+    pd.testing.assert_frame_equal(loaded["frames"].load(loaded["data_ref"]), data)
+
+
+def test_plot_tables_decode_on_first_access(portfolios_dir: Path) -> None:
+    # [test->req~ring5.portfolio.restore~1]
+    data = _data()
+    _save("lazy", data)
+    manager = RepositoryStateManager(plot_deserializer=PlotFactory.from_dict)
+
+    report = manager.restore_session(PortfolioService(manager).load_portfolio("lazy"))
+    plot = manager.get_plots()[0]
+
+    assert report.complete
+    assert plot.pending_processed_data is not None
+    pd.testing.assert_frame_equal(plot.processed_data, data)
+    assert plot.pending_processed_data is None
+
+
+def test_resaving_undecoded_plots_keeps_their_tables(portfolios_dir: Path) -> None:
+    # [test->req~ring5.portfolio.save~1]
+    data = _data()
+    _save("first", data)
+    manager = RepositoryStateManager(plot_deserializer=PlotFactory.from_dict)
+    service = PortfolioService(manager)
+    manager.restore_session(service.load_portfolio("first"))
+
+    service.save_portfolio("second", manager.get_data(), manager.get_plots(), {}, 2)
+    restored = RepositoryStateManager(plot_deserializer=PlotFactory.from_dict)
+    restored.restore_session(service.load_portfolio("second"))
+
+    assert all(plot.pending_processed_data is not None for plot in manager.get_plots())
+    pd.testing.assert_frame_equal(restored.get_plots()[1].processed_data, data)
+
+
+def test_migration_moves_embedded_csv_into_shared_frames() -> None:
+    # [test->req~ring5.portfolio.migration~1]
+    text = "benchmark,ipc\nmcf,1.25\n"
+    migrated = PortfolioMigrator.migrate(
+        {
+            "schema_version": 4,
+            "data_csv": text,
+            "plots": [
+                {"id": 1, "config": {}, "processed_data": text},
+                {"id": 2, "config": {}, "processed_data": None},
+            ],
+        }
+    )
+
+    assert "data_csv" not in migrated
+    assert migrated["plots"][0]["processed_data_ref"] == migrated["data_ref"]
+    assert migrated["plots"][1]["processed_data_ref"] is None
+    frames = PortfolioFrames(migrated["frames"])
+    assert len(frames) == 1
+    assert frames.load(migrated["data_ref"])["ipc"].tolist() == [1.25]
+
+
+def test_legacy_json_portfolios_still_restore(portfolios_dir: Path) -> None:
+    # [test->req~ring5.portfolio.restore~1]
+    (portfolios_dir / "legacy.json").write_text(
+        json.dumps(
+            {
+                "schema_version": 4,
+                "data_csv": "benchmark,ipc\nmcf,1.25\n",
+                "plots": [
+                    {
+                        "id": 1,
+                        "name": "IPC",
+                        "plot_type": "bar",
+                        "config": {"x": "benchmark", "y": "ipc"},
+                        "processed_data": "benchmark,ipc\nmcf,1.25\n",
+                    }
+                ],
+                "config": {},
+            }
+        )
+    )
+    manager = RepositoryStateManager(plot_deserializer=PlotFactory.from_dict)
+
+    report = manager.restore_session(PortfolioService(manager).load_portfolio("legacy"))
+
+    assert report.complete
+    assert manager.get_data()["ipc"].tolist() == [1.25]
+    assert manager.get_plots()[0].processed_data["benchmark"].tolist() == ["mcf"]
+
+
+def test_tampered_frames_are_refused() -> None:
+    frames = PortfolioFrames(
+        {"sha256:" + "0" * 64: {"encoding": "csv", "sha256": "0" * 64, "text": "a\n1\n"}}
+    )
+
+    with pytest.raises(ValueError, match="failed its checksum"):
+        frames.load("sha256:" + "0" * 64)
+    with pytest.raises(ValueError, match="missing from the frames table"):
+        frames.load("sha256:" + "1" * 64)
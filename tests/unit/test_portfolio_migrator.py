@@ -44,8 +44,8 @@ class TestV1Migration:
         """Old portfolios cannot retroactively claim current-machine provenance."""
         v1: Dict[str, Any] = {"plots": [{"config": {}}]}
         result = PortfolioMigrator.migrate(v1)
-        assert result["schema_version"] == 4
-        assert result["version"] == "4.0"
+        assert result["schema_version"] == 5
+        assert result["version"] == "5.0"
         assert result["environment_metadata"] is None
         assert result["integrity_manifest"] is None
 
@@ -74,7 +74,7 @@ class TestIdempotent:
             "plots": [{"config": {"engine": "matplotlib", "width": 800}}],
         }
         result = PortfolioMigrator.migrate(v3)
-        assert result["schema_version"] == 4
+        assert result["schema_version"] == 5
         assert result["environment_metadata"] == {"custom": "preserved"}
         assert result["integrity_manifest"] == {"custom": "preserved"}
         assert result["plots"][0]["config"]["engine"] == "matplotlib"
@@ -83,7 +83,7 @@ class TestIdempotent:
     def test_v2_records_environment_as_unavailable(self) -> None:
         v2: Dict[str, Any] = {"schema_version": 2, "plots": []}
         result = PortfolioMigrator.migrate(v2)
-        assert result["schema_version"] == 4
+        assert result["schema_version"] == 5
         assert result["environment_metadata"] is None
         assert result["integrity_manifest"] is None
 
@@ -102,18 +102,18 @@ class TestEdgeCases:
     def test_empty_plots_list(self) -> None:
         data: Dict[str, Any] = {"plots": []}
         result = PortfolioMigrator.migrate(data)
-        assert result["schema_version"] == 4
+        assert result["schema_version"] == 5
         assert result["plots"] == []
 
     def test_missing_plots_key(self) -> None:
         data: Dict[str, Any] = {}
         result = PortfolioMigrator.migrate(data)
-        assert result["schema_version"] == 4
+        assert result["schema_version"] == 5
 
     def test_plot_without_config(self) -> None:
         data: Dict[str, Any] = {"plots": [{"name": "test"}]}
         result = PortfolioMigrator.migrate(data)
-        assert result["schema_version"] == 4
+        assert result["schema_version"] == 5
 
     def test_preserves_engine_if_already_set(self) -> None:
         """V1 portfolio with explicit engine keeps it."""
@@ -132,15 +132,15 @@ class TestForwardVersionGuard:
 
         from src.core.services.portfolio_migrator import PortfolioVersionError
 
-        v4: Dict[str, Any] = {
-            "schema_version": 5,
+        v6: Dict[str, Any] = {
+            "schema_version": 6,
             "plots": [{"plot_type": "sankey_3d", "config": {}}],
-            "v4_only_key": {"future": "data"},
+            "v6_only_key": {"future": "data"},
         }
         with pytest.raises(PortfolioVersionError, match="newer than this RING-5"):
-            PortfolioMigrator.migrate(v4)
+            PortfolioMigrator.migrate(v6)
 
     def test_current_version_still_loads(self) -> None:
-        data: Dict[str, Any] = {"schema_version": 4, "plots": []}
+        data: Dict[str, Any] = {"schema_version": 5, "plots": []}
         result = PortfolioMigrator.migrate(data)
-        assert result["schema_version"] == 4
+        assert result["schema_version"] == 5
@@ -12,6 +12,7 @@ import pytest
 
 import ring5
 from ring5.cli import build_parser, main
+from src.core.services.portfolio_container import PortfolioContainer
 
 # Shares the conftest `portfolios_dir` patching with the public-api suite —
 # keep both files in one xdist group so they never interleave across workers.
@@ -176,8 +177,8 @@ class TestUpgradeCommand:
         code = main(["upgrade", "old"])
         assert code == 0
 
-        upgraded = json.loads((portfolios_dir / "old.json").read_text())
-        assert upgraded["schema_version"] == 4
+        upgraded = PortfolioContainer.read_document((portfolios_dir / "old.json").read_bytes())
+        assert upgraded["schema_version"] == 5
         assert upgraded["environment_metadata"] is not None
         assert "export_format" not in upgraded["plots"][0]["config"]
 
@@ -316,6 +317,30 @@ class TestRecipeMatrixCommand:
         )
         assert "valid finite UTF-8 JSON" in capsys.readouterr().err
 
+    def test_recipe_matrix_rejects_recycling_limits_without_processes(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        recipe = tmp_path / "recipe.json"
+        matrix = tmp_path / "matrix.json"
+        self._write_recipe(recipe)
+        matrix.write_text(json.dumps({"input_csv": [str(tmp_path / "data.csv")]}))
+
+        code = main(
+            [
+                "recipe-matrix",
+                str(recipe),
+                "-m",
+                str(matrix),
+                "-o",
+                str(tmp_path / "out"),
+                "--max-cases-per-worker",
+                "4",
+            ]
+        )
+
+        assert code == 2
+        assert "require processes=True" in capsys.readouterr().err
+
     def test_recipe_matrix_rejects_missing_and_oversized_inputs(
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
@@ -0,0 +1,52 @@
+"""Tests for single-pass row partitioning."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from src.core.services.visualization.row_partition import RowPartition
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "benchmark": ["mcf", "mcf", "lbm", "lbm", None, np.nan, "mcf"],
+            "config": ["base", "opt", "base", "base", "base", "base", "base"],
+            "ipc": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0],
+        }
+    )
+
+
+def test_missing_markers_share_one_key() -> None:
+    partition = RowPartition(_frame(), ["benchmark"])
+
+    assert partition.rows(None)["ipc"].tolist() == [5.0, 6.0]
+    assert partition.rows(np.nan)["ipc"].tolist() == [5.0, 6.0]
+    assert set(partition.keys()) == {("mcf",), ("lbm",), (None,)}
+
+
+def test_multi_column_keys_keep_source_order() -> None:
+    partition = RowPartition(_frame(), ["benchmark", "config"])
+
+    assert partition.rows("mcf", "base")["ipc"].tolist() == [1.0, 7.0]
+    assert partition.rows("mcf", "opt")["ipc"].tolist() == [2.0]
+    assert partition.positions("mcf", "base").tolist() == [0, 6]
+
+
+def test_contiguous_rows_are_slices_of_the_source() -> None:
+    data = _frame()
+    partition = RowPartition(data, ["benchmark"])
+
+    rows = partition.rows("lbm")
+    rows.loc[rows.index[0], "ipc"] = 99.0
+
+    assert rows.index.tolist() == [2, 3]
+    assert data.loc[2, "ipc"] == 3.0
+
+
+def test_unknown_keys_and_no_columns() -> None:
+    data = _frame()
+
+    assert RowPartition(data, ["benchmark"]).rows("gcc").empty
+    assert RowPartition(data, []).rows().equals(data)
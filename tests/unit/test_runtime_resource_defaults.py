@@ -15,7 +15,10 @@ from src.core.common.runtime_limits import (
 )
 from src.parsing.framework.work_pool import DEFAULT_WORKERS, _default_workers
 from src.parsing.gem5.impl.strategies.perl_worker_pool import (
+    DEFAULT_PERL_POOL_RSS_MB,
     DEFAULT_PERL_WORKERS,
+    AdaptivePoolPolicy,
+    _adaptive_policy_from_environment,
     _default_pool_size,
 )
 
@@ -99,6 +102,29 @@ def test_parser_worker_defaults_and_overrides(monkeypatch: pytest.MonkeyPatch) -
     assert _default_pool_size() == 3
 
 
+def test_auto_pool_sizes_follow_the_host(monkeypatch: pytest.MonkeyPatch) -> None:
+    """``auto`` lets both parser layers scale to the CPU count under an RSS budget."""
+    monkeypatch.setattr(os, "cpu_count", lambda: 64)
+    monkeypatch.setenv("RING5_WORK_POOL_SIZE", "auto")
+    monkeypatch.setenv("RING5_PERL_POOL_SIZE", "auto")
+    monkeypatch.delenv("RING5_PERL_POOL_RSS_MB", raising=False)
+
+    assert _default_workers() == 64
+    assert _default_pool_size() == 64
+    assert _adaptive_policy_from_environment() == AdaptivePoolPolicy(
+        min_workers=DEFAULT_PERL_WORKERS,
+        max_workers=64,
+        rss_budget_bytes=DEFAULT_PERL_POOL_RSS_MB * 1024 * 1024,
+    )
+
+    monkeypatch.setenv("RING5_PERL_POOL_RSS_MB", "512")
+    policy = _adaptive_policy_from_environment()
+    assert policy is not None and policy.rss_budget_bytes == 512 * 1024 * 1024
+
+    monkeypatch.setenv("RING5_PERL_POOL_SIZE", "3")
+    assert _adaptive_policy_from_environment() is None
+
+
 @pytest.mark.parametrize("value", ["", "invalid", "0", "-1"])
 def test_invalid_work_pool_overrides_are_reported(
     value: str,
@@ -23,11 +23,11 @@ def test_stats_scan_work_success() -> None:
     ) as mock_scanner_cls:
         mock_instance = MagicMock()
         mock_scanner_cls.return_value = mock_instance
-        mock_instance.scan_file.return_value = mock_vars
+        mock_instance.scan_file_persistent.return_value = mock_vars
 
         result = work()
 
-        mock_instance.scan_file.assert_called_once()
+        mock_instance.scan_file_persistent.assert_called_once()
         assert len(result.variables) == 2
         assert result.variables[0].name == "var1"
         assert result.ok
@@ -41,7 +41,7 @@ def test_stats_scan_work_failure() -> None:
     ) as mock_scanner_cls:
         mock_instance = MagicMock()
         mock_scanner_cls.return_value = mock_instance
-        mock_instance.scan_file.side_effect = RuntimeError("Scan error")
+        mock_instance.scan_file_persistent.side_effect = RuntimeError("Scan error")
 
         # A fatal scan failure is reported as a failed ScanFileResult,
         # never masked as an empty success.
@@ -59,7 +59,7 @@ def test_stats_scan_work_reports_os_error() -> None:
     ) as mock_scanner_cls:
         mock_instance = MagicMock()
         mock_scanner_cls.return_value = mock_instance
-        mock_instance.scan_file.side_effect = PermissionError("Permission denied")
+        mock_instance.scan_file_persistent.side_effect = PermissionError("Permission denied")
 
         result = work()
 
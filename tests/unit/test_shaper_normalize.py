@@ -180,6 +180,35 @@ def test_zero_division() -> None:
     assert result["metric"].iloc[1] == 0.0
 
 
+def test_zero_denominator_only_zeroes_its_group_and_keeps_row_order() -> None:
+    # [test->req~ring5.shaping.normalize~1]
+    df = pd.DataFrame(
+        {
+            "config": ["test", "baseline", "baseline", "test", "baseline"],
+            "bench": ["b2", "b1", "b2", "b1", "b3"],
+            "metric": [30.0, 10.0, 0.0, 20.0, np.nan],
+            "metric.sd": [3.0, 1.0, 0.5, 2.0, 1.0],
+        },
+        index=[40, 10, 30, 20, 50],
+    )
+
+    n = Normalize(
+        {
+            "normalizeVars": ["metric"],
+            "normalizerColumn": "config",
+            "normalizerValue": "baseline",
+            "groupBy": ["bench"],
+        }
+    )
+
+    result = n(df)
+
+    assert list(result.index) == [40, 10, 30, 20, 50]
+    assert list(result.columns) == list(df.columns)
+    np.testing.assert_array_equal(result["metric"].to_numpy(), [0.0, 1.0, 0.0, 2.0, 0.0])
+    np.testing.assert_array_equal(result["metric.sd"].to_numpy(), [0.0, 0.1, 0.0, 0.2, 0.0])
+
+
 def test_different_normalizer_vars() -> None:
     # Use 'norm_base' col to normalize 'metric' col
     df = pd.DataFrame(
@@ -55,6 +55,47 @@ def test_bootstrap_results_are_deterministic() -> None:
     pd.testing.assert_frame_equal(first, second)
 
 
+def test_process_pool_matches_in_process_bootstrap_streams() -> None:
+    # [test->req~ring5.analysis.statistical-comparison~1]
+    baseline = pd.DataFrame(
+        {
+            "benchmark": ["a"] * 4 + ["b"] * 4,
+            "ipc": [1.0, 1.2, 0.9, 1.1, 2.0, 2.2, 2.1, 1.9],
+            "cycles": [10, 12, 11, 13, 20, 21, 19, 22],
+        }
+    )
+    candidate = pd.DataFrame(
+        {
+            "benchmark": ["a"] * 4 + ["b"] * 4,
+            "ipc": [1.3, 1.4, 1.2, 1.5, 2.4, 2.3, 2.6, 2.5],
+            "cycles": [9, 8, 10, 9, 18, 17, 19, 16],
+        }
+    )
+    options: dict[str, int] = {"bootstrap_samples": 200, "random_seed": 3}
+
+    serial = StatisticalComparisonService.compare(
+        baseline, candidate, ["benchmark"], ["ipc", "cycles"], **options
+    )
+    pooled = StatisticalComparisonService.compare(
+        baseline, candidate, ["benchmark"], ["ipc", "cycles"], workers=2, **options
+    )
+
+    pd.testing.assert_frame_equal(serial, pooled, check_exact=True)
+    # Every (group, metric) keeps its own SeedSequence stream.
+    bootstrap = serial[["bootstrap_difference", "bootstrap_ci_low", "bootstrap_ci_high"]]
+    np.testing.assert_allclose(
+        bootstrap.to_numpy(),
+        [
+            [0.3, 0.15, 0.45],
+            [-2.535, -3.75, -1.49375],
+            [0.401375, 0.25, 0.575],
+            [-2.94375, -4.5, -1.5],
+        ],
+        rtol=1e-12,
+        atol=1e-12,
+    )
+
+
 def test_group_order_and_missing_groups_are_preserved() -> None:
     baseline = pd.DataFrame({"key": ["shared", "shared", "old"], "value": [1.0, 2.0, 3.0]})
     candidate = pd.DataFrame({"key": ["shared", "shared", "new"], "value": [2.0, 3.0, 4.0]})
@@ -119,6 +160,7 @@ def test_small_samples_and_zero_variance_are_reported() -> None:
         ({"bootstrap_samples": 50_001}, "cannot exceed"),
         ({"random_seed": -1}, "random_seed"),
         ({"minimum_sample_size": 1}, "minimum_sample_size"),
+        ({"workers": 0}, "workers"),
     ],
 )
 def test_invalid_statistical_options_are_rejected(kwargs: dict[str, object], message: str) -> None:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any, cast
 
+import numpy as np
 import plotly.graph_objects as go
 
 from src.core.models.visualization.annotation_config import AnnotationConfig
@@ -633,6 +634,23 @@ class TestScatterTrace:
         scatter = _scatter_trace(trace)
         assert cast(Any, scatter.error_y).array == (0.3,)
 
+    def test_scatter_accepts_numpy_arrays(self) -> None:
+        trace = ScatterTraceConfig(
+            x=np.arange(3.0),
+            y=np.array([1.0, 2.0, 4.0]),
+            error_y=np.array([0.1, 0.2, 0.3]),
+            size_values=np.array([5.0, 6.0, 7.0]),
+        )
+        scatter = _scatter_trace(trace)
+        assert list(cast(Any, scatter.y)) == [1.0, 2.0, 4.0]
+        assert list(cast(Any, scatter.error_y).array) == [0.1, 0.2, 0.3]
+        assert list(cast(Any, scatter.marker).size) == [5.0, 6.0, 7.0]
+
+    def test_scatter_empty_error_array_is_omitted(self) -> None:
+        trace = ScatterTraceConfig(x=np.arange(2.0), y=np.ones(2), error_y=np.array([]))
+        scatter = _scatter_trace(trace)
+        assert scatter.error_y is None or cast(Any, scatter.error_y).array is None
+
     def test_scatter_size_values(self) -> None:
         trace = ScatterTraceConfig(x=["a", "b"], y=[1, 2], size_values=[10.0, 20.0])
         scatter = _scatter_trace(trace)